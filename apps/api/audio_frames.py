@@ -0,0 +1,267 @@
+"""
+Binary audio frames for the ``/chat`` WebSocket.
+
+Voice audio travels as binary WebSocket messages instead of base64 inside
+JSON: a fixed 12-byte little-endian header followed by the raw payload.
+
+    offset  size  field
+    0       1     version (1)
+    1       1     frame type (1 = audio, 2 = end of utterance)
+    2       1     codec (0 = pcm_s16le, 1 = opus in an Ogg/WebM stream)
+    3       1     channels
+    4       4     sample rate (Hz)
+    8       4     sequence number
+    12      ...   payload
+
+JSON text messages are still used for control and transcripts.
+``AudioUpload`` feeds the microphone frames of one utterance into a streaming
+transcriber as they arrive, instead of buffering and base64-decoding the whole
+recording once it is complete.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("<BBBBII")
+FRAME_HEADER_SIZE = FRAME_HEADER.size
+
+# Opus is decoded by ffmpeg straight to the rate the recognizer works at
+OPUS_DECODE_SAMPLE_RATE = 16000
+_DECODER_READ_BYTES = 4096
+
+_END = object()
+
+
+class FrameType(IntEnum):
+    AUDIO = 1
+    END = 2
+
+
+class Codec(IntEnum):
+    PCM16 = 0
+    OPUS = 1
+
+
+class FrameError(ValueError):
+    """Raised for binary messages that are not valid audio frames."""
+
+
+@dataclass(frozen=True, slots=True)
+class AudioFrame:
+    type: FrameType
+    codec: Codec
+    channels: int
+    sample_rate: int
+    sequence: int
+    payload: memoryview
+
+
+def encode_frame(
+    frame_type: FrameType,
+    payload: bytes = b"",
+    *,
+    sample_rate: int,
+    sequence: int = 0,
+    codec: Codec = Codec.PCM16,
+    channels: int = 1,
+) -> bytes:
+    """Build a binary frame."""
+    header = FRAME_HEADER.pack(
+        FRAME_VERSION, frame_type, codec, channels, sample_rate, sequence & 0xFFFFFFFF
+    )
+    return header + payload
+
+
+def decode_frame(data: bytes) -> AudioFrame:
+    """
+    Parse a binary frame without copying its payload.
+
+    Raises:
+        FrameError: If the header is truncated or has unknown values
+    """
+    if len(data) < FRAME_HEADER_SIZE:
+        raise FrameError(f"Audio frame shorter than its {FRAME_HEADER_SIZE}-byte header")
+    version, frame_type, codec, channels, sample_rate, sequence = FRAME_HEADER.unpack_from(data)
+    if version != FRAME_VERSION:
+        raise FrameError(f"Unsupported audio frame version {version}")
+    try:
+        frame_type = FrameType(frame_type)
+        codec = Codec(codec)
+    except ValueError as exc:
+        raise FrameError(str(exc)) from exc
+    if frame_type is FrameType.AUDIO and not (8000 <= sample_rate <= 48000 and 1 <= channels <= 2):
+        raise FrameError(f"Unsupported audio format: {sample_rate} Hz, {channels} channels")
+    return AudioFrame(
+        frame_type, codec, channels, sample_rate, sequence, memoryview(data)[FRAME_HEADER_SIZE:]
+    )
+
+
+class _FfmpegDecoder:
+    """Persistent ffmpeg process turning a compressed stream into mono PCM16."""
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self._process = process
+
+    @classmethod
+    async def start(cls, sample_rate: int) -> "_FfmpegDecoder":
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-loglevel", "error", "-i", "pipe:0",
+            "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return cls(process)
+
+    async def write(self, data: bytes) -> None:
+        self._process.stdin.write(data)
+        await self._process.stdin.drain()
+
+    async def pcm(self) -> AsyncIterator[bytes]:
+        while chunk := await self._process.stdout.read(_DECODER_READ_BYTES):
+            yield chunk
+
+    async def close(self) -> None:
+        if not self._process.stdin.is_closing():
+            self._process.stdin.close()
+        await self._process.wait()
+
+    def kill(self) -> None:
+        if self._process.returncode is None:
+            self._process.kill()
+
+
+class AudioUpload:
+    """
+    Stream one utterance's binary frames into a transcriber.
+
+    Args:
+        transcribe: ``transcribe(pcm16_chunks, sample_rate)`` yielding result
+            dicts, e.g. ``stream_transcribe_audio``.
+        on_result: Awaited with every result (partials included) as it arrives.
+        max_buffered: Chunks queued for the transcriber before ``feed`` waits,
+            which pushes back on the client through the socket.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[AsyncIterator[bytes], int], AsyncIterator[dict[str, Any]]],
+        on_result: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+        *,
+        max_buffered: int = 64,
+    ) -> None:
+        self._transcribe = transcribe
+        self._on_result = on_result
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_buffered))
+        self._task: asyncio.Task | None = None
+        self._decoder: _FfmpegDecoder | None = None
+        self._codec: Codec | None = None
+        self._channels = 1
+        self._carry = b""
+        self._next_sequence = 0
+        self._finals: list[str] = []
+        self._last: dict[str, Any] | None = None
+        self.bytes_received = 0
+        self.frames_received = 0
+
+    async def feed(self, frame: AudioFrame) -> None:
+        """Queue an ``AUDIO`` frame, starting the transcriber on the first one."""
+        if self._task is None:
+            await self._start(frame)
+        elif self._task.done():
+            # The transcriber stopped early; surface its error instead of queueing
+            self._task.result()
+            return
+        if frame.codec is not self._codec:
+            raise FrameError("Audio codec changed in the middle of an utterance")
+
+        if frame.sequence != self._next_sequence:
+            logger.warning(
+                "Audio frame out of sequence",
+                extra={"expected": self._next_sequence, "received": frame.sequence},
+            )
+        self._next_sequence = frame.sequence + 1
+        self.frames_received += 1
+        self.bytes_received += len(frame.payload)
+
+        if self._decoder is not None:
+            await self._decoder.write(frame.payload)
+            return
+        pcm = self._pcm_mono(frame.payload)
+        if pcm:
+            await self._queue.put(pcm)
+
+    async def finish(self) -> dict[str, Any]:
+        """
+        End the utterance and wait for the transcriber.
+
+        Returns:
+            The last result, with ``text`` holding the whole transcript
+        """
+        if self._task is None:
+            return {"text": ""}
+        if self._decoder is not None:
+            await self._decoder.close()
+        elif not self._task.done():
+            await self._queue.put(_END)
+        await self._task
+        result = dict(self._last or {})
+        result["text"] = " ".join(self._finals).strip()
+        return result
+
+    def cancel(self) -> None:
+        if self._decoder is not None:
+            self._decoder.kill()
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _start(self, frame: AudioFrame) -> None:
+        self._codec = frame.codec
+        self._channels = frame.channels
+        if frame.codec is Codec.OPUS:
+            self._decoder = await _FfmpegDecoder.start(OPUS_DECODE_SAMPLE_RATE)
+            source, sample_rate = self._decoder.pcm(), OPUS_DECODE_SAMPLE_RATE
+        else:
+            source, sample_rate = self._queued(), frame.sample_rate
+        self._task = asyncio.create_task(self._run(source, sample_rate))
+        self._task.add_done_callback(self._drain)
+
+    async def _queued(self) -> AsyncIterator[bytes]:
+        while (chunk := await self._queue.get()) is not _END:
+            yield chunk
+
+    async def _run(self, source: AsyncIterator[bytes], sample_rate: int) -> None:
+        async for result in self._transcribe(source, sample_rate):
+            if "error" in result:
+                raise RuntimeError(result["error"])
+            self._last = result
+            if result.get("is_final") and result.get("text"):
+                self._finals.append(result["text"].strip())
+            if self._on_result is not None:
+                await self._on_result(result)
+
+    def _drain(self, _task: asyncio.Task) -> None:
+        # Unblock a ``feed`` waiting on a full queue once nobody consumes it
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def _pcm_mono(self, payload: memoryview) -> bytes:
+        data = self._carry + payload.tobytes()
+        frame_bytes = 2 * self._channels
+        usable = len(data) - len(data) % frame_bytes
+        data, self._carry = data[:usable], data[usable:]
+        if self._channels == 1 or not data:
+            return data
+        samples = np.frombuffer(data, dtype="<i2").reshape(-1, self._channels)
+        return samples.mean(axis=1).astype("<i2").tobytes()
@@ -5,6 +5,7 @@ Enhanced audio pipeline with streaming capabilities for real-time STT and TTS.
 import asyncio
 import contextlib
 import html
+import importlib.util
 import io
 import logging
 import math
@@ -13,14 +14,25 @@ import re
 import subprocess
 import tempfile
 import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, AsyncGenerator
 from urllib.request import urlretrieve
 
 import numpy as np
 
+from apps.api.streaming_stt import DecodeResult, StreamingRecognizer, Word
+from apps.api.tts_pipeline import SentenceSplitter, SpeechPipeline
+from packages.common.audio_frontend import (
+    GrowableAudioBuffer,
+    StreamingResampler,
+    pcm16_to_float,
+    resample,
+    rms,
+)
+from packages.common.whisper_engine import PRIORITY_LIVE, WhisperSpec, get_whisper_engine
+
 if TYPE_CHECKING:
-    from faster_whisper import WhisperModel
     from piper.voice import PiperVoice
 
 logger = logging.getLogger(__name__)
@@ -29,27 +41,18 @@ logger = logging.getLogger(__name__)
 # Optional dependencies (faster-whisper for STT, MeloTTS for TTS)
 # ---------------------------------------------------------------------------
 
-try:  # pragma: no cover - optional dependency
-    from faster_whisper import WhisperModel  # type: ignore
-
-    FW_AVAILABLE = True
-except Exception:  # pragma: no cover
-    FW_AVAILABLE = False
-
-try:  # pragma: no cover - optional dependency
-    from piper.voice import PiperVoice  # type: ignore
-
-    PIPER_AVAILABLE = True
-except Exception:  # pragma: no cover
-    PIPER_AVAILABLE = False
+# Only checked for presence here; both are imported when a model is first loaded.
+FW_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+PIPER_AVAILABLE = importlib.util.find_spec("piper") is not None
 
 # ---------------------------------------------------------------------------
 # Globals for lazy-loading heavy models
 # ---------------------------------------------------------------------------
-WHISPER_MODEL: "WhisperModel | None" = None
+WHISPER_SPEC: WhisperSpec | None = None
 WHISPER_LOCK = asyncio.Lock()
 PIPER_VOICE: "PiperVoice | None" = None
 PIPER_LOCK = asyncio.Lock()
+TTS_EXECUTOR: ThreadPoolExecutor | None = None
 
 WHISPER_TARGET_SR = 16000
 PIPER_SAMPLE_RATE = 22050  # Piper default output sample rate
@@ -184,6 +187,17 @@ def _ensure_pcm16(audio_bytes: bytes, sample_rate: int) -> tuple[bytes, int]:
     return audio_bytes, sample_rate
 
 
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Invalid %s '%s'; defaulting to %s", name, value, default)
+        return default
+
+
 def _resolve_piper_voice() -> str:
     """Resolve Piper voice model from environment or default to paola_medium (Italian)."""
     voice_env = os.getenv("TTS_VOICE", "it_IT-paola-medium").strip()
@@ -215,7 +229,7 @@ class StreamingAudioProcessor:
     def __init__(self, sample_rate: int = 16000, chunk_size: int = 1024):
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
-        self.audio_buffer = np.array([], dtype=np.float32)
+        self.audio_buffer = GrowableAudioBuffer(sample_rate * 5)
         self.is_recording = False
         self.voice_activity_threshold = 0.01
         self.silence_chunks = 0
@@ -231,11 +245,12 @@ class StreamingAudioProcessor:
         Returns:
             True if voice activity detected, False otherwise
         """
-        self.audio_buffer = np.concatenate([self.audio_buffer, chunk])
+        self.audio_buffer.append(chunk)
+        return self.detect_voice(chunk)
 
-        # Calculate RMS energy
-        rms = np.sqrt(np.mean(chunk**2))
-        has_voice = rms > self.voice_activity_threshold
+    def detect_voice(self, chunk: np.ndarray) -> bool:
+        """Update silence tracking for ``chunk`` without buffering it."""
+        has_voice = rms(chunk) > self.voice_activity_threshold
 
         if has_voice:
             self.silence_chunks = 0
@@ -250,173 +265,97 @@ class StreamingAudioProcessor:
 
     def get_buffered_audio(self) -> np.ndarray:
         """Get and clear the audio buffer."""
-        audio = self.audio_buffer.copy()
-        self.audio_buffer = np.array([], dtype=np.float32)
-        return audio
+        return self.audio_buffer.take()
 
     def reset(self):
         """Reset the processor state."""
-        self.audio_buffer = np.array([], dtype=np.float32)
+        self.audio_buffer.clear()
         self.silence_chunks = 0
         self.is_recording = False
 
 
-def _resample_audio(audio: np.ndarray, source_sr: int, target_sr: int) -> np.ndarray:
-    """High-quality audio resampling."""
-    if source_sr == target_sr:
-        return audio
-    if len(audio) == 0:
-        return audio
+def _whisper_candidates() -> list[WhisperSpec]:
+    """Live STT model candidates, in preference order, from STT_* environment overrides."""
+    model_name = os.getenv("STT_MODEL", "large-v3")
+    device = os.getenv("STT_DEVICE", "auto")
+    compute_type = os.getenv("STT_COMPUTE_TYPE", "float16")
 
-    # Use scipy for high-quality resampling if available
-    try:
-        from scipy import signal
-
-        # Calculate resampling ratio
-        ratio = target_sr / source_sr
-        # Calculate number of samples in resampled audio
-        target_length = int(len(audio) * ratio)
-        # Resample using scipy's resample function
-        resampled = signal.resample(audio, target_length)
-        return np.array(resampled, dtype=np.float32)
-    except ImportError:
-        # Fallback to linear interpolation
-        duration = len(audio) / float(source_sr)
-        target_len = int(duration * target_sr)
-        if target_len <= 1:
-            return audio
-        old_idx = np.linspace(0.0, 1.0, num=len(audio), endpoint=False)
-        new_idx = np.linspace(0.0, 1.0, num=target_len, endpoint=False)
-        resampled = np.interp(new_idx, old_idx, audio)
-        return np.array(resampled, dtype=np.float32)
-
-
-async def _load_whisper() -> "WhisperModel | None":
-    """Lazy-load faster-whisper model with environment overrides."""
-    global WHISPER_MODEL
+    def is_cuda_device(dev: str) -> bool:
+        normalized = (dev or "").lower()
+        return normalized.startswith("cuda") or normalized == "gpu"
+
+    compute_fallbacks_env = os.getenv("STT_COMPUTE_FALLBACKS", "int8_float16,int8")
+    compute_fallbacks = [
+        candidate.strip()
+        for candidate in compute_fallbacks_env.split(",")
+        if candidate.strip()
+    ]
+
+    candidates: list[WhisperSpec] = [WhisperSpec(model_name, device, compute_type)]
+
+    if is_cuda_device(device):
+        for compute_candidate in compute_fallbacks:
+            candidates.append(WhisperSpec(model_name, device, compute_candidate))
+
+        # Always include a CPU int8 fallback for the same model to avoid GPU OOMs
+        candidates.append(
+            WhisperSpec(
+                model_name,
+                os.getenv("STT_CPU_FALLBACK_DEVICE", "cpu"),
+                os.getenv("STT_CPU_FALLBACK_COMPUTE_TYPE", "int8"),
+            )
+        )
+
+    fallback_model_name = os.getenv("STT_FALLBACK_MODEL")
+    if fallback_model_name:
+        candidates.append(
+            WhisperSpec(
+                fallback_model_name,
+                os.getenv("STT_FALLBACK_DEVICE", "cpu"),
+                os.getenv("STT_FALLBACK_COMPUTE_TYPE", "int8"),
+            )
+        )
+
+    return list(dict.fromkeys(candidates))
+
+
+async def _load_whisper() -> WhisperSpec | None:
+    """
+    Resolve the live STT model on the shared Whisper engine.
+
+    Returns the spec to submit jobs with, or None if STT is unavailable. The
+    model itself is cached by the engine and shared with media ingestion when
+    both resolve to the same configuration.
+    """
+    global WHISPER_SPEC
     if not FW_AVAILABLE:  # pragma: no cover - dependency optional
         logger.warning("faster-whisper not available; STT disabled")
         return None
 
-    if WHISPER_MODEL is not None:
-        return WHISPER_MODEL
+    if WHISPER_SPEC is not None:
+        return WHISPER_SPEC
 
     async with WHISPER_LOCK:
-        if WHISPER_MODEL is not None:
-            return WHISPER_MODEL
+        if WHISPER_SPEC is not None:
+            return WHISPER_SPEC
 
+        candidates = _whisper_candidates()
         loop = asyncio.get_running_loop()
-        model_name = os.getenv("STT_MODEL", "large-v3")
-        device = os.getenv("STT_DEVICE", "auto")
-        compute_type = os.getenv("STT_COMPUTE_TYPE", "float16")
-
-        # Get number of workers for CPU inference (defaults to 1)
-        num_workers_env = os.getenv("STT_NUM_WORKERS", "1")
         try:
-            num_workers = max(1, int(num_workers_env))
-        except ValueError:
-            logger.warning("Invalid STT_NUM_WORKERS '%s'; defaulting to 1", num_workers_env)
-            num_workers = 1
-
-        def load_candidate(candidate: tuple[str, str, str]) -> "WhisperModel":
-            candidate_model, candidate_device, candidate_compute = candidate
-            logger.info(
-                "Loading faster-whisper model (model=%s, device=%s, compute_type=%s, num_workers=%s, primary=%s)",
-                candidate_model,
-                candidate_device,
-                candidate_compute,
-                num_workers,
-                candidate_model == model_name and candidate_device == device,
+            WHISPER_SPEC = await loop.run_in_executor(
+                None, get_whisper_engine().resolve, candidates
             )
-            return WhisperModel(
-                candidate_model,
-                device=candidate_device,
-                compute_type=candidate_compute,
-                num_workers=num_workers,
+            logger.info(
+                "faster-whisper model ready (model=%s, device=%s, compute_type=%s, primary=%s)",
+                WHISPER_SPEC.model,
+                WHISPER_SPEC.device,
+                WHISPER_SPEC.compute_type,
+                WHISPER_SPEC == candidates[0],
             )
+        except RuntimeError as exc:  # pragma: no cover
+            logger.error("Unable to initialize any faster-whisper model: %s", exc.__cause__ or exc)
 
-        def is_cuda_device(dev: str) -> bool:
-            normalized = (dev or "").lower()
-            return normalized.startswith("cuda") or normalized == "gpu"
-
-        compute_fallbacks_env = os.getenv("STT_COMPUTE_FALLBACKS", "int8_float16,int8")
-        compute_fallbacks = [
-            candidate.strip()
-            for candidate in compute_fallbacks_env.split(",")
-            if candidate.strip()
-        ]
-
-        model_candidates: list[tuple[str, str, str, str]] = [
-            (model_name, device, compute_type, "primary")
-        ]
-
-        if is_cuda_device(device):
-            for compute_candidate in compute_fallbacks:
-                candidate_tuple = (
-                    model_name,
-                    device,
-                    compute_candidate,
-                    f"primary-compute-fallback:{compute_candidate}",
-                )
-                if candidate_tuple not in model_candidates:
-                    model_candidates.append(candidate_tuple)
-
-            # Always include a CPU int8 fallback for the same model to avoid GPU OOMs
-            cpu_fallback_tuple = (
-                model_name,
-                os.getenv("STT_CPU_FALLBACK_DEVICE", "cpu"),
-                os.getenv("STT_CPU_FALLBACK_COMPUTE_TYPE", "int8"),
-                "auto-cpu-fallback",
-            )
-            if cpu_fallback_tuple not in model_candidates:
-                model_candidates.append(cpu_fallback_tuple)
-
-        fallback_model_name = os.getenv("STT_FALLBACK_MODEL")
-        fallback_device = os.getenv("STT_FALLBACK_DEVICE", "cpu")
-        fallback_compute = os.getenv("STT_FALLBACK_COMPUTE_TYPE", "int8")
-        if fallback_model_name:
-            candidate_tuple = (
-                fallback_model_name,
-                fallback_device,
-                fallback_compute,
-                "fallback-model",
-            )
-            if candidate_tuple not in model_candidates:
-                model_candidates.append(candidate_tuple)
-
-        last_error: Exception | None = None
-        for candidate_model, candidate_device, candidate_compute, candidate_label in model_candidates:
-            try:
-                WHISPER_MODEL = await loop.run_in_executor(
-                    None,
-                    lambda c=(candidate_model, candidate_device, candidate_compute): load_candidate(c),
-                )
-                logger.info(
-                    "faster-whisper model ready (model=%s, device=%s, compute_type=%s, source=%s)",
-                    candidate_model,
-                    candidate_device,
-                    candidate_compute,
-                    candidate_label,
-                )
-                break
-            except (RuntimeError, ImportError) as exc:  # pragma: no cover
-                last_error = exc
-                message = str(exc).lower()
-                if "out of memory" in message or "cuda" in message:
-                    logger.warning(
-                        "Failed to load faster-whisper model %s on %s (%s); trying next candidate",
-                        candidate_model,
-                        candidate_device,
-                        exc,
-                    )
-                    continue
-                logger.error("Failed to load faster-whisper model: %s", exc)
-                break
-
-        if WHISPER_MODEL is None and last_error is not None:
-            logger.error("Unable to initialize any faster-whisper model: %s", last_error)
-
-    return WHISPER_MODEL
+    return WHISPER_SPEC
 
 
 async def _load_piper_tts() -> "PiperVoice | None":
@@ -515,6 +454,59 @@ def _generate_piper_wav(voice: "PiperVoice", text: str) -> tuple[bytes, int]:
         raise
 
 
+def _generate_piper_pcm(voice: "PiperVoice", text: str) -> tuple[bytes, int]:
+    """Generate raw PCM16 mono samples using Piper TTS."""
+    wav_bytes, _ = _generate_piper_wav(voice, text)
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
+        return wav_file.readframes(wav_file.getnframes()), wav_file.getframerate()
+
+
+def _resolve_tts_workers() -> int:
+    """Resolve the number of concurrent sentence synthesis workers from environment."""
+    workers_env = os.getenv("TTS_WORKERS", "2")
+    try:
+        return max(1, int(workers_env))
+    except ValueError:
+        logger.warning("Invalid TTS_WORKERS '%s'; defaulting to 2", workers_env)
+        return 2
+
+
+def _get_tts_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for sentence synthesis."""
+    global TTS_EXECUTOR
+    if TTS_EXECUTOR is None:
+        TTS_EXECUTOR = ThreadPoolExecutor(
+            max_workers=_resolve_tts_workers(), thread_name_prefix="tts-worker"
+        )
+    return TTS_EXECUTOR
+
+
+async def create_speech_pipeline() -> SpeechPipeline | None:
+    """
+    Create a sentence-level Piper synthesis pipeline.
+
+    Returns:
+        A ``SpeechPipeline`` producing PCM16 audio per sentence, or None if TTS is unavailable.
+    """
+    voice = await _load_piper_tts()
+    if not voice:
+        logger.error("Piper TTS not available, cannot synthesize speech")
+        return None
+
+    def _synthesize_sentence(sentence: str) -> tuple[bytes, int] | None:
+        # Code blocks are dropped rather than read out when they make up a whole sentence.
+        cleaned = sanitize_tts_text(MARKDOWN_CODE_BLOCK_RE.sub(" ", sentence))
+        if not cleaned:
+            return None
+        return _generate_piper_pcm(voice, cleaned)
+
+    return SpeechPipeline(
+        _synthesize_sentence,
+        executor=_get_tts_executor(),
+        max_pending=_resolve_tts_workers() * 2,
+    )
+
+
 def _pcm16_to_wav(pcm: bytes, sample_rate: int) -> bytes:
     """Wrap raw PCM16 mono samples into a WAV container."""
     with io.BytesIO() as buf:
@@ -539,12 +531,20 @@ async def stream_transcribe_audio(
         sample_rate: Sample rate of the input audio
         language: Optional language code (e.g., "it", "en")
 
+    Audio is decoded incrementally by a ``StreamingRecognizer``: every
+    ``STT_STREAM_STRIDE_MS`` of voiced audio the uncommitted window (at most
+    ``STT_STREAM_WINDOW_S`` seconds) is decoded, and words confirmed by two
+    consecutive passes are committed.
+
     Yields:
-        Transcription results with partial and final text
+        Transcription results with the full ``text`` so far, split into
+        ``committed_text`` (stable) and ``tentative_text`` (may still change),
+        plus ``is_final`` at the end of each utterance
     """
-    model = await _load_whisper()
-    if not model:
+    spec = await _load_whisper()
+    if not spec:
         raise RuntimeError("STT model unavailable")
+    engine = get_whisper_engine()
 
     beam_size_env = os.getenv("STT_BEAM_SIZE", "1")
     try:
@@ -565,74 +565,113 @@ async def stream_transcribe_audio(
             language = language.split(",", 1)[0].strip() or None
 
     processor = StreamingAudioProcessor(sample_rate)
-    accumulated_audio = np.array([], dtype=np.float32)
+
+    def _decode_window(window: np.ndarray, prompt: str) -> DecodeResult:
+        def _job(model: Any) -> DecodeResult:
+            segments, info = model.transcribe(
+                window,
+                beam_size=beam_size,
+                vad_filter=True,
+                word_timestamps=True,
+                language=language,
+                initial_prompt=prompt or None,
+                condition_on_previous_text=False,
+            )
+
+            words: list[Word] = []
+            confidences = []
+            for seg in segments:
+                for word in getattr(seg, "words", None) or []:
+                    if word.word.strip():
+                        words.append(Word(float(word.start), float(word.end), word.word.strip()))
+                avg_logprob = getattr(seg, "avg_logprob", None)
+                if avg_logprob is not None:
+                    confidences.append(math.exp(avg_logprob))
+
+            avg_conf = None
+            if confidences:
+                avg_conf = float(sum(confidences) / len(confidences))
+
+            detected_lang = getattr(info, "language", None) if info else None
+            return DecodeResult(words=words, language=detected_lang, confidence=avg_conf)
+
+        # Live dictation jumps ahead of any queued media transcription
+        return engine.run(
+            spec,
+            _job,
+            priority=PRIORITY_LIVE,
+            audio_seconds=window.size / WHISPER_TARGET_SR,
+        )
+
+    # Stateful across chunks, unlike resampling every chunk on its own
+    resampler = StreamingResampler(sample_rate, WHISPER_TARGET_SR)
+    scratch = np.empty(0, dtype=np.float32)
+    recognizer = StreamingRecognizer(
+        _decode_window,
+        sample_rate=WHISPER_TARGET_SR,
+        stride_s=_env_float("STT_STREAM_STRIDE_MS", 1000.0) / 1000.0,
+        max_window_s=_env_float("STT_STREAM_WINDOW_S", 12.0),
+        overlap_s=_env_float("STT_STREAM_OVERLAP_MS", 500.0) / 1000.0,
+    )
+    loop = asyncio.get_running_loop()
+    voiced = False
+
+    async def _run(step) -> dict[str, Any] | None:
+        try:
+            return await loop.run_in_executor(None, step)
+        except (RuntimeError, ValueError) as e:
+            logger.error("Transcription error: %s", e)
+            recognizer.reset()
+            return {
+                "text": "",
+                "language": None,
+                "confidence": None,
+                "is_final": True,
+                "error": str(e),
+            }
 
     async for chunk in audio_chunks:
-        # Convert chunk to float32
-        audio_array = np.frombuffer(chunk, dtype=np.int16).astype(np.float32) / 32768
-
-        # Add to processor
-        has_voice = processor.add_audio_chunk(audio_array)
-        accumulated_audio = np.concatenate([accumulated_audio, audio_array])
-
-        # Check if we should process (voice activity or silence threshold)
-        if has_voice or processor.should_stop_recording():
-            if len(accumulated_audio) > 0:
-                # Resample if needed
-                processed = _resample_audio(accumulated_audio, sample_rate, WHISPER_TARGET_SR)
-
-                def _transcribe_chunk():
-                    segments, info = model.transcribe(
-                        processed,
-                        beam_size=beam_size,
-                        vad_filter=True,
-                        word_timestamps=True,
-                        language=language,
-                    )
-
-                    text_parts = []
-                    confidences = []
-                    for seg in segments:
-                        seg_text = getattr(seg, "text", "").strip()
-                        if seg_text:
-                            text_parts.append(seg_text)
-                        avg_logprob = getattr(seg, "avg_logprob", None)
-                        if avg_logprob is not None:
-                            confidences.append(math.exp(avg_logprob))
-
-                    transcript = " ".join(text_parts).strip()
-                    avg_conf = None
-                    if confidences:
-                        avg_conf = float(sum(confidences) / len(confidences))
-
-                    detected_lang = getattr(info, "language", None) if info else None
-
-                    return {
-                        "text": transcript,
-                        "language": detected_lang,
-                        "confidence": avg_conf,
-                        "is_final": processor.should_stop_recording(),
-                    }
-
-                loop = asyncio.get_running_loop()
-                try:
-                    result = await loop.run_in_executor(None, _transcribe_chunk)
-                    if result["text"]:
-                        yield result
-                except (RuntimeError, ValueError) as e:
-                    logger.error("Transcription error: %s", e)
-                    yield {
-                        "text": "",
-                        "language": None,
-                        "confidence": None,
-                        "is_final": True,
-                        "error": str(e),
-                    }
-
-                # Reset if final
-                if processor.should_stop_recording():
-                    processor.reset()
-                    accumulated_audio = np.array([], dtype=np.float32)
+        # Convert chunk to float32 into a reused scratch buffer
+        if scratch.size < len(chunk) // 2:
+            scratch = np.empty(len(chunk) // 2, dtype=np.float32)
+        audio_array = pcm16_to_float(chunk, out=scratch)
+
+        has_voice = processor.detect_voice(audio_array)
+        voiced = voiced or has_voice
+        recognizer.add_audio(resampler.process(audio_array))
+
+        if processor.should_stop_recording():
+            # Utterance ended: commit whatever is still tentative and start over
+            if voiced:
+                result = await _run(recognizer.finish)
+                if result and (result["text"] or "error" in result):
+                    yield result
+            else:
+                recognizer.reset()
+            processor.reset()
+            voiced = False
+            continue
+
+        # Decode on a fixed stride; each pass only covers the uncommitted window
+        while voiced and recognizer.ready():
+            result = await _run(recognizer.step)
+            if result and (result["text"] or "error" in result):
+                yield result
+
+    if voiced:
+        result = await _run(recognizer.finish)
+        if result and (result["text"] or "error" in result):
+            yield result
+
+    logger.debug(
+        "Streaming transcription finished",
+        extra={
+            "decodes": recognizer.stats.decodes,
+            "audio_seconds": round(recognizer.stats.audio_seconds, 2),
+            "decoded_seconds": round(recognizer.stats.decoded_seconds, 2),
+            "rtf": round(recognizer.stats.real_time_factor, 3),
+        },
+    )
 
 
 async def stream_synthesize_speech(
@@ -641,42 +680,43 @@ async def stream_synthesize_speech(
     chunk_size: int = 1024,
 ) -> AsyncGenerator[tuple[bytes, int], None]:
     """
-    Stream speech synthesis in chunks using Piper TTS.
+    Stream speech synthesis sentence by sentence using Piper TTS.
+
+    Sentences are synthesized concurrently on the TTS worker pool, so the first
+    chunk is available after the first sentence rather than the whole text.
 
     Args:
         text: Text to synthesize
-        chunk_size: Size of audio chunks to yield
+        chunk_size: Size in bytes of the PCM16 chunks to yield
 
     Yields:
-        Tuples of (audio_chunk, sample_rate)
+        Tuples of (pcm16_chunk, sample_rate)
     """
-    cleaned = sanitize_tts_text(text)
-    if not cleaned:
-        cleaned = text.strip()
-        if not cleaned:
-            return
+    splitter = SentenceSplitter()
+    sentences = splitter.feed(text) + splitter.flush()
+    if not sentences:
+        return
 
-    voice = await _load_piper_tts()
-    if not voice:
-        logger.error("Piper TTS not available, cannot synthesize speech")
+    pipeline = await create_speech_pipeline()
+    if not pipeline:
         return
 
-    def _synthesize_stream():
-        wav_bytes, sample_rate = _generate_piper_wav(voice, cleaned)
-        audio_chunks: list[tuple[bytes, int]] = []
-        for i in range(0, len(wav_bytes), chunk_size):
-            chunk = wav_bytes[i : i + chunk_size]
-            audio_chunks.append((chunk, sample_rate))
-        return audio_chunks
+    async def _submit_all() -> None:
+        try:
+            for sentence in sentences:
+                await pipeline.submit(sentence)
+        finally:
+            await pipeline.close()
 
-    loop = asyncio.get_running_loop()
+    submitter = asyncio.create_task(_submit_all())
     try:
-        chunks = await loop.run_in_executor(None, _synthesize_stream)
-        for chunk in chunks:
-            yield chunk
-    except (RuntimeError, ValueError) as exc:  # pragma: no cover
-        logger.error("Piper TTS synthesis failed: %s", exc, exc_info=True)
-        return
+        async for _sentence, pcm, sample_rate in pipeline.results():
+            for i in range(0, len(pcm), chunk_size):
+                yield pcm[i : i + chunk_size], sample_rate
+    finally:
+        if not submitter.done():
+            submitter.cancel()
+            pipeline.cancel()
 
 
 async def transcribe_audio_pcm16(
@@ -698,9 +738,10 @@ async def transcribe_audio_pcm16(
     if not audio_pcm:
         return {"text": "", "language": None, "confidence": None}
 
-    model = await _load_whisper()
-    if not model:
+    spec = await _load_whisper()
+    if not spec:
         raise RuntimeError("STT model unavailable")
+    engine = get_whisper_engine()
 
     beam_size_env = os.getenv("STT_BEAM_SIZE", "1")
     try:
@@ -722,16 +763,9 @@ async def transcribe_audio_pcm16(
 
     audio_pcm, sample_rate = _ensure_pcm16(audio_pcm, sample_rate)
 
-    def _run() -> dict[str, Any]:
-        # Convert PCM16 to float32 [-1, 1]
-        padding_length = len(audio_pcm) % 2
-        if padding_length:
-            padded = audio_pcm + b"\x00" * (2 - padding_length)
-        else:
-            padded = audio_pcm
-
-        arr = np.frombuffer(padded, dtype=np.int16).astype(np.float32) / 32768
-        processed = _resample_audio(arr, sample_rate, WHISPER_TARGET_SR)
+    def _run(model: Any) -> dict[str, Any]:
+        # Convert PCM16 to float32 [-1, 1] straight from the received bytes
+        processed = resample(pcm16_to_float(audio_pcm), sample_rate, WHISPER_TARGET_SR)
 
         segments, info = model.transcribe(
             processed,
@@ -760,8 +794,12 @@ async def transcribe_audio_pcm16(
 
         return {"text": transcript, "language": detected_lang, "confidence": avg_conf}
 
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, _run)
+    return await engine.arun(
+        spec,
+        _run,
+        priority=PRIORITY_LIVE,
+        audio_seconds=len(audio_pcm) / 2 / sample_rate,
+    )
 
 
 async def synthesize_speech(
@@ -798,6 +836,7 @@ __all__ = [
     "StreamingAudioProcessor",
     "stream_transcribe_audio",
     "stream_synthesize_speech",
+    "create_speech_pipeline",
     "transcribe_audio_pcm16",
     "synthesize_speech",
     "_pcm16_to_wav",
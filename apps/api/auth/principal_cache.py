@@ -0,0 +1,109 @@
+"""
+In-process cache of authenticated principals.
+
+Authentication normally costs a database round-trip per request (user lookup
+by JWT subject or API key, plus the default collection grant). Resolved users
+are kept here for a short TTL, keyed by credential:
+
+* ``sub:<username>`` for a verified JWT subject
+* ``key:<sha256(api key)>:<username>`` for Authentik API key headers
+
+Entries are dropped explicitly when a user's key is regenerated, their role
+changes or their account is deleted. Other API workers and the admin CLI see
+such changes within one TTL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from apps.api.config import settings
+
+
+def jwt_subject_key(username: str) -> str:
+    return f"sub:{username}"
+
+
+def api_key_key(api_key: str, username: str) -> str:
+    digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    return f"key:{digest}:{username}"
+
+
+class PrincipalCache:
+    """
+    TTL + LRU map from credential key to a detached ``User``, plus memoised
+    collection grants per user.
+
+    Args:
+        ttl: Seconds an entry stays valid (0 disables caching)
+        max_entries: Entries kept before the least recently used is dropped
+        clock: Monotonic time source (overridable in tests)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_entries: int = 4096,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._grants: set[tuple[int, str]] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, user = entry
+        if expires <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return user
+
+    def put(self, key: str, user: Any) -> None:
+        if not self.enabled or user is None:
+            return
+        self._entries[key] = (self._clock() + self.ttl, user)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Forget every cached credential and grant of ``user_id``."""
+        stale = [key for key, (_, user) in self._entries.items() if getattr(user, "id", None) == user_id]
+        for key in stale:
+            del self._entries[key]
+        self._grants = {grant for grant in self._grants if grant[0] != user_id}
+
+    def has_grant(self, user_id: int, collection: str) -> bool:
+        return (user_id, collection) in self._grants
+
+    def add_grant(self, user_id: int, collection: str) -> None:
+        if self.enabled:
+            self._grants.add((user_id, collection))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._grants.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(ttl=settings.auth_principal_cache_ttl)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop cached authentication state after a key, role or account change."""
+    principal_cache.invalidate_user(user_id)
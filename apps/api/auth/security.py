@@ -13,6 +13,7 @@ from fastapi.security import HTTPBearer
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.api.auth.principal_cache import api_key_key, jwt_subject_key, principal_cache
 from apps.api.config import settings
 from packages.common.exceptions import ValidationError
 from packages.db import get_async_session, User
@@ -103,8 +104,56 @@ async def authenticate_authentik_user(
     username: str | None = None,
 ) -> User | None:
     """Resolve the authenticated user from Authentik credentials."""
+    if not api_key:
+        logger.warning("API key verification failed: empty key")
+        return None
+
+    key = api_key_key(api_key, _normalize_username(username))
+    user = principal_cache.get(key)
+    if user is not None:
+        return user
+
     async with get_async_session() as session:
-        return await _ensure_user_for_api_key(session, api_key, username)
+        user = await _ensure_user_for_api_key(session, api_key, username)
+    if user is not None:
+        # The lookup may have updated the row, so cached copies of this user are stale
+        principal_cache.invalidate_user(user.id)
+        principal_cache.put(key, user)
+    return user
+
+
+async def _get_user_by_subject(username: str) -> User | None:
+    """Resolve a verified JWT subject to a user, via the principal cache."""
+    key = jwt_subject_key(username)
+    user = principal_cache.get(key)
+    if user is None:
+        async with get_async_session() as db:
+            user = await UserRepository(db).get_by_username(username)
+        principal_cache.put(key, user)
+    return user
+
+
+def _decode_subject(token: str, *, log_level: int = logging.WARNING) -> str | None:
+    """Return the normalized subject of a valid JWT, or None."""
+    try:
+        secret = settings.jwt_secret or settings.root_api_key
+        payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
+    except JWTError as e:
+        logger.log(
+            log_level,
+            "JWT authentication failed",
+            extra={"error": str(e), "error_type": type(e).__name__}
+        )
+        return None
+    except ValueError as e:
+        logger.log(
+            log_level,
+            "Token parsing failed",
+            extra={"error": str(e), "error_type": type(e).__name__}
+        )
+        return None
+    username = payload.get("sub")
+    return _normalize_username(username) if username else None
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
@@ -135,53 +184,36 @@ async def get_current_user(
     1. Check for JWT token in youworker_token cookie
     2. If no cookie but Authentik headers present, validate Authentik credentials
     3. Return user object if authenticated, raise 401 otherwise
+
+    Resolved users are reused from the principal cache for a short TTL, so a
+    repeat request normally needs no database round-trip.
     """
-    async with get_async_session() as db:
-        user_repo = UserRepository(db)
-        token = youworker_token
-
-        # Try JWT authentication from cookie
-        if token:
-            try:
-                secret = settings.jwt_secret or settings.root_api_key
-                payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
-                username = payload.get("sub")
-
-                if username:
-                    normalized_username = _normalize_username(username)
-                    user = await user_repo.get_by_username(normalized_username)
-                    if user:
-                        return user
-            except JWTError as e:
-                logger.warning(
-                    "JWT authentication failed",
-                    extra={"error": str(e), "error_type": type(e).__name__}
-                )
-                # Fall through to Authentik header check
-            except ValueError as e:
-                logger.warning(
-                    "Token parsing failed",
-                    extra={"error": str(e), "error_type": type(e).__name__}
-                )
-                # Fall through to Authentik header check
-
-        # If JWT not present or invalid, check for Authentik headers (for direct API access)
-        if authentik_api_key:
-            user = await _ensure_user_for_api_key(db, authentik_api_key, authentik_username)
+    # Try JWT authentication from cookie
+    if youworker_token:
+        username = _decode_subject(youworker_token)
+        if username:
+            user = await _get_user_by_subject(username)
             if user:
                 return user
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid Authentik credentials",
-            )
+        # Fall through to Authentik header check
 
-        # No valid authentication found
+    # If JWT not present or invalid, check for Authentik headers (for direct API access)
+    if authentik_api_key:
+        user = await authenticate_authentik_user(authentik_api_key, authentik_username)
+        if user:
+            return user
         raise HTTPException(
             status_code=401,
-            detail="Not authenticated - please authenticate via Authentik SSO",
-            headers={"WWW-Authenticate": "Bearer"},
+            detail="Invalid Authentik credentials",
         )
 
+    # No valid authentication found
+    raise HTTPException(
+        status_code=401,
+        detail="Not authenticated - please authenticate via Authentik SSO",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 
 async def get_current_user_optional(
     youworker_token: str | None = Cookie(default=None),
@@ -193,40 +225,21 @@ async def get_current_user_optional(
 
     Same as get_current_user but returns None instead of raising HTTPException.
     """
-    async with get_async_session() as db:
-        user_repo = UserRepository(db)
-        token = youworker_token
-
-        # Try JWT authentication from cookie
-        if token:
-            try:
-                secret = settings.jwt_secret or settings.root_api_key
-                payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
-                username = payload.get("sub")
-
-                if username:
-                    normalized_username = _normalize_username(username)
-                    user = await user_repo.get_by_username(normalized_username)
-                    if user:
-                        return user
-            except JWTError as e:
-                logger.debug(
-                    "JWT authentication failed",
-                    extra={"error": str(e), "error_type": type(e).__name__}
-                )
-            except ValueError as e:
-                logger.debug(
-                    "Token parsing failed",
-                    extra={"error": str(e), "error_type": type(e).__name__}
-                )
-
-        # Try Authentik headers
-        if authentik_api_key:
-            user = await _ensure_user_for_api_key(db, authentik_api_key, authentik_username)
+    # Try JWT authentication from cookie
+    if youworker_token:
+        username = _decode_subject(youworker_token, log_level=logging.DEBUG)
+        if username:
+            user = await _get_user_by_subject(username)
             if user:
                 return user
 
-        return None
+    # Try Authentik headers
+    if authentik_api_key:
+        user = await authenticate_authentik_user(authentik_api_key, authentik_username)
+        if user:
+            return user
+
+    return None
 
 
 async def get_current_active_user(current_user=Depends(get_current_user)):
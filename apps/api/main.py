@@ -5,7 +5,6 @@ Main application entry point with modular route organization.
 """
 
 import logging
-import uuid
 from contextlib import asynccontextmanager
 from typing import Any
 from urllib.parse import urlparse
@@ -22,6 +21,7 @@ from apps.api.config import settings
 from apps.api.middleware import (
     CSRFMiddleware,
     IPWhitelistMiddleware,
+    RequestContextMiddleware,
     get_ip_whitelist_from_env,
     parse_and_validate_cors_origins,
 )
@@ -30,7 +30,7 @@ from packages.agent import MCPRegistry, AgentLoop
 from packages.vectorstore import QdrantStore
 from packages.db import init_db as init_database
 from packages.ingestion import IngestionPipeline
-from packages.common import correlation_id_var, set_correlation_id
+from packages.common import correlation_id_var
 from packages.common.logger import configure_json_logging
 from packages.common.exceptions import (
     YouWorkerException,
@@ -251,72 +251,10 @@ app.add_middleware(
 )
 
 
-# Correlation ID middleware for request tracing
-@app.middleware("http")
-async def add_correlation_id(request: Request, call_next):
-    """
-    Middleware that adds a correlation ID to each request.
-
-    The correlation ID can be provided by the client via X-Correlation-ID header
-    or will be auto-generated. It's included in all log messages and returned
-    in the response headers for client-side correlation.
-    """
-    # Get or generate correlation ID
-    correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
-    set_correlation_id(correlation_id)
-
-    # Process request
-    response = await call_next(request)
-
-    # Add correlation ID to response headers
-    response.headers["X-Correlation-ID"] = correlation_id
-
-    return response
-
-
-@app.middleware("http")
-async def add_api_version(request: Request, call_next):
-    """
-    API versioning middleware.
-
-    Supports both URL-based versioning (/v1/endpoint) and header-based versioning.
-    The API version is stored in request.state for use by endpoints if needed.
-
-    Header: X-API-Version (optional, defaults to "v1")
-    URL: /v1/endpoint (preferred method)
-
-    Future versions can be added by:
-    1. Creating new route modules with version-specific logic
-    2. Including them with app.include_router(v2_router, prefix="/v2")
-    3. Updating this middleware to handle version-specific features
-    """
-    # Get API version from header (fallback to v1)
-    api_version = request.headers.get("X-API-Version", "v1")
-
-    # Validate version format
-    if not api_version.startswith("v"):
-        api_version = f"v{api_version}"
-
-    # Store version in request state for endpoint access
-    request.state.api_version = api_version
-
-    # Process request
-    response = await call_next(request)
-
-    # Include API version in response headers for client awareness
-    response.headers["X-API-Version"] = api_version
-
-    return response
-
-
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    """Attach basic security headers to every response."""
-    response = await call_next(request)
-    response.headers.setdefault("X-Content-Type-Options", "nosniff")
-    response.headers.setdefault("Referrer-Policy", "same-origin")
-    response.headers.setdefault("X-Frame-Options", "SAMEORIGIN")
-    return response
+# Correlation ID, API version and security headers, added outermost so they are
+# also present on CSRF / IP whitelist rejections. Pure ASGI: streamed responses
+# pass through without being re-chunked.
+app.add_middleware(RequestContextMiddleware)
 
 
 # Include route modules
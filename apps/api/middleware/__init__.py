@@ -2,12 +2,14 @@
 
 from apps.api.middleware.csrf import CSRFMiddleware
 from apps.api.middleware.ip_whitelist import IPWhitelistMiddleware, get_ip_whitelist_from_env
+from apps.api.middleware.request_context import RequestContextMiddleware
 from apps.api.middleware.cors_validation import validate_cors_origin, parse_and_validate_cors_origins
 
 __all__ = [
     "CSRFMiddleware",
     "IPWhitelistMiddleware",
     "get_ip_whitelist_from_env",
+    "RequestContextMiddleware",
     "validate_cors_origin",
     "parse_and_validate_cors_origins",
 ]
@@ -8,16 +8,15 @@ from typing import Iterable
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from apps.api.csrf import CSRFTokenError, validate_csrf_token
 
 logger = logging.getLogger(__name__)
 
 
-class CSRFMiddleware(BaseHTTPMiddleware):
-    """Validate CSRF tokens on unsafe HTTP methods."""
+class CSRFMiddleware:
+    """Validate CSRF tokens on unsafe HTTP methods (pure ASGI, responses pass through untouched)."""
 
     SAFE_METHODS: set[str] = {"GET", "HEAD", "OPTIONS", "TRACE"}
 
@@ -30,7 +29,7 @@ class CSRFMiddleware(BaseHTTPMiddleware):
         exempt_paths: Iterable[str] | None = None,
         include_cookie_check: bool = True,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.header_name = header_name
         self.cookie_name = cookie_name
         self.include_cookie_check = include_cookie_check and bool(cookie_name)
@@ -58,15 +57,24 @@ class CSRFMiddleware(BaseHTTPMiddleware):
             content={"detail": detail, "code": code},
         )
 
-    async def dispatch(self, request: Request, call_next):
-        if request.scope["type"] != "http":
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
+        rejection = self._check(request)
+        if rejection is not None:
+            await rejection(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def _check(self, request: Request) -> JSONResponse | None:
         method = request.method.upper()
         path = request.url.path
 
         if method in self.SAFE_METHODS or self._is_exempt(path):
-            return await call_next(request)
+            return None
 
         header_token = request.headers.get(self.header_name)
         if not header_token:
@@ -90,4 +98,4 @@ class CSRFMiddleware(BaseHTTPMiddleware):
             return self._reject(str(exc), code="csrf_invalid")
 
         request.state.csrf_token = token
-        return await call_next(request)
+        return None
@@ -9,14 +9,14 @@ from typing import Callable
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Receive, Scope, Send
 
 from apps.api.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-class IPWhitelistMiddleware(BaseHTTPMiddleware):
+class IPWhitelistMiddleware:
     """
     Middleware to restrict access to whitelisted IP addresses.
 
@@ -30,7 +30,7 @@ class IPWhitelistMiddleware(BaseHTTPMiddleware):
         whitelisted_ips: list[str] | None = None,
         enabled: bool = True,
     ):
-        super().__init__(app)
+        self.app = app
         self.whitelisted_ips = whitelisted_ips or []
         self.enabled = enabled and settings.app_env == "production"
 
@@ -45,14 +45,16 @@ class IPWhitelistMiddleware(BaseHTTPMiddleware):
                 extra={"enabled": False, "reason": "development_mode"}
             )
 
-    async def dispatch(self, request: Request, call_next):
-        """Process the request and check IP whitelist."""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Check the client IP, then pass the request through unchanged."""
 
         # Skip IP check if disabled or in development
-        if not self.enabled:
-            return await call_next(request)
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Get client IP from various headers (reverse proxy support)
+        request = Request(scope)
         client_ip = self._get_client_ip(request)
 
         # Check if IP is whitelisted
@@ -65,21 +67,22 @@ class IPWhitelistMiddleware(BaseHTTPMiddleware):
                     "action": "denied"
                 }
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_403_FORBIDDEN,
                 content={
                     "detail": "Access forbidden: IP address not whitelisted",
                     "client_ip": client_ip,
                 },
             )
+            await response(scope, receive, send)
+            return
 
         # IP is allowed, proceed with request
         logger.debug(
             "Request from whitelisted IP",
             extra={"client_ip": client_ip, "action": "allowed"}
         )
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
     def _get_client_ip(self, request: Request) -> str:
         """
@@ -0,0 +1,82 @@
+"""
+Request context middleware (pure ASGI).
+
+Replaces the ``@app.middleware("http")`` functions for correlation IDs, API
+versioning and security headers. Those ran as three ``BaseHTTPMiddleware``
+layers, each adding a task and re-streaming every response chunk; here the
+request is passed straight through and the headers are added to the
+``http.response.start`` message.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from packages.common import set_correlation_id
+
+CORRELATION_HEADER = "x-correlation-id"
+API_VERSION_HEADER = "x-api-version"
+DEFAULT_API_VERSION = "v1"
+
+SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"referrer-policy", b"same-origin"),
+    (b"x-frame-options", b"SAMEORIGIN"),
+)
+
+
+class RequestContextMiddleware:
+    """
+    Per-request correlation ID, API version and security headers.
+
+    * ``X-Correlation-ID`` is taken from the request or generated, stored in
+      the logging context and echoed on the response.
+    * ``X-API-Version`` (default ``v1``) is exposed as ``request.state.api_version``
+      and echoed on the response.
+    * Basic security headers are added unless the endpoint set them already.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = api_version = None
+        for name, value in scope["headers"]:
+            if name == b"x-correlation-id":
+                correlation_id = value.decode("latin-1")
+            elif name == b"x-api-version":
+                api_version = value.decode("latin-1")
+        correlation_id = correlation_id or str(uuid.uuid4())
+        api_version = api_version or DEFAULT_API_VERSION
+        if not api_version.startswith("v"):
+            api_version = f"v{api_version}"
+
+        set_correlation_id(correlation_id)
+        scope.setdefault("state", {})["api_version"] = api_version
+
+        context_headers = [
+            (CORRELATION_HEADER.encode(), correlation_id.encode("latin-1")),
+            (API_VERSION_HEADER.encode(), api_version.encode("latin-1")),
+        ]
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                replaced = {CORRELATION_HEADER.encode(), API_VERSION_HEADER.encode()}
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", ())
+                    if name.lower() not in replaced
+                ]
+                present = {name.lower() for name, _ in headers}
+                headers.extend(context_headers)
+                headers.extend(item for item in SECURITY_HEADERS if item[0] not in present)
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,145 @@
+"""
+Startup readiness tracking.
+
+``StartupService.initialize`` runs its stages concurrently: critical ones are
+awaited before the API accepts traffic, slow optional ones (model warm-up, MCP
+discovery, the ingestion pipeline) finish in the background and are retried
+with backoff until they come up. Each stage reports its state here; ``/health``
+shows it per component and ``/health/ready`` answers 503 until every critical
+component is ready.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+
+# Backoff between attempts of a retried stage
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+
+@dataclass
+class ComponentStatus:
+    """State of one startup component."""
+
+    critical: bool
+    state: str = PENDING
+    error: str | None = None
+    duration_ms: int | None = None
+    attempts: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "critical": self.critical,
+            "error": self.error,
+            "duration_ms": self.duration_ms,
+            "attempts": self.attempts,
+        }
+
+
+class StartupReadiness:
+    """Per-component readiness of the API process."""
+
+    def __init__(self) -> None:
+        self._components: dict[str, ComponentStatus] = {}
+        self._done: dict[str, asyncio.Event] = {}
+
+    def register(self, name: str, *, critical: bool = False) -> None:
+        self._components[name] = ComponentStatus(critical=critical)
+        self._done[name] = asyncio.Event()
+
+    async def run(
+        self,
+        name: str,
+        stage: Callable[[], Awaitable[Any]],
+        *,
+        reraise: bool = False,
+        retry: bool = False,
+        retry_delay: float = RETRY_DELAY,
+        max_retry_delay: float = MAX_RETRY_DELAY,
+    ) -> bool:
+        """
+        Run a registered stage and record its outcome.
+
+        Failures are logged and recorded; they are raised again only with
+        ``reraise`` (for stages the process cannot start without). With
+        ``retry`` a failed stage is run again, the delay doubling up to
+        ``max_retry_delay``, until it completes or the task is cancelled, so
+        a dependency that was briefly down at boot does not leave the
+        component missing until the process is restarted.
+
+        Returns:
+            True when the stage completed
+        """
+        status = self._components[name]
+        delay = retry_delay
+        try:
+            while True:
+                status.attempts += 1
+                started = time.perf_counter()
+                try:
+                    await stage()
+                except asyncio.CancelledError:
+                    status.state, status.error = FAILED, "cancelled"
+                    raise
+                except Exception as e:
+                    status.state, status.error = FAILED, f"{type(e).__name__}: {e}"
+                    logger.warning(
+                        "Startup stage failed",
+                        extra={"component": name, "critical": status.critical, "error": str(e),
+                               "error_type": type(e).__name__, "attempt": status.attempts,
+                               "retry_in": delay if retry else None}
+                    )
+                    if reraise:
+                        raise
+                    if not retry:
+                        break
+                else:
+                    status.state, status.error = READY, None
+                    break
+                finally:
+                    status.duration_ms = int((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_retry_delay)
+        finally:
+            self._done[name].set()
+
+        if status.state == READY:
+            logger.info(
+                "Startup stage ready",
+                extra={"component": name, "duration_ms": status.duration_ms}
+            )
+        return status.state == READY
+
+    async def wait(self, name: str) -> bool:
+        """Wait for a stage to finish; True when it succeeded."""
+        await self._done[name].wait()
+        return self._components[name].state == READY
+
+    def state(self, name: str) -> str:
+        return self._components[name].state
+
+    @property
+    def ready(self) -> bool:
+        """True once every critical component is ready."""
+        return all(c.state == READY for c in self._components.values() if c.critical)
+
+    def pending(self) -> list[str]:
+        return [name for name, c in self._components.items() if c.state == PENDING]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "components": {name: c.to_dict() for name, c in self._components.items()},
+        }
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime, timezone
+from typing import Literal
 
-from fastapi import APIRouter, Depends, Response, status
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi.responses import StreamingResponse
 
 from apps.api.dependencies import get_account_service
@@ -45,13 +44,24 @@ async def purge_history(
     return summary
 
 
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "zip": "application/zip",
+}
+
+
 @router.get("/export", response_class=StreamingResponse)
 async def export_account(
+    export_format: Literal["ndjson", "zip"] = Query(default="ndjson", alias="format"),
     current_user=Depends(get_current_user_with_collection_access),
     service: AccountService = Depends(get_account_service)
 ):
     """
-    Return a downloadable JSON export containing the user's data.
+    Stream a downloadable export of the user's data.
+
+    ``format=ndjson`` (default) returns one ``{"type": ..., "data": ...}``
+    object per line; ``format=zip`` returns the same lines deflated in
+    ``export.ndjson`` plus a ``manifest.json`` with record counts.
 
     Includes:
     - User profile
@@ -60,13 +70,11 @@ async def export_account(
     - Ingestion runs
     - Tool runs
     """
-    snapshot = await service.export_snapshot(current_user.id)
-
-    payload = jsonable_encoder(snapshot)
-    content = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
-    filename = f"youworker-export-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json"
+    chunks = await service.stream_export(current_user.id, export_format)
+    timestamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    filename = f"youworker-export-{timestamp}.{export_format}"
 
-    response = StreamingResponse(iter([content]), media_type="application/json")
+    response = StreamingResponse(chunks, media_type=EXPORT_MEDIA_TYPES[export_format])
     response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
 
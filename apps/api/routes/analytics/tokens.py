@@ -6,11 +6,10 @@ import logging
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select, and_
 
 from apps.api.auth.security import get_current_active_user
 from packages.db import get_async_session
-from packages.db.models import ChatSession, ChatMessage
+from packages.db.repositories import AnalyticsRepository
 
 logger = logging.getLogger(__name__)
 
@@ -23,41 +22,13 @@ async def get_tokens_timeline(
     days: int = Query(default=30, ge=1, le=365),
     interval: str = Query(default="day", pattern="^(hour|day|week)$"),
 ):
-    """Get token usage over time."""
+    """Get token usage over time (from the hourly/daily usage rollups)."""
     async with get_async_session() as db:
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        user_id = current_user.id
-
-        # Determine the date truncation based on interval
-        if interval == "hour":
-            date_trunc = func.date_trunc("hour", ChatMessage.created_at)
-        elif interval == "week":
-            date_trunc = func.date_trunc("week", ChatMessage.created_at)
-        else:  # day
-            date_trunc = func.date_trunc("day", ChatMessage.created_at)
-
-        query = (
-            select(
-                date_trunc.label("period"),
-                func.sum(ChatMessage.tokens_in).label("tokens_in"),
-                func.sum(ChatMessage.tokens_out).label("tokens_out"),
-                func.count(ChatMessage.id).label("message_count"),
-            )
-            .join(ChatSession)
-            .where(
-                and_(
-                    ChatSession.user_id == user_id,
-                    ChatMessage.created_at >= cutoff_date,
-                    ChatMessage.tokens_in.isnot(None),
-                )
-            )
-            .group_by("period")
-            .order_by("period")
+        rows = await AnalyticsRepository(db).get_token_timeline(
+            current_user.id, cutoff_date, interval
         )
 
-        result = await db.execute(query)
-        rows = result.all()
-
         return {
             "interval": interval,
             "data": [
@@ -118,6 +118,7 @@ class ToolEventRecorder:
                     latency_ms=latency_ms,
                     result_preview=(data.get("result_preview") or None),
                     tool_name=tool_name,
+                    cache_hit=tool_cache_hit(data),
                 )
         except Exception as exc:  # pragma: no cover - defensive logging
             self._logger.error(
@@ -132,6 +133,11 @@ class ToolEventRecorder:
         return data
 
 
+def tool_cache_hit(data: dict[str, Any]) -> bool | None:
+    """Map the ``cache`` field of a tool end event to the ``ToolRun.cache_hit`` flag."""
+    return {"hit": True, "miss": False}.get(data.get("cache"))
+
+
 def get_user_attr(user: Any, attr: str, default: Any | None = None) -> Any | None:
     """Safely extract an attribute from a user object or mapping."""
 
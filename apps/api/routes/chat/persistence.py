@@ -56,6 +56,7 @@ async def record_tool_end(
     latency_ms: int | None = None,
     result_preview: str | None = None,
     tool_name: str | None = None,
+    cache_hit: bool | None = None,
 ) -> None:
     """Record the end of a tool execution."""
     tool_repo = ToolRepository(db)
@@ -67,6 +68,7 @@ async def record_tool_end(
         result_preview=result_preview,
         error_message=None if status == "success" else result_preview,
         tool_name=tool_name,
+        cache_hit=cache_hit,
     )
 
 
@@ -2,7 +2,6 @@
 Streaming chat endpoint with Server-Sent Events.
 """
 
-import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, Request
@@ -12,6 +11,7 @@ from httpx import HTTPStatusError
 from apps.api.config import settings
 from apps.api.routes.deps import get_current_user_with_collection_access, get_chat_service
 from apps.api.utils.response_formatting import sse_format
+from apps.api.utils.token_coalescer import coalesce_tokens
 
 from .models import ChatRequest
 
@@ -59,7 +59,7 @@ async def chat_endpoint(
                 # Convert messages list to the format expected by send_message_streaming
                 messages_data = [{"role": msg.role, "content": msg.content} for msg in chat_request.messages]
 
-                async for event in chat_service.send_message_streaming(
+                events = chat_service.send_message_streaming(
                     user=current_user,
                     text_input=messages_data[-1]["content"] if messages_data else "",
                     session_id=chat_request.session_id or "default",
@@ -69,11 +69,12 @@ async def chat_endpoint(
                     expect_audio=chat_request.expect_audio,
                     disable_web=chat_request.disable_web,
                     max_iterations=settings.max_agent_iterations,
-                ):
+                )
+                # Merge per-chunk token events into frames flushed every few ms
+                async for event in coalesce_tokens(events):
                     pad = pad_pending
                     pad_pending = False
                     yield sse_format(event, pad=pad)
-                    await asyncio.sleep(0)
 
             except HTTPStatusError as e:
                 error_msg = f"Ollama error ({e.response.status_code}): {e.response.text.strip()}"
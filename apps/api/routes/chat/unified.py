@@ -2,7 +2,6 @@
 Unified chat endpoint supporting both text and audio input.
 """
 
-import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, Request
@@ -17,6 +16,7 @@ from apps.api.routes.deps import (
 )
 from apps.api.utils.error_handling import handle_audio_errors, handle_ollama_errors
 from apps.api.utils.response_formatting import sse_format
+from apps.api.utils.token_coalescer import coalesce_tokens
 from packages.agent import AgentLoop
 
 from .models import UnifiedChatRequest, UnifiedChatResponse
@@ -53,7 +53,7 @@ async def unified_chat_endpoint(
 
             try:
                 # Use ChatService for all business logic
-                async for event in chat_service.send_message_streaming(
+                events = chat_service.send_message_streaming(
                     user=current_user,
                     text_input=unified_request.text_input,
                     audio_b64=unified_request.audio_b64,
@@ -64,7 +64,8 @@ async def unified_chat_endpoint(
                     enable_tools=unified_request.enable_tools,
                     expect_audio=unified_request.expect_audio,
                     max_iterations=settings.max_agent_iterations,
-                ):
+                )
+                async for event in coalesce_tokens(events):
                     # Format event as SSE
                     pad = pad_pending
                     pad_pending = False
@@ -86,7 +87,6 @@ async def unified_chat_endpoint(
                         event["data"] = response.model_dump()
 
                     yield sse_format(event, pad=pad)
-                    await asyncio.sleep(0)
 
             except (HTTPStatusError, Exception) as e:
                 error_msg = (
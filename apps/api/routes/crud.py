@@ -22,6 +22,7 @@ from apps.api.dependencies import (
 )
 from apps.api.services import SessionService, DocumentService, AnalyticsService
 from packages.common.exceptions import ResourceNotFoundError
+from packages.db.pagination import Cursor
 
 logger = logging.getLogger(__name__)
 
@@ -45,17 +46,22 @@ def _extract_user_id(user) -> int:
 async def list_sessions(
     current_user=Depends(get_current_user_with_collection_access),
     limit: int = Query(default=50, le=100),
+    cursor: str | None = Query(default=None),
     session_service: SessionService = Depends(get_session_service),
 ):
-    """List user's chat sessions."""
+    """List user's chat sessions, most recently updated first.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page.
+    """
     user_id = _extract_user_id(current_user)
 
-    sessions = await session_service.list_sessions(
+    result = await session_service.list_sessions(
         user_id=user_id,
-        limit=limit
+        limit=limit,
+        after=Cursor.from_token(cursor)
     )
 
-    return {"sessions": sessions, "total": len(sessions)}
+    return result
 
 
 @router.get("/sessions/{session_id}")
@@ -145,16 +151,22 @@ async def list_documents(
     collection: str | None = Query(default=None),
     limit: int = Query(default=100, le=1000),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     document_service: DocumentService = Depends(get_document_service),
 ):
-    """List ingested documents."""
+    """List ingested documents, newest first.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page;
+    ``offset`` is still accepted for older clients.
+    """
     user_id = _extract_user_id(current_user)
 
     result = await document_service.list_documents(
         user_id=user_id,
         collection=collection,
         limit=limit,
-        offset=offset
+        offset=offset,
+        after=Cursor.from_token(cursor)
     )
 
     return result
@@ -185,15 +197,21 @@ async def list_ingestion_runs(
     current_user=Depends(get_current_user_with_collection_access),
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
 ):
-    """List ingestion run history."""
+    """List ingestion run history, newest first.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page;
+    ``offset`` is still accepted for older clients.
+    """
     user_id = _extract_user_id(current_user)
 
     result = await analytics_service.list_ingestion_runs(
         user_id=user_id,
         limit=limit,
-        offset=offset
+        offset=offset,
+        after=Cursor.from_token(cursor)
     )
 
     return result
@@ -226,15 +244,21 @@ async def list_tool_runs(
     current_user=Depends(get_current_user_with_collection_access),
     limit: int = Query(default=100, le=1000),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
 ):
-    """List tool execution logs."""
+    """List tool execution logs, newest first.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page;
+    ``offset`` is still accepted for older clients.
+    """
     user_id = _extract_user_id(current_user)
 
     result = await analytics_service.list_tool_runs(
         user_id=user_id,
         limit=limit,
-        offset=offset
+        offset=offset,
+        after=Cursor.from_token(cursor)
     )
 
     return result
@@ -2,6 +2,7 @@
 
 from fastapi import HTTPException, Request, Depends
 
+from apps.api.readiness import StartupReadiness
 from packages.agent import AgentLoop, MCPRegistry
 from packages.ingestion import IngestionPipeline
 from packages.llm import OllamaClient
@@ -46,6 +47,11 @@ def get_registry_optional(request: Request) -> MCPRegistry | None:
     return getattr(request.app.state, "registry", None)
 
 
+def get_readiness_optional(request: Request) -> StartupReadiness | None:
+    """Startup readiness tracker; None before the lifespan has started."""
+    return getattr(request.app.state, "readiness", None)
+
+
 def get_vector_store(request: Request) -> QdrantStore:
     """Return the vector store singleton."""
     return _get_state(request, "vector_store", "Vector store not initialized")
@@ -65,19 +71,22 @@ async def get_current_user_with_collection_access(
     This is a shared dependency used across multiple route modules.
     Returns the User object.
     """
+    from apps.api.auth.principal_cache import principal_cache
     from packages.db import get_async_session
     from packages.db.repositories import DocumentRepository
 
-    # Ensure root has access to default collection
+    # Ensure root has access to default collection (once per user, then memoised)
     try:
         from packages.vectorstore.schema import DEFAULT_COLLECTION
 
-        async with get_async_session() as db:
-            doc_repo = DocumentRepository(db)
-            await doc_repo.grant_user_collection_access(
-                user_id=current_user.id,
-                collection_name=DEFAULT_COLLECTION
-            )
+        if not principal_cache.has_grant(current_user.id, DEFAULT_COLLECTION):
+            async with get_async_session() as db:
+                doc_repo = DocumentRepository(db)
+                await doc_repo.grant_user_collection_access(
+                    user_id=current_user.id,
+                    collection_name=DEFAULT_COLLECTION
+                )
+            principal_cache.add_grant(current_user.id, DEFAULT_COLLECTION)
     except (AttributeError, ImportError, ValueError):
         # Silent fail - collection access is a nice-to-have
         pass
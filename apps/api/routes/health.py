@@ -6,6 +6,7 @@ import logging
 from typing import Any
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 
 from apps.api.audio_pipeline import (
     FW_AVAILABLE as STT_AVAILABLE,
@@ -14,10 +15,12 @@ from apps.api.audio_pipeline import (
 from apps.api.routes.deps import (
     get_agent_loop_optional,
     get_ollama_client_optional,
+    get_readiness_optional,
     get_registry_optional,
 )
 from apps.api.auth.security import get_current_user_optional
 from packages.common.health import get_aggregate_health
+from packages.common.whisper_engine import get_whisper_engine
 
 logger = logging.getLogger(__name__)
 
@@ -30,16 +33,18 @@ async def health_check(
     registry=Depends(get_registry_optional),
     ollama_client=Depends(get_ollama_client_optional),
     agent_loop=Depends(get_agent_loop_optional),
+    readiness=Depends(get_readiness_optional),
 ):
     """
     Health check endpoint with detailed component status.
 
     Returns overall health status and individual component health.
-    Status is 'degraded' if some MCP servers are unavailable.
+    Status is 'degraded' if some MCP servers are unavailable, and 'starting'
+    while a critical startup stage has not completed.
     """
     from apps.api.config import settings
 
-    mcp_status = {"healthy": [], "unhealthy": [], "total": 0}
+    mcp_status = {"healthy": [], "unhealthy": [], "total": 0, "saturated": [], "pools": {}}
 
     if registry:
         healthy_servers = registry.list_healthy_servers()
@@ -49,6 +54,14 @@ async def health_check(
         mcp_status["unhealthy"] = [s for s in all_servers if s not in healthy_servers]
         mcp_status["total"] = len(all_servers)
 
+        # Saturated pools have calls queueing for a connection slot
+        if hasattr(registry, "pool_stats"):
+            pools = registry.pool_stats()
+            mcp_status["pools"] = pools
+            mcp_status["saturated"] = [s for s, stats in pools.items() if stats["saturated"]]
+        if hasattr(registry, "cache_stats"):
+            mcp_status["tool_cache"] = registry.cache_stats()
+
     # Ollama model availability
     ollama_status: dict[str, Any] = {
         "base_url": settings.ollama_base_url,
@@ -89,22 +102,45 @@ async def health_check(
     if ollama_status["missing"]:
         overall_status = "degraded"
 
+    startup = readiness.snapshot() if readiness else {"ready": False, "components": {}}
+    if not startup["ready"]:
+        overall_status = "starting"
+
     return {
         "status": overall_status,
+        "ready": startup["ready"],
+        "startup": startup["components"],
         "components": {
             "mcp_servers": mcp_status,
             "voice": {
                 "mode": "turn_based",
                 "stt_available": STT_AVAILABLE,
                 "tts_available": TTS_AVAILABLE,
+                "whisper_engine": get_whisper_engine().stats(),
             },
-            "database": "connected",  # If we got here, DB is working
+            "database": (
+                "connected" if readiness and readiness.state("database") == "ready"
+                else "not_initialized"
+            ),
             "agent": "ready" if agent_loop else "not_initialized",
             "ollama": ollama_status,
         },
     }
 
 
+@router.get("/health/ready")
+async def readiness_check(readiness=Depends(get_readiness_optional)):
+    """
+    Readiness probe: 200 once critical components (the database) are up, 503 before.
+
+    Slow optional components (model warm-up, MCP discovery, ingestion
+    pipeline) are reported but do not hold back readiness; they are retried
+    in the background until they come up.
+    """
+    snapshot = readiness.snapshot() if readiness else {"ready": False, "components": {}}
+    return JSONResponse(status_code=200 if snapshot["ready"] else 503, content=snapshot)
+
+
 @router.get("/health/detailed")
 async def detailed_health_check():
     """
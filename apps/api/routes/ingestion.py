@@ -11,7 +11,11 @@ from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from apps.api.routes.deps import get_ingestion_service, get_current_user_with_collection_access
+from apps.api.routes.deps import (
+    get_current_user_with_collection_access,
+    get_ingestion_service,
+    get_registry_optional,
+)
 from apps.api.services import IngestionService
 
 
@@ -26,6 +30,14 @@ def _get_user_id(user) -> int:
 
 logger = logging.getLogger(__name__)
 
+
+def _invalidate_knowledge_cache(request: Request) -> None:
+    """New documents change knowledge search answers, so drop the cached ones."""
+    registry = get_registry_optional(request)
+    if registry is not None:
+        registry.invalidate_tool_cache(server_id="semantic")
+
+
 router = APIRouter(prefix="/v1")
 limiter = Limiter(key_func=get_remote_address)
 
@@ -73,6 +85,7 @@ async def ingest_endpoint(
             recursive=ingest_request.recursive,
             tags=ingest_request.tags,
         )
+        _invalidate_knowledge_cache(request)
 
         # Return formatted response
         return result.to_dict()
@@ -141,6 +154,7 @@ async def ingest_upload_endpoint(
             files=files,
             tags=tags,
         )
+        _invalidate_knowledge_cache(request)
 
         # Return formatted response
         return result.to_dict()
@@ -183,6 +183,36 @@ client.send({
 client.disconnect();
 ```
 
+## Binary Audio Frames
+
+Audio travels as binary WebSocket messages: a 12-byte little-endian header
+(version `1`, frame type `1` = audio / `2` = end of utterance, codec `0` =
+PCM16 / `1` = Opus in Ogg or WebM, channels, sample rate as uint32, sequence
+number as uint32) followed by the raw payload. See `apps/api/audio_frames.py`.
+JSON text messages stay in use for control, transcripts and text.
+
+## Voice Input
+
+1. Optionally send `{"type": "audio_start", "metadata": {...}}`; its metadata
+   (e.g. `expect_audio`, `language`) applies to the spoken turn.
+2. Send microphone chunks as audio frames while recording. They are
+   transcribed as they arrive and `transcript` messages with
+   `metadata.is_final = false` report partial text.
+3. Send an end-of-utterance frame (or `{"type": "audio_end"}`). The final
+   `transcript` message follows and the transcript is answered as a text message.
+
+The older `audio` JSON message with base64 `audio_data` is still accepted.
+
+## Voice Responses
+
+When a message is sent with `metadata.expect_audio = true`, the spoken
+answer is streamed while the text is still being generated. For every
+sentence the server sends an `audio` JSON message (`content` = sentence,
+`sample_rate`, `metadata.format = "pcm_s16le"`, `metadata.bytes`) followed by
+audio frames carrying that many bytes of mono PCM16 audio. An `audio` message
+with `metadata.is_final = true` ends the response. Clients must check
+`typeof event.data` before calling `JSON.parse`.
+
 ## Best Practices
 
 1. **Session State Management**
@@ -213,9 +243,12 @@ client.disconnect();
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
+import time
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
@@ -225,17 +258,28 @@ from pydantic import BaseModel, Field
 from apps.api.routes.deps import get_current_user_with_collection_access
 from apps.api.routes.deps import get_agent_loop
 from apps.api.websocket_manager import get_connection_manager
+from apps.api.utils.token_coalescer import coalesce_tokens
+from apps.api.audio_frames import (
+    AudioUpload,
+    FrameError,
+    FrameType,
+    decode_frame,
+    encode_frame,
+)
 from apps.api.audio_pipeline import (
+    create_speech_pipeline,
+    stream_transcribe_audio,
     transcribe_audio_pcm16,
     synthesize_speech,
 )
+from apps.api.tts_pipeline import SentenceSplitter, SpeechPipeline
 from packages.agent import AgentLoop
 from packages.db import get_async_session
 from packages.db.models import User
 from packages.llm import ChatMessage as LLMChatMessage
 
 from apps.api.routes.chat.models import UnifiedChatRequest, UnifiedChatResponse
-from apps.api.routes.chat.helpers import prepare_chat_messages
+from apps.api.routes.chat.helpers import prepare_chat_messages, tool_cache_hit
 from apps.api.routes.chat.persistence import (
     persist_last_user_message,
     record_tool_start,
@@ -249,11 +293,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 manager = get_connection_manager()
 
+# Size of binary PCM16 frames sent for voice responses (~0.2 s at 22.05 kHz)
+AUDIO_FRAME_BYTES = 8192
+
 
 class ChatMessageModel(BaseModel):
     """Enhanced chat message model for chat API."""
 
-    type: str  # "text", "audio", "system"
+    type: str  # "text", "audio", "audio_start", "audio_end", "system"
     content: str | None = None
     audio_data: str | None = None  # Base64 encoded audio
     sample_rate: int = Field(default=16000, ge=8000, le=48000)
@@ -335,6 +382,9 @@ async def websocket_chat_endpoint(
 
     # Register connection (tie to user from API key)
     connection_id = await manager.connect(websocket, user.id, session_id)
+    # Spoken turn currently being uploaded as binary frames
+    upload: AudioUpload | None = None
+    voice_turn: dict[str, Any] = {}
 
     try:
         # Send welcome message
@@ -350,15 +400,33 @@ async def websocket_chat_endpoint(
         # Handle messages
         while True:
             try:
-                # Receive message
-                data = await websocket.receive_text()
-                message = ChatMessageModel.model_validate_json(data)
+                # Receive message (JSON control/text or binary audio frame)
+                received = await websocket.receive()
+                if received["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(received.get("code", 1000))
+                if received.get("bytes") is not None:
+                    upload = await handle_audio_frame(
+                        connection_id, received["bytes"], upload, voice_turn, user, session_id
+                    )
+                    continue
+                message = ChatMessageModel.model_validate_json(received.get("text") or "")
 
                 # Process message based on type
                 if message.type == "text":
                     await handle_text_message(connection_id, message, user, session_id)
                 elif message.type == "audio":
                     await handle_audio_message(connection_id, message, user, session_id)
+                elif message.type == "audio_start":
+                    if upload is not None:
+                        upload.cancel()
+                        upload = None
+                    voice_turn = dict(message.metadata)
+                elif message.type == "audio_end":
+                    if upload is not None:
+                        await finish_audio_upload(
+                            connection_id, upload, voice_turn, user, session_id
+                        )
+                    upload, voice_turn = None, {}
                 elif message.type == "stop":
                     # Handle stop streaming request
                     logger.info("Stop request received", extra={"connection_id": connection_id})
@@ -403,6 +471,8 @@ async def websocket_chat_endpoint(
     except Exception as e:
         logger.error("WebSocket error", extra={"error": str(e), "error_type": type(e).__name__})
     finally:
+        if upload is not None:
+            upload.cancel()
         await manager.disconnect(connection_id)
 
 
@@ -493,41 +563,74 @@ async def handle_audio_message(
             message.sample_rate,
         )
 
-        transcript = transcript_result.get("text", "").strip()
-        if not transcript:
-            await manager.send_message(
-                connection_id,
-                {
-                    "type": "error",
-                    "content": "Could not transcribe audio",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                },
-            )
-            return
-
-        # Send transcript
+        await respond_to_transcript(
+            connection_id, transcript_result, message.metadata, user, session_id
+        )
+
+    except Exception as e:
+        logger.error("Error processing audio", extra={"error": str(e), "error_type": type(e).__name__})
         await manager.send_message(
             connection_id,
             {
-                "type": "transcript",
-                "content": transcript,
-                "metadata": {
-                    "confidence": transcript_result.get("confidence"),
-                    "language": transcript_result.get("language"),
-                },
+                "type": "error",
+                "content": f"Error processing audio: {str(e)}",
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
         )
 
-        # Process as text message
-        text_message = ChatMessageModel(
-            type="text",
-            content=transcript,
-            metadata=message.metadata,
+
+async def handle_audio_frame(
+    connection_id: str,
+    data: bytes,
+    upload: AudioUpload | None,
+    voice_turn: dict[str, Any],
+    user,
+    session_id: str,
+) -> AudioUpload | None:
+    """
+    Handle a binary audio frame of a spoken turn.
+
+    Audio frames stream into the recognizer while the user is still talking;
+    an end frame finishes the turn. Returns the upload still in progress.
+    """
+    try:
+        frame = decode_frame(data)
+    except FrameError as e:
+        await manager.send_message(
+            connection_id,
+            {
+                "type": "error",
+                "content": f"Invalid audio frame: {e}",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        return upload
+
+    if frame.type is FrameType.END:
+        if upload is not None:
+            await finish_audio_upload(connection_id, upload, voice_turn, user, session_id)
+        voice_turn.clear()
+        return None
+
+    if upload is None:
+        upload = AudioUpload(
+            partial(stream_transcribe_audio, language=voice_turn.get("language")),
+            partial(send_partial_transcript, connection_id),
+        )
+        await manager.send_message(
+            connection_id,
+            {
+                "type": "status",
+                "content": "Transcribing audio...",
+                "metadata": {"stage": "transcription"},
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
         )
-        await handle_text_message(connection_id, text_message, user, session_id)
 
+    try:
+        await upload.feed(frame)
     except Exception as e:
+        upload.cancel()
         logger.error("Error processing audio", extra={"error": str(e), "error_type": type(e).__name__})
         await manager.send_message(
             connection_id,
@@ -537,6 +640,107 @@ async def handle_audio_message(
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
         )
+        return None
+    return upload
+
+
+async def send_partial_transcript(connection_id: str, result: dict[str, Any]):
+    """Send an interim transcript while the user is still speaking."""
+    if result.get("is_final"):
+        return
+    await manager.send_message(
+        connection_id,
+        {
+            "type": "transcript",
+            "content": result.get("text", ""),
+            "metadata": {
+                "is_final": False,
+                "committed_text": result.get("committed_text"),
+                "tentative_text": result.get("tentative_text"),
+                "language": result.get("language"),
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+
+
+async def finish_audio_upload(
+    connection_id: str,
+    upload: AudioUpload,
+    voice_turn: dict[str, Any],
+    user,
+    session_id: str,
+):
+    """Finish a streamed spoken turn and answer its transcript."""
+    try:
+        transcript_result = await upload.finish()
+    except Exception as e:
+        logger.error("Error processing audio", extra={"error": str(e), "error_type": type(e).__name__})
+        await manager.send_message(
+            connection_id,
+            {
+                "type": "error",
+                "content": f"Error processing audio: {str(e)}",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        return
+
+    logger.info(
+        "Voice upload finished",
+        extra={
+            "connection_id": connection_id,
+            "frames": upload.frames_received,
+            "audio_bytes": upload.bytes_received,
+        },
+    )
+    await respond_to_transcript(
+        connection_id, transcript_result, dict(voice_turn), user, session_id
+    )
+
+
+async def respond_to_transcript(
+    connection_id: str,
+    transcript_result: dict[str, Any],
+    metadata: dict[str, Any],
+    user,
+    session_id: str,
+):
+    """Send the final transcript and answer it as a text message."""
+    transcript = (transcript_result.get("text") or "").strip()
+    if not transcript:
+        await manager.send_message(
+            connection_id,
+            {
+                "type": "error",
+                "content": "Could not transcribe audio",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        return
+
+    # Send transcript
+    await manager.send_message(
+        connection_id,
+        {
+            "type": "transcript",
+            "content": transcript,
+            "metadata": {
+                "is_final": True,
+                "confidence": transcript_result.get("confidence"),
+                "language": transcript_result.get("language"),
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+
+    # Process as text message
+    text_message = ChatMessageModel(
+        type="text",
+        content=transcript,
+        metadata=metadata,
+    )
+    await handle_text_message(connection_id, text_message, user, session_id)
 
 
 async def stream_agent_response(
@@ -563,15 +767,25 @@ async def stream_agent_response(
 
     collected_text = ""
     tool_events = []
+    splitter = SentenceSplitter()
+    speech: SpeechPipeline | None = None
+    speech_sender: asyncio.Task | None = None
 
     try:
+        if expect_audio:
+            # Sentences are synthesized and sent while the answer is still being generated
+            speech = await create_speech_pipeline()
+            speech_sender = asyncio.create_task(stream_audio_response(connection_id, speech))
+
         # Stream agent response
-        async for event in agent_loop.run_until_completion(
+        events = agent_loop.run_until_completion(
             messages=conversation,
             enable_tools=True,
             max_iterations=10,
             model="gpt-oss:20b",
-        ):
+        )
+        # Coalesce per-chunk tokens so each WebSocket message carries several of them
+        async for event in coalesce_tokens(events):
             event_type = event.get("event")
             data = event.get("data", {})
 
@@ -579,6 +793,10 @@ async def stream_agent_response(
                 # Stream text token
                 text = data.get("text", "")
                 collected_text += text
+                if speech is not None:
+                    # Never wait for TTS here: a full synthesis queue must not hold back text
+                    for sentence in splitter.feed(text):
+                        speech.feed(sentence)
 
                 await manager.send_message(
                     connection_id,
@@ -603,6 +821,7 @@ async def stream_agent_response(
                             "status": data.get("status"),
                             "args": data.get("args"),
                             "latency_ms": data.get("latency_ms"),
+                            "cache": data.get("cache"),
                         },
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                     },
@@ -632,6 +851,7 @@ async def stream_agent_response(
                             latency_ms=data.get("latency_ms"),
                             result_preview=data.get("result_preview"),
                             tool_name=data.get("tool"),
+                            cache_hit=tool_cache_hit(data),
                         )
 
             elif event_type == "done":
@@ -657,9 +877,15 @@ async def stream_agent_response(
                     },
                 )
 
-                # Generate audio if requested
-                if expect_audio and final_text:
-                    await stream_audio_response(connection_id, final_text)
+                # Finish the spoken response with whatever text is left
+                if speech is not None:
+                    if not collected_text and final_text:
+                        splitter.feed(final_text)
+                    for sentence in splitter.flush():
+                        speech.feed(sentence)
+                    await speech.close()
+                if speech_sender is not None:
+                    await speech_sender
 
                 # Send completion status
                 await manager.send_message(
@@ -684,10 +910,22 @@ async def stream_agent_response(
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
         )
+    finally:
+        if speech_sender is not None and not speech_sender.done():
+            if speech is not None:
+                speech.cancel()
+            speech_sender.cancel()
 
 
-async def stream_audio_response(connection_id: str, text: str):
-    """Stream audio response for TTS."""
+async def stream_audio_response(connection_id: str, speech: SpeechPipeline | None):
+    """
+    Stream a voice response sentence by sentence.
+
+    Each synthesized sentence is announced with an ``audio`` JSON message
+    (sentence text, sample rate, format and byte length) followed by its
+    PCM16 mono samples in binary audio frames. A final ``audio`` message with
+    ``is_final`` marks the end of the response.
+    """
     try:
         # Send audio generation status
         await manager.send_message(
@@ -700,24 +938,46 @@ async def stream_audio_response(connection_id: str, text: str):
             },
         )
 
-        # Generate audio (non-streaming for now)
-        audio_result = await synthesize_speech(text)
-        if audio_result:
-            wav_bytes, sample_rate = audio_result
-            # Encode as base64
-            audio_b64 = base64.b64encode(wav_bytes).decode("ascii")
-
-            # Send audio
-            await manager.send_message(
-                connection_id,
-                {
-                    "type": "audio",
-                    "audio_data": audio_b64,
-                    "sample_rate": sample_rate,
-                    "metadata": {"is_final": True},
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                },
-            )
+        if speech is not None:
+            started = time.perf_counter()
+            sentence_index = 0
+            frame_sequence = 0
+            async for sentence, pcm, sample_rate in speech.results():
+                if sentence_index == 0:
+                    logger.info(
+                        "First audio ready",
+                        extra={
+                            "connection_id": connection_id,
+                            "time_to_first_audio_ms": round((time.perf_counter() - started) * 1000),
+                        },
+                    )
+                await manager.send_message(
+                    connection_id,
+                    {
+                        "type": "audio",
+                        "content": sentence,
+                        "sample_rate": sample_rate,
+                        "metadata": {
+                            "format": "pcm_s16le",
+                            "channels": 1,
+                            "sentence_index": sentence_index,
+                            "bytes": len(pcm),
+                        },
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                    },
+                )
+                for offset in range(0, len(pcm), AUDIO_FRAME_BYTES):
+                    await manager.send_bytes(
+                        connection_id,
+                        encode_frame(
+                            FrameType.AUDIO,
+                            pcm[offset : offset + AUDIO_FRAME_BYTES],
+                            sample_rate=sample_rate,
+                            sequence=frame_sequence,
+                        ),
+                    )
+                    frame_sequence += 1
+                sentence_index += 1
 
         # Send audio completion
         await manager.send_message(
@@ -729,7 +989,12 @@ async def stream_audio_response(connection_id: str, text: str):
             },
         )
 
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
+        if speech is not None:
+            # Stop accepting sentences so the text stream is never blocked on a dead consumer
+            speech.cancel()
         logger.error("Error generating audio", extra={"error": str(e), "error_type": type(e).__name__})
         await manager.send_message(
             connection_id,
@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import AsyncIterator
 
+from apps.api.auth.principal_cache import invalidate_user
+from apps.api.utils.export_stream import ndjson_stream, zip_stream
 from packages.common.exceptions import ResourceNotFoundError
 from packages.db.repositories import UserRepository
 
@@ -37,6 +42,7 @@ class AccountService:
         """
         new_key = await self.user_repo.regenerate_api_key(user_id)
         await self.user_repo.commit()
+        invalidate_user(user_id)
 
         logger.info(
             "API key regenerated",
@@ -69,31 +75,58 @@ class AccountService:
 
         return summary
 
-    async def export_snapshot(self, user_id: int) -> dict:
+    async def stream_export(
+        self,
+        user_id: int,
+        export_format: str = "ndjson"
+    ) -> AsyncIterator[bytes]:
         """
-        Export all user data for GDPR compliance.
+        Export all user data for GDPR compliance as a byte stream.
+
+        Rows are read in keyset batches and encoded as they arrive, so the
+        export runs in constant memory. The user is looked up before this
+        returns, so a missing account fails before the response starts.
 
         Args:
             user_id: User ID
+            export_format: ``ndjson`` or ``zip``
 
         Returns:
-            Complete user data snapshot
+            Async iterator of encoded export chunks
 
         Raises:
             ResourceNotFoundError: If user not found
         """
-        snapshot = await self.user_repo.export_snapshot(user_id)
-
-        logger.info(
-            "Account export generated",
-            extra={
-                "user_id": user_id,
-                "sessions_count": len(snapshot.get("sessions", [])),
-                "documents_count": len(snapshot.get("documents", []))
-            }
-        )
+        records = self.user_repo.iter_export(user_id)
+        first = await anext(records)
+
+        async def with_first():
+            yield first
+            async for record in records:
+                yield record
+
+        encode = zip_stream if export_format == "zip" else ndjson_stream
+        counts: Counter[str] = Counter()
+        chunks = encode(with_first(), exported_at=datetime.now(timezone.utc), counts=counts)
+
+        async def logged():
+            bytes_sent = 0
+            async for chunk in chunks:
+                bytes_sent += len(chunk)
+                yield chunk
+            logger.info(
+                "Account export generated",
+                extra={
+                    "user_id": user_id,
+                    "format": export_format,
+                    "bytes": bytes_sent,
+                    "sessions_count": counts["session"],
+                    "messages_count": counts["message"],
+                    "documents_count": counts["document"]
+                }
+            )
 
-        return snapshot
+        return logged()
 
     async def delete_account(self, user_id: int) -> bool:
         """
@@ -116,6 +149,7 @@ class AccountService:
             )
 
         await self.user_repo.commit()
+        invalidate_user(user_id)
 
         logger.warning(
             "Account deleted",
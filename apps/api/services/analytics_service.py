@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 
 from packages.common.exceptions import ResourceNotFoundError
+from packages.db.pagination import Cursor, next_cursor
 from packages.db.repositories import ToolRepository, IngestionRepository
 
 logger = logging.getLogger(__name__)
@@ -32,7 +33,8 @@ class AnalyticsService:
         self,
         user_id: int,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Cursor | None = None
     ) -> dict:
         """
         List tool execution logs for a user.
@@ -40,7 +42,8 @@ class AnalyticsService:
         Args:
             user_id: User ID
             limit: Maximum number of runs
-            offset: Number of runs to skip
+            offset: Number of runs to skip (prefer ``after``)
+            after: Cursor returned as ``next_cursor`` by the previous page
 
         Returns:
             Tool runs list with metadata
@@ -48,8 +51,10 @@ class AnalyticsService:
         runs = await self.tool_repo.get_user_tool_runs(
             user_id=user_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after
         )
+        cursor = next_cursor(runs, "start_ts", limit)
 
         return {
             "runs": [
@@ -63,17 +68,20 @@ class AnalyticsService:
                     "args": r.args,
                     "error_message": r.error_message,
                     "result_preview": r.result_preview,
+                    "cache_hit": r.cache_hit,
                 }
                 for r in runs
             ],
             "total": len(runs),
+            "next_cursor": cursor.encode() if cursor else None,
         }
 
     async def list_ingestion_runs(
         self,
         user_id: int,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Cursor | None = None
     ) -> dict:
         """
         List ingestion run history for a user.
@@ -81,7 +89,8 @@ class AnalyticsService:
         Args:
             user_id: User ID
             limit: Maximum number of runs
-            offset: Number of runs to skip
+            offset: Number of runs to skip (prefer ``after``)
+            after: Cursor returned as ``next_cursor`` by the previous page
 
         Returns:
             Ingestion runs list with metadata
@@ -89,8 +98,10 @@ class AnalyticsService:
         runs = await self.ingestion_repo.get_user_ingestion_runs(
             user_id=user_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after
         )
+        cursor = next_cursor(runs, "started_at", limit)
 
         return {
             "runs": [
@@ -115,6 +126,7 @@ class AnalyticsService:
                 for r in runs
             ],
             "total": len(runs),
+            "next_cursor": cursor.encode() if cursor else None,
         }
 
     async def delete_ingestion_run(
@@ -21,7 +21,6 @@ from apps.api.audio_pipeline import (
 from packages.agent import AgentLoop
 from packages.llm import ChatMessage
 from packages.db.models import ChatSession
-from packages.parsers.media_transcriber import release_resources as release_whisper_resources
 
 from .base import BaseService
 from ..routes.chat.helpers import ToolEventRecorder, prepare_chat_messages, get_user_id
@@ -343,9 +342,6 @@ class ChatService(BaseService):
             ValueError: Invalid input
             RuntimeError: Processing errors
         """
-        # Unload ingestion Whisper model to free GPU memory for chat model
-        release_whisper_resources()
-
         # Unload embedding model to free GPU memory for chat model
         try:
             await self.agent_loop.ollama_client.unload_model(self.settings.embed_model)
@@ -516,9 +512,6 @@ class ChatService(BaseService):
             ValueError: Invalid input
             RuntimeError: Processing errors
         """
-        # Unload ingestion Whisper model to free GPU memory for chat model
-        release_whisper_resources()
-
         # Unload embedding model to free GPU memory for chat model
         try:
             await self.agent_loop.ollama_client.unload_model(self.settings.embed_model)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 
 from packages.common.exceptions import ResourceNotFoundError
+from packages.db.pagination import Cursor, next_cursor
 from packages.db.repositories import DocumentRepository
 
 logger = logging.getLogger(__name__)
@@ -27,16 +28,18 @@ class DocumentService:
         user_id: int,
         collection: str | None = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Cursor | None = None
     ) -> dict:
         """
-        List ingested documents for a user.
+        List ingested documents for a user, newest first.
 
         Args:
             user_id: User ID
             collection: Optional collection filter
             limit: Maximum number of documents
-            offset: Number of documents to skip
+            offset: Number of documents to skip (prefer ``after``)
+            after: Cursor returned as ``next_cursor`` by the previous page
 
         Returns:
             Documents list with metadata
@@ -45,8 +48,10 @@ class DocumentService:
             user_id=user_id,
             collection=collection,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after
         )
+        cursor = next_cursor(documents, "created_at", limit)
 
         def serialize_tags(doc) -> list[str]:
             tags = []
@@ -81,6 +86,7 @@ class DocumentService:
         return {
             "documents": documents_payload,
             "total": len(documents_payload),
+            "next_cursor": cursor.encode() if cursor else None,
         }
 
     async def delete_document(
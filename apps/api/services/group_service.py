@@ -11,6 +11,7 @@ from packages.common.exceptions import (
     ValidationError,
 )
 from packages.db.repositories import GroupRepository, UserRepository
+from packages.db.repositories.group_repository import GroupAccess
 
 logger = logging.getLogger(__name__)
 
@@ -69,9 +70,6 @@ class GroupService:
         )
         await self.group_repo.commit()
 
-        # Fetch group with members
-        group = await self.group_repo.get_by_id_with_members(group.id)
-
         logger.info(
             "Group created",
             extra={
@@ -81,7 +79,7 @@ class GroupService:
             }
         )
 
-        return self._to_response(group)
+        return self._to_response(group, member_count=1)
 
     async def get_group(self, group_id: int, user_id: int) -> dict:
         """
@@ -98,6 +96,10 @@ class GroupService:
             ResourceNotFoundError: If group not found
             AuthorizationError: If user is not a member
         """
+        # Authorize before loading the member list
+        access = await self.group_repo.get_access(group_id, user_id)
+        self._require_member(group_id, access)
+
         group = await self.group_repo.get_by_id_with_members(group_id)
         if not group:
             raise ResourceNotFoundError(
@@ -105,14 +107,6 @@ class GroupService:
                 code="GROUP_NOT_FOUND"
             )
 
-        # Check if user is a member
-        is_member = any(m.user_id == user_id for m in group.members)
-        if not is_member:
-            raise AuthorizationError(
-                "User is not a member of this group",
-                code="NOT_GROUP_MEMBER"
-            )
-
         return self._to_response_with_members(group)
 
     async def update_group(
@@ -139,9 +133,9 @@ class GroupService:
             AuthorizationError: If user is not admin
             ValidationError: If new name already exists
         """
-        # Check admin permission
-        is_admin = await self.group_repo.is_admin(user_id, group_id)
-        if not is_admin:
+        # Check admin permission (also counts the members for the response)
+        access = await self.group_repo.get_access(group_id, user_id)
+        if not access.requester_is_admin:
             raise AuthorizationError(
                 "Only group admins can update group details",
                 code="NOT_GROUP_ADMIN"
@@ -155,9 +149,6 @@ class GroupService:
         )
         await self.group_repo.commit()
 
-        # Fetch with members
-        group = await self.group_repo.get_by_id_with_members(group.id)
-
         logger.info(
             "Group updated",
             extra={
@@ -166,7 +157,7 @@ class GroupService:
             }
         )
 
-        return self._to_response(group)
+        return self._to_response(group, member_count=access.member_count)
 
     async def delete_group(self, group_id: int, user_id: int) -> bool:
         """
@@ -235,9 +226,12 @@ class GroupService:
             AuthorizationError: If requester is not admin
             ValidationError: If user is already a member
         """
-        # Check admin permission
-        is_admin = await self.group_repo.is_admin(requester_user_id, group_id)
-        if not is_admin:
+        # Check admin permission; this also caches whether the user to add is
+        # already a member, so add_member does not look it up again
+        access = await self.group_repo.get_access(
+            group_id, requester_user_id, user_id_to_add
+        )
+        if not access.requester_is_admin:
             raise AuthorizationError(
                 "Only group admins can add members",
                 code="NOT_GROUP_ADMIN"
@@ -299,26 +293,21 @@ class GroupService:
             ValidationError: If trying to remove the last admin
         """
         # Check admin permission
-        is_admin = await self.group_repo.is_admin(requester_user_id, group_id)
-        if not is_admin:
+        access = await self.group_repo.get_access(
+            group_id, requester_user_id, user_id_to_remove
+        )
+        if not access.requester_is_admin:
             raise AuthorizationError(
                 "Only group admins can remove members",
                 code="NOT_GROUP_ADMIN"
             )
 
         # Check if removing an admin - ensure at least one admin remains
-        is_removing_admin = await self.group_repo.is_admin(
-            user_id_to_remove,
-            group_id
-        )
-        if is_removing_admin:
-            members = await self.group_repo.get_members(group_id)
-            admin_count = sum(1 for m in members if m.role == "admin")
-            if admin_count <= 1:
-                raise ValidationError(
-                    "Cannot remove the last admin from the group",
-                    code="LAST_ADMIN"
-                )
+        if access.target_is_last_admin:
+            raise ValidationError(
+                "Cannot remove the last admin from the group",
+                code="LAST_ADMIN"
+            )
 
         # Remove member
         removed = await self.group_repo.remove_member(user_id_to_remove, group_id)
@@ -366,38 +355,30 @@ class GroupService:
             ValidationError: If trying to demote the last admin
         """
         # Check admin permission
-        is_admin = await self.group_repo.is_admin(requester_user_id, group_id)
-        if not is_admin:
+        access = await self.group_repo.get_access(
+            group_id, requester_user_id, user_id_to_update
+        )
+        if not access.requester_is_admin:
             raise AuthorizationError(
                 "Only group admins can update member roles",
                 code="NOT_GROUP_ADMIN"
             )
 
         # Check if demoting an admin to member - ensure at least one admin remains
-        if role == "member":
-            is_currently_admin = await self.group_repo.is_admin(
-                user_id_to_update,
-                group_id
+        if role == "member" and access.target_is_last_admin:
+            raise ValidationError(
+                "Cannot demote the last admin",
+                code="LAST_ADMIN"
             )
-            if is_currently_admin:
-                members = await self.group_repo.get_members(group_id)
-                admin_count = sum(1 for m in members if m.role == "admin")
-                if admin_count <= 1:
-                    raise ValidationError(
-                        "Cannot demote the last admin",
-                        code="LAST_ADMIN"
-                    )
-
-        # Update role
+
+        # Update role (the membership comes back with its user)
         membership = await self.group_repo.update_member_role(
             user_id=user_id_to_update,
             group_id=group_id,
             role=role
         )
         await self.group_repo.commit()
-
-        # Get user for username
-        user = await self.user_repo.get_by_id(user_id_to_update)
+        user = membership.user
 
         logger.info(
             "Member role updated",
@@ -426,8 +407,11 @@ class GroupService:
         Returns:
             List of group response data
         """
-        groups = await self.group_repo.get_user_groups(user_id)
-        return [self._to_response(group) for group in groups]
+        groups = await self.group_repo.get_user_groups_with_member_counts(user_id)
+        return [
+            self._to_response(group, member_count=member_count)
+            for group, member_count in groups
+        ]
 
     async def get_group_members(self, group_id: int, user_id: int) -> list[dict]:
         """
@@ -444,15 +428,11 @@ class GroupService:
             ResourceNotFoundError: If group not found
             AuthorizationError: If user is not a member
         """
-        # Check if user is a member
-        members = await self.group_repo.get_members(group_id)
-        is_member = any(m.user_id == user_id for m in members)
-        if not is_member:
-            raise AuthorizationError(
-                "User is not a member of this group",
-                code="NOT_GROUP_MEMBER"
-            )
+        # Authorize before loading the member list
+        access = await self.group_repo.get_access(group_id, user_id)
+        self._require_member(group_id, access)
 
+        members = await self.group_repo.get_members(group_id)
         return [
             {
                 "user_id": m.user_id,
@@ -463,7 +443,20 @@ class GroupService:
             for m in members
         ]
 
-    def _to_response(self, group) -> dict:
+    def _require_member(self, group_id: int, access: GroupAccess) -> None:
+        """Raise unless the group exists and the requester belongs to it."""
+        if not access.group_exists:
+            raise ResourceNotFoundError(
+                f"Group not found: {group_id}",
+                code="GROUP_NOT_FOUND"
+            )
+        if access.requester_role is None:
+            raise AuthorizationError(
+                "User is not a member of this group",
+                code="NOT_GROUP_MEMBER"
+            )
+
+    def _to_response(self, group, member_count: int) -> dict:
         """Convert group model to response dict."""
         return {
             "id": group.id,
@@ -471,12 +464,12 @@ class GroupService:
             "description": group.description,
             "created_at": group.created_at.isoformat(),
             "updated_at": group.updated_at.isoformat(),
-            "member_count": len(group.members) if hasattr(group, "members") else 0
+            "member_count": member_count
         }
 
     def _to_response_with_members(self, group) -> dict:
-        """Convert group model to response dict with members."""
-        response = self._to_response(group)
+        """Convert group model (members loaded) to response dict with members."""
+        response = self._to_response(group, member_count=len(group.members))
         response["members"] = [
             {
                 "user_id": m.user_id,
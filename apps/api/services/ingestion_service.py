@@ -228,6 +228,23 @@ class IngestionService(BaseService):
 
         return 0
 
+    @staticmethod
+    def _progress_logger(user_id: int):
+        """Progress callback logging each media item at 10% steps."""
+        reported: dict[str, int] = {}
+
+        def report(uri: str, fraction: float) -> None:
+            step = int(fraction * 10)
+            if step <= reported.get(uri, -1):
+                return
+            reported[uri] = step
+            logger.info(
+                "Ingestion progress",
+                extra={"uri": uri, "percent": step * 10, "user_id": user_id},
+            )
+
+        return report
+
     def _prepare_file_summaries(
         self, files: list[dict[str, Any]] | None
     ) -> tuple[list[dict[str, Any]], int]:
@@ -443,6 +460,7 @@ class IngestionService(BaseService):
                 from_web=from_web,
                 tags=sanitized_tags,
                 user_id=user_id,
+                progress=self._progress_logger(user_id),
             )
         except Exception as e:
             logger.error(
@@ -524,6 +542,7 @@ class IngestionService(BaseService):
                 from_web=False,
                 tags=sanitized_tags,
                 user_id=user_id,
+                progress=self._progress_logger(user_id),
             )
         except Exception as e:
             stack = traceback.format_exc()
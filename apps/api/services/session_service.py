@@ -23,6 +23,7 @@ def _normalize_message_content(content: str | None) -> str | None:
     return content
 
 from packages.common.exceptions import ResourceNotFoundError
+from packages.db.pagination import Cursor, next_cursor
 from packages.db.repositories import ChatRepository, ToolRepository
 
 logger = logging.getLogger(__name__)
@@ -49,24 +50,28 @@ class SessionService:
     async def list_sessions(
         self,
         user_id: int,
-        limit: int = 50
-    ) -> list[dict]:
+        limit: int = 50,
+        after: Cursor | None = None
+    ) -> dict:
         """
-        List user's chat sessions.
+        List user's chat sessions, most recently updated first.
 
         Args:
             user_id: User ID
             limit: Maximum number of sessions
+            after: Cursor returned as ``next_cursor`` by the previous page
 
         Returns:
-            List of session response data
+            Sessions list with the cursor of the next page
         """
         sessions = await self.chat_repo.get_user_sessions(
             user_id=user_id,
-            limit=limit
+            limit=limit,
+            after=after
         )
+        cursor = next_cursor(sessions, "updated_at", limit)
 
-        return [
+        sessions_payload = [
             {
                 "id": s.id,
                 "external_id": s.external_id,
@@ -79,6 +84,12 @@ class SessionService:
             for s in sessions
         ]
 
+        return {
+            "sessions": sessions_payload,
+            "total": len(sessions_payload),
+            "next_cursor": cursor.encode() if cursor else None,
+        }
+
     async def get_session(
         self,
         session_id: int,
@@ -143,6 +154,7 @@ class SessionService:
                 "status": tr.status,
                 "ts": tr.start_ts.isoformat(),
                 "latency_ms": tr.latency_ms,
+                "cache_hit": tr.cache_hit,
             }
             for tr in tool_runs
         ]
@@ -3,16 +3,21 @@ Startup and shutdown service for API initialization.
 Handles database, clients, and registry setup.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from typing import Any
 
 from fastapi import FastAPI
 
 from apps.api.config import settings
+from apps.api.readiness import StartupReadiness
 from packages.agent import MCPRegistry, AgentLoop
 from packages.common.exceptions import ConfigurationError
 from packages.db import init_db as init_database, get_async_session
+from packages.db.message_crypto import _get_message_fernet, get_message_crypto
+from packages.db.rollups import RollupAggregator
 from packages.ingestion import IngestionPipeline
 from packages.llm import OllamaClient
 from packages.vectorstore import QdrantStore
@@ -30,11 +35,12 @@ class StartupService:
         self.ingestion_pipeline: IngestionPipeline | None = None
         self.registry: MCPRegistry | None = None
         self.agent_loop: AgentLoop | None = None
+        self.rollup_aggregator: RollupAggregator | None = None
+        self.readiness = StartupReadiness()
+        self._startup_tasks: list[asyncio.Task] = []
 
     def _validate_encryption_config(self) -> None:
         """Validate that chat message encryption is properly configured."""
-        from packages.db.models import _get_message_fernet
-
         fernet = _get_message_fernet()
         if fernet is None:
             logger.critical(
@@ -79,6 +85,11 @@ class StartupService:
     async def initialize(self, app: FastAPI) -> None:
         """Initialize all services during startup."""
         logger.info("Starting up API service...")
+        self.readiness = StartupReadiness()
+        self.readiness.register("database", critical=True)
+        for name in ("models", "ingestion_pipeline", "mcp_servers"):
+            self.readiness.register(name)
+        app.state.readiness = self.readiness
 
         # CRITICAL: Validate encryption configuration before any operations
         logger.info("Validating encryption configuration...")
@@ -108,50 +119,16 @@ class StartupService:
                 }
             )
 
-        # Initialize database
-        logger.info("Initializing database...")
-        await init_database(settings)  # type: ignore
-        logger.info("Database initialized")
-
-        # Ensure root user API key hash matches configured value so Authentik headers validate
-        async with get_async_session() as db:
-            user_repo = UserRepository(db)
-            await user_repo.ensure_root_user(username="root", api_key=settings.root_api_key)
-        logger.info("Root user synchronized with configured API key")
-
-        # Initialize Ollama client
-        logger.info("Initializing Ollama client...")
+        # Cheap clients first: none of these touch the network when created
         self.ollama_client = OllamaClient(
             base_url=settings.ollama_base_url,
             auto_pull=settings.ollama_auto_pull,
         )
-        logger.info("Ollama client initialized")
-
-        # Preload startup models (gpt-oss:20b on GPU, STT in system RAM)
-        logger.info("Preloading startup models...")
-        try:
-            from packages.llm.model_manager import get_model_manager
-            model_manager = await get_model_manager()
-            await model_manager.ensure_startup_models_loaded()
-            logger.info("✓ Startup models preloaded (chat model on GPU)")
-        except Exception as e:
-            logger.warning(
-                "Failed to preload startup models",
-                extra={"error": str(e), "error_type": type(e).__name__}
-            )
-            # Continue anyway - models will load on first use
-
-        # Initialize vector store
-        logger.info("Initializing vector store...")
         self.vector_store = QdrantStore(
             url=settings.qdrant_url,
             embedding_dim=settings.embedding_dim,
             default_collection=settings.qdrant_collection,
         )
-        logger.info("Vector store initialized")
-
-        # Initialize ingestion pipeline
-        self.ingestion_pipeline = IngestionPipeline(settings=settings)  # type: ignore
 
         # Parse MCP server URLs
         logger.info("Parsing MCP server URLs...")
@@ -194,76 +171,137 @@ class StartupService:
             extra={"mcp_servers": mcp_server_configs, "count": len(mcp_server_configs)}
         )
 
-        # Initialize MCP registry
-        self.registry = MCPRegistry(server_configs=mcp_server_configs)
-
-        # Connect to all MCP servers and discover tools
-        logger.info("About to connect to MCP servers...")
-        try:
-            await self.registry.connect_all()
-            logger.info(
-                "Connected to MCP servers",
-                extra={"server_count": len(self.registry.clients)}
-            )
+        # Initialize MCP registry (tools are discovered in the background)
+        self.registry = MCPRegistry(
+            server_configs=mcp_server_configs,
+            pool_size=settings.mcp_pool_size,
+            max_in_flight_per_connection=settings.mcp_max_in_flight_per_connection,
+            heartbeat_interval=settings.mcp_heartbeat_interval,
+            tool_cache_size=settings.mcp_tool_cache_size,
+        )
 
-            # Persist MCP servers and tools on refresh
-            async def persist_registry(tools: dict[str, Any], clients: dict[str, Any]):
-                from packages.db import get_async_session
-                from packages.db.repositories import MCPRepository
-
-                async with get_async_session() as db:
-                    mcp_repo = MCPRepository(db)
-
-                    # Servers
-                    servers = []
-                    for sid, client in clients.items():
-                        servers.append(
-                            (
-                                sid,
-                                client.ws_url.replace("ws://", "http://").replace("wss://", "https://"),
-                                client.is_healthy,
-                            )
+        # Persist MCP servers and tools whenever discovery sees a change
+        async def persist_registry(tools: dict[str, Any], clients: dict[str, Any]):
+            from packages.db import get_async_session
+
+            if not await self.readiness.wait("database"):
+                return
+            from packages.db.repositories import MCPRepository
+
+            async with get_async_session() as db:
+                mcp_repo = MCPRepository(db)
+
+                # Servers
+                servers = []
+                for sid, client in clients.items():
+                    servers.append(
+                        (
+                            sid,
+                            client.ws_url.replace("ws://", "http://").replace("wss://", "https://"),
+                            client.is_healthy,
                         )
-                    smap = await mcp_repo.upsert_mcp_servers(servers)
-
-                    # Tools
-                    tool_rows = []
-                    for qname, tool in tools.items():
-                        tool_rows.append((tool.server_id, qname, tool.description, tool.input_schema))
-                    await mcp_repo.upsert_tools(smap, tool_rows)
-
-            self.registry.set_refreshed_callback(persist_registry)
-            # Trigger initial persist now
-            await persist_registry(self.registry.tools, self.registry.clients)
-            # Start periodic refresh of tools
-            refresh_interval = max(0, settings.mcp_refresh_interval)
-            await self.registry.start_periodic_refresh(interval_seconds=refresh_interval)
-        except (ConnectionError, TimeoutError, OSError) as e:
-            logger.error(
-                "Failed to connect to MCP servers",
-                extra={"error": str(e), "error_type": type(e).__name__}
-            )
-            # Continue anyway - some servers may be unavailable
+                    )
+                smap = await mcp_repo.upsert_mcp_servers(servers)
 
-        # Initialize agent loop
+                # Tools
+                tool_rows = []
+                for qname, tool in tools.items():
+                    tool_rows.append((tool.server_id, qname, tool.description, tool.input_schema))
+                await mcp_repo.upsert_tools(smap, tool_rows)
+
+        self.registry.set_refreshed_callback(persist_registry)
+
+        # Initialize agent loop; it offers whatever tools have been discovered so far
         self.agent_loop = AgentLoop(
             ollama_client=self.ollama_client,
             registry=self.registry,
             model=settings.chat_model,
         )
 
-        # Attach to app state
+        # Attach to app state (the ingestion pipeline once its stage completes)
         app.state.ollama_client = self.ollama_client
         app.state.vector_store = self.vector_store
-        app.state.ingestion_pipeline = self.ingestion_pipeline
         app.state.registry = self.registry
         app.state.agent_loop = self.agent_loop
 
-        logger.info("API service ready")
+        # Optional components come up in the background, retried until they
+        # succeed; the database is awaited
+        for name, stage in (
+            ("models", self._warm_up_models),
+            ("ingestion_pipeline", lambda: self._init_ingestion_pipeline(app)),
+            ("mcp_servers", self._connect_mcp_servers),
+        ):
+            self._startup_tasks.append(
+                asyncio.create_task(
+                    self.readiness.run(name, stage, retry=True), name=f"startup-{name}"
+                )
+            )
+
+        try:
+            await self.readiness.run("database", self._init_database, reraise=True)
+        except BaseException:
+            await self._cancel_startup_tasks()
+            raise
+
+        logger.info(
+            "API service ready",
+            extra={"starting_in_background": self.readiness.pending()}
+        )
+
+    async def _init_database(self) -> None:
+        logger.info("Initializing database...")
+        await init_database(settings)  # type: ignore
+
+        # Ensure root user API key hash matches configured value so Authentik headers validate
+        async with get_async_session() as db:
+            user_repo = UserRepository(db)
+            await user_repo.ensure_root_user(username="root", api_key=settings.root_api_key)
+        logger.info("Root user synchronized with configured API key")
+
+        # Keep the analytics rollups read by the dashboard up to date
+        self.rollup_aggregator = RollupAggregator(
+            interval=settings.analytics_rollup_interval,
+            settle=timedelta(minutes=settings.analytics_rollup_settle_minutes),
+        )
+        await self.rollup_aggregator.start()
+
+    async def _warm_up_models(self) -> None:
+        """Preload startup models (chat model on GPU, STT in system RAM); others load on first use."""
+        from packages.llm.model_manager import get_model_manager
+
+        model_manager = await get_model_manager()
+        await model_manager.ensure_startup_models_loaded()
+
+    async def _init_ingestion_pipeline(self, app: FastAPI) -> None:
+        # The constructor makes blocking Qdrant calls, including creating the
+        # collection; it is the only startup stage that touches Qdrant
+        self.ingestion_pipeline = await asyncio.to_thread(
+            IngestionPipeline, settings=settings  # type: ignore
+        )
+        app.state.ingestion_pipeline = self.ingestion_pipeline
+
+    async def _connect_mcp_servers(self) -> None:
+        """Connect to all MCP servers and discover tools (persisted by the refreshed callback)."""
+        await self.registry.connect_all()
+        logger.info(
+            "Connected to MCP servers",
+            extra={"server_count": len(self.registry.clients)}
+        )
+        refresh_interval = max(0, settings.mcp_refresh_interval)
+        await self.registry.start_periodic_refresh(interval_seconds=refresh_interval)
+
+    async def _cancel_startup_tasks(self) -> None:
+        for task in self._startup_tasks:
+            task.cancel()
+        await asyncio.gather(*self._startup_tasks, return_exceptions=True)
+        self._startup_tasks.clear()
 
     async def shutdown(self, app: FastAPI) -> None:
         """Clean up resources during shutdown."""
         logger.info("Shutting down API service...")
+        await self._cancel_startup_tasks()
+        if self.rollup_aggregator:
+            await self.rollup_aggregator.stop()
         if self.ollama_client:
             await self.ollama_client.close()
         if self.registry:
@@ -271,3 +309,4 @@ class StartupService:
             await self.registry.close_all()
         if self.vector_store:
             await self.vector_store.close()
+        get_message_crypto().shutdown()
@@ -0,0 +1,306 @@
+"""
+Incremental streaming speech recognition.
+
+Audio is appended to a preallocated ring buffer at Whisper's sample rate and
+decoded on a fixed stride over a bounded window that starts at the end of the
+already-committed transcript. Consecutive hypotheses are compared word by word
+(LocalAgreement-2): the longest prefix two decodes agree on is committed and
+never decoded again, the remainder is reported as tentative text. Per-stride
+cost is bounded by the window length, so a long dictation costs roughly
+linear time instead of re-decoding the whole utterance on every chunk.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import numpy as np
+
+# Tolerance when matching word timestamps against the committed boundary
+_TIME_EPSILON = 0.1
+# Longest n-gram checked when removing words repeated across the window overlap
+_MAX_OVERLAP_NGRAM = 5
+
+_NORMALIZE_RE = re.compile(r"[^\w']+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class Word:
+    """A recognised word with absolute start/end times in seconds."""
+
+    start: float
+    end: float
+    text: str
+
+    @property
+    def key(self) -> str:
+        return _NORMALIZE_RE.sub("", self.text.lower())
+
+
+@dataclass
+class DecodeResult:
+    """Output of one decode pass over a window (times relative to the window start)."""
+
+    words: list[Word]
+    language: str | None = None
+    confidence: float | None = None
+
+
+Decoder = Callable[[np.ndarray, str], DecodeResult]
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity float32 ring buffer addressed by absolute sample index.
+
+    Old audio is overwritten once capacity is exceeded; ``read`` only returns
+    samples that are still held.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, int(capacity))
+        self._data = np.zeros(self.capacity, dtype=np.float32)
+        self.total = 0  # absolute index one past the newest sample
+
+    @property
+    def start(self) -> int:
+        """Absolute index of the oldest sample still held."""
+        return max(0, self.total - self.capacity)
+
+    def write(self, samples: np.ndarray) -> None:
+        samples = np.asarray(samples, dtype=np.float32)
+        if samples.size > self.capacity:
+            self.total += samples.size - self.capacity
+            samples = samples[-self.capacity :]
+        count = samples.size
+        if count == 0:
+            return
+        pos = self.total % self.capacity
+        first = min(count, self.capacity - pos)
+        self._data[pos : pos + first] = samples[:first]
+        if first < count:
+            self._data[: count - first] = samples[first:]
+        self.total += count
+
+    def read(self, begin: int, end: int | None = None) -> np.ndarray:
+        """Copy samples in ``[begin, end)`` (clamped to what is still buffered)."""
+        end = self.total if end is None else min(end, self.total)
+        begin = max(begin, self.start)
+        if end <= begin:
+            return np.zeros(0, dtype=np.float32)
+        lo = begin % self.capacity
+        count = end - begin
+        if lo + count <= self.capacity:
+            return self._data[lo : lo + count].copy()
+        first = self.capacity - lo
+        return np.concatenate((self._data[lo:], self._data[: count - first]))
+
+    def clear(self) -> None:
+        self.total = 0
+
+
+class LocalAgreement:
+    """Commit the longest word prefix on which two consecutive hypotheses agree."""
+
+    def __init__(self) -> None:
+        self.committed: list[Word] = []
+        self._previous: list[Word] = []
+        self.committed_until = 0.0
+
+    @property
+    def tentative(self) -> list[Word]:
+        return list(self._previous)
+
+    def _trim(self, words: list[Word]) -> list[Word]:
+        """Drop words that belong to the already-committed part of the audio."""
+        fresh = [w for w in words if w.start > self.committed_until - _TIME_EPSILON]
+        if fresh and self.committed and abs(fresh[0].start - self.committed_until) < 1.0:
+            # Whisper often repeats the last committed words at the start of the window.
+            max_n = min(len(self.committed), len(fresh), _MAX_OVERLAP_NGRAM)
+            for n in range(max_n, 0, -1):
+                tail = [w.key for w in self.committed[-n:]]
+                head = [w.key for w in fresh[:n]]
+                if tail == head:
+                    fresh = fresh[n:]
+                    break
+        return fresh
+
+    def insert(self, words: list[Word]) -> list[Word]:
+        """Feed a new hypothesis and return the words newly committed by it."""
+        current = self._trim(words)
+        agreed: list[Word] = []
+        for new, old in zip(current, self._previous):
+            if new.key != old.key:
+                break
+            agreed.append(new)
+        self._commit(agreed)
+        self._previous = current[len(agreed) :]
+        return agreed
+
+    def flush(self) -> list[Word]:
+        """Commit everything still tentative (end of utterance or forced)."""
+        pending = self._previous
+        self._commit(pending)
+        self._previous = []
+        return pending
+
+    def _commit(self, words: list[Word]) -> None:
+        if words:
+            self.committed.extend(words)
+            self.committed_until = words[-1].end
+
+    def reset(self) -> None:
+        self.committed = []
+        self._previous = []
+        self.committed_until = 0.0
+
+
+def join_words(words: list[Word]) -> str:
+    return " ".join(w.text.strip() for w in words if w.text.strip())
+
+
+@dataclass
+class StreamingStats:
+    decodes: int = 0
+    decoded_seconds: float = 0.0
+    decode_time: float = 0.0
+    audio_seconds: float = 0.0
+    partial_latencies: list[float] = field(default_factory=list)
+
+    @property
+    def real_time_factor(self) -> float:
+        return self.decode_time / self.audio_seconds if self.audio_seconds else 0.0
+
+
+class StreamingRecognizer:
+    """
+    Sliding-window recognizer with committed-prefix stabilisation.
+
+    Args:
+        decode: Runs the ASR model over a window of 16 kHz float32 audio, with
+            the committed text passed as prompt, returning words whose times
+            are relative to the window start.
+        sample_rate: Sample rate of audio passed to ``add_audio``.
+        stride_s: Minimum new audio between two decodes.
+        max_window_s: Longest window ever decoded. When the uncommitted audio
+            outgrows it, the tentative hypothesis is force-committed so both
+            decode cost and finalisation latency stay bounded.
+        overlap_s: Audio before the committed boundary included in each window
+            as acoustic context.
+    """
+
+    def __init__(
+        self,
+        decode: Decoder,
+        *,
+        sample_rate: int = 16000,
+        stride_s: float = 1.0,
+        max_window_s: float = 12.0,
+        overlap_s: float = 0.5,
+        prompt_chars: int = 200,
+    ) -> None:
+        self.decode = decode
+        self.sample_rate = sample_rate
+        self.stride = max(1, int(stride_s * sample_rate))
+        self.max_window = max(self.stride, int(max_window_s * sample_rate))
+        self.overlap = max(0, int(overlap_s * sample_rate))
+        self.prompt_chars = prompt_chars
+        self.buffer = AudioRingBuffer(self.max_window + self.overlap + 2 * self.stride)
+        self.agreement = LocalAgreement()
+        self.stats = StreamingStats()
+        self.language: str | None = None
+        self.confidence: float | None = None
+        self._last_decode_at = 0
+        self._utterance_start = 0
+        self._floor = 0
+
+    @property
+    def pending_samples(self) -> int:
+        return self.buffer.total - self._last_decode_at
+
+    def add_audio(self, samples: np.ndarray) -> None:
+        self.buffer.write(samples)
+        self.stats.audio_seconds += len(samples) / self.sample_rate
+
+    def ready(self) -> bool:
+        """True once at least one stride of undecoded audio is buffered."""
+        return self.pending_samples >= self.stride
+
+    def step(self, *, final: bool = False) -> dict[str, Any] | None:
+        """
+        Decode the current window and update the committed prefix.
+
+        Returns a result dict (``text``, ``committed_text``, ``tentative_text``,
+        ``language``, ``confidence``, ``is_final``) or ``None`` when there is
+        nothing to decode.
+        """
+        committed_sample = self._utterance_start + int(
+            self.agreement.committed_until * self.sample_rate
+        )
+        window_begin = max(committed_sample - self.overlap, self._floor, self.buffer.start)
+        window_end = min(self.buffer.total, window_begin + self.max_window)
+        forced = window_end < self.buffer.total
+
+        audio = self.buffer.read(window_begin, window_end)
+        self._last_decode_at = window_end
+        if audio.size == 0 and not final:
+            return None
+
+        if audio.size:
+            started = time.perf_counter()
+            result = self.decode(audio, self._prompt())
+            elapsed = time.perf_counter() - started
+            self.stats.decodes += 1
+            self.stats.decoded_seconds += audio.size / self.sample_rate
+            self.stats.decode_time += elapsed
+            self.stats.partial_latencies.append(elapsed + self.stride / self.sample_rate)
+            self.language = result.language or self.language
+            if result.confidence is not None:
+                self.confidence = result.confidence
+
+            offset = (window_begin - self._utterance_start) / self.sample_rate
+            self.agreement.insert(
+                [Word(w.start + offset, w.end + offset, w.text) for w in result.words]
+            )
+        if final or forced:
+            self.agreement.flush()
+        if forced:
+            # Never re-enter audio a forced pass already gave up on, even if it held no words.
+            self._floor = max(window_begin + 1, window_end - self.overlap)
+
+        committed = join_words(self.agreement.committed)
+        tentative = join_words(self.agreement.tentative)
+        return {
+            "text": " ".join(part for part in (committed, tentative) if part),
+            "committed_text": committed,
+            "tentative_text": tentative,
+            "language": self.language,
+            "confidence": self.confidence,
+            "is_final": final,
+        }
+
+    def finish(self) -> dict[str, Any] | None:
+        """Flush the utterance and start a new one (buffered audio is discarded)."""
+        result = None
+        if self.buffer.total > self._utterance_start:
+            result = self.step(final=True)
+            # A backlog longer than one window is decoded in window-sized passes.
+            while self._last_decode_at < self.buffer.total:
+                result = self.step(final=True)
+        self.reset()
+        return result
+
+    def reset(self) -> None:
+        self.agreement.reset()
+        self._utterance_start = self.buffer.total
+        self._floor = self.buffer.total
+        self._last_decode_at = self.buffer.total
+        self.language = None
+        self.confidence = None
+
+    def _prompt(self) -> str:
+        text = join_words(self.agreement.committed)
+        return text[-self.prompt_chars :] if self.prompt_chars > 0 else ""
@@ -0,0 +1,192 @@
+"""
+Sentence-pipelined speech synthesis.
+
+``SentenceSplitter`` cuts a streamed answer into speakable sentences as tokens
+arrive, and ``SpeechPipeline`` synthesizes those sentences concurrently on a
+worker pool while handing the audio back strictly in order. Together they let
+voice responses start playing after the first sentence instead of after the
+whole answer has been generated and synthesized.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from concurrent.futures import Executor
+from typing import AsyncIterator, Callable
+
+logger = logging.getLogger(__name__)
+
+# Sentence end punctuation (optionally followed by closing quotes/brackets) or a
+# line break, followed by whitespace.
+_BOUNDARY_RE = re.compile(r"(?:[.!?…]+[\"'”’)\]]*|[;:]|\n)\s+")
+_CODE_FENCE = "```"
+
+_END = object()
+
+
+class SentenceSplitter:
+    """
+    Incrementally split streamed text into sentences.
+
+    Fragments shorter than ``min_chars`` are merged with the next sentence so
+    the synthesizer is not fed single words, and text without any boundary is
+    cut at a word break once it exceeds ``max_chars``. Fenced code blocks are
+    never split.
+    """
+
+    def __init__(self, *, min_chars: int = 30, max_chars: int = 300) -> None:
+        self.min_chars = max(1, min_chars)
+        self.max_chars = max(self.min_chars, max_chars)
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        """Add streamed text and return any sentences that are now complete."""
+        self._buffer += text
+        sentences: list[str] = []
+        while True:
+            sentence = self._next_sentence()
+            if sentence is None:
+                return sentences
+            if sentence.strip():
+                sentences.append(sentence.strip())
+
+    def flush(self) -> list[str]:
+        """Return whatever text is left at the end of the stream."""
+        rest, self._buffer = self._buffer.strip(), ""
+        return [rest] if rest else []
+
+    def _next_sentence(self) -> str | None:
+        searchable = self._buffer
+        if searchable.count(_CODE_FENCE) % 2:
+            # Inside an open code block: only text before the fence may be emitted.
+            searchable = searchable[: searchable.rfind(_CODE_FENCE)]
+
+        for match in _BOUNDARY_RE.finditer(searchable):
+            if not self._outside_code(match.start()):
+                continue
+            if len(searchable[: match.end()].strip()) >= self.min_chars:
+                return self._take(match.end())
+
+        if len(searchable) > self.max_chars and self._outside_code(self.max_chars):
+            cut = searchable.rfind(" ", 0, self.max_chars)
+            return self._take(cut + 1 if cut > 0 else self.max_chars)
+        return None
+
+    def _outside_code(self, position: int) -> bool:
+        return self._buffer.count(_CODE_FENCE, 0, position) % 2 == 0
+
+    def _take(self, end: int) -> str:
+        sentence, self._buffer = self._buffer[:end], self._buffer[end:]
+        return sentence
+
+
+class SpeechPipeline:
+    """
+    Synthesize sentences concurrently and yield their audio in submission order.
+
+    Args:
+        synthesize: Blocking function returning ``(pcm16_bytes, sample_rate)``
+            for a sentence, or ``None`` to skip it.
+        executor: Worker pool the synthesizer runs on.
+        max_pending: Sentences queued or in flight before ``submit`` waits.
+
+    Producers that must not wait (a token stream being forwarded to the
+    client) use ``feed`` instead of ``submit``: sentences go to an unbounded
+    backlog of text, and a feeder task submits them as slots free up, so only
+    ``max_pending`` syntheses are ever outstanding.
+    """
+
+    def __init__(
+        self,
+        synthesize: Callable[[str], tuple[bytes, int] | None],
+        *,
+        executor: Executor | None = None,
+        max_pending: int = 4,
+    ) -> None:
+        self._synthesize = synthesize
+        self._executor = executor
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_pending))
+        self._backlog: asyncio.Queue = asyncio.Queue()
+        self._feeder: asyncio.Task | None = None
+        self._closed = False
+
+    async def submit(self, sentence: str) -> None:
+        """
+        Start synthesizing ``sentence``; waits while ``max_pending`` are outstanding.
+
+        Sentences submitted after ``close`` or ``cancel`` are ignored.
+        """
+        if self._closed:
+            return
+        await self._start(sentence)
+
+    def feed(self, sentence: str) -> None:
+        """
+        Queue ``sentence`` for synthesis without waiting.
+
+        Fed sentences are synthesized in order, after any submitted earlier.
+        Sentences fed after ``close`` or ``cancel`` are ignored.
+        """
+        if self._closed:
+            return
+        if self._feeder is None:
+            self._feeder = asyncio.get_running_loop().create_task(self._feed_backlog())
+        self._backlog.put_nowait(sentence)
+
+    async def close(self) -> None:
+        """Signal that no more sentences will be submitted; fed sentences are still spoken."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._feeder is not None:
+            self._backlog.put_nowait(_END)
+            await asyncio.gather(self._feeder, return_exceptions=True)
+        await self._queue.put(_END)
+
+    async def _start(self, sentence: str) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, self._synthesize, sentence)
+        try:
+            await self._queue.put((sentence, future))
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    async def _feed_backlog(self) -> None:
+        while True:
+            sentence = await self._backlog.get()
+            if sentence is _END:
+                return
+            await self._start(sentence)
+
+    async def results(self) -> AsyncIterator[tuple[str, bytes, int]]:
+        """Yield ``(sentence, pcm16_bytes, sample_rate)`` in submission order."""
+        while True:
+            item = await self._queue.get()
+            if item is _END:
+                return
+            sentence, future = item
+            try:
+                audio = await future
+            except Exception as exc:
+                logger.warning(
+                    "Sentence synthesis failed",
+                    extra={"error": str(exc), "error_type": type(exc).__name__},
+                )
+                continue
+            if audio and audio[0]:
+                yield sentence, audio[0], audio[1]
+
+    def cancel(self) -> None:
+        """Drop queued sentences; synthesis already running on a worker finishes on its own."""
+        self._closed = True
+        if self._feeder is not None:
+            self._feeder.cancel()
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _END:
+                item[1].cancel()
+        # Wake up a consumer blocked in ``results``
+        self._queue.put_nowait(_END)
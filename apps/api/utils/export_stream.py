@@ -0,0 +1,143 @@
+"""
+Streaming encoders for account exports.
+
+``UserRepository.iter_export`` yields ``(record_type, record)`` pairs as rows
+come out of the database. The encoders here turn that stream into response
+chunks without materialising the export: NDJSON writes one
+``{"type": ..., "data": ...}`` object per line, ZIP deflates the same lines
+into ``export.ndjson`` and appends a ``manifest.json`` with record counts.
+Output is buffered into chunks of roughly ``chunk_bytes`` so a large export is
+not sent as one socket write per row.
+"""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from collections import Counter
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+from fastapi.encoders import jsonable_encoder
+
+EXPORT_FORMAT_VERSION = 1
+DEFAULT_CHUNK_BYTES = 64 * 1024
+
+Records = AsyncIterator[tuple[str, dict[str, Any]]]
+
+
+def encode_record(record_type: str, record: dict[str, Any]) -> bytes:
+    """Encode one export record as an NDJSON line."""
+    line = json.dumps(
+        {"type": record_type, "data": record},
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=jsonable_encoder,
+    )
+    return line.encode("utf-8") + b"\n"
+
+
+async def _lines(
+    records: Records, exported_at: datetime, counts: Counter[str]
+) -> AsyncIterator[bytes]:
+    yield encode_record(
+        "export", {"format_version": EXPORT_FORMAT_VERSION, "exported_at": exported_at}
+    )
+    async for record_type, record in records:
+        counts[record_type] += 1
+        yield encode_record(record_type, record)
+
+
+async def ndjson_stream(
+    records: Records,
+    *,
+    exported_at: datetime,
+    counts: Counter[str] | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> AsyncIterator[bytes]:
+    """
+    Encode export records as NDJSON.
+
+    Args:
+        records: Export records in output order
+        exported_at: Timestamp written to the leading ``export`` line
+        counts: Filled with the number of records per type as they are written
+        chunk_bytes: Approximate size of the yielded chunks
+
+    Yields:
+        Chunks of newline-delimited JSON
+    """
+    counts = Counter() if counts is None else counts
+    buffer = bytearray()
+    async for line in _lines(records, exported_at, counts):
+        buffer += line
+        if len(buffer) >= chunk_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+class _ChunkSink:
+    """Write-only file object ``zipfile`` streams into (no seek, no tell)."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+async def zip_stream(
+    records: Records,
+    *,
+    exported_at: datetime,
+    counts: Counter[str] | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> AsyncIterator[bytes]:
+    """
+    Encode export records as a ZIP archive written on the fly.
+
+    The archive holds ``export.ndjson`` (the NDJSON export, deflated) and
+    ``manifest.json``. ``zipfile`` falls back to data descriptors on a
+    non-seekable sink, so nothing has to be rewritten once sent.
+
+    Args:
+        records: Export records in output order
+        exported_at: Timestamp written to the export and the manifest
+        counts: Filled with the number of records per type as they are written
+        chunk_bytes: Approximate size of the yielded chunks
+
+    Yields:
+        Chunks of the ZIP archive
+    """
+    counts = Counter() if counts is None else counts
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        with archive.open("export.ndjson", mode="w", force_zip64=True) as member:
+            async for line in _lines(records, exported_at, counts):
+                member.write(line)
+                if len(sink) >= chunk_bytes:
+                    yield sink.drain()
+        manifest = {
+            "format_version": EXPORT_FORMAT_VERSION,
+            "exported_at": exported_at,
+            "files": ["export.ndjson"],
+            "counts": dict(counts),
+        }
+        archive.writestr(
+            "manifest.json", json.dumps(manifest, indent=2, default=jsonable_encoder)
+        )
+    yield sink.drain()
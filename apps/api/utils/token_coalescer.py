@@ -0,0 +1,162 @@
+"""
+Token coalescing for streamed chat responses.
+
+The agent loop yields one ``token`` event per Ollama chunk, which is often a
+single word piece. Sending each of those as its own SSE frame or WebSocket
+message costs a JSON encode, a frame and a socket write per token. The
+coalescer merges consecutive token events and flushes them every
+``flush_interval_ms`` milliseconds or once ``flush_bytes`` of text are
+buffered, whichever comes first. The first token of a response is always
+sent immediately so time-to-first-token does not regress, and any non-token
+event (tool, log, done, ...) flushes pending text before it is forwarded, so
+event ordering is preserved. The helper task reads at most ``max_queued``
+events ahead of the consumer, so a slow client applies backpressure to the
+model stream instead of buffering it in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator
+
+from apps.api.config import settings
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+_TIMEOUT = object()
+
+
+class TokenCoalescer:
+    """Merge ``token`` events from an event stream into fewer, larger frames."""
+
+    def __init__(
+        self,
+        *,
+        flush_interval_ms: int = 25,
+        flush_bytes: int = 1024,
+        first_token_immediate: bool = True,
+        max_queued: int = 256,
+    ) -> None:
+        self.flush_interval = max(0, flush_interval_ms) / 1000.0
+        self.flush_bytes = max(1, flush_bytes)
+        self.first_token_immediate = first_token_immediate
+        self.max_queued = max(1, max_queued)
+        self.events_in = 0
+        self.frames_out = 0
+
+    async def coalesce(
+        self, events: AsyncIterator[dict[str, Any]]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield ``events`` with consecutive token events merged.
+
+        The upstream iterator is drained by a helper task so pending text can be
+        flushed on a timer even while the model is momentarily silent.
+        """
+        if self.flush_interval <= 0:
+            async for event in events:
+                self.events_in += 1
+                self.frames_out += 1
+                yield event
+            return
+
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self.max_queued)
+
+        async def pump() -> None:
+            try:
+                async for event in events:
+                    await queue.put(event)
+            except Exception as exc:  # re-raised in the consumer
+                await queue.put(exc)
+                return
+            await queue.put(_END)
+
+        pump_task = asyncio.create_task(pump())
+        pending: list[str] = []
+        pending_bytes = 0
+        deadline: float | None = None
+        sent_first_token = not self.first_token_immediate
+
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    item = _TIMEOUT
+
+                if item is _TIMEOUT:
+                    # Flush interval elapsed with text still buffered
+                    yield self._flush(pending)
+                    pending, pending_bytes, deadline = [], 0, None
+                    continue
+
+                if item is _END:
+                    break
+                if isinstance(item, Exception):
+                    if pending:
+                        yield self._flush(pending)
+                        pending = []
+                    raise item
+
+                self.events_in += 1
+                if item.get("event") == "token":
+                    text = (item.get("data") or {}).get("text", "")
+                    if not sent_first_token:
+                        sent_first_token = True
+                        self.frames_out += 1
+                        yield item
+                        continue
+                    if not text:
+                        continue
+                    pending.append(text)
+                    pending_bytes += len(text.encode("utf-8"))
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                    if pending_bytes >= self.flush_bytes:
+                        yield self._flush(pending)
+                        pending, pending_bytes, deadline = [], 0, None
+                    continue
+
+                if pending:
+                    yield self._flush(pending)
+                    pending, pending_bytes, deadline = [], 0, None
+                self.frames_out += 1
+                yield item
+
+            if pending:
+                yield self._flush(pending)
+        finally:
+            if not pump_task.done():
+                pump_task.cancel()
+                try:
+                    await pump_task
+                except (asyncio.CancelledError, Exception):
+                    pass
+            logger.debug(
+                "Token stream coalesced",
+                extra={"events_in": self.events_in, "frames_out": self.frames_out},
+            )
+
+    def _flush(self, pending: list[str]) -> dict[str, Any]:
+        self.frames_out += 1
+        return {"event": "token", "data": {"text": "".join(pending)}}
+
+
+def coalesce_tokens(
+    events: AsyncIterator[dict[str, Any]],
+    *,
+    flush_interval_ms: int | None = None,
+    flush_bytes: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Wrap an agent/chat event stream with a ``TokenCoalescer`` using API settings."""
+    coalescer = TokenCoalescer(
+        flush_interval_ms=(
+            flush_interval_ms if flush_interval_ms is not None else settings.stream_flush_interval_ms
+        ),
+        flush_bytes=flush_bytes if flush_bytes is not None else settings.stream_flush_bytes,
+    )
+    return coalescer.coalesce(events)
@@ -156,10 +156,11 @@ class ConnectionManager:
             # Use send_text for FastAPI WebSocket
             await self.active_connections[connection_id].send_text(json.dumps(message))
 
-            # Update activity timestamp
-            async with self._lock:
-                if connection_id in self.connection_metadata:
-                    self.connection_metadata[connection_id]["last_activity"] = datetime.now(timezone.utc)
+            # Update activity timestamp. A single dict write cannot interleave with
+            # other coroutines, so the registry lock is not needed on this hot path.
+            metadata = self.connection_metadata.get(connection_id)
+            if metadata is not None:
+                metadata["last_activity"] = datetime.now(timezone.utc)
         except Exception as e:
             logger.error(
                 "Error sending message to connection",
@@ -172,6 +173,34 @@ class ConnectionManager:
             # Connection might be dead, schedule cleanup
             asyncio.create_task(self.disconnect(connection_id))
 
+    async def send_bytes(self, connection_id: str, data: bytes):
+        """
+        Send a binary frame to a specific connection.
+
+        Args:
+            connection_id: Target connection ID
+            data: Raw payload (e.g. PCM audio)
+        """
+        if connection_id not in self.active_connections:
+            return
+
+        try:
+            await self.active_connections[connection_id].send_bytes(data)
+
+            metadata = self.connection_metadata.get(connection_id)
+            if metadata is not None:
+                metadata["last_activity"] = datetime.now(timezone.utc)
+        except Exception as e:
+            logger.error(
+                "Error sending binary frame to connection",
+                extra={
+                    "connection_id": connection_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__
+                }
+            )
+            asyncio.create_task(self.disconnect(connection_id))
+
     async def broadcast_to_session(self, session_id: str, message: dict[str, Any]):
         """
         Broadcast message to all connections in a session.
@@ -256,6 +256,7 @@ mcp_handler.register_tool(
         "additionalProperties": False,
     },
     handler=lambda iso, fmt="%Y-%m-%d %H:%M:%S", tz="UTC": format_time(iso=iso, fmt=fmt, tz=tz),
+    cache={"ttl": 86400},
 )
 
 mcp_handler.register_tool(
@@ -315,6 +316,7 @@ mcp_handler.register_tool(
         "additionalProperties": False,
     },
     handler=lambda iso, delta, tz="UTC": add_time(iso=iso, delta=delta, tz=tz),
+    cache={"ttl": 86400},
 )
 
 @app.websocket("/mcp")
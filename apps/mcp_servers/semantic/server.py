@@ -161,6 +161,31 @@ async def _semantic_query(
         return {"error": str(e)}
 
 
+def _chunk_sources(metadata: dict[str, Any]) -> list[dict[str, Any]]:
+    """Documents a chunk came from.
+
+    Deduplicated chunks list every document they were found in under
+    ``sources``; older points only carry their own ``uri``.
+    """
+    sources = metadata.get("sources")
+    if sources:
+        return [
+            {key: source[key] for key in ("uri", "filename", "chunk_index") if key in source}
+            for source in sources
+        ]
+    return [{"uri": metadata["uri"]}] if metadata.get("uri") else []
+
+
+def _source_label(sources: list[dict[str, Any]], source_count: int, fallback: Any) -> str:
+    uris = [source["uri"] for source in sources if source.get("uri")]
+    if not uris:
+        return str(fallback)
+    label = ", ".join(uris)
+    if source_count > len(uris):
+        label += f" (+{source_count - len(uris)} more)"
+    return label
+
+
 async def knowledge_search(
     question: str,
     tags: list[str] | None = None,
@@ -198,21 +223,39 @@ async def knowledge_search(
 
     context_lines: list[str] = []
     citations: list[dict[str, Any]] = []
+    search_sources: list[dict[str, Any]] = []
     for idx, r in enumerate(results, start=1):
-        uri = (r.get("metadata", {}) or {}).get("uri")
+        metadata = r.get("metadata", {}) or {}
+        uri = metadata.get("uri")
+        chunk_sources = _chunk_sources(metadata)
+        source_count = max(int(metadata.get("source_count") or 0), len(chunk_sources))
         score = r.get("score")
         text = r.get("text", "")
         snip = _snippet(text)
-        context_lines.append(f"[{idx}] Source: {uri or r.get('id')}, Score: {score}\n{snip}")
+        label = _source_label(chunk_sources, source_count, r.get("id"))
+        context_lines.append(f"[{idx}] Source: {label}, Score: {score}\n{snip}")
         citations.append(
             {
                 "index": idx,
                 "id": r.get("id"),
                 "uri": uri,
+                "sources": chunk_sources,
+                "source_count": source_count,
                 "score": score,
                 "snippet": snip,
             }
         )
+        search_sources.append(
+            {
+                "id": r["id"],
+                "uri": uri,
+                "sources": chunk_sources,
+                "source_count": source_count,
+                "score": r["score"],
+                "text": r["text"],
+                "metadata": metadata,
+            }
+        )
 
     system_msg = (
         "You are a helpful assistant. Use ONLY the provided context snippets to answer."
@@ -246,31 +289,13 @@ async def knowledge_search(
             "error": "LLM synthesis failed",
             "details": str(exc),
             "citations": citations,
-            "sources": [
-                {
-                    "id": r["id"],
-                    "uri": r.get("metadata", {}).get("uri"),
-                    "score": r["score"],
-                    "text": r["text"],
-                    "metadata": r.get("metadata", {}),
-                }
-                for r in results
-            ],
+            "sources": search_sources,
         }
 
     return {
         "answer": answer_text.strip(),
         "citations": citations,
-        "sources": [
-            {
-                "id": r["id"],
-                "uri": r.get("metadata", {}).get("uri"),
-                "score": r["score"],
-                "text": r["text"],
-                "metadata": r.get("metadata", {}),
-            }
-            for r in results
-        ],
+        "sources": search_sources,
     }
 
 
@@ -318,6 +343,8 @@ mcp_handler.register_tool(
         "additionalProperties": False,
     },
     handler=knowledge_search,
+    # The API drops cached answers whenever new documents are ingested
+    cache={"ttl": 600},
 )
 
 
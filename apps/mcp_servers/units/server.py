@@ -67,8 +67,8 @@ mcp_handler = MCPProtocolHandler(
 
 # Register tools
 # Note: 'from' is a Python keyword, so we need to handle it specially
-async def convert_wrapper(**kwargs):
-    """Wrapper to handle 'from' keyword."""
+def convert_wrapper(**kwargs):
+    """Wrapper to handle 'from' keyword (sync, so it runs on the handler's thread pool)."""
     return convert_units(
         value=kwargs["value"],
         from_unit=kwargs["from"],
@@ -99,6 +99,7 @@ mcp_handler.register_tool(
         "additionalProperties": False,
     },
     handler=convert_wrapper,
+    cache={"ttl": 86400},
 )
 
 
@@ -0,0 +1,289 @@
+"""
+Concurrent crawl engine for the web MCP server.
+
+The crawler walks the link graph level by level. All pages of one level are
+fetched concurrently through a bounded worker pool, with per-host concurrency
+and delay limits so a single site is never hammered. Discovered links are
+normalised and deduplicated before any DNS resolution happens, and only as
+many URLs as the page budget allows are ever resolved or fetched.
+
+robots.txt files are kept in a process-wide cache with a TTL, so repeated
+crawls of the same site do not refetch them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+from urllib.parse import urldefrag, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a site-provided Crawl-delay so one slow site cannot stall a tool call.
+MAX_ROBOTS_CRAWL_DELAY = 5.0
+
+
+def normalize_url(url: str) -> str | None:
+    """Canonical form used for frontier deduplication (or ``None`` if not crawlable)."""
+    url, _ = urldefrag(url.strip())
+    parsed = urlparse(url)
+    if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+        return None
+    host = parsed.hostname.lower()
+    port = parsed.port
+    if port and not (
+        (parsed.scheme == "http" and port == 80) or (parsed.scheme == "https" and port == 443)
+    ):
+        host = f"{host}:{port}"
+    return urlunparse((parsed.scheme, host, parsed.path or "/", parsed.params, parsed.query, ""))
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class RobotsCache:
+    """Process-wide robots.txt cache with TTL and single-flight fetching."""
+
+    def __init__(self, *, ttl: float = 3600.0, max_entries: int = 512) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[RobotFileParser | None, float]] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[RobotFileParser | None]] = {}
+
+    async def get(
+        self, url: str, fetch_text: Callable[[str], Awaitable[str | None]]
+    ) -> RobotFileParser | None:
+        """Return the parsed robots.txt for ``url``'s origin (``None`` means allow all)."""
+        origin = _origin(url)
+        cached = self._entries.get(origin)
+        if cached is not None and cached[1] > time.monotonic():
+            self._entries.move_to_end(origin)
+            return cached[0]
+
+        pending = self._pending.get(origin)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[RobotFileParser | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending[origin] = future
+        try:
+            parser: RobotFileParser | None = None
+            try:
+                text = await fetch_text(f"{origin}/robots.txt")
+            except Exception:
+                text = None
+            if text:
+                parser = RobotFileParser()
+                parser.parse(text.splitlines())
+            self._store(origin, parser)
+            future.set_result(parser)
+            return parser
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._pending.pop(origin, None)
+
+    def _store(self, origin: str, parser: RobotFileParser | None) -> None:
+        self._entries[origin] = (parser, time.monotonic() + self.ttl)
+        self._entries.move_to_end(origin)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"entries": len(self._entries), "ttl": self.ttl}
+
+
+@dataclass
+class _HostSlot:
+    semaphore: asyncio.Semaphore
+    next_slot: float = 0.0
+    users: int = 0
+
+
+class HostThrottle:
+    """
+    Per-host concurrency and minimum-interval limits shared by all crawls.
+
+    A host's state is kept while a call for it is queued or running, and
+    afterwards only until its next slot opens, so the table holds the hosts
+    being crawled rather than every host ever seen.
+    """
+
+    # Idle hosts are swept when a new host is added past this many entries.
+    _SWEEP_AT = 256
+
+    def __init__(self, *, max_per_host: int = 2, min_delay: float = 0.0) -> None:
+        self.max_per_host = max_per_host
+        self.min_delay = min_delay
+        self._hosts: dict[str, _HostSlot] = {}
+
+    def _acquire(self, host: str) -> _HostSlot:
+        slot = self._hosts.get(host)
+        if slot is None:
+            if len(self._hosts) >= self._SWEEP_AT:
+                self._sweep()
+            slot = self._hosts[host] = _HostSlot(asyncio.Semaphore(self.max_per_host))
+        slot.users += 1
+        return slot
+
+    def _release(self, host: str, slot: _HostSlot) -> None:
+        slot.users -= 1
+        if slot.users == 0 and slot.next_slot <= time.monotonic():
+            self._hosts.pop(host, None)
+
+    def _sweep(self) -> None:
+        now = time.monotonic()
+        for host in [h for h, s in self._hosts.items() if s.users == 0 and s.next_slot <= now]:
+            del self._hosts[host]
+
+    async def run(
+        self, host: str, call: Callable[[], Awaitable[Any]], delay: float | None = None
+    ) -> Any:
+        """Run ``call`` once a slot for ``host`` is free and its delay has elapsed."""
+        interval = max(self.min_delay, delay or 0.0)
+        slot = self._acquire(host)
+        try:
+            async with slot.semaphore:
+                if interval > 0:
+                    now = time.monotonic()
+                    start_at = max(now, slot.next_slot)
+                    slot.next_slot = start_at + interval
+                    if start_at > now:
+                        await asyncio.sleep(start_at - now)
+                return await call()
+        finally:
+            self._release(host, slot)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"hosts": len(self._hosts)}
+
+
+@dataclass
+class CrawlPage:
+    """Result of visiting a single page."""
+
+    result: dict[str, Any] | None
+    links: list[str] = field(default_factory=list)
+
+
+class CrawlEngine:
+    """
+    Level-synchronous concurrent crawler.
+
+    Args:
+        ensure_safe: Validates a URL (SSRF checks) and returns the URL to fetch;
+            raises ``ValueError`` to skip it.
+        visit: Fetches and processes a page, returning its result and (when
+            requested) outgoing absolute links.
+        fetch_robots: Returns robots.txt text for a URL, or ``None``.
+        robots: Shared robots cache, or ``None`` to ignore robots.txt.
+        throttle: Shared per-host throttle.
+        max_workers: Maximum concurrent page visits for this crawl.
+        user_agent: Agent name matched against robots.txt rules.
+    """
+
+    def __init__(
+        self,
+        *,
+        ensure_safe: Callable[[str], Awaitable[str]],
+        visit: Callable[[str, bool], Awaitable[CrawlPage | None]],
+        fetch_robots: Callable[[str], Awaitable[str | None]],
+        robots: RobotsCache | None,
+        throttle: HostThrottle,
+        max_workers: int = 4,
+        user_agent: str = "*",
+    ) -> None:
+        self._ensure_safe = ensure_safe
+        self._visit = visit
+        self._fetch_robots = fetch_robots
+        self._robots = robots
+        self._throttle = throttle
+        self._workers = asyncio.Semaphore(max_workers)
+        self._user_agent = user_agent
+
+    async def crawl(
+        self,
+        start_url: str,
+        *,
+        depth: int,
+        max_pages: int,
+        same_host: bool,
+    ) -> list[dict[str, Any]]:
+        """Crawl from ``start_url`` and return page results in frontier order."""
+        start = normalize_url(start_url) or start_url
+        start_host = urlparse(start).hostname
+        seen: set[str] = {start}
+        level: list[str] = [start]
+        results: list[dict[str, Any]] = []
+
+        for current_depth in range(depth + 1):
+            want_links = current_depth < depth
+            next_level: list[str] = []
+            cursor = 0
+
+            # Fetch the level in budget-sized waves: a wave never exceeds the number
+            # of pages still needed, so URLs past max_pages are never resolved.
+            while cursor < len(level) and len(results) < max_pages:
+                budget = max_pages - len(results)
+                wave = level[cursor : cursor + budget]
+                cursor += len(wave)
+                pages = await asyncio.gather(*(self._process(url, want_links) for url in wave))
+
+                for page in pages:
+                    if page is None:
+                        continue
+                    if page.result is not None and len(results) < max_pages:
+                        results.append(page.result)
+                    for link in page.links:
+                        normalized = normalize_url(link)
+                        if normalized is None or normalized in seen:
+                            continue
+                        if same_host and urlparse(normalized).hostname != start_host:
+                            continue
+                        seen.add(normalized)
+                        next_level.append(normalized)
+
+            if not next_level or len(results) >= max_pages:
+                break
+            level = next_level
+
+        return results
+
+    async def _process(self, url: str, want_links: bool) -> CrawlPage | None:
+        async with self._workers:
+            try:
+                safe_url = await self._ensure_safe(url)
+            except ValueError:
+                return None
+
+            delay: float | None = None
+            if self._robots is not None:
+                parser = await self._robots.get(safe_url, self._fetch_robots)
+                if parser is not None:
+                    if not parser.can_fetch(self._user_agent, safe_url):
+                        return None
+                    crawl_delay = parser.crawl_delay(self._user_agent)
+                    if crawl_delay:
+                        delay = min(float(crawl_delay), MAX_ROBOTS_CRAWL_DELAY)
+
+            host = urlparse(safe_url).netloc
+            try:
+                return await self._throttle.run(
+                    host, lambda: self._visit(safe_url, want_links), delay
+                )
+            except Exception as exc:
+                logger.debug(
+                    "Crawl visit failed",
+                    extra={"url": safe_url, "error": str(exc), "error_type": type(exc).__name__},
+                )
+                return None
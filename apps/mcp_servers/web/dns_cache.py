@@ -0,0 +1,295 @@
+"""
+Validated DNS resolution cache for the web MCP server.
+
+``SafeResolver`` resolves hostnames once per TTL (with single-flight for
+concurrent lookups of the same host), rejects hosts that resolve to private,
+loopback, link-local, reserved, multicast or unspecified addresses, and keeps
+the validated addresses so the HTTP transport can connect to exactly the IP
+that passed the SSRF check instead of resolving the name a second time.
+
+``PinnedTransport`` is an httpx transport over an httpcore connection pool
+that uses the pinned backend. It never goes through a proxy, including one
+configured with ``HTTP_PROXY``/``HTTPS_PROXY``: a proxy would resolve the
+hostname itself and connect to an address that was never validated.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ipaddress
+import socket
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator
+
+import httpcore
+import httpx
+
+DISALLOWED_ADDRESS_MESSAGE = "URL resolves to a disallowed IP address"
+UNRESOLVABLE_MESSAGE = "Unable to resolve host"
+
+
+def is_disallowed_ip(address: str) -> bool:
+    """Return True for addresses the web tools must never connect to."""
+    ip = ipaddress.ip_address(address)
+    return (
+        ip.is_private
+        or ip.is_loopback
+        or ip.is_link_local
+        or ip.is_reserved
+        or ip.is_multicast
+        or ip.is_unspecified
+    )
+
+
+@dataclass
+class _Resolution:
+    addresses: tuple[str, ...]
+    error: str | None
+    expires_at: float
+
+
+class SafeResolver:
+    """TTL-bounded, single-flight resolver that only hands out public addresses."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        max_entries: int = 2048,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _Resolution] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[_Resolution]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def resolve(self, host: str) -> tuple[str, ...]:
+        """
+        Resolve ``host`` to validated public addresses.
+
+        Raises:
+            ValueError: If the host cannot be resolved or any address is disallowed
+        """
+        host = host.lower().rstrip(".")
+        resolution = self._lookup(host)
+        if resolution is None:
+            resolution = await self._resolve_once(host)
+        if resolution.error:
+            raise ValueError(resolution.error)
+        return resolution.addresses
+
+    def _lookup(self, host: str) -> _Resolution | None:
+        resolution = self._entries.get(host)
+        if resolution is None:
+            return None
+        if resolution.expires_at <= time.monotonic():
+            self._entries.pop(host, None)
+            return None
+        self._entries.move_to_end(host)
+        self.hits += 1
+        return resolution
+
+    async def _resolve_once(self, host: str) -> _Resolution:
+        pending = self._pending.get(host)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future: asyncio.Future[_Resolution] = asyncio.get_running_loop().create_future()
+        self._pending[host] = future
+        try:
+            resolution = await self._resolve_uncached(host)
+            self._entries[host] = resolution
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            future.set_result(resolution)
+            return resolution
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._pending.pop(host, None)
+
+    async def _resolve_uncached(self, host: str) -> _Resolution:
+        try:
+            ipaddress.ip_address(host)
+            addresses: list[str] = [host]
+        except ValueError:
+            loop = asyncio.get_running_loop()
+            try:
+                infos = await loop.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+            except Exception:
+                return self._failure(UNRESOLVABLE_MESSAGE)
+            addresses = []
+            for info in infos:
+                if info and info[4] and info[4][0] not in addresses:
+                    addresses.append(info[4][0])
+
+        if not addresses:
+            return self._failure(UNRESOLVABLE_MESSAGE)
+        if any(is_disallowed_ip(address) for address in addresses):
+            # Validation outcome is a property of the DNS answer, so cache it for the full TTL.
+            return _Resolution((), DISALLOWED_ADDRESS_MESSAGE, time.monotonic() + self.ttl)
+        return _Resolution(tuple(addresses), None, time.monotonic() + self.ttl)
+
+    def _failure(self, message: str) -> _Resolution:
+        return _Resolution((), message, time.monotonic() + self.negative_ttl)
+
+    def snapshot(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "ttl": self.ttl,
+        }
+
+
+class RejectedHostError(httpcore.ConnectError):
+    """Connection refused because ``SafeResolver`` rejected the host."""
+
+
+class PinnedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    httpcore backend that connects to addresses validated by ``SafeResolver``.
+
+    TLS still uses the original hostname for SNI and certificate checks, since
+    httpcore passes the origin host to ``start_tls`` separately.
+    """
+
+    def __init__(self, resolver: SafeResolver) -> None:
+        self._resolver = resolver
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Any = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._resolver.resolve(host)
+        except ValueError as exc:
+            raise RejectedHostError(str(exc)) from exc
+
+        last_error: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_error = exc
+        assert last_error is not None
+        raise last_error
+
+    async def connect_unix_socket(
+        self, path: str, timeout: float | None = None, socket_options: Any = None
+    ) -> httpcore.AsyncNetworkStream:
+        raise httpcore.ConnectError("Unix sockets are not allowed")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# Most specific first: the first match wins.
+_HTTPCORE_ERRORS: tuple[tuple[type[Exception], type[httpx.TransportError]], ...] = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextlib.contextmanager
+def _map_httpcore_errors() -> Iterator[None]:
+    try:
+        yield
+    except Exception as exc:
+        for source, target in _HTTPCORE_ERRORS:
+            if isinstance(exc, source):
+                raise target(str(exc)) from exc
+        raise
+
+
+class _PinnedResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _map_httpcore_errors():
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class PinnedTransport(httpx.AsyncBaseTransport):
+    """httpx transport whose connections go through ``PinnedNetworkBackend`` (no proxies)."""
+
+    def __init__(self, resolver: SafeResolver, *, limits: httpx.Limits | None = None) -> None:
+        limits = limits or httpx.Limits()
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=PinnedNetworkBackend(resolver),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _map_httpcore_errors():
+            response = await self._pool.handle_async_request(core_request)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_PinnedResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+def build_pinned_transport(
+    resolver: SafeResolver, *, limits: httpx.Limits | None = None
+) -> PinnedTransport:
+    """Create an httpx transport whose connections go through ``PinnedNetworkBackend``."""
+    return PinnedTransport(resolver, limits=limits)
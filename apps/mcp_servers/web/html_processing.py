@@ -0,0 +1,276 @@
+"""
+HTML processing for the web MCP server.
+
+Every extractor parses the page exactly once with lxml's C parser and reuses
+that tree for title, metadata, link and text extraction; readability works on
+cheap deep copies of the same tree instead of re-parsing the HTML for each of
+its passes. The extractors are plain module-level functions taking and
+returning picklable values, so ``HtmlProcessor`` can run them in a process (or
+thread) pool and keep the event loop free while large pages are processed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, TypeVar
+
+import lxml.html
+from lxml import etree
+from readability import Document
+from readability.htmls import get_title, shorten_title
+from readability.readability import html_cleaner
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PAGE_BOILERPLATE_TAGS = ("script", "style", "nav", "footer", "header")
+ARTICLE_BOILERPLATE_TAGS = PAGE_BOILERPLATE_TAGS + ("aside",)
+META_FIELDS = ("description", "og:description", "og:site_name", "author")
+
+_utf8_parser = lxml.html.HTMLParser(encoding="utf-8")
+
+
+class _ParsedDocument(Document):
+    """readability ``Document`` over an already-parsed tree.
+
+    readability re-parses its input on every ``title()``/``summary()`` pass;
+    this variant hands each pass a cleaned copy of the shared tree instead.
+    ``_parse`` is a private readability hook: if a readability release drops
+    it, ``_readable_summary`` falls back to serialising the tree for a plain
+    ``Document`` (slower, same output).
+    """
+
+    def __init__(self, tree: lxml.html.HtmlElement, **kwargs: Any) -> None:
+        super().__init__("", **kwargs)
+        self._tree = tree
+
+    def _parse(self, input: Any) -> lxml.html.HtmlElement:
+        doc = html_cleaner.clean_html(self._tree)  # deep-copies element input
+        doc.resolve_base_href(handle_failures=self.handle_failures)
+        return doc
+
+
+def parse_html(html: str) -> lxml.html.HtmlElement | None:
+    """Parse a full HTML document, returning ``None`` for empty or unparseable input."""
+    if not html or not html.strip():
+        return None
+    try:
+        # Same normalisation readability applies, which also sidesteps lxml's
+        # refusal to parse str input that carries an XML encoding declaration.
+        return lxml.html.document_fromstring(
+            html.encode("utf-8", "replace"), parser=_utf8_parser
+        )
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _text(element: etree._Element, separator: str) -> str:
+    """Equivalent of BeautifulSoup ``get_text(separator, strip=True)``."""
+    return separator.join(
+        chunk.strip() for chunk in element.itertext() if chunk and chunk.strip()
+    )
+
+
+def _strip_tags(element: etree._Element, tags: tuple[str, ...]) -> None:
+    etree.strip_elements(element, etree.Comment, *tags, with_tail=False)
+
+
+def _page_title(tree: lxml.html.HtmlElement) -> str:
+    title = tree.find(".//title")
+    return _text(title, "") if title is not None else ""
+
+
+def _readable_title(tree: lxml.html.HtmlElement) -> str:
+    title = shorten_title(tree) or get_title(tree) or ""
+    return "" if title == "[no-title]" else title.strip()
+
+
+_HAS_PARSE_HOOK = callable(getattr(Document, "_parse", None))
+
+
+def _readable_summary(tree: lxml.html.HtmlElement) -> lxml.html.HtmlElement | None:
+    if _HAS_PARSE_HOOK:
+        document = _ParsedDocument(tree)
+    else:  # pragma: no cover - depends on the installed readability
+        document = Document(lxml.html.tostring(tree, encoding="unicode"))
+    summary_html = document.summary() or ""
+    if not summary_html.strip():
+        return None
+    try:
+        summary = lxml.html.fragment_fromstring(summary_html, create_parent="div")
+    except (etree.ParserError, ValueError):
+        return None
+    _strip_tags(summary, ARTICLE_BOILERPLATE_TAGS)
+    return summary
+
+
+def _anchor_links(element: etree._Element, limit: int | None = None) -> list[dict[str, str]]:
+    links: list[dict[str, str]] = []
+    for anchor in element.iter("a"):
+        href = (anchor.get("href") or "").strip()
+        if not href.startswith("http"):
+            continue
+        link_text = _text(anchor, "")
+        if link_text:
+            links.append({"url": href, "text": link_text})
+            if limit is not None and len(links) >= limit:
+                break
+    return links
+
+
+def _meta(tree: lxml.html.HtmlElement) -> dict[str, Any]:
+    meta: dict[str, Any] = {}
+    for name in META_FIELDS:
+        for attribute in ("name", "property"):
+            matches = [tag for tag in tree.iter("meta") if tag.get(attribute) == name]
+            if matches:
+                if matches[0].get("content"):
+                    meta[name] = matches[0].get("content")
+                break
+    return meta
+
+
+def _has_class_xpath(class_name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def extract_page(html: str, max_links: int) -> dict[str, Any]:
+    """Title, visible text and outgoing links for ``web.fetch``."""
+    tree = parse_html(html)
+    if tree is None:
+        return {"title": "", "text": "", "links": []}
+    title = _page_title(tree)
+    _strip_tags(tree, PAGE_BOILERPLATE_TAGS)
+    return {
+        "title": title,
+        "text": _text(tree, "\n"),
+        "links": _anchor_links(tree, max_links),
+    }
+
+
+def extract_article(html: str, include_links: bool) -> dict[str, Any]:
+    """Readable article text, metadata and optional links for ``web.extract_article``."""
+    tree = parse_html(html)
+    if tree is None:
+        return {"title": "", "text": "", "metadata": {}, "links": []}
+    summary = _readable_summary(tree)
+    return {
+        "title": _readable_title(tree),
+        "text": _text(summary, "\n") if summary is not None else "",
+        "metadata": _meta(tree),
+        "links": _anchor_links(summary) if include_links and summary is not None else [],
+    }
+
+
+def extract_crawl_page(html: str, want_links: bool) -> dict[str, Any]:
+    """Title, readable snippet and (optionally) absolute link targets for ``web.crawl``."""
+    tree = parse_html(html)
+    if tree is None:
+        return {"title": "", "snippet": "", "links": []}
+    summary = _readable_summary(tree)
+    links: list[str] = []
+    if want_links:
+        for anchor in tree.iter("a"):
+            href = (anchor.get("href") or "").strip()
+            if href.startswith("http"):
+                links.append(href)
+    return {
+        "title": _readable_title(tree),
+        "snippet": _text(summary, " ")[:500] if summary is not None else "",
+        "links": links,
+    }
+
+
+def extract_search_results(html: str, top_k: int) -> list[dict[str, str]]:
+    """Parse DuckDuckGo HTML result blocks for ``web.search``."""
+    tree = parse_html(html)
+    if tree is None:
+        return []
+    results: list[dict[str, str]] = []
+    for result in tree.xpath(f"//*[{_has_class_xpath('result')}]")[:top_k]:
+        title_elem = next(iter(result.xpath(f".//*[{_has_class_xpath('result__title')}]")), None)
+        snippet_elem = next(
+            iter(result.xpath(f".//*[{_has_class_xpath('result__snippet')}]")), None
+        )
+        link_elem = next(
+            iter(
+                result.xpath(
+                    f".//*[{_has_class_xpath('result__a')} or {_has_class_xpath('result__url')}]"
+                )
+            ),
+            None,
+        )
+        title = _text(title_elem, "") if title_elem is not None else ""
+        url = link_elem.get("href", "") if link_elem is not None else ""
+        snippet = _text(snippet_elem, "") if snippet_elem is not None else ""
+        if title or url or snippet:
+            results.append({"title": title, "url": url, "snippet": snippet})
+    return results
+
+
+class HtmlProcessor:
+    """
+    Bounded worker pool for CPU-heavy HTML extraction.
+
+    ``mode`` is ``"process"`` (default; true parallelism, isolates readability's
+    pure-Python scoring from the event loop's GIL) or ``"thread"``.
+    """
+
+    def __init__(self, *, mode: str = "process", max_workers: int | None = None) -> None:
+        self.mode = mode if mode in {"process", "thread"} else "process"
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        # Bound queued work so a burst of crawls cannot pile up unbounded HTML in memory.
+        self._slots = asyncio.Semaphore(self.max_workers * 2)
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="html-worker"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``func(*args)`` in the pool and await its result.
+
+        A process pool whose worker died (e.g. killed by the OOM killer) is
+        unusable for good; it is replaced and the call retried once.
+        """
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            call = functools.partial(func, *args)
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, call)
+            except BrokenProcessPool:
+                logger.warning(
+                    "HTML worker pool broken; recreating it",
+                    extra={"operation": "html_processing", "error_type": "BrokenProcessPool"},
+                )
+                self._discard(executor)
+                return await loop.run_in_executor(self._get_executor(), call)
+
+    def _discard(self, executor: Executor) -> None:
+        # Concurrent calls may hit the same broken pool; only the first replaces it.
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
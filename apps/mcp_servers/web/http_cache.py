@@ -0,0 +1,369 @@
+"""
+In-memory HTTP response cache for the web MCP server.
+
+Stores successful GET responses keyed by URL, bounded by total body size, and
+honours Cache-Control / Expires freshness. Stale entries carrying an ETag or
+Last-Modified validator are revalidated with a conditional request. Fetches
+that failed on the transport or with a 5xx status are remembered briefly
+(negative cache) so retry storms from agents do not hammer unreachable hosts;
+client errors and rejected URLs are not cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from apps.mcp_servers.web.dns_cache import RejectedHostError
+
+# Headers that describe the stored body and must be replayed on a cache hit.
+_STORED_HEADERS = (
+    "content-type",
+    "content-language",
+    "etag",
+    "last-modified",
+    "cache-control",
+    "expires",
+)
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body plus the metadata needed to serve or revalidate it."""
+
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    fresh_until: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (now if now is not None else time.monotonic()) < self.fresh_until
+
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def to_response(self, method: str = "GET") -> httpx.Response:
+        """Rebuild an ``httpx.Response`` so callers cannot tell a hit from a fetch."""
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(method, self.url),
+        )
+
+
+@dataclass
+class _NegativeEntry:
+    error: Exception
+    expires_at: float
+
+
+@dataclass
+class CacheStats:
+    """Counters surfaced on the server health endpoint."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    negative_hits: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+def is_cacheable_failure(error: Exception) -> bool:
+    """Whether a failed fetch says something about the host rather than the request."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    if not isinstance(error, (httpx.TransportError, asyncio.TimeoutError)):
+        return False
+    # Hosts rejected by the resolver surface as a ConnectError caused by
+    # RejectedHostError; those say nothing about the host being down.
+    cause = error.__cause__
+    while cause is not None:
+        if isinstance(cause, RejectedHostError):
+            return False
+        cause = cause.__cause__
+    return True
+
+
+def replay_failure(error: Exception) -> Exception:
+    """
+    Build a new exception equivalent to a cached failure.
+
+    The cached object is never raised again: each raise would append to its
+    traceback, which would then be shared by every request replaying it.
+    Callers chain the original with ``raise replay_failure(e) from e``.
+    """
+    message = f"{error} (cached failure)"
+    if isinstance(error, httpx.HTTPStatusError):
+        return httpx.HTTPStatusError(message, request=error.request, response=error.response)
+    if isinstance(error, httpx.RequestError):
+        try:
+            request = error.request
+        except RuntimeError:  # raised by httpx when no request is attached
+            request = None
+        return type(error)(message, request=request)
+    return type(error)(message)
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """Parse a Cache-Control header into a lowercase directive map."""
+    directives: dict[str, str | None] = {}
+    if not value:
+        return directives
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "=" in part:
+            key, _, arg = part.partition("=")
+            directives[key.strip().lower()] = arg.strip().strip('"')
+        else:
+            directives[part.lower()] = None
+    return directives
+
+
+def _parse_seconds(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return None
+
+
+def freshness_lifetime(headers: httpx.Headers, default_ttl: float) -> float | None:
+    """
+    Compute how long a response may be served without revalidation.
+
+    Returns ``None`` when the response must not be stored at all, ``0`` when it
+    may be stored but must be revalidated before every use.
+    """
+    directives = parse_cache_control(headers.get("cache-control"))
+
+    # This cache is shared between users, so private responses are not stored.
+    if "no-store" in directives or "private" in directives:
+        return None
+    if headers.get("vary", "").strip() == "*":
+        return None
+    if "no-cache" in directives:
+        return 0.0
+
+    lifetime: float | None = None
+    for directive in ("s-maxage", "max-age"):
+        seconds = _parse_seconds(directives.get(directive))
+        if seconds is not None:
+            lifetime = float(seconds)
+            break
+
+    if lifetime is None and headers.get("expires"):
+        expires = _parse_http_date(headers["expires"])
+        if expires is None:
+            # An invalid Expires value means "already expired".
+            lifetime = 0.0
+        else:
+            date = _parse_http_date(headers.get("date"))
+            lifetime = max(0.0, expires - (date if date is not None else time.time()))
+
+    if lifetime is None:
+        lifetime = default_ttl
+
+    age = _parse_seconds(headers.get("age")) or 0
+    return max(0.0, lifetime - age)
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of HTTP responses with negative caching.
+
+    Not thread-safe; intended to be used from the server's event loop only.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        max_entry_bytes: int,
+        default_ttl: float = 60.0,
+        negative_ttl: float = 15.0,
+        max_negative_entries: int = 1024,
+        enabled: bool = True,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.max_negative_entries = max_negative_entries
+        self.enabled = enabled
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._negative: OrderedDict[str, _NegativeEntry] = OrderedDict()
+        self._bytes = 0
+        self.stats = CacheStats()
+
+    def get(self, url: str) -> CachedResponse | None:
+        """
+        Return the stored entry for ``url`` (fresh or stale) and mark it recently used.
+
+        A fresh entry counts as a hit; a stale or missing one as a miss, and
+        a stale one that revalidates also counts as ``revalidated``.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        if entry is not None and entry.is_fresh():
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+        return entry
+
+    def store(self, url: str, response: httpx.Response) -> CachedResponse | None:
+        """Store a successful response if its headers allow it."""
+        if not self.enabled or response.status_code != 200:
+            return None
+        lifetime = freshness_lifetime(response.headers, self.default_ttl)
+        if lifetime is None:
+            self._remove(url)
+            return None
+        content = response.content
+        if len(content) > self.max_entry_bytes:
+            return None
+
+        entry = CachedResponse(
+            url=url,
+            status_code=response.status_code,
+            headers={
+                name: response.headers[name]
+                for name in _STORED_HEADERS
+                if name in response.headers
+            },
+            content=content,
+            fresh_until=time.monotonic() + lifetime,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        self._remove(url)
+        self._entries[url] = entry
+        self._bytes += entry.size
+        self.stats.stores += 1
+        self._evict()
+        return entry
+
+    def refresh(self, entry: CachedResponse, not_modified: httpx.Response) -> CachedResponse:
+        """Update freshness of ``entry`` after a ``304 Not Modified`` revalidation."""
+        merged = httpx.Headers(entry.headers)
+        for name in _STORED_HEADERS + ("age", "date", "vary"):
+            if name in not_modified.headers:
+                merged[name] = not_modified.headers[name]
+        lifetime = freshness_lifetime(merged, self.default_ttl)
+        if lifetime is None:
+            self._remove(entry.url)
+            lifetime = 0.0
+        entry.fresh_until = time.monotonic() + lifetime
+        entry.etag = merged.get("etag") or entry.etag
+        entry.last_modified = merged.get("last-modified") or entry.last_modified
+        entry.headers = {name: merged[name] for name in _STORED_HEADERS if name in merged}
+        self.stats.revalidated += 1
+        return entry
+
+    def conditional_headers(self, entry: CachedResponse) -> dict[str, str]:
+        """Validator headers for revalidating ``entry``."""
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def get_failure(self, url: str) -> Exception | None:
+        """
+        Return a recently recorded failure for ``url``, if still within the negative TTL.
+
+        The returned object is the original exception; raise
+        ``replay_failure(error)`` rather than the exception itself.
+        """
+        if not self.enabled:
+            return None
+        negative = self._negative.get(url)
+        if negative is None:
+            return None
+        if negative.expires_at <= time.monotonic():
+            self._negative.pop(url, None)
+            return None
+        self.stats.negative_hits += 1
+        return negative.error
+
+    def record_failure(self, url: str, error: Exception) -> bool:
+        """
+        Remember a failed fetch of ``url`` for the negative TTL.
+
+        Only transport errors and 5xx responses are recorded (see
+        ``is_cacheable_failure``). Past ``max_negative_entries`` the oldest
+        failures are evicted first; all share one TTL, so they are also the
+        first to expire.
+
+        Returns:
+            True if the failure was recorded
+        """
+        if not self.enabled or self.negative_ttl <= 0 or not is_cacheable_failure(error):
+            return False
+        self._negative.pop(url, None)
+        self._negative[url] = _NegativeEntry(error, time.monotonic() + self.negative_ttl)
+        while len(self._negative) > self.max_negative_entries:
+            self._negative.popitem(last=False)
+        return True
+
+    def clear_failure(self, url: str) -> None:
+        self._negative.pop(url, None)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cache statistics for health reporting."""
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_ratio": round(self.stats.hits / lookups, 3) if lookups else 0.0,
+            "revalidated": self.stats.revalidated,
+            "negative_hits": self.stats.negative_hits,
+            "negative_entries": len(self._negative),
+            "stores": self.stats.stores,
+            "evictions": self.stats.evictions,
+        }
+
+    def _remove(self, url: str) -> None:
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.stats.evictions += 1
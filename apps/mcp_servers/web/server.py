@@ -10,17 +10,13 @@ Tools:
 
 import asyncio
 import os
-import ipaddress
 import logging
 import re
-import socket
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
-from readability import Document
 from fastapi import FastAPI, WebSocket
-from bs4 import BeautifulSoup
 
 from packages.mcp.base_handler import (
     MCPProtocolHandler,
@@ -28,6 +24,17 @@ from packages.mcp.base_handler import (
     mcp_websocket_handler,
 )
 
+from apps.mcp_servers.web.crawler import CrawlEngine, CrawlPage, HostThrottle, RobotsCache
+from apps.mcp_servers.web.dns_cache import SafeResolver, build_pinned_transport
+from apps.mcp_servers.web.html_processing import (
+    HtmlProcessor,
+    extract_article,
+    extract_crawl_page,
+    extract_page,
+    extract_search_results,
+)
+from apps.mcp_servers.web.http_cache import ResponseCache, replay_failure
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -47,6 +54,37 @@ CRAWL_MAX_DEPTH = 2
 CRAWL_MAX_PAGES = 10
 RESPECT_ROBOTS_DEFAULT = True
 
+# Shared response cache for page fetches (fetch, extract_article, crawl)
+CACHE_ENABLED = os.environ.get("WEB_CACHE_ENABLED", "1").strip().lower() not in {"0", "false", "no"}
+CACHE_MAX_BYTES = int(os.environ.get("WEB_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+CACHE_DEFAULT_TTL = float(os.environ.get("WEB_CACHE_DEFAULT_TTL", "120"))
+CACHE_NEGATIVE_TTL = float(os.environ.get("WEB_CACHE_NEGATIVE_TTL", "15"))
+
+# Crawl engine limits (robots cache and host throttle are shared across crawls)
+CRAWL_MAX_WORKERS = int(os.environ.get("WEB_CRAWL_MAX_WORKERS", "6"))
+CRAWL_MAX_PER_HOST = int(os.environ.get("WEB_CRAWL_MAX_PER_HOST", "4"))
+CRAWL_HOST_DELAY = float(os.environ.get("WEB_CRAWL_HOST_DELAY", "0"))
+CRAWL_ROBOTS_TTL = float(os.environ.get("WEB_CRAWL_ROBOTS_TTL", "3600"))
+CRAWL_USER_AGENT = "youworker-web-mcp"
+
+response_cache = ResponseCache(
+    max_bytes=CACHE_MAX_BYTES,
+    max_entry_bytes=MAX_RESPONSE_BYTES,
+    default_ttl=CACHE_DEFAULT_TTL,
+    negative_ttl=CACHE_NEGATIVE_TTL,
+    enabled=CACHE_ENABLED,
+)
+dns_resolver = SafeResolver(
+    ttl=float(os.environ.get("WEB_DNS_CACHE_TTL", "300")),
+    negative_ttl=float(os.environ.get("WEB_DNS_NEGATIVE_TTL", "30")),
+)
+robots_cache = RobotsCache(ttl=CRAWL_ROBOTS_TTL)
+html_processor = HtmlProcessor(
+    mode=os.environ.get("WEB_HTML_POOL", "process").strip().lower(),
+    max_workers=int(os.environ.get("WEB_HTML_WORKERS", "0")) or None,
+)
+crawl_throttle = HostThrottle(max_per_host=CRAWL_MAX_PER_HOST, min_delay=CRAWL_HOST_DELAY)
+
 
 @app.on_event("startup")
 async def startup():
@@ -57,6 +95,7 @@ async def startup():
         timeout=httpx.Timeout(10.0, read=10.0, connect=5.0),
         headers={"User-Agent": "youworker-web-mcp/0.1 (+https://example.local)"},
         follow_redirects=False,
+        transport=build_pinned_transport(dns_resolver),
     )
     logger.info("HTTP client ready")
 
@@ -68,12 +107,19 @@ async def shutdown():
     if http_client:
         await http_client.aclose()
     http_client = None
+    html_processor.shutdown()
 
 
 @app.get("/health")
 async def health_check():
     """Health check."""
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "http_cache": response_cache.snapshot(),
+        "robots_cache": robots_cache.snapshot(),
+        "crawl_throttle": crawl_throttle.snapshot(),
+        "dns_cache": dns_resolver.snapshot(),
+    }
 
 
 async def search_web(query: str, top_k: int = 5, site: str | None = None) -> dict[str, Any]:
@@ -124,18 +170,7 @@ async def search_web(query: str, top_k: int = 5, site: str | None = None) -> dic
     if len(resp.content) > MAX_RESPONSE_BYTES:
         return {"error": "Search response exceeded size limit"}
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    results = []
-    for result_div in soup.select(".result")[:top_k]:
-        title_elem = result_div.select_one(".result__title")
-        snippet_elem = result_div.select_one(".result__snippet")
-        link_elem = result_div.select_one(".result__a, .result__url")
-
-        title = title_elem.get_text(strip=True) if title_elem else ""
-        url = link_elem.get("href", "") if link_elem else ""
-        snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
-        if title or url or snippet:
-            results.append({"title": title, "url": url, "snippet": snippet})
+    results = await html_processor.run(extract_search_results, resp.text, top_k)
 
     logger.info(
         "Search completed",
@@ -160,11 +195,7 @@ async def fetch_url(url: str, max_links: int = 10) -> dict[str, Any]:
         return {"error": str(exc)}
 
     try:
-        resp = await _request_with_retries(
-            "GET",
-            safe_url,
-            headers={"Accept": "text/html"},
-        )
+        resp = await _cached_get(safe_url, headers={"Accept": "text/html"})
     except Exception as exc:
         logger.error(
             "Fetch failed",
@@ -183,24 +214,8 @@ async def fetch_url(url: str, max_links: int = 10) -> dict[str, Any]:
     if len(html) > MAX_RESPONSE_BYTES:
         html = html[:MAX_RESPONSE_BYTES]
 
-    soup = BeautifulSoup(html, "html.parser")
-
-    title_tag = soup.find("title")
-    title = title_tag.get_text(strip=True) if title_tag else ""
-
-    for tag in soup(["script", "style", "nav", "footer", "header"]):
-        tag.decompose()
-
-    text = soup.get_text(separator="\n", strip=True)
-
-    links = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        link_text = a.get_text(strip=True)
-        if href.startswith("http") and link_text:
-            links.append({"url": href, "text": link_text})
-        if len(links) >= max_links:
-            break
+    page = await html_processor.run(extract_page, html, max_links)
+    title, text, links = page["title"], page["text"], page["links"]
 
     logger.info(
         "URL fetched successfully",
@@ -225,11 +240,7 @@ async def extract_readable(
         return {"error": str(exc)}
 
     try:
-        resp = await _request_with_retries(
-            "GET",
-            safe_url,
-            headers={"Accept": "text/html"},
-        )
+        resp = await _cached_get(safe_url, headers={"Accept": "text/html"})
     except Exception as exc:
         logger.error(
             "Readable fetch failed",
@@ -245,33 +256,13 @@ async def extract_readable(
     if len(html) > MAX_RESPONSE_BYTES:
         html = html[:MAX_RESPONSE_BYTES]
 
-    doc = Document(html)
-    title = (doc.short_title() or doc.title() or "").strip()
-    summary_html = doc.summary() or ""
-    soup = BeautifulSoup(summary_html, "html.parser")
-    # Strip scripts/boilerplate
-    for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
-        tag.decompose()
-    text = soup.get_text("\n", strip=True)
-
-    links: list[dict[str, str]] = []
-    if include_links:
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip()
-            if href.startswith("http"):
-                link_text = a.get_text(strip=True)
-                if link_text:
-                    links.append({"url": href, "text": link_text})
-
-    # Extract page-level metadata from original HTML
-    full_soup = BeautifulSoup(html, "html.parser")
-    meta: dict[str, Any] = {}
-    for name in ("description", "og:description", "og:site_name", "author"):
-        tag = full_soup.find("meta", attrs={"name": name}) or full_soup.find(
-            "meta", attrs={"property": name}
-        )
-        if tag and tag.get("content"):
-            meta[name] = tag.get("content")
+    article = await html_processor.run(extract_article, html, include_links)
+    title, text, meta, links = (
+        article["title"],
+        article["text"],
+        article["metadata"],
+        article["links"],
+    )
 
     return {
         "title": title,
@@ -304,126 +295,61 @@ async def crawl(
     except ValueError as exc:
         return {"error": str(exc)}
 
-    start_host = urlparse(start_url).hostname
-
-    # Simple robots.txt respect (optional, default enabled)
     respect_robots = os.environ.get("WEB_CRAWL_RESPECT_ROBOTS", "1").strip() not in {
         "0",
         "false",
         "False",
     }
-    robots_cache: dict[str, set[str]] = {}
-
-    async def allowed_by_robots(target: str) -> bool:
-        if not respect_robots:
-            return True
-        parsed = urlparse(target)
-        host = parsed.hostname or ""
-        scheme = parsed.scheme or "http"
-        base = f"{scheme}://{host}"
-        if base not in robots_cache:
-            # Fetch robots.txt once
-            try:
-                resp = await http_client.request(
-                    "GET",
-                    f"{base}/robots.txt",
-                    timeout=httpx.Timeout(3.0, connect=3.0, read=3.0),
-                )
-                if resp.status_code == 200 and len(resp.content) < 200_000:
-                    robots_cache[base] = set(resp.text.splitlines())
-                else:
-                    robots_cache[base] = set()
-            except Exception:
-                robots_cache[base] = set()
-
-        # Very light check: disallow simple path prefixes listed in Disallow for all (*)
-        lines = robots_cache.get(base) or set()
-        path = parsed.path or "/"
-        agent_star = False
-        disallows: list[str] = []
-        for line in lines:
-            s = line.strip()
-            if not s or s.startswith("#"):
-                continue
-            if s.lower().startswith("user-agent:"):
-                agent = s.split(":", 1)[1].strip()
-                agent_star = agent == "*"
-            elif agent_star and s.lower().startswith("disallow:"):
-                rule = s.split(":", 1)[1].strip()
-                if rule:
-                    disallows.append(rule)
-        for rule in disallows:
-            if path.startswith(rule):
-                return False
-        return True
-
-    # BFS crawl
-    from collections import deque
-
-    visited: set[str] = set()
-    queue = deque([(start_url, 0)])
-    results: list[dict[str, Any]] = []
-
-    while queue and len(results) < max_pages:
-        current, d = queue.popleft()
-        if current in visited:
-            continue
-        visited.add(current)
-
-        # Host restriction
-        if same_host and urlparse(current).hostname != start_host:
-            continue
-        if not await allowed_by_robots(current):
-            continue
-
-        # Fetch page
-        try:
-            resp = await _request_with_retries(
-                "GET",
-                current,
-                headers={"Accept": "text/html"},
-            )
-        except Exception:
-            continue
-
-        ctype = resp.headers.get("content-type", "").lower()
-        if "text/html" not in ctype:
-            continue
-        html = resp.text
-        if len(html) > MAX_RESPONSE_BYTES:
-            html = html[:MAX_RESPONSE_BYTES]
-
-        # Extract readable text snippet
-        doc = Document(html)
-        title = (doc.short_title() or doc.title() or "").strip()
-        snippet_html = doc.summary() or ""
-        snippet_soup = BeautifulSoup(snippet_html, "html.parser")
-        for tag in snippet_soup(["script", "style", "nav", "footer", "header", "aside"]):
-            tag.decompose()
-        snippet_text = snippet_soup.get_text(" ", strip=True)[:500]
-
-        if title or snippet_text:
-            results.append({"title": title, "url": current, "snippet": snippet_text})
-
-        # Enqueue outgoing links up to depth
-        if d < depth:
-            page_soup = BeautifulSoup(html, "html.parser")
-            for a in page_soup.find_all("a", href=True):
-                href = a["href"].strip()
-                if not href or not href.startswith("http"):
-                    continue
-                try:
-                    safe = await _ensure_safe_url(href)
-                except ValueError:
-                    continue
-                if same_host and urlparse(safe).hostname != start_host:
-                    continue
-                if safe not in visited:
-                    queue.append((safe, d + 1))
+
+    engine = CrawlEngine(
+        ensure_safe=_ensure_safe_url,
+        visit=_crawl_visit,
+        fetch_robots=_fetch_robots_txt,
+        robots=robots_cache if respect_robots else None,
+        throttle=crawl_throttle,
+        max_workers=CRAWL_MAX_WORKERS,
+        user_agent=CRAWL_USER_AGENT,
+    )
+    results = await engine.crawl(start_url, depth=depth, max_pages=max_pages, same_host=same_host)
 
     return {"start_url": url, "pages": results}
 
 
+async def _crawl_visit(page_url: str, want_links: bool) -> CrawlPage | None:
+    """Fetch one crawl page and return its snippet plus outgoing links."""
+    resp = await _cached_get(page_url, headers={"Accept": "text/html"})
+
+    ctype = resp.headers.get("content-type", "").lower()
+    if "text/html" not in ctype:
+        return None
+    html = resp.text
+    if len(html) > MAX_RESPONSE_BYTES:
+        html = html[:MAX_RESPONSE_BYTES]
+
+    # Readable snippet and outgoing links come from a single parse in the HTML pool
+    page = await html_processor.run(extract_crawl_page, html, want_links)
+    title, snippet_text, links = page["title"], page["snippet"], page["links"]
+
+    result = None
+    if title or snippet_text:
+        result = {"title": title, "url": page_url, "snippet": snippet_text}
+    return CrawlPage(result=result, links=links)
+
+
+async def _fetch_robots_txt(robots_url: str) -> str | None:
+    """Fetch robots.txt text for the crawl engine's shared robots cache."""
+    if not http_client:
+        return None
+    resp = await http_client.request(
+        "GET",
+        robots_url,
+        timeout=httpx.Timeout(3.0, connect=3.0, read=3.0),
+    )
+    if resp.status_code == 200 and len(resp.content) < 200_000:
+        return resp.text
+    return None
+
+
 async def _request_with_retries(
     method: str,
     url: str,
@@ -449,6 +375,10 @@ async def _request_with_retries(
                 params=params,
             )
 
+            if response.status_code == 304:
+                # Conditional revalidation succeeded; the caller owns the cached body.
+                return response
+
             if 300 <= response.status_code < 400:
                 raise httpx.HTTPStatusError(
                     "Redirects are not allowed",
@@ -483,6 +413,45 @@ async def _request_with_retries(
     raise last_error
 
 
+async def _cached_get(url: str, *, headers: dict[str, str] | None = None) -> httpx.Response:
+    """GET ``url`` through the shared response cache.
+
+    Fresh entries are served without network access, stale entries with an
+    ETag/Last-Modified are revalidated conditionally, and recent failures are
+    replayed from the negative cache instead of being retried.
+    """
+    failure = response_cache.get_failure(url)
+    if failure is not None:
+        raise replay_failure(failure) from failure
+
+    entry = response_cache.get(url)
+    if entry is not None and entry.is_fresh():
+        return entry.to_response()
+
+    request_headers = dict(headers or {})
+    if entry is not None and entry.has_validators():
+        request_headers.update(response_cache.conditional_headers(entry))
+
+    try:
+        response = await _request_with_retries("GET", url, headers=request_headers)
+    except Exception as exc:
+        response_cache.record_failure(url, exc)
+        raise
+
+    if response.status_code == 304:
+        if entry is None:
+            # Should not happen without validators; treat as a failed fetch.
+            raise httpx.HTTPStatusError(
+                "Unexpected 304 response", request=response.request, response=response
+            )
+        response_cache.refresh(entry, response)
+        return entry.to_response()
+
+    response_cache.clear_failure(url)
+    response_cache.store(url, response)
+    return response
+
+
 async def _ensure_safe_url(raw_url: str) -> str:
     if not isinstance(raw_url, str) or not raw_url.strip():
         raise ValueError("url must be a non-empty string")
@@ -494,33 +463,9 @@ async def _ensure_safe_url(raw_url: str) -> str:
     if not parsed.hostname:
         raise ValueError("URL must include a hostname")
 
-    host = parsed.hostname
-
-    try:
-        ipaddress.ip_address(host)
-        addresses = {host}
-    except ValueError:
-        loop = asyncio.get_running_loop()
-        try:
-            infos = await loop.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
-        except Exception as exc:
-            raise ValueError("Unable to resolve host") from exc
-        addresses = {info[4][0] for info in infos if info and info[4]}
-
-    if not addresses:
-        raise ValueError("Unable to resolve host")
-
-    for address in addresses:
-        ip = ipaddress.ip_address(address)
-        if (
-            ip.is_private
-            or ip.is_loopback
-            or ip.is_link_local
-            or ip.is_reserved
-            or ip.is_multicast
-            or ip.is_unspecified
-        ):
-            raise ValueError("URL resolves to a disallowed IP address")
+    # Resolution and the private/loopback/reserved checks are cached per host; the
+    # HTTP transport connects to the same validated addresses.
+    await dns_resolver.resolve(parsed.hostname)
 
     return parsed.geturl()
 
@@ -592,6 +537,7 @@ mcp_handler.register_tool(
         "additionalProperties": False,
     },
     handler=fetch_url,
+    cache={"ttl": 300},
 )
 
 mcp_handler.register_tool(
@@ -624,6 +570,7 @@ mcp_handler.register_tool(
         "additionalProperties": False,
     },
     handler=extract_readable,
+    cache={"ttl": 300},
 )
 
 mcp_handler.register_tool(
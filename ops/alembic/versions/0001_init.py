@@ -44,7 +44,8 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text("timezone('utc', now())")),
     )
     op.create_index('ix_chat_sessions_external_id', 'chat_sessions', ['external_id'])
-    op.create_index('ix_chat_sessions_user_created', 'chat_sessions', ['user_id', 'created_at'])
+    op.create_index('ix_chat_sessions_user_created', 'chat_sessions', ['user_id', 'created_at', 'id'])
+    op.create_index('ix_chat_sessions_user_updated', 'chat_sessions', ['user_id', 'updated_at', 'id'])
 
     # Chat messages table (content stored as encrypted binary)
     op.create_table(
@@ -59,7 +60,7 @@ def upgrade() -> None:
         sa.Column('tokens_in', sa.Integer(), nullable=True),
         sa.Column('tokens_out', sa.Integer(), nullable=True),
     )
-    op.create_index('ix_chat_messages_session_created', 'chat_messages', ['session_id', 'created_at'])
+    op.create_index('ix_chat_messages_session_created', 'chat_messages', ['session_id', 'created_at', 'id'])
     op.create_index('ix_chat_messages_tokens', 'chat_messages', ['session_id', 'tokens_in', 'tokens_out'],
                    postgresql_where=sa.text('tokens_in IS NOT NULL'))
     op.create_index('ix_chat_messages_encrypted', 'chat_messages', ['session_id', 'created_at'],
@@ -111,6 +112,7 @@ def upgrade() -> None:
         sa.Column('args', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('error_message', sa.Text(), nullable=True),
         sa.Column('result_preview', sa.Text(), nullable=True),
+        sa.Column('cache_hit', sa.Boolean(), nullable=True),
     )
     op.create_index('ix_tool_runs_tool_id', 'tool_runs', ['tool_id'])
     op.create_index('ix_tool_runs_user_id', 'tool_runs', ['user_id'])
@@ -119,7 +121,7 @@ def upgrade() -> None:
     op.create_index('ix_tool_runs_tool_name', 'tool_runs', ['tool_name'])
     op.create_index('ix_tool_runs_status', 'tool_runs', ['status'])
     op.create_index('ix_tool_runs_start_ts', 'tool_runs', ['start_ts'])
-    op.create_index('ix_tool_runs_user_start', 'tool_runs', ['user_id', 'start_ts'])
+    op.create_index('ix_tool_runs_user_start', 'tool_runs', ['user_id', 'start_ts', 'id'])
     op.create_index('ix_tool_runs_tool_start', 'tool_runs', ['tool_name', 'start_ts'])
     op.create_index('ix_tool_runs_analytics', 'tool_runs', ['user_id', 'tool_name', 'status', 'start_ts'])
     op.create_index('ix_tool_runs_message', 'tool_runs', ['message_id', 'start_ts'])
@@ -143,7 +145,7 @@ def upgrade() -> None:
     op.create_index('ix_ingestion_runs_user_id', 'ingestion_runs', ['user_id'])
     op.create_index('ix_ingestion_runs_started_at', 'ingestion_runs', ['started_at'])
     op.create_index('ix_ingestion_runs_status', 'ingestion_runs', ['status'])
-    op.create_index('ix_ingestion_runs_user_started', 'ingestion_runs', ['user_id', 'started_at'])
+    op.create_index('ix_ingestion_runs_user_started', 'ingestion_runs', ['user_id', 'started_at', 'id'])
     op.create_index('idx_ingestion_runs_user_status_started', 'ingestion_runs', ['user_id', 'status', 'started_at'])
 
     # Groups table
@@ -224,7 +226,7 @@ def upgrade() -> None:
     op.create_index('ix_documents_created_at', 'documents', ['created_at'])
     op.create_index('ix_documents_is_private', 'documents', ['is_private'])
     op.create_index('ix_documents_collection_created', 'documents', ['collection', 'created_at'])
-    op.create_index('ix_documents_user_created', 'documents', ['user_id', 'created_at'])
+    op.create_index('ix_documents_user_created', 'documents', ['user_id', 'created_at', 'id'])
     op.create_index('idx_documents_user_collection_created', 'documents', ['user_id', 'collection', 'created_at'])
     op.create_index('idx_documents_group_id', 'documents', ['group_id'])
     op.create_index('idx_documents_group_private', 'documents', ['group_id', 'is_private'])
@@ -303,8 +305,34 @@ def upgrade() -> None:
     op.create_index('ix_user_document_access_document_id', 'user_document_access', ['document_id'])
     op.create_unique_constraint('uq_user_document', 'user_document_access', ['user_id', 'document_id'])
 
+    # Analytics rollups (per-user hourly/daily totals) and aggregator watermark
+    op.create_table(
+        'usage_rollups',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('granularity', sa.String(length=8), primary_key=True),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), primary_key=True),
+        sa.Column('sessions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('messages', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('token_messages', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tokens_in', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('tokens_out', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('tool_runs', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tool_successes', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tool_latency_ms_sum', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('tool_latency_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('ingestion_runs', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_table(
+        'analytics_rollup_state',
+        sa.Column('name', sa.String(length=64), primary_key=True),
+        sa.Column('watermark', sa.DateTime(timezone=True), nullable=False),
+    )
+
 
 def downgrade() -> None:
+    op.drop_table('analytics_rollup_state')
+    op.drop_table('usage_rollups')
+
     # Drop junction tables first (they depend on other tables)
     op.drop_table('user_document_access')
     op.drop_table('user_collection_access')
@@ -256,6 +256,17 @@ class AgentLoop:
         Returns:
             Tool result as string (JSON if structured)
         """
+        result, _ = await self.execute_tool_call_with_status(tool_call)
+        return result
+
+    async def execute_tool_call_with_status(self, tool_call: ToolCall) -> tuple[str, str | None]:
+        """
+        Execute a single tool call, also reporting whether the result cache served it.
+
+        Returns:
+            ``(result, cache_status)``; ``cache_status`` is ``"hit"``, ``"miss"``
+            or ``None`` when the tool is not cacheable or the call failed
+        """
         logger.info(
             "Executing tool",
             extra={
@@ -266,13 +277,15 @@ class AgentLoop:
         )
 
         try:
-            result = await self.registry.call_tool(tool_call.name, tool_call.arguments)
+            result, cache_status = await self.registry.call_tool_with_status(
+                tool_call.name, tool_call.arguments
+            )
 
             # Convert result to string
             if isinstance(result, dict):
-                return json.dumps(result, indent=2)
+                return json.dumps(result, indent=2), cache_status
             else:
-                return str(result)
+                return str(result), cache_status
 
         except (ConnectionError, TimeoutError, OSError) as e:
             error_msg = f"Network error in tool execution: {str(e)}"
@@ -284,7 +297,7 @@ class AgentLoop:
                     "error_type": type(e).__name__
                 }
             )
-            return json.dumps({"error": error_msg, "type": "network_error"})
+            return json.dumps({"error": error_msg, "type": "network_error"}), None
 
         except ValueError as e:
             error_msg = f"Invalid arguments for tool: {str(e)}"
@@ -296,7 +309,7 @@ class AgentLoop:
                     "tool_args": tool_call.arguments
                 }
             )
-            return json.dumps({"error": error_msg, "type": "invalid_args"})
+            return json.dumps({"error": error_msg, "type": "invalid_args"}), None
 
         except Exception as e:
             error_msg = f"Unexpected error in tool execution: {str(e)}"
@@ -308,7 +321,7 @@ class AgentLoop:
                     "error_type": type(e).__name__
                 }
             )
-            return json.dumps({"error": error_msg, "type": "unexpected_error"})
+            return json.dumps({"error": error_msg, "type": "unexpected_error"}), None
 
     async def run_until_completion(
         self,
@@ -399,7 +412,7 @@ class AgentLoop:
                 )
 
                 # Execute tool
-                tool_result = await self.execute_tool_call(tool_call)
+                tool_result, cache_status = await self.execute_tool_call_with_status(tool_call)
                 duration_ms = int((time.perf_counter() - timer_start) * 1000)
                 finished_at = datetime.now(timezone.utc)
 
@@ -440,16 +453,16 @@ class AgentLoop:
                 if isinstance(preview, str) and len(preview) > 2000:
                     preview = preview[:2000]
 
-                yield {
-                    "event": "tool",
-                    "data": {
-                        "tool": tool_call.name,
-                        "status": tool_status,
-                        "ts": finished_at.isoformat(),
-                        "latency_ms": duration_ms,
-                        "result_preview": preview,
-                    },
+                end_data = {
+                    "tool": tool_call.name,
+                    "status": tool_status,
+                    "ts": finished_at.isoformat(),
+                    "latency_ms": duration_ms,
+                    "result_preview": preview,
                 }
+                if cache_status is not None:
+                    end_data["cache"] = cache_status
+                yield {"event": "tool", "data": end_data}
 
                 # Check for multiple tool calls violation
                 if len(turn_result.tool_calls) > 1:
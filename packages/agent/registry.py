@@ -3,11 +3,15 @@ MCP tool registry with dynamic discovery and management.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 from typing import Any
 
 from packages.mcp import MCPClient, MCPTool
 
+from .tool_cache import ToolCachePolicy, ToolResultCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,22 +20,50 @@ class MCPRegistry:
     Registry that manages multiple MCP servers and their tools.
 
     Handles:
-    - Multi-server connection and tool discovery
+    - Multi-server connection and tool discovery (incremental: servers whose
+      advertised schema version is unchanged are not re-listed)
     - Tool routing to appropriate server
     - Health monitoring
     - LLM schema generation
+    - Result caching for tools that declare a cache policy
     """
 
-    def __init__(self, server_configs: list[dict[str, str]]):
+    def __init__(
+        self,
+        server_configs: list[dict[str, str]],
+        *,
+        pool_size: int = 2,
+        max_in_flight_per_connection: int = 8,
+        heartbeat_interval: float = 30.0,
+        tool_cache_size: int = 512,
+    ):
         """
         Initialize the registry.
 
         Args:
             server_configs: List of {"server_id": str, "url": str} dicts
+            pool_size: WebSocket connections per server
+            max_in_flight_per_connection: Concurrent requests per connection
+            heartbeat_interval: Idle seconds before a connection is pinged
+            tool_cache_size: Cached tool results kept (0 disables caching)
         """
         self.server_configs = server_configs
+        self._client_options = {
+            "pool_size": pool_size,
+            "max_in_flight_per_connection": max_in_flight_per_connection,
+            "heartbeat_interval": heartbeat_interval,
+        }
         self.clients: dict[str, MCPClient] = {}
         self.tools: dict[str, MCPTool] = {}  # qualified_name -> MCPTool
+        self.result_cache = ToolResultCache(tool_cache_size) if tool_cache_size > 0 else None
+        self._cache_policies: dict[str, ToolCachePolicy] = {}
+        # Per-server discovery state for incremental refresh
+        self._server_tools: dict[str, dict[str, MCPTool]] = {}
+        self._server_versions: dict[str, str] = {}
+        self._server_fingerprints: dict[str, str] = {}
+        self._persisted_health: dict[str, bool] | None = None
+        # to_llm_tools results per (excluded servers, healthy servers)
+        self._llm_tools_cache: dict[tuple[frozenset[str], tuple[str, ...]], list[dict[str, Any]]] = {}
         self._lock = asyncio.Lock()
         # Exposed name mapping (sanitized for LLM tool schema)
         self._exposed_to_qualified: dict[str, str] = {}
@@ -43,7 +75,7 @@ class MCPRegistry:
         self._on_refreshed = None
 
     def set_refreshed_callback(self, callback):
-        """Set a callback invoked after tools are refreshed.
+        """Set a callback invoked after a refresh that changed tools or server health.
 
         Callback signature: async or sync function accepting (tools: dict[str, MCPTool], clients: dict[str, MCPClient])
         """
@@ -61,77 +93,152 @@ class MCPRegistry:
             server_id = config["server_id"]
             url = config["url"]
 
-            client = MCPClient(server_url=url, server_id=server_id)
+            client = MCPClient(server_url=url, server_id=server_id, **self._client_options)
             self.clients[server_id] = client
 
         # Discover tools from all servers
         await self.refresh_tools()
 
-    async def refresh_tools(self) -> None:
-        """Refresh tool list from all servers."""
-        async with self._lock:
-            new_tools = {}
+    async def refresh_tools(self, force: bool = False) -> bool:
+        """
+        Refresh tools from all servers, re-listing only those that changed.
 
-            # Discover tools from each server
-            tasks = []
-            for server_id, client in self.clients.items():
-                tasks.append(self._discover_from_server(client, new_tools))
+        A server whose advertised schema version matches the last listing is
+        skipped. The tool map, exposure map and LLM schemas are rebuilt, and the
+        refreshed callback fired, only when tools or server health changed.
 
-            await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            force: Re-list every server regardless of its schema version
 
-            self.tools = new_tools
-            # Rebuild exposure map
-            self._rebuild_exposure_map()
-            logger.info(
-                "Registry tools refreshed",
-                extra={
-                    "tool_count": len(self.tools),
-                    "server_count": len(self.clients),
-                    "exposed_count": len(self._exposed_to_qualified)
-                }
+        Returns:
+            True if any server's tools changed
+        """
+        async with self._lock:
+            results = await asyncio.gather(
+                *(self._refresh_server(client, force) for client in self.clients.values()),
+                return_exceptions=True,
             )
+            changed = any(result is True for result in results)
+            health = {server_id: client.is_healthy for server_id, client in self.clients.items()}
+
+            if changed:
+                self._apply_server_tools()
+                logger.info(
+                    "Registry tools refreshed",
+                    extra={
+                        "tool_count": len(self.tools),
+                        "server_count": len(self.clients),
+                        "exposed_count": len(self._exposed_to_qualified),
+                        "changed_servers": [
+                            server_id
+                            for server_id, result in zip(self.clients, results)
+                            if result is True
+                        ],
+                    }
+                )
+            else:
+                logger.debug(
+                    "Registry tools unchanged",
+                    extra={"tool_count": len(self.tools), "server_count": len(self.clients)}
+                )
+
             # Invoke callback
-            if self._on_refreshed:
+            if self._on_refreshed and (changed or health != self._persisted_health):
                 try:
                     maybe = self._on_refreshed(self.tools, self.clients)
                     if asyncio.iscoroutine(maybe):
                         await maybe
+                    self._persisted_health = health
                 except Exception as e:
                     logger.error(
                         "on_refreshed callback failed",
                         extra={"error": str(e), "error_type": type(e).__name__}
                     )
+            return changed
 
-    async def _discover_from_server(
-        self, client: MCPClient, tools_dict: dict[str, MCPTool]
-    ) -> None:
-        """Discover tools from a single server."""
+    async def _refresh_server(self, client: MCPClient, force: bool) -> bool:
+        """Re-list one server's tools if its schema version moved; True when they changed."""
+        server_id = client.server_id
         try:
+            known = self._server_versions.get(server_id)
+            if not force and known is not None and server_id in self._server_tools:
+                if await client.fetch_tools_version() == known:
+                    return False
             tools = await client.list_tools()
-            for tool in tools:
-                qualified_name = f"{client.server_id}.{tool.name}"
-                tools_dict[qualified_name] = tool
         except Exception as e:
             logger.error(
                 "Failed to discover tools from server",
                 extra={
-                    "server_id": client.server_id,
+                    "server_id": server_id,
                     "error": str(e),
                     "error_type": type(e).__name__
                 }
             )
+            # An unreachable server contributes no tools until it answers again
+            self._server_versions.pop(server_id, None)
+            self._server_fingerprints.pop(server_id, None)
+            return self._server_tools.pop(server_id, None) is not None
+
+        if client.tools_version:
+            self._server_versions[server_id] = client.tools_version
+        else:
+            self._server_versions.pop(server_id, None)
+
+        fingerprint = self._fingerprint(tools)
+        if server_id in self._server_tools and self._server_fingerprints.get(server_id) == fingerprint:
+            return False
+        self._server_fingerprints[server_id] = fingerprint
+        self._server_tools[server_id] = {f"{server_id}.{tool.name}": tool for tool in tools}
+        return True
+
+    @staticmethod
+    def _fingerprint(tools: list[MCPTool]) -> str:
+        payload = json.dumps(
+            [[t.name, t.description, t.input_schema, t.tags, t.cache] for t in tools],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _apply_server_tools(self) -> None:
+        """Rebuild the merged tool map and everything derived from it."""
+        tools: dict[str, MCPTool] = {}
+        for server_id in self.clients:
+            tools.update(self._server_tools.get(server_id, {}))
+        self.tools = tools
+        self._cache_policies = {
+            tool.name: policy
+            for tool in tools.values()
+            if (policy := ToolCachePolicy.from_metadata(tool.cache)) is not None
+        }
+        # Rebuild exposure map
+        self._rebuild_exposure_map()
+        self._llm_tools_cache = {}
 
     def to_llm_tools(self, exclude_servers: list[str] | None = None) -> list[dict[str, Any]]:
         """
         Convert registry tools to LLM tool schema format.
 
+        The list is built once per combination of excluded and healthy servers
+        and reused until tools change; callers must not modify it.
+
         Args:
             exclude_servers: Optional list of server IDs to exclude (e.g., ["web"] to disable web tools)
 
         Returns:
             List of tool schemas in OpenAI/Ollama format
         """
-        exclude_set = set(exclude_servers or [])
+        exclude_set = frozenset(exclude_servers or ())
+        healthy = tuple(server_id for server_id, client in self.clients.items() if client.is_healthy)
+        key = (exclude_set, healthy)
+        schemas = self._llm_tools_cache.get(key)
+        if schemas is None:
+            schemas = self._build_llm_tools(exclude_set)
+            self._llm_tools_cache[key] = schemas
+        return schemas
+
+    def _build_llm_tools(self, exclude_set: frozenset[str]) -> list[dict[str, Any]]:
         schemas: list[dict[str, Any]] = []
         for qualified_name, tool in self.tools.items():
             if not self._is_tool_available(tool):
@@ -168,6 +275,19 @@ class MCPRegistry:
         Returns:
             Tool execution result
         """
+        result, _ = await self.call_tool_with_status(tool_name, arguments)
+        return result
+
+    async def call_tool_with_status(
+        self, tool_name: str, arguments: dict[str, Any]
+    ) -> tuple[Any, str | None]:
+        """
+        Route and execute a tool call, serving it from the result cache when allowed.
+
+        Returns:
+            ``(result, cache_status)`` where ``cache_status`` is ``"hit"``,
+            ``"miss"``, or ``None`` for tools without a cache policy
+        """
         tool = self.tools.get(tool_name)
         if not tool:
             # Try exposed name mapping (sanitized names from LLM)
@@ -184,6 +304,25 @@ class MCPRegistry:
         if not client.is_healthy:
             raise RuntimeError(f"MCP server {tool.server_id} is unhealthy")
 
+        policy = self._cache_policies.get(tool.name)
+        if policy is None or self.result_cache is None:
+            return await self._invoke(client, tool, tool_name, arguments), None
+
+        result, status = await self.result_cache.get_or_call(
+            tool.name,
+            arguments,
+            policy,
+            lambda: self._invoke(client, tool, tool_name, arguments),
+        )
+        logger.debug(
+            "Tool result cache lookup",
+            extra={"tool_name": tool.name, "cache": status},
+        )
+        return result, status
+
+    async def _invoke(
+        self, client: MCPClient, tool: MCPTool, tool_name: str, arguments: dict[str, Any]
+    ) -> Any:
         logger.info(
             "Calling tool on MCP server",
             extra={"tool_name": tool_name, "server_id": tool.server_id}
@@ -212,6 +351,26 @@ class MCPRegistry:
             )
             raise RuntimeError(f"Tool {tool_name} execution failed: {e}")
 
+    def invalidate_tool_cache(self, server_id: str | None = None) -> int:
+        """Drop cached results for one server's tools (all servers when ``None``)."""
+        if self.result_cache is None:
+            return 0
+        dropped = self.result_cache.invalidate(f"{server_id}." if server_id else None)
+        if dropped:
+            logger.info(
+                "Tool result cache invalidated",
+                extra={"server_id": server_id, "entries": dropped},
+            )
+        return dropped
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Result cache counters, plus the tools that declare a cache policy."""
+        stats: dict[str, Any] = (
+            self.result_cache.stats() if self.result_cache is not None else {"enabled": False}
+        )
+        stats["cacheable_tools"] = sorted(self._cache_policies)
+        return stats
+
     async def close_all(self) -> None:
         """Close all MCP client connections."""
         # Stop periodic refresh first
@@ -227,6 +386,10 @@ class MCPRegistry:
         """Get list of healthy server IDs."""
         return [server_id for server_id, client in self.clients.items() if client.is_healthy]
 
+    def pool_stats(self) -> dict[str, dict[str, Any]]:
+        """Connection pool usage per server ID."""
+        return {server_id: client.pool_stats() for server_id, client in self.clients.items()}
+
     def _rebuild_exposure_map(self) -> None:
         exposed_to_qualified: dict[str, str] = {}
         qualified_to_exposed: dict[str, str] = {}
@@ -0,0 +1,172 @@
+"""
+Result cache for idempotent MCP tools.
+
+Servers opt a tool in by declaring a ``cache`` policy next to its schema in
+``tools/list``::
+
+    {"name": "convert", "inputSchema": {...}, "cache": {"ttl": 86400}}
+
+Policy fields:
+
+* ``ttl`` - seconds a result stays valid (required, > 0)
+* ``cacheable`` - set to ``false`` to switch caching off explicitly
+* ``keyFields`` - arguments that identify a call (default: all of them)
+
+The registry enforces the policies centrally: results live in a bounded LRU,
+and concurrent identical calls share one in-flight request to the server.
+Results carrying an ``error`` key are never stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+
+
+@dataclass(frozen=True, slots=True)
+class ToolCachePolicy:
+    """Caching rules declared by a tool."""
+
+    ttl: float
+    key_fields: tuple[str, ...] | None = None
+
+    @classmethod
+    def from_metadata(cls, metadata: Any) -> "ToolCachePolicy | None":
+        """Build a policy from tool metadata; ``None`` when the tool is not cacheable."""
+        if not isinstance(metadata, dict) or not metadata.get("cacheable", True):
+            return None
+        try:
+            ttl = float(metadata.get("ttl", 0))
+        except (TypeError, ValueError):
+            return None
+        if ttl <= 0:
+            return None
+        fields = metadata.get("keyFields")
+        if isinstance(fields, list) and all(isinstance(f, str) for f in fields):
+            return cls(ttl=ttl, key_fields=tuple(fields))
+        return cls(ttl=ttl)
+
+    def key(self, tool_name: str, arguments: dict[str, Any]) -> tuple[str, str]:
+        if self.key_fields is not None:
+            arguments = {field: arguments.get(field) for field in self.key_fields}
+        return tool_name, json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ToolResultCache:
+    """
+    LRU of tool results with per-entry expiry and single-flight calls.
+
+    Args:
+        max_entries: Results kept before the least recently used is evicted
+        clock: Monotonic time source (overridable in tests)
+    """
+
+    def __init__(
+        self, max_entries: int = 512, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_call(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        policy: ToolCachePolicy,
+        call: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, str]:
+        """
+        Return a cached result or run ``call`` (once for concurrent identical calls).
+
+        Returns:
+            ``(result, CACHE_HIT | CACHE_MISS)``; results shared with other
+            callers are copies, so callers may modify them.
+        """
+        key = policy.key(tool_name, arguments)
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(value), CACHE_HIT
+                del self._entries[key]
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                value = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if pending.cancelled():
+                    continue  # The leading call was cancelled; try again ourselves
+                raise
+            self.hits += 1
+            self.coalesced += 1
+            return copy.deepcopy(value), CACHE_HIT
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.misses += 1
+        try:
+            value = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        else:
+            if not (isinstance(value, dict) and "error" in value):
+                self._store(key, value, policy.ttl)
+            future.set_result(value)
+            return value, CACHE_MISS
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self, prefix: str | None = None) -> int:
+        """Drop cached results for tools whose name starts with ``prefix`` (all when ``None``)."""
+        if prefix is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        stale = [key for key in self._entries if key[0].startswith(prefix)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+        }
+
+    def _store(self, key: tuple[str, str], value: Any, ttl: float) -> None:
+        self._entries[key] = (self._clock() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
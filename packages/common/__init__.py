@@ -1,26 +1,20 @@
 """
 Common utilities, settings, and accelerator management for the ingestion pipeline.
+
+Health checks and audit logging pull in the database layer, Qdrant client and
+httpx; they are imported on first attribute access so that light consumers
+(MCP servers, the MCP client) do not pay for them at start-up.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .logger import get_logger
 from .settings import Settings, get_settings
 from .accelerator import AcceleratorChoice, coerce_preference, resolve_accelerator
 from .correlation import get_correlation_id, set_correlation_id, clear_correlation_id, correlation_id_var
-from .health import (
-    HealthStatus,
-    HealthCheck,
-    check_postgres_health,
-    check_qdrant_health,
-    check_ollama_health,
-    check_mcp_servers_health,
-    get_aggregate_health,
-)
-from .audit import (
-    create_audit_log,
-    log_user_action,
-    log_security_event,
-    AuditAction,
-)
 from .exceptions import (
     YouWorkerException,
     ResourceNotFoundError,
@@ -37,6 +31,41 @@ from .exceptions import (
     ConfigurationError,
 )
 
+if TYPE_CHECKING:
+    from .audit import AuditAction, create_audit_log, log_security_event, log_user_action
+    from .health import (
+        HealthCheck,
+        HealthStatus,
+        check_mcp_servers_health,
+        check_ollama_health,
+        check_postgres_health,
+        check_qdrant_health,
+        get_aggregate_health,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "HealthStatus": ".health",
+    "HealthCheck": ".health",
+    "check_postgres_health": ".health",
+    "check_qdrant_health": ".health",
+    "check_ollama_health": ".health",
+    "check_mcp_servers_health": ".health",
+    "get_aggregate_health": ".health",
+    "create_audit_log": ".audit",
+    "log_user_action": ".audit",
+    "log_security_event": ".audit",
+    "AuditAction": ".audit",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     "get_logger",
     "Settings",
@@ -0,0 +1,246 @@
+"""
+Audio front-end shared by live speech-to-text and media ingestion.
+
+* ``GrowableAudioBuffer`` - preallocated sample buffer that grows by doubling
+  and drops consumed samples without reallocating on every chunk.
+* ``StreamingResampler`` - polyphase FIR resampler (``resample_poly``-style)
+  that keeps its filter state across chunks, so a stream can be resampled
+  chunk by chunk with the same result as resampling it in one go.
+* ``pcm16_to_float``, ``rms`` and ``frame_rms`` - conversion and energy helpers
+  that work on views of the incoming data instead of temporary copies.
+"""
+
+from __future__ import annotations
+
+from math import gcd
+from typing import Any
+
+import numpy as np
+
+_UNRESOLVED: Any = object()
+# scipy.signal.upfirdn, imported on first use (scipy.signal costs ~0.7 s to import).
+# scipy is optional; None selects the numpy path, which gives the same result.
+upfirdn: Any = _UNRESOLVED
+
+PCM16_SCALE = 1.0 / 32768.0
+
+
+def _upfirdn() -> Any:
+    global upfirdn
+    if upfirdn is _UNRESOLVED:
+        try:  # pragma: no cover - optional dependency
+            from scipy.signal import upfirdn as scipy_upfirdn
+        except ImportError:  # pragma: no cover
+            scipy_upfirdn = None
+        upfirdn = scipy_upfirdn
+    return upfirdn
+
+
+def pcm16_to_float(data: bytes | bytearray | memoryview, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert little-endian PCM16 bytes to float32 in [-1, 1).
+
+    A trailing odd byte is ignored. When ``out`` is given (and large enough)
+    the samples are written into it and a view of it is returned.
+    """
+    usable = len(data) - len(data) % 2
+    samples = np.frombuffer(data, dtype="<i2", count=usable // 2)
+    if out is None or out.size < samples.size:
+        out = np.empty(samples.size, dtype=np.float32)
+    view = out[: samples.size]
+    np.multiply(samples, np.float32(PCM16_SCALE), out=view, casting="unsafe")
+    return view
+
+
+def rms(audio: np.ndarray) -> float:
+    """Root-mean-square level of ``audio`` without squaring into a temporary."""
+    if not audio.size:
+        return 0.0
+    return float(np.sqrt(np.dot(audio, audio) / audio.size))
+
+
+def frame_rms(audio: np.ndarray, frame: int) -> np.ndarray:
+    """RMS of each complete ``frame``-sample frame, computed on a reshaped view."""
+    frames = audio.size // frame
+    view = audio[: frames * frame].reshape(frames, frame).astype(np.float32, copy=False)
+    return np.sqrt(np.einsum("ij,ij->i", view, view) / frame)
+
+
+class GrowableAudioBuffer:
+    """
+    Append-only sample buffer with amortised O(1) appends.
+
+    Storage doubles when full, and ``consume`` only moves the read position;
+    live samples are compacted to the front only when space runs out.
+    """
+
+    def __init__(self, capacity: int = 16000, dtype: np.dtype | type = np.float32) -> None:
+        self._data = np.empty(max(1, capacity), dtype=dtype)
+        self._begin = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._begin
+
+    @property
+    def capacity(self) -> int:
+        return self._data.size
+
+    def append(self, samples: np.ndarray) -> None:
+        count = samples.size
+        if self._end + count > self._data.size:
+            self._make_room(count)
+        self._data[self._end : self._end + count] = samples
+        self._end += count
+
+    def view(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Buffered samples (no copy); valid until the next ``append``."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        return self._data[self._begin + start : self._begin + stop]
+
+    def consume(self, count: int) -> None:
+        """Drop ``count`` samples from the front."""
+        self._begin = min(self._end, self._begin + count)
+        if self._begin == self._end:
+            self._begin = self._end = 0
+
+    def take(self, count: int | None = None) -> np.ndarray:
+        """Copy out and drop the first ``count`` samples (all when ``None``)."""
+        samples = self.view(0, count).copy()
+        self.consume(samples.size)
+        return samples
+
+    def clear(self) -> None:
+        self._begin = self._end = 0
+
+    def _make_room(self, count: int) -> None:
+        live = len(self)
+        capacity = self._data.size
+        while live + count > capacity:
+            capacity *= 2
+        if capacity == self._data.size:
+            # Enough space once consumed samples are dropped
+            self._data[:live] = self._data[self._begin : self._end]
+        else:
+            grown = np.empty(capacity, dtype=self._data.dtype)
+            grown[:live] = self._data[self._begin : self._end]
+            self._data = grown
+        self._begin, self._end = 0, live
+
+
+def _design_filter(up: int, down: int, taps_per_phase: int, beta: float) -> tuple[np.ndarray, int]:
+    """
+    Kaiser-windowed sinc low-pass for the upsampled rate, with gain ``up``.
+
+    The filter is zero-padded in front so its centre falls on a multiple of
+    ``down``, which makes the delay a whole number of output samples.
+
+    Returns:
+        ``(taps, delay)`` with ``len(taps)`` a multiple of ``up``
+    """
+    half = taps_per_phase * up // 2
+    cutoff = 1.0 / max(up, down)
+    t = np.arange(-half, half + 1, dtype=np.float64)
+    taps = cutoff * np.sinc(cutoff * t) * np.kaiser(t.size, beta)
+    taps *= up / taps.sum()
+    pre = -half % down
+    post = -(pre + taps.size) % up
+    return np.pad(taps, (pre, post)), (half + pre) // down
+
+
+class StreamingResampler:
+    """
+    Stateful rational-ratio resampler.
+
+    The input is conceptually upsampled by ``up``, low-pass filtered and
+    decimated by ``down``; only the non-zero products are computed (scipy's
+    ``upfirdn`` when available, otherwise the polyphase filter bank applied to
+    all output samples of a chunk at once with numpy). About
+    ``taps_per_phase`` input samples are carried over between chunks. Output
+    lags the input by ``delay`` output samples.
+
+    Args:
+        source_rate: Input sample rate
+        target_rate: Output sample rate
+        taps_per_phase: Filter taps per polyphase branch (quality vs. CPU)
+        beta: Kaiser window shape parameter
+    """
+
+    def __init__(
+        self,
+        source_rate: int,
+        target_rate: int,
+        *,
+        taps_per_phase: int = 24,
+        beta: float = 8.0,
+    ) -> None:
+        divisor = gcd(source_rate, target_rate)
+        self.source_rate = source_rate
+        self.target_rate = target_rate
+        self.up = target_rate // divisor
+        self.down = source_rate // divisor
+        taps, self.delay = _design_filter(self.up, self.down, taps_per_phase, beta)
+        self._taps = taps.astype(np.float32)
+        self.taps = taps.size // self.up
+        # bank[p, k] = taps[p + k * up]: the branch used for output phase p
+        self._bank = self._taps.reshape(self.taps, self.up).T.copy()
+        self._offsets = np.arange(self.taps)
+        self.reset()
+
+    @property
+    def passthrough(self) -> bool:
+        return self.up == self.down
+
+    def reset(self) -> None:
+        self._history = np.empty(0, dtype=np.float32)
+        self._consumed = 0  # input samples seen
+        self._produced = 0  # output samples emitted
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Resample the next chunk of the stream."""
+        if self.passthrough:
+            return chunk.astype(np.float32, copy=False)
+        if not chunk.size:
+            return np.empty(0, dtype=np.float32)
+
+        extended = np.concatenate((self._history, chunk.astype(np.float32, copy=False)))
+        # Global index of extended[0]; always a multiple of ``down`` so output
+        # phases line up with a filter run started at extended[0].
+        base = self._consumed - self._history.size
+        self._consumed += chunk.size
+        first, end = self._produced, -(-self._consumed * self.up // self.down)
+        self._produced = end
+        keep_from = max(0, self._consumed - (self.taps - 1)) // self.down * self.down
+        self._history = extended[keep_from - base :].copy()
+        if first >= end:
+            return np.empty(0, dtype=np.float32)
+
+        offset = base * self.up // self.down
+        filter_fn = _upfirdn()
+        if filter_fn is not None:
+            output = filter_fn(self._taps, extended, self.up, self.down)
+            return output[first - offset : end - offset].astype(np.float32, copy=False)
+
+        position = np.arange(first, end, dtype=np.int64) * self.down
+        # Index of x[q - k] for every output and branch tap, past ``taps - 1`` zeros
+        index = (position // self.up - base + self.taps - 1)[:, None] - self._offsets
+        padded = np.concatenate((np.zeros(self.taps - 1, dtype=np.float32), extended))
+        return np.einsum("ij,ij->i", padded[index], self._bank[position % self.up])
+
+    def flush(self) -> np.ndarray:
+        """Emit the samples still inside the filter at the end of the stream."""
+        if self.passthrough:
+            return np.empty(0, dtype=np.float32)
+        # Enough silence to push the last real sample past the filter delay
+        padding = -(-self.delay * self.down // self.up) + 1
+        return self.process(np.zeros(padding, dtype=np.float32))
+
+
+def resample(audio: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """Resample a whole signal, compensating the filter delay."""
+    if source_rate == target_rate or not audio.size:
+        return audio.astype(np.float32, copy=False)
+    resampler = StreamingResampler(source_rate, target_rate)
+    output = np.concatenate((resampler.process(audio), resampler.flush()))
+    length = -(-audio.size * resampler.up // resampler.down)
+    return output[resampler.delay : resampler.delay + length]
@@ -37,6 +37,18 @@ class DatabaseConfig(BaseModel):
         le=60.0,
         description="Log queries taking longer than this threshold in seconds"
     )
+    analytics_rollup_interval: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        description="Seconds between analytics rollup passes (0 disables the aggregator)"
+    )
+    analytics_rollup_settle_minutes: int = Field(
+        default=60,
+        ge=0,
+        le=1440,
+        description="Minutes before the last pass that are recomputed to catch late updates"
+    )
 
     @field_validator("url")
     @classmethod
@@ -63,12 +75,30 @@ class SecurityConfig(BaseModel):
         default=None,
         description="Fernet key for chat message encryption (defaults to JWT secret)"
     )
+    message_decrypt_workers: int = Field(
+        default=4,
+        ge=0,
+        le=64,
+        description="Threads that decrypt batches of chat messages off the event loop (0 decrypts inline)",
+    )
+    message_plaintext_cache_mb: int = Field(
+        default=32,
+        ge=0,
+        le=4096,
+        description="Size of the in-process cache of decrypted chat messages, in MB (0 disables)",
+    )
     whitelisted_ips: str = Field(default="", description="Comma-separated IPs for production access control")
 
     # Authentik SSO integration
     authentik_enabled: bool = Field(default=False, description="Enable Authentik SSO")
     authentik_header_name: str = Field(default="x-authentik-api-key", description="Authentik API key header")
     authentik_forward_user_header: str | None = Field(default=None, description="Authentik forwarded user header")
+    auth_principal_cache_ttl: float = Field(
+        default=60.0,
+        ge=0.0,
+        le=3600.0,
+        description="Seconds an authenticated user is reused without a database lookup (0 disables)",
+    )
 
 
 class OllamaConfig(BaseModel):
@@ -161,6 +191,37 @@ class IngestionConfig(BaseModel):
     crawl_max_depth: int = Field(default=2, ge=1, description="Max crawl depth")
     crawl_max_pages: int = Field(default=50, ge=1, description="Max pages to crawl")
 
+    # Video keyframes
+    video_frame_interval: float = Field(
+        default=5.0, gt=0, le=600, description="Seconds between sampled video keyframes"
+    )
+    video_scene_threshold: int = Field(
+        default=4,
+        ge=0,
+        le=64,
+        description="Drop keyframes within this perceptual-hash distance of the last kept one (0 disables)",
+    )
+
+    # Long media transcription
+    media_segment_seconds: float = Field(
+        default=30.0,
+        ge=5,
+        le=600,
+        description="Target length of the silence-split audio segments transcribed in parallel",
+    )
+
+    # Chunk deduplication
+    dedup_enabled: bool = Field(
+        default=True,
+        description="Store identical and near-identical chunks once per collection and owner",
+    )
+    dedup_simhash_distance: int = Field(
+        default=0,
+        ge=0,
+        le=7,
+        description="Max differing SimHash bits for chunks to count as near duplicates (0 = exact only)",
+    )
+
 
 class AgentConfig(BaseModel):
     """AI agent behavior configuration."""
@@ -178,6 +239,27 @@ class MCPConfig(BaseModel):
 
     server_urls: str = Field(default="", description="Comma-separated MCP server URLs")
     refresh_interval: int = Field(default=90, ge=10, description="Health check interval in seconds")
+    pool_size: int = Field(
+        default=2, ge=1, le=16, description="WebSocket connections per MCP server"
+    )
+    max_in_flight_per_connection: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Concurrent requests multiplexed on one MCP connection",
+    )
+    heartbeat_interval: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=600.0,
+        description="Ping an MCP connection after this many idle seconds (0 disables)",
+    )
+    tool_cache_size: int = Field(
+        default=512,
+        ge=0,
+        le=100000,
+        description="Tool results cached for tools that declare a cache policy (0 disables)",
+    )
 
 
 class RetryConfig(BaseModel):
@@ -209,6 +291,44 @@ class RetryConfig(BaseModel):
     )
 
 
+class StreamingConfig(BaseModel):
+    """Output streaming (SSE/WebSocket) behaviour."""
+
+    flush_interval_ms: int = Field(
+        default=25,
+        ge=0,
+        le=1000,
+        description="Coalesce streamed tokens into frames flushed at this interval (0 disables)"
+    )
+    flush_bytes: int = Field(
+        default=1024,
+        ge=1,
+        description="Flush a coalesced token frame early once this many bytes are buffered"
+    )
+
+
+class WhisperEngineConfig(BaseModel):
+    """Shared Whisper engine used by live STT and media ingestion."""
+
+    workers: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Worker threads (and CTranslate2 workers) serving transcription requests"
+    )
+    batch_size: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Batch size for batched long-form media transcription (1 disables batching)"
+    )
+    idle_unload_seconds: int = Field(
+        default=600,
+        ge=0,
+        description="Unload Whisper models unused for this many seconds (0 keeps them loaded)"
+    )
+
+
 class APIConfig(BaseModel):
     """API server configuration."""
 
@@ -267,6 +387,8 @@ class Settings(BaseSettings):
     agent: AgentConfig = Field(default_factory=AgentConfig)
     mcp: MCPConfig = Field(default_factory=MCPConfig)
     retry: RetryConfig = Field(default_factory=RetryConfig)
+    streaming: StreamingConfig = Field(default_factory=StreamingConfig)
+    whisper_engine: WhisperEngineConfig = Field(default_factory=WhisperEngineConfig)
     api: APIConfig = Field(default_factory=APIConfig)
 
     # Flat legacy fields for backward compatibility (mapped from nested configs)
@@ -306,6 +428,14 @@ class Settings(BaseSettings):
     def db_slow_query_threshold(self) -> float:
         return self.database.slow_query_threshold
 
+    @property
+    def analytics_rollup_interval(self) -> int:
+        return self.database.analytics_rollup_interval
+
+    @property
+    def analytics_rollup_settle_minutes(self) -> int:
+        return self.database.analytics_rollup_settle_minutes
+
     @property
     def root_api_key(self) -> str:
         return self.security.root_api_key
@@ -330,10 +460,22 @@ class Settings(BaseSettings):
     def csrf_token_ttl_seconds(self) -> int:
         return self.security.csrf_token_ttl_seconds
 
+    @property
+    def auth_principal_cache_ttl(self) -> float:
+        return self.security.auth_principal_cache_ttl
+
     @property
     def chat_message_encryption_secret(self) -> str | None:
         return self.security.chat_message_encryption_secret
 
+    @property
+    def message_decrypt_workers(self) -> int:
+        return self.security.message_decrypt_workers
+
+    @property
+    def message_plaintext_cache_mb(self) -> int:
+        return self.security.message_plaintext_cache_mb
+
     @property
     def whitelisted_ips(self) -> str:
         return self.security.whitelisted_ips
@@ -478,6 +620,26 @@ class Settings(BaseSettings):
     def crawl_max_pages(self) -> int:
         return self.ingestion.crawl_max_pages
 
+    @property
+    def ingest_video_frame_interval(self) -> float:
+        return self.ingestion.video_frame_interval
+
+    @property
+    def ingest_video_scene_threshold(self) -> int:
+        return self.ingestion.video_scene_threshold
+
+    @property
+    def ingest_media_segment_seconds(self) -> float:
+        return self.ingestion.media_segment_seconds
+
+    @property
+    def ingest_dedup_enabled(self) -> bool:
+        return self.ingestion.dedup_enabled
+
+    @property
+    def ingest_dedup_simhash_distance(self) -> int:
+        return self.ingestion.dedup_simhash_distance
+
     @property
     def max_agent_iterations(self) -> int:
         return self.agent.max_iterations
@@ -490,6 +652,22 @@ class Settings(BaseSettings):
     def mcp_refresh_interval(self) -> int:
         return self.mcp.refresh_interval
 
+    @property
+    def mcp_pool_size(self) -> int:
+        return self.mcp.pool_size
+
+    @property
+    def mcp_max_in_flight_per_connection(self) -> int:
+        return self.mcp.max_in_flight_per_connection
+
+    @property
+    def mcp_heartbeat_interval(self) -> float:
+        return self.mcp.heartbeat_interval
+
+    @property
+    def mcp_tool_cache_size(self) -> int:
+        return self.mcp.tool_cache_size
+
     @property
     def retry_max_attempts(self) -> int:
         return self.retry.max_attempts
@@ -506,6 +684,26 @@ class Settings(BaseSettings):
     def retry_multiplier(self) -> float:
         return self.retry.multiplier
 
+    @property
+    def stream_flush_interval_ms(self) -> int:
+        return self.streaming.flush_interval_ms
+
+    @property
+    def stream_flush_bytes(self) -> int:
+        return self.streaming.flush_bytes
+
+    @property
+    def whisper_engine_workers(self) -> int:
+        return self.whisper_engine.workers
+
+    @property
+    def whisper_batch_size(self) -> int:
+        return self.whisper_engine.batch_size
+
+    @property
+    def whisper_idle_unload_seconds(self) -> int:
+        return self.whisper_engine.idle_unload_seconds
+
     @property
     def api_host(self) -> str:
         return self.api.host
@@ -549,6 +747,8 @@ class Settings(BaseSettings):
             "DB_POOL_PRE_PING": ("database", "pool_pre_ping"),
             "DB_ECHO_POOL": ("database", "echo_pool"),
             "DB_SLOW_QUERY_THRESHOLD": ("database", "slow_query_threshold"),
+            "ANALYTICS_ROLLUP_INTERVAL": ("database", "analytics_rollup_interval"),
+            "ANALYTICS_ROLLUP_SETTLE_MINUTES": ("database", "analytics_rollup_settle_minutes"),
 
             # Security
             "ROOT_API_KEY": ("security", "root_api_key"),
@@ -558,10 +758,13 @@ class Settings(BaseSettings):
             "CSRF_HEADER_NAME": ("security", "csrf_header_name"),
             "CSRF_TOKEN_TTL_SECONDS": ("security", "csrf_token_ttl_seconds"),
             "CHAT_MESSAGE_ENCRYPTION_SECRET": ("security", "chat_message_encryption_secret"),
+            "MESSAGE_DECRYPT_WORKERS": ("security", "message_decrypt_workers"),
+            "MESSAGE_PLAINTEXT_CACHE_MB": ("security", "message_plaintext_cache_mb"),
             "WHITELISTED_IPS": ("security", "whitelisted_ips"),
             "AUTHENTIK_ENABLED": ("security", "authentik_enabled"),
             "AUTHENTIK_HEADER_NAME": ("security", "authentik_header_name"),
             "AUTHENTIK_FORWARD_USER_HEADER": ("security", "authentik_forward_user_header"),
+            "AUTH_PRINCIPAL_CACHE_TTL": ("security", "auth_principal_cache_ttl"),
 
             # Ollama
             "OLLAMA_BASE_URL": ("ollama", "base_url"),
@@ -598,6 +801,11 @@ class Settings(BaseSettings):
             "INGEST_USER_AGENT": ("ingestion", "user_agent"),
             "CRAWL_MAX_DEPTH": ("ingestion", "crawl_max_depth"),
             "CRAWL_MAX_PAGES": ("ingestion", "crawl_max_pages"),
+            "INGEST_VIDEO_FRAME_INTERVAL": ("ingestion", "video_frame_interval"),
+            "INGEST_VIDEO_SCENE_THRESHOLD": ("ingestion", "video_scene_threshold"),
+            "INGEST_MEDIA_SEGMENT_SECONDS": ("ingestion", "media_segment_seconds"),
+            "INGEST_DEDUP_ENABLED": ("ingestion", "dedup_enabled"),
+            "INGEST_DEDUP_SIMHASH_DISTANCE": ("ingestion", "dedup_simhash_distance"),
 
             # Agent
             "MAX_AGENT_ITERATIONS": ("agent", "max_iterations"),
@@ -605,6 +813,10 @@ class Settings(BaseSettings):
             # MCP
             "MCP_SERVER_URLS": ("mcp", "server_urls"),
             "MCP_REFRESH_INTERVAL": ("mcp", "refresh_interval"),
+            "MCP_POOL_SIZE": ("mcp", "pool_size"),
+            "MCP_MAX_IN_FLIGHT": ("mcp", "max_in_flight_per_connection"),
+            "MCP_HEARTBEAT_INTERVAL": ("mcp", "heartbeat_interval"),
+            "MCP_TOOL_CACHE_SIZE": ("mcp", "tool_cache_size"),
 
             # Retry
             "RETRY_MAX_ATTEMPTS": ("retry", "max_attempts"),
@@ -612,6 +824,15 @@ class Settings(BaseSettings):
             "RETRY_MAX_WAIT": ("retry", "max_wait"),
             "RETRY_MULTIPLIER": ("retry", "multiplier"),
 
+            # Streaming
+            "STREAM_FLUSH_INTERVAL_MS": ("streaming", "flush_interval_ms"),
+            "STREAM_FLUSH_BYTES": ("streaming", "flush_bytes"),
+
+            # Whisper engine
+            "WHISPER_ENGINE_WORKERS": ("whisper_engine", "workers"),
+            "WHISPER_BATCH_SIZE": ("whisper_engine", "batch_size"),
+            "WHISPER_IDLE_UNLOAD_SECONDS": ("whisper_engine", "idle_unload_seconds"),
+
             # API
             "API_HOST": ("api", "host"),
             "API_PORT": ("api", "port"),
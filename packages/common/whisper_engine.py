@@ -0,0 +1,424 @@
+"""
+Shared Whisper inference engine.
+
+Live speech-to-text in the API and media transcription during ingestion both
+run on one process-wide ``WhisperEngine``:
+
+* a fixed pool of worker threads serving every transcription request;
+* models cached per ``WhisperSpec`` and loaded once with ``num_workers`` equal
+  to the pool size, so CTranslate2 runs the workers in parallel on one set of
+  weights (callers that resolve to the same spec never load it twice, and a
+  load blocks only the callers waiting for that spec);
+* a priority queue, so live dictation is served ahead of queued media jobs;
+* queue-wait, processing-time and real-time-factor metrics per priority class;
+* optional unloading of models that have been idle for a configured time,
+  instead of unloading after every chat message.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Sequence, TypeVar
+
+from packages.common.logger import get_logger
+from packages.common.settings import get_settings
+
+logger = get_logger(__name__)
+
+# faster-whisper (CTranslate2, av, tokenizers) is imported when a model is loaded
+WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+
+
+@lru_cache(maxsize=1)
+def _batched_pipeline_class() -> Any:
+    if not WHISPER_AVAILABLE:
+        return None
+    try:  # pragma: no cover - only in faster-whisper >= 1.1
+        from faster_whisper import BatchedInferencePipeline  # type: ignore
+    except ImportError:  # pragma: no cover
+        return None
+    return BatchedInferencePipeline
+
+T = TypeVar("T")
+
+PRIORITY_LIVE = 0
+PRIORITY_BATCH = 10
+_PRIORITY_LABELS = {PRIORITY_LIVE: "live", PRIORITY_BATCH: "batch"}
+
+# Samples kept per priority class for queue-wait percentiles
+_WAIT_SAMPLES = 256
+
+
+@dataclass(frozen=True)
+class WhisperSpec:
+    """Model configuration; requests with equal specs share one loaded model."""
+
+    model: str
+    device: str = "auto"
+    compute_type: str = "default"
+    device_index: int | None = None
+
+
+@dataclass
+class _Job:
+    spec: WhisperSpec
+    run: Callable[[Any], Any]
+    future: Future
+    priority: int
+    audio_seconds: float | None
+    enqueued_at: float
+
+
+class _ClassStats:
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.audio_seconds = 0.0
+        self.processing_seconds = 0.0
+        self.waits: deque[float] = deque(maxlen=_WAIT_SAMPLES)
+
+    def snapshot(self) -> dict[str, Any]:
+        waits = sorted(self.waits)
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queue_wait_ms": {
+                "avg": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "p95": (
+                    round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1)
+                    if waits
+                    else 0.0
+                ),
+                "max": round(waits[-1] * 1000, 1) if waits else 0.0,
+            },
+            "audio_seconds": round(self.audio_seconds, 2),
+            "processing_seconds": round(self.processing_seconds, 2),
+            "rtf": (
+                round(self.processing_seconds / self.audio_seconds, 3)
+                if self.audio_seconds
+                else None
+            ),
+        }
+
+
+class WhisperEngine:
+    """
+    Priority-scheduled pool of Whisper workers sharing cached models.
+
+    Args:
+        workers: Number of worker threads (and CTranslate2 workers per model).
+        batch_size: Batch size for ``BatchedInferencePipeline`` on batch jobs
+            (1 disables batching).
+        idle_unload_seconds: Unload models unused for this long (0 keeps them loaded).
+        cpu_threads: Intra-op threads per CPU model (0 lets CTranslate2 decide).
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 2,
+        batch_size: int = 8,
+        idle_unload_seconds: float = 0.0,
+        cpu_threads: int = 0,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.cpu_threads = max(0, cpu_threads)
+        self.batch_size = max(1, batch_size)
+        self.idle_unload_seconds = max(0.0, idle_unload_seconds)
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._threads: list[threading.Thread] = []
+        self._start_lock = threading.Lock()
+        self._models: dict[WhisperSpec, Any] = {}
+        self._loading: dict[WhisperSpec, Future] = {}
+        self._last_used: dict[WhisperSpec, float] = {}
+        self._model_lock = threading.Lock()
+        self._stats = {priority: _ClassStats() for priority in _PRIORITY_LABELS}
+        self._stats_lock = threading.Lock()
+        self._busy = 0
+        self._closed = False
+
+    # ------------------------------------------------------------------ models
+
+    def resolve(self, candidates: Sequence[WhisperSpec]) -> WhisperSpec:
+        """
+        Return the first candidate spec whose model loads, loading it if needed.
+
+        Raises:
+            RuntimeError: If faster-whisper is missing or no candidate loads
+        """
+        last_error: Exception | None = None
+        for spec in candidates:
+            try:
+                self._get_model(spec)
+                return spec
+            except Exception as exc:  # pragma: no cover - depends on hardware
+                last_error = exc
+                logger.warning(
+                    "whisper-engine-load-failed",
+                    extra={
+                        "model": spec.model,
+                        "device": spec.device,
+                        "compute_type": spec.compute_type,
+                        "error": str(exc),
+                    },
+                )
+        if last_error is not None:
+            raise RuntimeError("Failed to initialise Whisper model on all candidates") from last_error
+        raise RuntimeError("No Whisper model candidates configured")
+
+    def _get_model(self, spec: WhisperSpec) -> Any:
+        # Loading takes seconds, so it happens outside ``_model_lock``; concurrent
+        # callers for the same spec wait on the first caller's load instead.
+        with self._model_lock:
+            model = self._models.get(spec)
+            if model is not None:
+                self._last_used[spec] = time.monotonic()
+                return model
+            loading = self._loading.get(spec)
+            owner = loading is None
+            if owner:
+                loading = self._loading[spec] = Future()
+
+        if not owner:
+            try:
+                return loading.result()
+            except Exception as exc:
+                raise RuntimeError(f"Loading Whisper model {spec.model!r} failed") from exc
+
+        try:
+            model = self._load(spec)
+        except BaseException as exc:
+            with self._model_lock:
+                self._loading.pop(spec, None)
+            loading.set_exception(exc)
+            raise
+        with self._model_lock:
+            self._models[spec] = model
+            self._last_used[spec] = time.monotonic()
+            self._loading.pop(spec, None)
+        loading.set_result(model)
+        return model
+
+    def _load(self, spec: WhisperSpec) -> Any:
+        if not WHISPER_AVAILABLE:
+            raise RuntimeError("WhisperModel is not available. Install faster-whisper.")
+        from faster_whisper import WhisperModel  # type: ignore
+
+        kwargs: dict[str, Any] = {
+            "device": spec.device,
+            "compute_type": spec.compute_type,
+            "num_workers": self.workers,
+        }
+        if self.cpu_threads:
+            kwargs["cpu_threads"] = self.cpu_threads
+        if spec.device_index is not None:
+            kwargs["device_index"] = spec.device_index
+        logger.info(
+            "whisper-engine-load",
+            extra={
+                "model": spec.model,
+                "device": spec.device,
+                "compute_type": spec.compute_type,
+                "workers": self.workers,
+            },
+        )
+        return WhisperModel(spec.model, **kwargs)
+
+    def batched(self, model: Any) -> Any:
+        """Wrap ``model`` for batched long-form inference when the backend supports it."""
+        pipeline_class = _batched_pipeline_class() if self.batch_size > 1 else None
+        if pipeline_class is not None:
+            return pipeline_class(model=model)
+        return None
+
+    def release(self, *, idle_only: bool = False) -> None:
+        """Unload cached models (only those past the idle timeout when ``idle_only``)."""
+        now = time.monotonic()
+        with self._model_lock:
+            for spec in list(self._models):
+                if idle_only and (
+                    self._busy
+                    or now - self._last_used.get(spec, now) < self.idle_unload_seconds
+                ):
+                    continue
+                model = self._models.pop(spec)
+                self._last_used.pop(spec, None)
+                release = getattr(model, "release_model", None)
+                if callable(release):
+                    with suppress(Exception):
+                        release()
+                logger.info("whisper-engine-unload", extra={"model": spec.model, "device": spec.device})
+
+    # -------------------------------------------------------------- scheduling
+
+    def submit(
+        self,
+        spec: WhisperSpec,
+        run: Callable[[Any], T],
+        *,
+        priority: int = PRIORITY_BATCH,
+        audio_seconds: float | None = None,
+    ) -> "Future[T]":
+        """
+        Queue ``run(model)`` for execution on a worker.
+
+        Args:
+            spec: Model the job needs
+            run: Blocking callable receiving the loaded model
+            priority: ``PRIORITY_LIVE`` jobs are always served before ``PRIORITY_BATCH``
+            audio_seconds: Length of the audio processed, for RTF metrics
+        """
+        if self._closed:
+            raise RuntimeError("Whisper engine is shut down")
+        self._ensure_workers()
+        future: Future = Future()
+        priority = PRIORITY_LIVE if priority <= PRIORITY_LIVE else PRIORITY_BATCH
+        with self._stats_lock:
+            self._stats[priority].submitted += 1
+        job = _Job(spec, run, future, priority, audio_seconds, time.monotonic())
+        self._queue.put((priority, next(self._sequence), job))
+        return future
+
+    def run(self, spec: WhisperSpec, run: Callable[[Any], T], **kwargs: Any) -> T:
+        """Blocking variant of ``submit`` for code already running in a thread."""
+        return self.submit(spec, run, **kwargs).result()
+
+    async def arun(self, spec: WhisperSpec, run: Callable[[Any], T], **kwargs: Any) -> T:
+        """Await ``run(model)`` without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(spec, run, **kwargs))
+
+    def _ensure_workers(self) -> None:
+        if self._threads:
+            return
+        with self._start_lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker, name=f"whisper-worker-{index}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _worker(self) -> None:
+        idle_timeout = self.idle_unload_seconds or None
+        while True:
+            try:
+                _, _, job = self._queue.get(timeout=idle_timeout)
+            except queue.Empty:
+                self.release(idle_only=True)
+                continue
+            if job is None:
+                return
+            self._execute(job)
+
+    def _execute(self, job: _Job) -> None:
+        stats = self._stats[job.priority]
+        started = time.monotonic()
+        if not job.future.set_running_or_notify_cancel():
+            return
+        with self._stats_lock:
+            stats.waits.append(started - job.enqueued_at)
+            self._busy += 1
+        try:
+            result = job.run(self._get_model(job.spec))
+        except BaseException as exc:
+            with self._stats_lock:
+                stats.failed += 1
+            job.future.set_exception(exc)
+        else:
+            elapsed = time.monotonic() - started
+            with self._stats_lock:
+                stats.completed += 1
+                if job.audio_seconds:
+                    stats.audio_seconds += job.audio_seconds
+                    stats.processing_seconds += elapsed
+            job.future.set_result(result)
+        finally:
+            with self._stats_lock:
+                self._busy -= 1
+            with self._model_lock:
+                if job.spec in self._models:
+                    self._last_used[job.spec] = time.monotonic()
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            classes = {
+                label: self._stats[priority].snapshot()
+                for priority, label in _PRIORITY_LABELS.items()
+            }
+        return {
+            "workers": self.workers,
+            "started": bool(self._threads),
+            "busy": self._busy,
+            "queued": self._queue.qsize(),
+            "batching": self.batch_size > 1 and _batched_pipeline_class() is not None,
+            "models": [
+                {"model": spec.model, "device": spec.device, "compute_type": spec.compute_type}
+                for spec in list(self._models)
+            ],
+            **classes,
+        }
+
+    def shutdown(self, *, cancel_pending: bool = True, timeout: float | None = None) -> None:
+        """
+        Stop the workers, then unload the models.
+
+        Args:
+            cancel_pending: Cancel jobs still waiting in the queue (otherwise they run first)
+            timeout: Seconds to wait for each worker to finish; models stay
+                loaded if a worker is still running a job afterwards
+        """
+        self._closed = True
+        if cancel_pending:
+            while True:
+                try:
+                    _, _, job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is not None:
+                    job.future.cancel()
+        threads, self._threads = self._threads, []
+        for _ in threads:
+            # Sentinels sort after every real job so queued work still completes.
+            self._queue.put((PRIORITY_BATCH + 1, next(self._sequence), None))
+        for thread in threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+        if any(thread.is_alive() for thread in threads if thread is not threading.current_thread()):
+            logger.warning("whisper-engine-shutdown-timeout", extra={"timeout": timeout})
+            return
+        self.release()
+
+
+_ENGINE: WhisperEngine | None = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def get_whisper_engine() -> WhisperEngine:
+    """Process-wide engine configured from settings."""
+    global _ENGINE
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                settings = get_settings()
+                _ENGINE = WhisperEngine(
+                    workers=settings.whisper_engine_workers,
+                    batch_size=settings.whisper_batch_size,
+                    idle_unload_seconds=settings.whisper_idle_unload_seconds,
+                    cpu_threads=settings.ingest_whisper_cpu_threads or 0,
+                )
+    return _ENGINE
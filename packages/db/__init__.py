@@ -18,6 +18,8 @@ from .models import (
     UserCollectionAccess,
     UserDocumentAccess,
     AuditLog,
+    UsageRollup,
+    AnalyticsRollupState,
 )
 
 # New repository pattern - recommended for new code
@@ -61,6 +63,8 @@ __all__ = [
     "UserCollectionAccess",
     "UserDocumentAccess",
     "AuditLog",
+    "UsageRollup",
+    "AnalyticsRollupState",
     # Repositories (NEW - use these for new code)
     "BaseRepository",
     "UserRepository",
@@ -30,7 +30,9 @@ from .models import (
     UserDocumentAccess,
     Group,
     UserGroupMembership,
+    decrypt_message_contents,
 )
+from .repositories.group_repository import GroupRepository
 from .repositories.user_repository import UserRepository
 
 logger = logging.getLogger(__name__)
@@ -131,116 +133,12 @@ async def delete_user_account(session: AsyncSession, user_id: int) -> bool:
 
 
 async def export_user_snapshot(session: AsyncSession, user_id: int) -> dict:
-    """Collect a snapshot of the user's data for export."""
-    user = await session.get(User, user_id)
-    if not user:
-        raise ResourceNotFoundError(
-            f"User not found: {user_id}",
-            code="USER_NOT_FOUND",
-            details={"user_id": user_id}
-        )
-
-    sessions_result = await session.execute(
-        select(ChatSession)
-        .options(selectinload(ChatSession.messages))
-        .where(ChatSession.user_id == user_id)
-        .order_by(ChatSession.created_at.asc())
-    )
-    sessions = sessions_result.scalars().unique().all()
-
-    documents = await get_user_documents(session, user_id=user_id, limit=10_000, offset=0)
-    ingestion_runs = await get_user_ingestion_runs(session, user_id=user_id, limit=10_000)
-    tool_runs = await get_user_tool_runs(session, user_id=user_id, limit=10_000)
-
-    sessions_payload = []
-    for chat_session in sessions:
-        messages = sorted(
-            chat_session.messages,
-            key=lambda message: message.created_at or datetime.now(timezone.utc),
-        )
-        sessions_payload.append(
-            {
-                "id": chat_session.id,
-                "external_id": chat_session.external_id,
-                "title": chat_session.title,
-                "model": chat_session.model,
-                "enable_tools": chat_session.enable_tools,
-                "created_at": chat_session.created_at,
-                "updated_at": chat_session.updated_at,
-                "message_count": len(messages),
-                "messages": [
-                    {
-                        "id": message.id,
-                        "role": message.role,
-                        "content": message.content,
-                        "tool_call_id": message.tool_call_id,
-                        "tool_call_name": message.tool_call_name,
-                        "created_at": message.created_at,
-                        "tokens_in": message.tokens_in,
-                        "tokens_out": message.tokens_out,
-                    }
-                    for message in messages
-                ],
-            }
-        )
+    """Collect a snapshot of the user's data for export.
 
-    return {
-        "user": {
-            "id": user.id,
-            "username": user.username,
-            "created_at": user.created_at,
-            "is_root": user.is_root,
-        },
-        "exported_at": datetime.now(timezone.utc),
-        "sessions": sessions_payload,
-        "documents": [
-            {
-                "id": document.id,
-                "uri": document.uri,
-                "path": document.path,
-                "mime": document.mime,
-                "bytes_size": document.bytes_size,
-                "source": document.source,
-                "tags": document.tags,
-                "collection": document.collection,
-                "path_hash": document.path_hash,
-                "created_at": document.created_at,
-                "last_ingested_at": document.last_ingested_at,
-            }
-            for document in documents
-        ],
-        "ingestion_runs": [
-            {
-                "id": run.id,
-                "target": run.target,
-                "from_web": run.from_web,
-                "recursive": run.recursive,
-                "tags": run.tags,
-                "collection": run.collection,
-                "totals_files": run.totals_files,
-                "totals_chunks": run.totals_chunks,
-                "errors": run.errors,
-                "started_at": run.started_at,
-                "finished_at": run.finished_at,
-                "status": run.status,
-            }
-            for run in ingestion_runs
-        ],
-        "tool_runs": [
-            {
-                "id": tool_run.id,
-                "tool_name": tool_run.tool_name,
-                "status": tool_run.status,
-                "start_ts": tool_run.start_ts,
-                "end_ts": tool_run.end_ts,
-                "latency_ms": tool_run.latency_ms,
-                "args": tool_run.args,
-                "error_message": tool_run.error_message,
-                "result_preview": tool_run.result_preview,
-            }
-            for tool_run in tool_runs
-        ],
-    }
+    Delegates to ``UserRepository.export_snapshot``; use
+    ``UserRepository.iter_export`` to stream large accounts instead.
+    """
+    return await UserRepository(session).export_snapshot(user_id)
 
 
 async def upsert_mcp_servers(
@@ -574,6 +472,7 @@ async def get_session_with_messages(
     if not chat_session:
         return None
 
+    await decrypt_message_contents(chat_session.messages)
     return chat_session
 
 
@@ -910,109 +809,12 @@ async def add_user_to_group(
     session: AsyncSession, user_id: int, group_id: int, role: str = "member"
 ) -> UserGroupMembership:
     """Add a user to a group with a specified role."""
-    # Validate role
-    if role not in ("member", "admin"):
-        raise ValidationError(
-            f"Invalid role: {role}. Must be 'member' or 'admin'",
-            code="INVALID_ROLE",
-            details={"role": role}
-        )
-
-    # Check if membership already exists
-    existing_membership_result = await session.execute(
-        select(UserGroupMembership).where(
-            UserGroupMembership.user_id == user_id,
-            UserGroupMembership.group_id == group_id
-        )
-    )
-    existing_membership = existing_membership_result.scalar_one_or_none()
-
-    if existing_membership:
-        raise ValidationError(
-            f"User {user_id} is already a member of group {group_id}",
-            code="MEMBERSHIP_EXISTS",
-            details={"user_id": user_id, "group_id": group_id}
-        )
-
-    try:
-        membership = UserGroupMembership(
-            user_id=user_id,
-            group_id=group_id,
-            role=role,
-            joined_at=datetime.now(timezone.utc)
-        )
-        session.add(membership)
-        await session.flush()
-
-        logger.info(
-            "User added to group",
-            extra={
-                "user_id": user_id,
-                "group_id": group_id,
-                "role": role,
-                "operation": "add_user_to_group"
-            }
-        )
-
-        return membership
-    except (ValidationError, ResourceNotFoundError):
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to add user to group",
-            extra={
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "user_id": user_id,
-                "group_id": group_id,
-                "operation": "add_user_to_group"
-            },
-            exc_info=True
-        )
-        raise DatabaseError(
-            f"Failed to add user to group: {str(e)}",
-            details={"operation": "add_user_to_group", "user_id": user_id, "group_id": group_id}
-        ) from e
+    return await GroupRepository(session).add_member(user_id, group_id, role)
 
 
 async def remove_user_from_group(session: AsyncSession, user_id: int, group_id: int) -> bool:
     """Remove a user from a group."""
-    try:
-        delete_result = await session.execute(
-            delete(UserGroupMembership).where(
-                UserGroupMembership.user_id == user_id,
-                UserGroupMembership.group_id == group_id
-            )
-        )
-        await session.flush()
-
-        if delete_result.rowcount:
-            logger.info(
-                "User removed from group",
-                extra={
-                    "user_id": user_id,
-                    "group_id": group_id,
-                    "operation": "remove_user_from_group"
-                }
-            )
-
-        return bool(delete_result.rowcount)
-    except Exception as e:
-        logger.error(
-            "Failed to remove user from group",
-            extra={
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "user_id": user_id,
-                "group_id": group_id,
-                "operation": "remove_user_from_group"
-            },
-            exc_info=True
-        )
-        raise DatabaseError(
-            f"Failed to remove user from group: {str(e)}",
-            details={"operation": "remove_user_from_group", "user_id": user_id, "group_id": group_id}
-        ) from e
+    return await GroupRepository(session).remove_member(user_id, group_id)
 
 
 async def get_user_groups(session: AsyncSession, user_id: int) -> list[Group]:
@@ -1071,93 +873,14 @@ async def get_group_members(session: AsyncSession, group_id: int) -> list[UserGr
 
 async def is_group_admin(session: AsyncSession, user_id: int, group_id: int) -> bool:
     """Check if a user is an admin of a group."""
-    try:
-        result = await session.execute(
-            select(UserGroupMembership).where(
-                UserGroupMembership.user_id == user_id,
-                UserGroupMembership.group_id == group_id,
-                UserGroupMembership.role == "admin"
-            )
-        )
-        return result.scalar_one_or_none() is not None
-    except Exception as e:
-        logger.error(
-            "Failed to check group admin status",
-            extra={
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "user_id": user_id,
-                "group_id": group_id,
-                "operation": "is_group_admin"
-            },
-            exc_info=True
-        )
-        raise DatabaseError(
-            f"Failed to check admin status: {str(e)}",
-            details={"operation": "is_group_admin", "user_id": user_id, "group_id": group_id}
-        ) from e
+    return await GroupRepository(session).is_admin(user_id, group_id)
 
 
 async def update_member_role(
     session: AsyncSession, user_id: int, group_id: int, role: str
 ) -> UserGroupMembership:
     """Update a member's role in a group."""
-    # Validate role
-    if role not in ("member", "admin"):
-        raise ValidationError(
-            f"Invalid role: {role}. Must be 'member' or 'admin'",
-            code="INVALID_ROLE",
-            details={"role": role}
-        )
-
-    try:
-        result = await session.execute(
-            select(UserGroupMembership).where(
-                UserGroupMembership.user_id == user_id,
-                UserGroupMembership.group_id == group_id
-            )
-        )
-        membership = result.scalar_one_or_none()
-
-        if not membership:
-            raise ResourceNotFoundError(
-                f"Membership not found for user {user_id} in group {group_id}",
-                code="MEMBERSHIP_NOT_FOUND",
-                details={"user_id": user_id, "group_id": group_id}
-            )
-
-        membership.role = role
-        await session.flush()
-
-        logger.info(
-            "Member role updated",
-            extra={
-                "user_id": user_id,
-                "group_id": group_id,
-                "role": role,
-                "operation": "update_member_role"
-            }
-        )
-
-        return membership
-    except (ValidationError, ResourceNotFoundError):
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to update member role",
-            extra={
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "user_id": user_id,
-                "group_id": group_id,
-                "operation": "update_member_role"
-            },
-            exc_info=True
-        )
-        raise DatabaseError(
-            f"Failed to update member role: {str(e)}",
-            details={"operation": "update_member_role", "user_id": user_id, "group_id": group_id}
-        ) from e
+    return await GroupRepository(session).update_member_role(user_id, group_id, role)
 
 
 async def get_user_group_ids(session: AsyncSession, user_id: int) -> list[int]:
@@ -1186,49 +909,4 @@ async def get_user_group_ids(session: AsyncSession, user_id: int) -> list[int]:
 
 async def can_user_access_document(session: AsyncSession, user_id: int, document_id: int) -> bool:
     """Check if a user can access a document based on ownership or group membership."""
-    try:
-        # Get the document
-        result = await session.execute(
-            select(Document).where(Document.id == document_id)
-        )
-        document = result.scalar_one_or_none()
-
-        if not document:
-            return False
-
-        # User owns the document
-        if document.user_id == user_id:
-            return True
-
-        # Document is private - only owner can access
-        if document.is_private:
-            return False
-
-        # Document belongs to a group - check if user is a member
-        if document.group_id:
-            membership_result = await session.execute(
-                select(UserGroupMembership).where(
-                    UserGroupMembership.user_id == user_id,
-                    UserGroupMembership.group_id == document.group_id
-                )
-            )
-            return membership_result.scalar_one_or_none() is not None
-
-        # Document has no group and is not private - not accessible
-        return False
-    except Exception as e:
-        logger.error(
-            "Failed to check document access",
-            extra={
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "user_id": user_id,
-                "document_id": document_id,
-                "operation": "can_user_access_document"
-            },
-            exc_info=True
-        )
-        raise DatabaseError(
-            f"Failed to check document access: {str(e)}",
-            details={"operation": "can_user_access_document", "user_id": user_id, "document_id": document_id}
-        ) from e
+    return await GroupRepository(session).can_user_access_document(user_id, document_id)
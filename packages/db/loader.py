@@ -0,0 +1,105 @@
+"""
+Request-scoped lookup cache.
+
+All repositories used while serving one request share the request's
+``AsyncSession`` (FastAPI resolves ``get_db_session`` once per request), so
+state kept in ``session.info`` lives exactly as long as the request.
+``SessionLoader`` keeps two things there:
+
+- primary-key lookups: ``get_many`` answers from the session's identity map
+  where it can, fetches the rest with one ``IN`` query and remembers ids that
+  do not exist (the identity map only holds hits, so ``session.get`` would
+  query again for every repeated miss);
+- group roles: every ``(group_id, user_id)`` role a query has seen, including
+  "not a member", so authorization checks repeated later in the request do
+  not go back to the database.
+
+Repositories update the role cache when they change memberships and drop the
+whole loader on rollback.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, TypeVar
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+#: Returned by ``SessionLoader.role`` when the role has not been looked up yet
+UNKNOWN: Any = object()
+
+_INFO_KEY = "request_loader"
+
+
+class SessionLoader:
+    """Identity-map backed lookups and membership roles for one session."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._missing: set[tuple[type, Any]] = set()
+        self._roles: dict[tuple[int, int], str | None] = {}
+
+    async def get(self, model: type[T], id: Any) -> T | None:
+        """Get one instance by primary key (None if it does not exist)."""
+        return (await self.get_many(model, [id])).get(id)
+
+    async def get_many(self, model: type[T], ids: Iterable[Any]) -> dict[Any, T]:
+        """
+        Get instances by primary key with at most one query.
+
+        Args:
+            model: Mapped class with a single-column primary key
+            ids: Primary keys (duplicates are fine)
+
+        Returns:
+            Instances by id; ids that do not exist are left out
+        """
+        found: dict[Any, T] = {}
+        pending: list[Any] = []
+        identity_map = self.session.identity_map
+        for id in dict.fromkeys(ids):
+            if (model, id) in self._missing:
+                continue
+            instance = identity_map.get(AsyncSession.identity_key(model, id))
+            if instance is None:
+                pending.append(id)
+            else:
+                found[id] = instance
+
+        if pending:
+            primary_key = inspect(model).primary_key[0]
+            result = await self.session.execute(
+                select(model).where(primary_key.in_(pending))
+            )
+            for instance in result.scalars().all():
+                found[getattr(instance, primary_key.key)] = instance
+            self._missing.update((model, id) for id in pending if id not in found)
+        return found
+
+    def role(self, group_id: int, user_id: int) -> str | None:
+        """Cached role of a user in a group (None: not a member, ``UNKNOWN``: not looked up)."""
+        return self._roles.get((group_id, user_id), UNKNOWN)
+
+    def remember_role(self, group_id: int, user_id: int, role: str | None) -> None:
+        """Record a role read from or written to the database (None = not a member)."""
+        self._roles[(group_id, user_id)] = role
+
+    def forget_group(self, group_id: int) -> None:
+        """Drop every cached role of a group (e.g. after the group is deleted)."""
+        for key in [key for key in self._roles if key[0] == group_id]:
+            del self._roles[key]
+
+
+def loader_for(session: AsyncSession) -> SessionLoader:
+    """Get the loader attached to ``session``, creating it on first use."""
+    loader = session.info.get(_INFO_KEY)
+    if loader is None:
+        loader = session.info[_INFO_KEY] = SessionLoader(session)
+    return loader
+
+
+def reset_loader(session: AsyncSession) -> None:
+    """Discard cached lookups, e.g. after a rollback undid the writes they saw."""
+    session.info.pop(_INFO_KEY, None)
@@ -0,0 +1,250 @@
+"""
+Chat message encryption.
+
+Message content is stored as a Fernet token. ``ChatMessage.content`` decrypts
+lazily, on first access, so rows that are loaded but never read (counts,
+listings, deletes) are not decrypted at all. Code that is about to read a
+whole history calls ``decrypt_message_contents`` (``packages.db.models``),
+which resolves every pending message in one batch on a small thread pool
+instead of one by one on the event loop.
+
+Plaintexts are kept in a bounded LRU keyed by a digest of the whole token.
+Tokens are immutable (a new encryption yields a new token), so entries never go
+stale; the cache only needs a size bound. Messages written by this process
+are added as they are encrypted, which keeps the sessions being chatted in
+warm.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Sequence
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from packages.common import get_settings
+from packages.common.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# Below this many cache misses a batch is decrypted inline: handing it to a
+# worker thread costs more than the decryption itself.
+INLINE_DECRYPT_THRESHOLD = 32
+# Tokens per task submitted to the pool
+DECRYPT_CHUNK_SIZE = 128
+
+
+@lru_cache(maxsize=1)
+def _get_message_fernet() -> Fernet | None:
+    settings = get_settings()
+    secret_source = (
+        settings.chat_message_encryption_secret
+        or settings.jwt_secret
+        or settings.root_api_key
+    )
+    if not secret_source:
+        return None
+    key_material = hashlib.sha256(secret_source.encode("utf-8")).digest()
+    key = base64.urlsafe_b64encode(key_material)
+    return Fernet(key)
+
+
+class PlaintextCache:
+    """Thread-safe LRU of decrypted messages, bounded by plaintext size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: bytes) -> bytes:
+        # The cache is consulted before the token is verified, so the key must
+        # cover all of it: legacy plaintext rows (or forged tokens) sharing a
+        # suffix with a cached token must not hit that token's entry.
+        return hashlib.blake2b(token, digest_size=16).digest()
+
+    def get(self, token: bytes) -> str | None:
+        if self.max_bytes <= 0:
+            return None
+        key = self._key(token)
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+    def put(self, token: bytes, text: str) -> None:
+        size = len(text)
+        if size > self.max_bytes:
+            return
+        key = self._key(token)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = text
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+
+class MessageCrypto:
+    """
+    Encrypts and decrypts chat message content.
+
+    Args:
+        fernet: Key to use; None when encryption is not configured
+        workers: Threads for batch decryption (0 decrypts inline)
+        cache_bytes: Plaintext cache bound (0 disables the cache)
+    """
+
+    def __init__(self, fernet: Fernet | None, *, workers: int = 4, cache_bytes: int = 0) -> None:
+        self._fernet = fernet
+        self.workers = workers
+        self.cache = PlaintextCache(cache_bytes)
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def _require_fernet(self, action: str) -> Fernet:
+        if self._fernet is None:
+            raise ConfigurationError(
+                f"Cannot {action} message: CHAT_MESSAGE_ENCRYPTION_SECRET not configured. "
+                "Generate one with: "
+                "python -c 'from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())'"
+            )
+        return self._fernet
+
+    def encrypt(self, text: str) -> bytes:
+        """Encrypt message content and remember the plaintext."""
+        fernet = self._require_fernet("encrypt")
+        try:
+            token = fernet.encrypt(text.encode("utf-8"))
+        except Exception as e:
+            raise ValueError(f"Encryption failed: {e}") from e
+        self.cache.put(token, text)
+        return token
+
+    def decrypt(self, token: bytes) -> str:
+        """Decrypt one message, using the cache."""
+        text = self.cache.get(token)
+        if text is None:
+            text, authentic = self._decrypt_uncached(token)
+            if authentic:
+                self.cache.put(token, text)
+        return text
+
+    async def decrypt_many(self, tokens: Sequence[bytes | None]) -> list[str | None]:
+        """
+        Decrypt a batch of messages, off the event loop when it is large.
+
+        Args:
+            tokens: Fernet tokens (None entries stay None)
+
+        Returns:
+            Plaintexts in the order of ``tokens``
+        """
+        texts: list[str | None] = [None] * len(tokens)
+        missing: list[int] = []
+        for i, token in enumerate(tokens):
+            if token is None:
+                continue
+            text = self.cache.get(token)
+            if text is None:
+                missing.append(i)
+            else:
+                texts[i] = text
+        if not missing:
+            return texts
+
+        if self.workers <= 0 or len(missing) < INLINE_DECRYPT_THRESHOLD:
+            decrypted = self._decrypt_chunk([tokens[i] for i in missing])
+        else:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            chunks = [
+                [tokens[i] for i in missing[start:start + DECRYPT_CHUNK_SIZE]]
+                for start in range(0, len(missing), DECRYPT_CHUNK_SIZE)
+            ]
+            results = await asyncio.gather(
+                *(loop.run_in_executor(executor, self._decrypt_chunk, chunk) for chunk in chunks)
+            )
+            decrypted = [text for chunk in results for text in chunk]
+
+        for i, (text, authentic) in zip(missing, decrypted):
+            texts[i] = text
+            if authentic:
+                self.cache.put(tokens[i], text)
+        return texts
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (they are restarted on next use)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="message-crypto"
+                )
+            return self._executor
+
+    def _decrypt_chunk(self, tokens: list[bytes]) -> list[tuple[str, bool]]:
+        return [self._decrypt_uncached(token) for token in tokens]
+
+    def _decrypt_uncached(self, token: bytes) -> tuple[str, bool]:
+        """Return the plaintext and whether it came from a valid token."""
+        fernet = self._require_fernet("decrypt")
+        data = bytes(token)
+        try:
+            return fernet.decrypt(data).decode("utf-8"), True
+        except InvalidToken:
+            # Rows written before encryption was mandatory are stored in clear;
+            # they carry no HMAC to key the cache on, so they are not cached.
+            logger.warning(
+                "Found unencrypted message data - migration required",
+                extra={"data_length": len(data), "migration_needed": True}
+            )
+            return data.decode("utf-8", errors="ignore"), False
+        except Exception as e:
+            raise ValueError(f"Decryption failed: {e}") from e
+
+
+@lru_cache(maxsize=1)
+def get_message_crypto() -> MessageCrypto:
+    """Process-wide message crypto service configured from settings."""
+    settings = get_settings()
+    return MessageCrypto(
+        _get_message_fernet(),
+        workers=settings.message_decrypt_workers,
+        cache_bytes=settings.message_plaintext_cache_mb * 1024 * 1024,
+    )
@@ -1,13 +1,9 @@
 from __future__ import annotations
 
-import base64
-import hashlib
-import logging
 from datetime import datetime, timezone
-from functools import lru_cache
+from typing import Iterable
 
 import sqlalchemy as sa
-from cryptography.fernet import Fernet, InvalidToken
 from sqlalchemy import (
     BigInteger,
     Boolean,
@@ -21,82 +17,11 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
-from sqlalchemy.types import TypeDecorator
 
+from .message_crypto import get_message_crypto
 from .session import Base
-from packages.common import get_settings
-from packages.common.exceptions import ConfigurationError
-
-
-@lru_cache(maxsize=1)
-def _get_message_fernet() -> Fernet | None:
-    settings = get_settings()
-    secret_source = (
-        settings.chat_message_encryption_secret
-        or settings.jwt_secret
-        or settings.root_api_key
-    )
-    if not secret_source:
-        return None
-    key_material = hashlib.sha256(secret_source.encode("utf-8")).digest()
-    key = base64.urlsafe_b64encode(key_material)
-    return Fernet(key)
-
-
-class EncryptedContent(TypeDecorator):
-    """Fernet-based encryption for chat messages - MANDATORY for security compliance."""
-
-    impl = sa.LargeBinary
-    cache_ok = True
-
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return None
-        if isinstance(value, bytes):
-            return value
-        if isinstance(value, str):
-            fernet = _get_message_fernet()
-            # CRITICAL: Encryption is now mandatory
-            if fernet is None:
-                raise ConfigurationError(
-                    "Chat message encryption is mandatory but CHAT_MESSAGE_ENCRYPTION_SECRET "
-                    "is not configured. Generate one with: "
-                    "python -c 'from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())'"
-                )
-            raw = value.encode("utf-8")
-            try:
-                return fernet.encrypt(raw)
-            except Exception as e:
-                raise ValueError(f"Encryption failed: {e}") from e
-        raise TypeError("content must be str or bytes")
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return None
-        if isinstance(value, (bytes, bytearray, memoryview)):
-            data = bytes(value)
-            fernet = _get_message_fernet()
-            # CRITICAL: Decryption requires valid key
-            if fernet is None:
-                raise ConfigurationError(
-                    "Cannot decrypt message: CHAT_MESSAGE_ENCRYPTION_SECRET not configured"
-                )
-            try:
-                decrypted = fernet.decrypt(data)
-                return decrypted.decode("utf-8")
-            except InvalidToken:
-                # Try to decode as plaintext for migration purposes only
-                # This allows reading old unencrypted data during migration
-                logger = logging.getLogger(__name__)
-                logger.warning(
-                    "Found unencrypted message data - migration required",
-                    extra={"data_length": len(data), "migration_needed": True}
-                )
-                return data.decode("utf-8", errors="ignore")
-            except Exception as e:
-                raise ValueError(f"Decryption failed: {e}") from e
-        return value
 
 
 class SoftDeleteMixin:
@@ -209,7 +134,11 @@ class ChatSession(AsyncAttrs, Base):
         order_by="ChatMessage.created_at"
     )
 
-    __table_args__ = (Index("idx_chat_sessions_user_created", "user_id", created_at.desc()),)
+    __table_args__ = (
+        # Keyset scans: exports page on created_at, session lists on updated_at
+        Index("idx_chat_sessions_user_created", "user_id", created_at.desc(), id.desc()),
+        Index("idx_chat_sessions_user_updated", "user_id", updated_at.desc(), id.desc()),
+    )
 
 
 class ChatMessage(AsyncAttrs, Base):
@@ -220,7 +149,8 @@ class ChatMessage(AsyncAttrs, Base):
         ForeignKey("chat_sessions.id", ondelete="CASCADE"), index=True
     )
     role: Mapped[str] = mapped_column(String(16), index=True)
-    content: Mapped[str | None] = mapped_column(EncryptedContent, nullable=True)
+    # Fernet token (column "content"); read and write the plaintext through ``content``
+    content_token: Mapped[bytes | None] = mapped_column("content", sa.LargeBinary, nullable=True)
     tool_call_name: Mapped[str | None] = mapped_column(String(256))
     tool_call_id: Mapped[str | None] = mapped_column(String(128))
     created_at: Mapped[datetime] = mapped_column(
@@ -231,8 +161,40 @@ class ChatMessage(AsyncAttrs, Base):
 
     session: Mapped[ChatSession] = relationship(back_populates="messages")
 
+    @hybrid_property
+    def content(self) -> str | None:
+        """Plaintext content, decrypted on first access (see ``decrypt_message_contents``)."""
+        token = self.content_token
+        if token is None:
+            return None
+        resolved = self.__dict__.get("_plaintext")
+        if resolved is not None and resolved[0] is token:
+            return resolved[1]
+        text = get_message_crypto().decrypt(token)
+        self._plaintext = (token, text)
+        return text
+
+    @content.inplace.setter
+    def _content_setter(self, value: str | bytes | None) -> None:
+        if value is None:
+            self.content_token = None
+        elif isinstance(value, bytes):
+            # Already a token (copied from another row)
+            self.content_token = value
+        elif isinstance(value, str):
+            token = get_message_crypto().encrypt(value)
+            self.content_token = token
+            self._plaintext = (token, value)
+        else:
+            raise TypeError("content must be str or bytes")
+
+    @content.inplace.expression
+    @classmethod
+    def _content_expression(cls):
+        return cls.content_token
+
     __table_args__ = (
-        Index("idx_chat_messages_session_created", "session_id", created_at.desc()),
+        Index("idx_chat_messages_session_created", "session_id", created_at.desc(), id.desc()),
         Index(
             "idx_chat_messages_tokens",
             "session_id",
@@ -249,6 +211,27 @@ class ChatMessage(AsyncAttrs, Base):
     )
 
 
+async def decrypt_message_contents(messages: Iterable[ChatMessage]) -> None:
+    """
+    Decrypt the content of ``messages`` in one batch before it is read.
+
+    Large batches are decrypted on the message crypto thread pool; afterwards
+    ``message.content`` returns without decrypting. Messages already resolved
+    are skipped.
+    """
+    pending = [
+        (message, message.content_token)
+        for message in messages
+        if message.content_token is not None
+        and (message.__dict__.get("_plaintext") or (None,))[0] is not message.content_token
+    ]
+    if not pending:
+        return
+    texts = await get_message_crypto().decrypt_many([token for _, token in pending])
+    for (message, token), text in zip(pending, texts):
+        message._plaintext = (token, text)
+
+
 class MCPServer(AsyncAttrs, Base):
     __tablename__ = "mcp_servers"
 
@@ -319,9 +302,11 @@ class ToolRun(AsyncAttrs, Base):
     args: Mapped[dict | None] = mapped_column(JSONB)
     error_message: Mapped[str | None] = mapped_column(Text)
     result_preview: Mapped[str | None] = mapped_column(Text)
+    # Served from the registry's result cache (None for tools without a cache policy)
+    cache_hit: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
 
     __table_args__ = (
-        Index("idx_tool_runs_user_start", "user_id", start_ts.desc()),
+        Index("idx_tool_runs_user_start", "user_id", start_ts.desc(), id.desc()),
         Index("idx_tool_runs_tool_start", "tool_name", start_ts.desc()),
         Index("idx_tool_runs_analytics", "user_id", "tool_name", "status", start_ts.desc()),
         Index("idx_tool_runs_message", "message_id", start_ts.desc()),
@@ -351,7 +336,7 @@ class IngestionRun(AsyncAttrs, Base):
     )
 
     __table_args__ = (
-        Index("idx_ingestion_runs_user_started", "user_id", started_at.desc()),
+        Index("idx_ingestion_runs_user_started", "user_id", started_at.desc(), id.desc()),
         Index("idx_ingestion_runs_user_status_started", "user_id", "status", started_at.desc()),
     )
 
@@ -404,7 +389,7 @@ class Document(AsyncAttrs, Base):
 
     __table_args__ = (
         Index("idx_documents_collection_created", "collection", created_at.desc()),
-        Index("idx_documents_user_created", "user_id", created_at.desc()),
+        Index("idx_documents_user_created", "user_id", created_at.desc(), id.desc()),
         Index("idx_documents_user_collection_created", "user_id", "collection", created_at.desc()),
         Index("idx_documents_group_private", "group_id", "is_private"),
         # path_hash is unique per user, not globally
@@ -554,3 +539,42 @@ class AuditLog(AsyncAttrs, Base):
         Index("idx_audit_logs_success_timestamp", "success", timestamp.desc()),
         Index("idx_audit_logs_correlation", "correlation_id"),
     )
+
+
+class UsageRollup(AsyncAttrs, Base):
+    """
+    Per-user activity totals for one hour or one day, read by the analytics dashboard.
+
+    Maintained by ``packages.db.rollups.RollupAggregator``: hourly rows are
+    recomputed from the raw tables for recent hours, daily rows are summed from
+    the hourly ones.
+    """
+
+    __tablename__ = "usage_rollups"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    granularity: Mapped[str] = mapped_column(String(8), primary_key=True)  # "hour" | "day"
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    sessions: Mapped[int] = mapped_column(Integer, default=0)
+    messages: Mapped[int] = mapped_column(Integer, default=0)
+    # Messages carrying token counts, and their totals
+    token_messages: Mapped[int] = mapped_column(Integer, default=0)
+    tokens_in: Mapped[int] = mapped_column(BigInteger, default=0)
+    tokens_out: Mapped[int] = mapped_column(BigInteger, default=0)
+    tool_runs: Mapped[int] = mapped_column(Integer, default=0)
+    tool_successes: Mapped[int] = mapped_column(Integer, default=0)
+    # Sum and count of non-null latencies, so averages can be combined across buckets
+    tool_latency_ms_sum: Mapped[int] = mapped_column(BigInteger, default=0)
+    tool_latency_count: Mapped[int] = mapped_column(Integer, default=0)
+    ingestion_runs: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class AnalyticsRollupState(AsyncAttrs, Base):
+    """High-water mark of the rollup aggregator (one row per aggregator name)."""
+
+    __tablename__ = "analytics_rollup_state"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -0,0 +1,105 @@
+"""
+Keyset (seek) pagination helpers.
+
+Pages are ordered by a timestamp column with the primary key as tie-breaker,
+and the next page starts strictly after the last ``(timestamp, id)`` pair of
+the previous one. Unlike OFFSET, the cost of a page does not grow with its
+position and rows inserted while a client is paging do not shift the window.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import tuple_
+
+from packages.common.exceptions import ValidationError
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position after which the next page starts."""
+
+    position: datetime
+    id: int
+
+    def encode(self) -> str:
+        """Opaque, URL-safe token for API clients."""
+        raw = json.dumps([self.position.isoformat(), self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """
+        Parse a token produced by ``encode``.
+
+        Raises:
+            ValidationError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            position, id_ = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return cls(position=datetime.fromisoformat(position), id=int(id_))
+        except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+            raise ValidationError(
+                "Invalid pagination cursor",
+                code="INVALID_CURSOR",
+                details={"cursor": token},
+            ) from e
+
+    @classmethod
+    def from_token(cls, token: str | None) -> "Cursor | None":
+        """Decode an optional query parameter."""
+        return cls.decode(token) if token else None
+
+
+def apply_keyset(
+    query: Any,
+    position_column: Any,
+    id_column: Any,
+    after: Cursor | None,
+    *,
+    limit: int,
+    descending: bool = True,
+) -> Any:
+    """
+    Order ``query`` by ``(position_column, id_column)`` and start after ``after``.
+
+    Args:
+        query: Select statement to paginate
+        position_column: Timestamp column the page is ordered by
+        id_column: Primary key column used as tie-breaker
+        after: Last row of the previous page, or None for the first page
+        limit: Page size
+        descending: Newest first (default) or oldest first
+
+    Returns:
+        Paginated select statement
+    """
+    key = tuple_(position_column, id_column)
+    if after is not None:
+        bound = tuple_(after.position, after.id)
+        query = query.where(key < bound if descending else key > bound)
+    if descending:
+        query = query.order_by(position_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(position_column.asc(), id_column.asc())
+    return query.limit(limit)
+
+
+def next_cursor(rows: Sequence[Any], position_attr: str, limit: int) -> Cursor | None:
+    """
+    Cursor for the page after ``rows``; None when this was the last page.
+
+    A full page is assumed to have a successor, so the final request of a
+    listing whose size is a multiple of ``limit`` returns an empty page.
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return Cursor(position=getattr(last, position_attr), id=last.id)
@@ -8,6 +8,7 @@ from .document_repository import DocumentRepository
 from .tool_repository import ToolRepository
 from .ingestion_repository import IngestionRepository
 from .mcp_repository import MCPRepository
+from .analytics_repository import AnalyticsRepository
 
 __all__ = [
     "BaseRepository",
@@ -18,4 +19,5 @@ __all__ = [
     "ToolRepository",
     "IngestionRepository",
     "MCPRepository",
+    "AnalyticsRepository",
 ]
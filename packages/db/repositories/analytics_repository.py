@@ -0,0 +1,276 @@
+"""Repository for analytics rollups."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import and_, delete, func, insert, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import (
+    AnalyticsRollupState,
+    ChatMessage,
+    ChatSession,
+    Document,
+    IngestionRun,
+    ToolRun,
+    UsageRollup,
+)
+from .base import BaseRepository
+
+HOUR = "hour"
+DAY = "day"
+
+_COUNTERS = (
+    "sessions",
+    "messages",
+    "token_messages",
+    "tokens_in",
+    "tokens_out",
+    "tool_runs",
+    "tool_successes",
+    "tool_latency_ms_sum",
+    "tool_latency_count",
+    "ingestion_runs",
+)
+
+
+def _trunc(field: str, column: Any) -> Any:
+    # Buckets are UTC, independent of the database session time zone
+    # Rendered inline so SELECT and GROUP BY contain the identical expression
+    return func.date_trunc(literal_column(f"'{field}'"), column, literal_column("'UTC'"))
+
+
+def floor_hour(ts: datetime) -> datetime:
+    return ts.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(ts: datetime) -> datetime:
+    return ts.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class AnalyticsRepository(BaseRepository[UsageRollup]):
+    """Repository for per-user hourly/daily usage rollups."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize analytics repository.
+
+        Args:
+            session: Database session
+        """
+        super().__init__(session, UsageRollup)
+
+    async def rebuild_hours(self, start: datetime, end: datetime) -> int:
+        """
+        Recompute hourly rollups for ``[start, end)`` from the raw tables.
+
+        Args:
+            start: First hour to rebuild (hour aligned)
+            end: End of the range (hour aligned, exclusive)
+
+        Returns:
+            Number of hourly rows written
+        """
+        rows: dict[tuple[int, datetime], dict[str, Any]] = {}
+
+        def merge(result, fields: tuple[str, ...]) -> None:
+            for row in result:
+                bucket = rows.setdefault(
+                    (row.user_id, row.bucket),
+                    {"user_id": row.user_id, "granularity": HOUR, "bucket_start": row.bucket,
+                     **{name: 0 for name in _COUNTERS}},
+                )
+                for name in fields:
+                    bucket[name] = int(getattr(row, name) or 0)
+
+        session_bucket = _trunc("hour", ChatSession.created_at).label("bucket")
+        merge(
+            await self.session.execute(
+                select(ChatSession.user_id, session_bucket, func.count(ChatSession.id).label("sessions"))
+                .where(and_(ChatSession.created_at >= start, ChatSession.created_at < end))
+                .group_by(ChatSession.user_id, session_bucket)
+            ),
+            ("sessions",),
+        )
+
+        has_tokens = ChatMessage.tokens_in.isnot(None)
+        message_bucket = _trunc("hour", ChatMessage.created_at).label("bucket")
+        merge(
+            await self.session.execute(
+                select(
+                    ChatSession.user_id,
+                    message_bucket,
+                    func.count(ChatMessage.id).label("messages"),
+                    func.count(ChatMessage.tokens_in).label("token_messages"),
+                    func.sum(ChatMessage.tokens_in).label("tokens_in"),
+                    func.sum(ChatMessage.tokens_out).filter(has_tokens).label("tokens_out"),
+                )
+                .join(ChatSession, ChatMessage.session_id == ChatSession.id)
+                .where(and_(ChatMessage.created_at >= start, ChatMessage.created_at < end))
+                .group_by(ChatSession.user_id, message_bucket)
+            ),
+            ("messages", "token_messages", "tokens_in", "tokens_out"),
+        )
+
+        tool_bucket = _trunc("hour", ToolRun.start_ts).label("bucket")
+        merge(
+            await self.session.execute(
+                select(
+                    ToolRun.user_id,
+                    tool_bucket,
+                    func.count(ToolRun.id).label("tool_runs"),
+                    func.count(ToolRun.id).filter(ToolRun.status == "success").label("tool_successes"),
+                    func.sum(ToolRun.latency_ms).label("tool_latency_ms_sum"),
+                    func.count(ToolRun.latency_ms).label("tool_latency_count"),
+                )
+                .where(and_(ToolRun.start_ts >= start, ToolRun.start_ts < end))
+                .group_by(ToolRun.user_id, tool_bucket)
+            ),
+            ("tool_runs", "tool_successes", "tool_latency_ms_sum", "tool_latency_count"),
+        )
+
+        ingestion_bucket = _trunc("hour", IngestionRun.started_at).label("bucket")
+        merge(
+            await self.session.execute(
+                select(
+                    IngestionRun.user_id,
+                    ingestion_bucket,
+                    func.count(IngestionRun.id).label("ingestion_runs"),
+                )
+                .where(and_(IngestionRun.started_at >= start, IngestionRun.started_at < end))
+                .group_by(IngestionRun.user_id, ingestion_bucket)
+            ),
+            ("ingestion_runs",),
+        )
+
+        await self.session.execute(
+            delete(UsageRollup).where(
+                and_(
+                    UsageRollup.granularity == HOUR,
+                    UsageRollup.bucket_start >= start,
+                    UsageRollup.bucket_start < end,
+                )
+            )
+        )
+        if rows:
+            await self.session.execute(insert(UsageRollup), list(rows.values()))
+        return len(rows)
+
+    async def rebuild_days(self, start: datetime, end: datetime) -> None:
+        """
+        Recompute daily rollups for ``[start, end)`` by summing the hourly rows.
+
+        Args:
+            start: First day to rebuild (day aligned)
+            end: End of the range (day aligned, exclusive)
+        """
+        day = _trunc("day", UsageRollup.bucket_start)
+        totals = (
+            select(
+                UsageRollup.user_id,
+                literal(DAY),
+                day,
+                *(func.sum(getattr(UsageRollup, name)) for name in _COUNTERS),
+            )
+            .where(
+                and_(
+                    UsageRollup.granularity == HOUR,
+                    UsageRollup.bucket_start >= start,
+                    UsageRollup.bucket_start < end,
+                )
+            )
+            .group_by(UsageRollup.user_id, day)
+        )
+        await self.session.execute(
+            delete(UsageRollup).where(
+                and_(
+                    UsageRollup.granularity == DAY,
+                    UsageRollup.bucket_start >= start,
+                    UsageRollup.bucket_start < end,
+                )
+            )
+        )
+        await self.session.execute(
+            insert(UsageRollup).from_select(
+                ["user_id", "granularity", "bucket_start", *_COUNTERS], totals
+            )
+        )
+
+    async def get_watermark(self, name: str) -> datetime | None:
+        state = await self.session.get(AnalyticsRollupState, name)
+        return state.watermark if state else None
+
+    async def set_watermark(self, name: str, watermark: datetime) -> None:
+        state = await self.session.get(AnalyticsRollupState, name)
+        if state is None:
+            self.session.add(AnalyticsRollupState(name=name, watermark=watermark))
+        else:
+            state.watermark = watermark
+
+    async def get_overview(self, user_id: int, since: datetime) -> Any:
+        """
+        Totals of a user's hourly rollups since ``since`` (hour precision), in one query.
+
+        Returns:
+            Row with one column per counter plus ``documents`` (all documents)
+        """
+        query = select(
+            *(func.coalesce(func.sum(getattr(UsageRollup, name)), 0).label(name) for name in _COUNTERS),
+            select(func.count(Document.id)).scalar_subquery().label("documents"),
+        ).where(
+            and_(
+                UsageRollup.user_id == user_id,
+                UsageRollup.granularity == HOUR,
+                UsageRollup.bucket_start >= floor_hour(since),
+            )
+        )
+        result = await self.session.execute(query)
+        return result.one()
+
+    async def get_token_timeline(self, user_id: int, since: datetime, interval: str) -> list[Any]:
+        """
+        Token usage per hour, day or week from the rollups.
+
+        Args:
+            user_id: User ID
+            since: Start of the period
+            interval: ``"hour"``, ``"day"`` or ``"week"``
+
+        Returns:
+            Rows of (period, tokens_in, tokens_out, message_count) for periods
+            with token-carrying messages, oldest first
+        """
+        if interval == HOUR:
+            granularity, start = HOUR, floor_hour(since)
+        else:
+            granularity, start = DAY, floor_day(since)
+        period = (
+            _trunc("week", UsageRollup.bucket_start)
+            if interval == "week"
+            else UsageRollup.bucket_start
+        ).label("period")
+        message_count = func.sum(UsageRollup.token_messages)
+
+        query = (
+            select(
+                period,
+                func.sum(UsageRollup.tokens_in).label("tokens_in"),
+                func.sum(UsageRollup.tokens_out).label("tokens_out"),
+                message_count.label("message_count"),
+            )
+            .where(
+                and_(
+                    UsageRollup.user_id == user_id,
+                    UsageRollup.granularity == granularity,
+                    UsageRollup.bucket_start >= start,
+                )
+            )
+            .group_by(period)
+            .having(message_count > 0)
+            .order_by(period)
+        )
+        result = await self.session.execute(query)
+        return list(result.all())
+
@@ -4,17 +4,23 @@ from __future__ import annotations
 
 from abc import ABC
 from datetime import datetime, timezone
-from typing import Any, Generic, TypeVar
+from typing import Any, AsyncIterator, Generic, TypeVar
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..loader import loader_for, reset_loader
+from ..pagination import Cursor, apply_keyset, next_cursor
+
 T = TypeVar("T")
 
 
 class BaseRepository(ABC, Generic[T]):
     """Abstract base repository with common CRUD operations."""
 
+    #: Timestamp column listings are keyset-paginated on (with ``id`` as tie-breaker)
+    keyset_column = "created_at"
+
     def __init__(self, session: AsyncSession, model: type[T]):
         """
         Initialize repository.
@@ -47,7 +53,9 @@ class BaseRepository(ABC, Generic[T]):
         Returns:
             Entity or None if not found
         """
-        instance = await self.session.get(self.model, id)
+        # Served from the session's identity map (or its memo of missing ids)
+        # when the same entity was already looked up during this request
+        instance = await loader_for(self.session).get(self.model, id)
         if instance and self._has_soft_delete() and not include_deleted:
             if getattr(instance, 'deleted_at', None) is not None:
                 return None
@@ -58,27 +66,75 @@ class BaseRepository(ABC, Generic[T]):
         limit: int = 100,
         offset: int = 0,
         order_by: Any | None = None,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        after: Cursor | None = None,
     ) -> list[T]:
         """
-        List all entities with pagination.
+        List entities, newest first.
+
+        Models with a ``keyset_column`` are paginated on ``(keyset_column, id)``:
+        pass the cursor of the previous page as ``after`` (see
+        ``pagination.next_cursor``). ``offset`` and ``order_by`` are kept for
+        existing callers and fall back to OFFSET pagination.
 
         Args:
             limit: Maximum number of entities to return
-            offset: Number of entities to skip
-            order_by: Column to order by
+            offset: Number of entities to skip (prefer ``after``)
+            order_by: Column to order by (disables keyset pagination)
             include_deleted: Include soft-deleted records
+            after: Cursor of the last entity of the previous page
 
         Returns:
             List of entities
         """
-        query = select(self.model).limit(limit).offset(offset)
-        query = self._apply_soft_delete_filter(query, include_deleted)
-        if order_by is not None:
-            query = query.order_by(order_by)
+        query = self._apply_soft_delete_filter(select(self.model), include_deleted)
+        position = getattr(self.model, self.keyset_column, None)
+        if order_by is None and position is not None:
+            query = apply_keyset(query, position, self.model.id, after, limit=limit)
+            if offset:
+                query = query.offset(offset)
+        else:
+            query = query.limit(limit).offset(offset)
+            if order_by is not None:
+                query = query.order_by(order_by)
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def _iter_keyset(
+        self,
+        query: Any,
+        position_column: Any,
+        id_column: Any,
+        *,
+        batch_size: int = 500,
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Yield the rows of ``query`` oldest first, one keyset page at a time.
+
+        Only one batch is held at a time; the session's identity map keeps weak
+        references, so rows are released once the caller drops them.
+
+        Args:
+            query: Select statement without ordering or limit
+            position_column: Timestamp column to page on
+            id_column: Primary key column (tie-breaker)
+            batch_size: Rows per round trip
+        """
+        after: Cursor | None = None
+        while True:
+            result = await self.session.execute(
+                apply_keyset(
+                    query, position_column, id_column, after,
+                    limit=batch_size, descending=False
+                )
+            )
+            rows = list(result.scalars().all())
+            if rows:
+                yield rows
+            after = next_cursor(rows, position_column.key, batch_size)
+            if after is None:
+                return
+
     async def create(self, **kwargs: Any) -> T:
         """
         Create new entity.
@@ -166,3 +222,4 @@ class BaseRepository(ABC, Generic[T]):
     async def rollback(self) -> None:
         """Rollback the transaction."""
         await self.session.rollback()
+        reset_loader(self.session)
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import AsyncIterator, Sequence
 
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ..models import ChatMessage, ChatSession
+from ..models import ChatMessage, ChatSession, decrypt_message_contents
+from ..pagination import Cursor, apply_keyset
 from .base import BaseRepository
 
 
@@ -123,26 +125,74 @@ class ChatRepository(BaseRepository[ChatSession]):
     async def get_user_sessions(
         self,
         user_id: int,
-        limit: int = 50
+        limit: int = 50,
+        after: Cursor | None = None
     ) -> list[ChatSession]:
         """
-        Get all sessions for a user.
+        Get sessions for a user, most recently updated first.
 
         Args:
             user_id: User ID
             limit: Maximum number of sessions to return
+            after: Cursor (``updated_at``, ``id``) of the last session of the previous page
 
         Returns:
             List of chat sessions
         """
         result = await self.session.execute(
-            select(ChatSession)
-            .where(ChatSession.user_id == user_id)
-            .order_by(ChatSession.updated_at.desc())
-            .limit(limit)
+            apply_keyset(
+                select(ChatSession).where(ChatSession.user_id == user_id),
+                ChatSession.updated_at, ChatSession.id, after, limit=limit
+            )
         )
         return list(result.scalars().all())
 
+    def iter_user_sessions(
+        self,
+        user_id: int,
+        batch_size: int = 200
+    ) -> AsyncIterator[list[ChatSession]]:
+        """
+        Yield all sessions of a user, oldest first, in keyset batches.
+
+        Messages are not loaded; use ``iter_session_messages``.
+
+        Args:
+            user_id: User ID
+            batch_size: Sessions per batch
+
+        Yields:
+            Batches of chat sessions
+        """
+        query = select(ChatSession).where(ChatSession.user_id == user_id)
+        return self._iter_keyset(
+            query, ChatSession.created_at, ChatSession.id, batch_size=batch_size
+        )
+
+    async def iter_session_messages(
+        self,
+        session_ids: Sequence[int],
+        batch_size: int = 1000
+    ) -> AsyncIterator[list[ChatMessage]]:
+        """
+        Yield the messages of the given sessions, oldest first, in keyset batches.
+
+        Message content is decrypted one batch at a time, off the event loop.
+
+        Args:
+            session_ids: Chat session IDs
+            batch_size: Messages per batch
+
+        Yields:
+            Batches of chat messages
+        """
+        query = select(ChatMessage).where(ChatMessage.session_id.in_(list(session_ids)))
+        async for messages in self._iter_keyset(
+            query, ChatMessage.created_at, ChatMessage.id, batch_size=batch_size
+        ):
+            await decrypt_message_contents(messages)
+            yield messages
+
     async def get_session_with_messages(
         self,
         session_id: int,
@@ -156,7 +206,7 @@ class ChatRepository(BaseRepository[ChatSession]):
             user_id: User ID (for authorization)
 
         Returns:
-            Chat session with messages, or None if not found
+            Chat session with messages (content already decrypted), or None if not found
         """
         result = await self.session.execute(
             select(ChatSession)
@@ -166,7 +216,10 @@ class ChatRepository(BaseRepository[ChatSession]):
             )
             .options(selectinload(ChatSession.messages))
         )
-        return result.scalar_one_or_none()
+        chat_session = result.scalar_one_or_none()
+        if chat_session is not None:
+            await decrypt_message_contents(chat_session.messages)
+        return chat_session
 
     async def delete_session(
         self,
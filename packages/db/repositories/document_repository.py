@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import AsyncIterator
 
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ..models import Document, DocumentCollection, UserCollectionAccess, Tag
+from ..pagination import Cursor, apply_keyset
 from .base import BaseRepository
 
 
@@ -60,16 +62,18 @@ class DocumentRepository(BaseRepository[Document]):
         user_id: int,
         collection: str | None = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Cursor | None = None
     ) -> list[Document]:
         """
-        Get documents for a user, optionally filtered by collection.
+        Get documents for a user, newest first, optionally filtered by collection.
 
         Args:
             user_id: User ID
             collection: Optional collection filter
             limit: Maximum number of documents
-            offset: Number of documents to skip
+            offset: Number of documents to skip (prefer ``after``)
+            after: Cursor of the last document of the previous page
 
         Returns:
             List of documents
@@ -79,15 +83,37 @@ class DocumentRepository(BaseRepository[Document]):
         if collection:
             query = query.where(Document.collection == collection)
 
-        result = await self.session.execute(
-            query
-            .options(selectinload(Document.tags))
-            .order_by(Document.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        query = apply_keyset(
+            query.options(selectinload(Document.tags)),
+            Document.created_at, Document.id, after, limit=limit
         )
+        if offset:
+            query = query.offset(offset)
+        result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    def iter_user_documents(
+        self,
+        user_id: int,
+        batch_size: int = 500
+    ) -> AsyncIterator[list[Document]]:
+        """
+        Yield all documents of a user, oldest first, in keyset batches.
+
+        Args:
+            user_id: User ID
+            batch_size: Documents per batch
+
+        Yields:
+            Batches of documents with tags loaded
+        """
+        query = (
+            select(Document)
+            .where(Document.user_id == user_id)
+            .options(selectinload(Document.tags))
+        )
+        return self._iter_keyset(query, Document.created_at, Document.id, batch_size=batch_size)
+
     async def upsert_document(
         self,
         user_id: int,
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from packages.common.exceptions import (
     DatabaseError,
@@ -15,12 +16,36 @@ from packages.common.exceptions import (
     ValidationError,
 )
 
+from ..loader import UNKNOWN, loader_for
 from ..models import Document, Group, UserGroupMembership
 from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class GroupAccess:
+    """Everything a membership change is authorized on, read in one query."""
+
+    group_exists: bool
+    requester_role: str | None
+    target_role: str | None
+    admin_count: int
+    member_count: int
+
+    @property
+    def requester_is_admin(self) -> bool:
+        return self.requester_role == "admin"
+
+    @property
+    def target_is_admin(self) -> bool:
+        return self.target_role == "admin"
+
+    @property
+    def target_is_last_admin(self) -> bool:
+        return self.target_is_admin and self.admin_count <= 1
+
+
 class GroupRepository(BaseRepository[Group]):
     """Repository for group-related database operations."""
 
@@ -50,7 +75,7 @@ class GroupRepository(BaseRepository[Group]):
 
     async def get_by_id_with_members(self, group_id: int) -> Group | None:
         """
-        Get a group by its ID with members eagerly loaded.
+        Get a group by its ID with members and their users eagerly loaded.
 
         Args:
             group_id: Group ID
@@ -61,7 +86,9 @@ class GroupRepository(BaseRepository[Group]):
         try:
             result = await self.session.execute(
                 select(Group)
-                .options(selectinload(Group.members))
+                .options(
+                    selectinload(Group.members).joinedload(UserGroupMembership.user)
+                )
                 .where(Group.id == group_id)
             )
             return result.scalar_one_or_none()
@@ -254,6 +281,7 @@ class GroupRepository(BaseRepository[Group]):
             )
             await self.session.flush()
 
+            loader_for(self.session).forget_group(group_id)
             if delete_result.rowcount:
                 logger.info(
                     "Group deleted successfully",
@@ -306,16 +334,8 @@ class GroupRepository(BaseRepository[Group]):
                 details={"role": role}
             )
 
-        # Check if membership already exists
-        existing_membership_result = await self.session.execute(
-            select(UserGroupMembership).where(
-                UserGroupMembership.user_id == user_id,
-                UserGroupMembership.group_id == group_id
-            )
-        )
-        existing_membership = existing_membership_result.scalar_one_or_none()
-
-        if existing_membership:
+        # Check if membership already exists (free if the role was already read)
+        if await self.get_role(user_id, group_id) is not None:
             raise ValidationError(
                 f"User {user_id} is already a member of group {group_id}",
                 code="MEMBERSHIP_EXISTS",
@@ -331,6 +351,7 @@ class GroupRepository(BaseRepository[Group]):
             )
             self.session.add(membership)
             await self.session.flush()
+            loader_for(self.session).remember_role(group_id, user_id, role)
 
             logger.info(
                 "User added to group",
@@ -381,6 +402,7 @@ class GroupRepository(BaseRepository[Group]):
                 )
             )
             await self.session.flush()
+            loader_for(self.session).remember_role(group_id, user_id, None)
 
             if delete_result.rowcount:
                 logger.info(
@@ -444,6 +466,52 @@ class GroupRepository(BaseRepository[Group]):
                 details={"operation": "get_user_groups", "user_id": user_id}
             ) from e
 
+    async def get_user_groups_with_member_counts(
+        self,
+        user_id: int
+    ) -> list[tuple[Group, int]]:
+        """
+        Get all groups a user belongs to with the size of each group.
+
+        The counts come from a correlated subquery in the same statement, so
+        listing groups does not load (or lazily query) any group's members.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List of (group, member count) pairs, newest group first
+        """
+        member_count = (
+            select(func.count(UserGroupMembership.id))
+            .where(UserGroupMembership.group_id == Group.id)
+            .correlate(Group)
+            .scalar_subquery()
+        )
+        try:
+            result = await self.session.execute(
+                select(Group, member_count)
+                .join(UserGroupMembership)
+                .where(UserGroupMembership.user_id == user_id)
+                .order_by(Group.created_at.desc())
+            )
+            return [(group, count) for group, count in result.all()]
+        except Exception as e:
+            logger.error(
+                "Failed to fetch user groups",
+                extra={
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "user_id": user_id,
+                    "operation": "get_user_groups_with_member_counts"
+                },
+                exc_info=True
+            )
+            raise DatabaseError(
+                f"Failed to fetch user groups: {str(e)}",
+                details={"operation": "get_user_groups_with_member_counts", "user_id": user_id}
+            ) from e
+
     async def get_members(self, group_id: int) -> list[UserGroupMembership]:
         """
         Get all members of a group.
@@ -457,7 +525,7 @@ class GroupRepository(BaseRepository[Group]):
         try:
             result = await self.session.execute(
                 select(UserGroupMembership)
-                .options(selectinload(UserGroupMembership.user))
+                .options(joinedload(UserGroupMembership.user))
                 .where(UserGroupMembership.group_id == group_id)
                 .order_by(UserGroupMembership.joined_at.asc())
             )
@@ -478,42 +546,141 @@ class GroupRepository(BaseRepository[Group]):
                 details={"operation": "get_members", "group_id": group_id}
             ) from e
 
-    async def is_admin(self, user_id: int, group_id: int) -> bool:
+    async def get_access(
+        self,
+        group_id: int,
+        requester_id: int,
+        target_id: int | None = None
+    ) -> GroupAccess:
         """
-        Check if a user is an admin of a group.
+        Read the roles and counts a membership change is authorized on.
+
+        One aggregate over the group's memberships answers whether the group
+        exists, the requester's and target's roles and the number of admins
+        and members. The roles are remembered for the rest of the request
+        (see ``packages.db.loader``).
+
+        Args:
+            group_id: Group ID
+            requester_id: User ID making the request
+            target_id: User ID the request acts on (defaults to the requester)
+
+        Returns:
+            Group access summary
+        """
+        if target_id is None:
+            target_id = requester_id
+        membership = UserGroupMembership
+        try:
+            result = await self.session.execute(
+                select(
+                    select(Group.id).where(Group.id == group_id).exists(),
+                    func.max(membership.role).filter(membership.user_id == requester_id),
+                    func.max(membership.role).filter(membership.user_id == target_id),
+                    func.count(membership.id).filter(membership.role == "admin"),
+                    func.count(membership.id),
+                ).where(membership.group_id == group_id)
+            )
+            group_exists, requester_role, target_role, admin_count, member_count = result.one()
+        except Exception as e:
+            logger.error(
+                "Failed to check group access",
+                extra={
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "user_id": requester_id,
+                    "group_id": group_id,
+                    "operation": "get_access"
+                },
+                exc_info=True
+            )
+            raise DatabaseError(
+                f"Failed to check group access: {str(e)}",
+                details={"operation": "get_access", "user_id": requester_id, "group_id": group_id}
+            ) from e
+
+        loader = loader_for(self.session)
+        loader.remember_role(group_id, requester_id, requester_role)
+        loader.remember_role(group_id, target_id, target_role)
+        return GroupAccess(
+            group_exists=bool(group_exists),
+            requester_role=requester_role,
+            target_role=target_role,
+            admin_count=admin_count,
+            member_count=member_count,
+        )
+
+    async def get_role(self, user_id: int, group_id: int) -> str | None:
+        """
+        Get a user's role in a group.
+
+        Answered from the request's role cache when this membership was
+        already read; otherwise a single-row lookup on the unique
+        ``(user_id, group_id)`` key.
 
         Args:
             user_id: User ID
             group_id: Group ID
 
         Returns:
-            True if user is admin, False otherwise
+            "member" or "admin", or None if the user is not a member
         """
+        loader = loader_for(self.session)
+        role = loader.role(group_id, user_id)
+        if role is not UNKNOWN:
+            return role
         try:
             result = await self.session.execute(
-                select(UserGroupMembership).where(
+                select(UserGroupMembership.role).where(
                     UserGroupMembership.user_id == user_id,
-                    UserGroupMembership.group_id == group_id,
-                    UserGroupMembership.role == "admin"
+                    UserGroupMembership.group_id == group_id
                 )
             )
-            return result.scalar_one_or_none() is not None
+            role = result.scalar_one_or_none()
         except Exception as e:
             logger.error(
-                "Failed to check group admin status",
+                "Failed to check group membership",
                 extra={
                     "error": str(e),
                     "error_type": type(e).__name__,
                     "user_id": user_id,
                     "group_id": group_id,
-                    "operation": "is_admin"
+                    "operation": "get_role"
                 },
                 exc_info=True
             )
             raise DatabaseError(
-                f"Failed to check admin status: {str(e)}",
-                details={"operation": "is_admin", "user_id": user_id, "group_id": group_id}
+                f"Failed to check group membership: {str(e)}",
+                details={"operation": "get_role", "user_id": user_id, "group_id": group_id}
             ) from e
+        loader.remember_role(group_id, user_id, role)
+        return role
+
+    async def is_member(self, user_id: int, group_id: int) -> bool:
+        """
+        Check if a user is a member of a group.
+
+        Args:
+            user_id: User ID
+            group_id: Group ID
+
+        Returns:
+            True if user is a member, False otherwise
+        """
+        return await self.get_role(user_id, group_id) is not None
+
+    async def is_admin(self, user_id: int, group_id: int) -> bool:
+        """
+        Check if a user is an admin of a group.
+
+        Args:
+            user_id: User ID
+            group_id: Group ID
+
+        Returns:
+            True if user is admin, False otherwise
+        """
+        return await self.get_role(user_id, group_id) == "admin"
 
     async def update_member_role(
         self,
@@ -530,7 +697,7 @@ class GroupRepository(BaseRepository[Group]):
             role: New role ("member" or "admin")
 
         Returns:
-            Updated membership
+            Updated membership, with its user loaded
 
         Raises:
             ValidationError: If role is invalid
@@ -547,7 +714,9 @@ class GroupRepository(BaseRepository[Group]):
 
         try:
             result = await self.session.execute(
-                select(UserGroupMembership).where(
+                select(UserGroupMembership)
+                .options(joinedload(UserGroupMembership.user))
+                .where(
                     UserGroupMembership.user_id == user_id,
                     UserGroupMembership.group_id == group_id
                 )
@@ -563,6 +732,7 @@ class GroupRepository(BaseRepository[Group]):
 
             membership.role = role
             await self.session.flush()
+            loader_for(self.session).remember_role(group_id, user_id, role)
 
             logger.info(
                 "Member role updated",
@@ -643,35 +813,29 @@ class GroupRepository(BaseRepository[Group]):
             True if user can access document, False otherwise
         """
         try:
-            # Get the document
+            # Ownership, privacy and group membership in one statement
+            is_group_member = exists().where(
+                UserGroupMembership.group_id == Document.group_id,
+                UserGroupMembership.user_id == user_id
+            )
             result = await self.session.execute(
-                select(Document).where(Document.id == document_id)
+                select(Document.user_id, Document.is_private, is_group_member)
+                .where(Document.id == document_id)
             )
-            document = result.scalar_one_or_none()
+            row = result.one_or_none()
 
-            if not document:
+            if row is None:
                 return False
 
+            owner_id, is_private, is_member = row
+
             # User owns the document
-            if document.user_id == user_id:
+            if owner_id == user_id:
                 return True
 
-            # Document is private - only owner can access
-            if document.is_private:
-                return False
-
-            # Document belongs to a group - check if user is a member
-            if document.group_id:
-                membership_result = await self.session.execute(
-                    select(UserGroupMembership).where(
-                        UserGroupMembership.user_id == user_id,
-                        UserGroupMembership.group_id == document.group_id
-                    )
-                )
-                return membership_result.scalar_one_or_none() is not None
-
-            # Document has no group and is not private - not accessible
-            return False
+            # Document is private - only owner can access; otherwise the user
+            # needs to be in the document's group (no group: not accessible)
+            return not is_private and bool(is_member)
         except Exception as e:
             logger.error(
                 "Failed to check document access",
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import AsyncIterator
 
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from ..models import IngestionRun, Tag
+from ..pagination import Cursor, apply_keyset
 from .base import BaseRepository
 
 
 class IngestionRepository(BaseRepository[IngestionRun]):
     """Repository for ingestion run tracking."""
 
+    keyset_column = "started_at"
+
     def __init__(self, session: AsyncSession):
         """
         Initialize ingestion repository.
@@ -114,27 +119,53 @@ class IngestionRepository(BaseRepository[IngestionRun]):
         self,
         user_id: int,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Cursor | None = None
     ) -> list[IngestionRun]:
         """
-        Get ingestion runs for a user.
+        Get ingestion runs for a user, newest first.
 
         Args:
             user_id: User ID
             limit: Maximum number of runs
-            offset: Number of runs to skip
+            offset: Number of runs to skip (prefer ``after``)
+            after: Cursor of the last run of the previous page
 
         Returns:
             List of ingestion runs
         """
-        result = await self.session.execute(
+        query = apply_keyset(
+            select(IngestionRun).where(IngestionRun.user_id == user_id),
+            IngestionRun.started_at, IngestionRun.id, after, limit=limit
+        )
+        if offset:
+            query = query.offset(offset)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    def iter_user_ingestion_runs(
+        self,
+        user_id: int,
+        batch_size: int = 500
+    ) -> AsyncIterator[list[IngestionRun]]:
+        """
+        Yield all ingestion runs of a user, oldest first, in keyset batches.
+
+        Args:
+            user_id: User ID
+            batch_size: Runs per batch
+
+        Yields:
+            Batches of ingestion runs with tags loaded
+        """
+        query = (
             select(IngestionRun)
             .where(IngestionRun.user_id == user_id)
-            .order_by(IngestionRun.started_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .options(selectinload(IngestionRun.tags))
+        )
+        return self._iter_keyset(
+            query, IngestionRun.started_at, IngestionRun.id, batch_size=batch_size
         )
-        return list(result.scalars().all())
 
     async def delete_ingestion_run(
         self,
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import AsyncIterator
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Tool, ToolRun
+from ..pagination import Cursor, apply_keyset
 from .base import BaseRepository
 
 
 class ToolRepository(BaseRepository[ToolRun]):
     """Repository for tool execution tracking."""
 
+    keyset_column = "start_ts"
+
     def __init__(self, session: AsyncSession):
         """
         Initialize tool repository.
@@ -80,6 +84,7 @@ class ToolRepository(BaseRepository[ToolRun]):
         result_preview: str | None = None,
         error_message: str | None = None,
         tool_name: str | None = None,
+        cache_hit: bool | None = None,
     ) -> None:
         """
         Finish tracking a tool execution.
@@ -92,6 +97,7 @@ class ToolRepository(BaseRepository[ToolRun]):
             result_preview: Result preview (optional)
             error_message: Error message if failed (optional)
             tool_name: Tool name for ID resolution (optional)
+            cache_hit: Whether the result cache served the call (optional)
         """
         q = select(ToolRun).where(ToolRun.id == run_id)
         result = await self.session.execute(q)
@@ -104,6 +110,7 @@ class ToolRepository(BaseRepository[ToolRun]):
         tr.latency_ms = latency_ms
         tr.result_preview = result_preview
         tr.error_message = error_message
+        tr.cache_hit = cache_hit
 
         if tr.tool_id is None and tool_name:
             try:
@@ -121,28 +128,48 @@ class ToolRepository(BaseRepository[ToolRun]):
         self,
         user_id: int,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Cursor | None = None
     ) -> list[ToolRun]:
         """
-        Get tool runs for a user.
+        Get tool runs for a user, newest first.
 
         Args:
             user_id: User ID
             limit: Maximum number of runs
-            offset: Number of runs to skip
+            offset: Number of runs to skip (prefer ``after``)
+            after: Cursor of the last run of the previous page
 
         Returns:
             List of tool runs
         """
-        result = await self.session.execute(
-            select(ToolRun)
-            .where(ToolRun.user_id == user_id)
-            .order_by(ToolRun.start_ts.desc())
-            .limit(limit)
-            .offset(offset)
+        query = apply_keyset(
+            select(ToolRun).where(ToolRun.user_id == user_id),
+            ToolRun.start_ts, ToolRun.id, after, limit=limit
         )
+        if offset:
+            query = query.offset(offset)
+        result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    def iter_user_tool_runs(
+        self,
+        user_id: int,
+        batch_size: int = 500
+    ) -> AsyncIterator[list[ToolRun]]:
+        """
+        Yield all tool runs of a user, oldest first, in keyset batches.
+
+        Args:
+            user_id: User ID
+            batch_size: Runs per batch
+
+        Yields:
+            Batches of tool runs
+        """
+        query = select(ToolRun).where(ToolRun.user_id == user_id)
+        return self._iter_keyset(query, ToolRun.start_ts, ToolRun.id, batch_size=batch_size)
+
     async def get_session_tool_runs(
         self,
         session_id: int,
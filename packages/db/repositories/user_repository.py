@@ -6,10 +6,10 @@ import hashlib
 import logging
 import secrets
 from datetime import datetime, timezone
+from typing import Any, AsyncIterator
 
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from packages.common.exceptions import (
     DatabaseError,
@@ -17,7 +17,7 @@ from packages.common.exceptions import (
     ValidationError,
 )
 
-from ..models import ChatMessage, ChatSession, User
+from ..models import ChatMessage, ChatSession, Document, IngestionRun, ToolRun, User
 from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
@@ -247,15 +247,27 @@ class UserRepository(BaseRepository[User]):
         await self.session.flush()
         return bool(delete_result.rowcount)
 
-    async def export_snapshot(self, user_id: int) -> dict:
+    async def iter_export(
+        self,
+        user_id: int,
+        batch_size: int = 500
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
         """
-        Collect a snapshot of the user's data for export.
+        Stream the user's data for export as ``(record_type, record)`` pairs.
+
+        Rows are fetched in keyset batches and yielded as they arrive, so
+        memory use does not depend on the size of the account. Records come
+        in this order: ``user``, then ``session`` and ``message`` records
+        (batch by batch, messages after the sessions they belong to), then
+        ``document``, ``ingestion_run`` and ``tool_run`` records, each oldest
+        first.
 
         Args:
             user_id: User ID
+            batch_size: Rows per database round trip
 
-        Returns:
-            Complete user data snapshot
+        Yields:
+            Record type and JSON-compatible record
 
         Raises:
             ResourceNotFoundError: If user not found
@@ -267,122 +279,159 @@ class UserRepository(BaseRepository[User]):
                 code="USER_NOT_FOUND",
                 details={"user_id": user_id}
             )
-
-        sessions_result = await self.session.execute(
-            select(ChatSession)
-            .options(selectinload(ChatSession.messages))
-            .where(ChatSession.user_id == user_id)
-            .order_by(ChatSession.created_at.asc())
-        )
-        sessions = sessions_result.scalars().unique().all()
+        yield "user", {
+            "id": user.id,
+            "username": user.username,
+            "created_at": user.created_at,
+            "is_root": user.is_root,
+        }
 
         # Import here to avoid circular imports
-        from . import DocumentRepository, ToolRepository, IngestionRepository
+        from . import ChatRepository, DocumentRepository, IngestionRepository, ToolRepository
+
+        chat_repo = ChatRepository(self.session)
+        async for sessions in chat_repo.iter_user_sessions(user_id, batch_size=batch_size):
+            for chat_session in sessions:
+                yield "session", _session_record(chat_session)
+            session_ids = [chat_session.id for chat_session in sessions]
+            async for messages in chat_repo.iter_session_messages(
+                session_ids, batch_size=batch_size
+            ):
+                for message in messages:
+                    yield "message", _message_record(message)
+
+        async for documents in DocumentRepository(self.session).iter_user_documents(
+            user_id, batch_size=batch_size
+        ):
+            for document in documents:
+                yield "document", _document_record(document)
+
+        async for runs in IngestionRepository(self.session).iter_user_ingestion_runs(
+            user_id, batch_size=batch_size
+        ):
+            for run in runs:
+                yield "ingestion_run", _ingestion_run_record(run)
+
+        async for tool_runs in ToolRepository(self.session).iter_user_tool_runs(
+            user_id, batch_size=batch_size
+        ):
+            for tool_run in tool_runs:
+                yield "tool_run", _tool_run_record(tool_run)
 
-        doc_repo = DocumentRepository(self.session)
-        tool_repo = ToolRepository(self.session)
-        ingestion_repo = IngestionRepository(self.session)
+    async def export_snapshot(self, user_id: int) -> dict:
+        """
+        Collect a snapshot of the user's data for export as a single dict.
 
-        documents = await doc_repo.get_user_documents(
-            user_id=user_id,
-            limit=10_000,
-            offset=0
-        )
-        ingestion_runs = await ingestion_repo.get_user_ingestion_runs(
-            user_id=user_id,
-            limit=10_000
-        )
-        tool_runs = await tool_repo.get_user_tool_runs(
-            user_id=user_id,
-            limit=10_000
-        )
+        Holds the whole account in memory; prefer ``iter_export`` for
+        anything that can be streamed.
 
-        sessions_payload = []
-        for chat_session in sessions:
-            messages = sorted(
-                chat_session.messages,
-                key=lambda message: message.created_at or datetime.now(timezone.utc),
-            )
-            sessions_payload.append(
-                {
-                    "id": chat_session.id,
-                    "external_id": chat_session.external_id,
-                    "title": chat_session.title,
-                    "model": chat_session.model,
-                    "enable_tools": chat_session.enable_tools,
-                    "created_at": chat_session.created_at,
-                    "updated_at": chat_session.updated_at,
-                    "message_count": len(messages),
-                    "messages": [
-                        {
-                            "id": message.id,
-                            "role": message.role,
-                            "content": message.content,
-                            "tool_call_id": message.tool_call_id,
-                            "tool_call_name": message.tool_call_name,
-                            "created_at": message.created_at,
-                            "tokens_in": message.tokens_in,
-                            "tokens_out": message.tokens_out,
-                        }
-                        for message in messages
-                    ],
-                }
-            )
+        Args:
+            user_id: User ID
 
-        return {
-            "user": {
-                "id": user.id,
-                "username": user.username,
-                "created_at": user.created_at,
-                "is_root": user.is_root,
-            },
+        Returns:
+            Complete user data snapshot
+
+        Raises:
+            ResourceNotFoundError: If user not found
+        """
+        snapshot: dict[str, Any] = {
+            "user": None,
             "exported_at": datetime.now(timezone.utc),
-            "sessions": sessions_payload,
-            "documents": [
-                {
-                    "id": document.id,
-                    "uri": document.uri,
-                    "path": document.path,
-                    "mime": document.mime,
-                    "bytes_size": document.bytes_size,
-                    "source": document.source,
-                    "tags": document.tags,
-                    "collection": document.collection,
-                    "path_hash": document.path_hash,
-                    "created_at": document.created_at,
-                    "last_ingested_at": document.last_ingested_at,
-                }
-                for document in documents
-            ],
-            "ingestion_runs": [
-                {
-                    "id": run.id,
-                    "target": run.target,
-                    "from_web": run.from_web,
-                    "recursive": run.recursive,
-                    "tags": run.tags,
-                    "collection": run.collection,
-                    "totals_files": run.totals_files,
-                    "totals_chunks": run.totals_chunks,
-                    "errors": run.errors,
-                    "started_at": run.started_at,
-                    "finished_at": run.finished_at,
-                    "status": run.status,
-                }
-                for run in ingestion_runs
-            ],
-            "tool_runs": [
-                {
-                    "id": tool_run.id,
-                    "tool_name": tool_run.tool_name,
-                    "status": tool_run.status,
-                    "start_ts": tool_run.start_ts,
-                    "end_ts": tool_run.end_ts,
-                    "latency_ms": tool_run.latency_ms,
-                    "args": tool_run.args,
-                    "error_message": tool_run.error_message,
-                    "result_preview": tool_run.result_preview,
-                }
-                for tool_run in tool_runs
-            ],
+            "sessions": [],
+            "documents": [],
+            "ingestion_runs": [],
+            "tool_runs": [],
         }
+        sessions_by_id: dict[int, dict[str, Any]] = {}
+        async for record_type, record in self.iter_export(user_id):
+            if record_type == "user":
+                snapshot["user"] = record
+            elif record_type == "session":
+                record = {**record, "message_count": 0, "messages": []}
+                sessions_by_id[record["id"]] = record
+                snapshot["sessions"].append(record)
+            elif record_type == "message":
+                chat_session = sessions_by_id[record.pop("session_id")]
+                chat_session["messages"].append(record)
+                chat_session["message_count"] += 1
+            else:
+                snapshot[f"{record_type}s"].append(record)
+        return snapshot
+
+
+def _tag_names(tags: list[Any]) -> list[str]:
+    return [tag.name for tag in tags]
+
+
+def _session_record(chat_session: ChatSession) -> dict[str, Any]:
+    return {
+        "id": chat_session.id,
+        "external_id": chat_session.external_id,
+        "title": chat_session.title,
+        "model": chat_session.model,
+        "enable_tools": chat_session.enable_tools,
+        "created_at": chat_session.created_at,
+        "updated_at": chat_session.updated_at,
+    }
+
+
+def _message_record(message: ChatMessage) -> dict[str, Any]:
+    return {
+        "id": message.id,
+        "session_id": message.session_id,
+        "role": message.role,
+        "content": message.content,
+        "tool_call_id": message.tool_call_id,
+        "tool_call_name": message.tool_call_name,
+        "created_at": message.created_at,
+        "tokens_in": message.tokens_in,
+        "tokens_out": message.tokens_out,
+    }
+
+
+def _document_record(document: Document) -> dict[str, Any]:
+    return {
+        "id": document.id,
+        "uri": document.uri,
+        "path": document.path,
+        "mime": document.mime,
+        "bytes_size": document.bytes_size,
+        "source": document.source,
+        "tags": _tag_names(document.tags),
+        "collection": document.collection,
+        "path_hash": document.path_hash,
+        "created_at": document.created_at,
+        "last_ingested_at": document.last_ingested_at,
+    }
+
+
+def _ingestion_run_record(run: IngestionRun) -> dict[str, Any]:
+    return {
+        "id": run.id,
+        "target": run.target,
+        "from_web": run.from_web,
+        "recursive": run.recursive,
+        "tags": _tag_names(run.tags),
+        "collection": run.collection,
+        "totals_files": run.totals_files,
+        "totals_chunks": run.totals_chunks,
+        "errors": run.errors,
+        "started_at": run.started_at,
+        "finished_at": run.finished_at,
+        "status": run.status,
+    }
+
+
+def _tool_run_record(tool_run: ToolRun) -> dict[str, Any]:
+    return {
+        "id": tool_run.id,
+        "session_id": tool_run.session_id,
+        "tool_name": tool_run.tool_name,
+        "status": tool_run.status,
+        "start_ts": tool_run.start_ts,
+        "end_ts": tool_run.end_ts,
+        "latency_ms": tool_run.latency_ms,
+        "args": tool_run.args,
+        "error_message": tool_run.error_message,
+        "result_preview": tool_run.result_preview,
+    }
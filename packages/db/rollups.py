@@ -0,0 +1,177 @@
+"""
+Background maintenance of the analytics rollup tables.
+
+Each pass recomputes the hourly rollups from the previous high-water mark
+(minus a settle window, so tool runs that finish late are still counted) up
+to the current hour, then re-sums the affected daily rollups. Recomputing
+whole buckets keeps passes idempotent; a Postgres advisory lock makes sure
+only one API worker runs a pass at a time.
+
+The first pass backfills a year of history in many short transactions, so
+it cannot hold the lock throughout. The worker that finds no watermark
+records a backfill claim in the same locked transaction and refreshes it
+with every day it rebuilds; other workers skip their passes while the claim
+is fresh instead of starting a backfill of their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy import func, select
+
+from .repositories.analytics_repository import AnalyticsRepository, floor_day, floor_hour
+from .session import get_async_session
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_NAME = "usage_rollups"
+# Progress marker of a running backfill (see module docstring)
+BACKFILL_CLAIM_NAME = "usage_rollups_backfill"
+# A claim not refreshed for this long belongs to a worker that died
+BACKFILL_CLAIM_LEASE = timedelta(minutes=10)
+# Arbitrary application-wide key for pg_try_advisory_xact_lock
+_ADVISORY_LOCK_KEY = 0x59575255  # "YWRU"
+# History rebuilt on the very first pass (the dashboard shows at most a year)
+INITIAL_BACKFILL = timedelta(days=365)
+
+
+class RollupAggregator:
+    """
+    Keeps ``usage_rollups`` up to date.
+
+    Args:
+        interval: Seconds between passes when running in the background
+        settle: Time before the previous watermark that is recomputed
+        clock: Current UTC time (overridable in tests)
+    """
+
+    def __init__(
+        self,
+        interval: float = 60.0,
+        settle: timedelta = timedelta(hours=1),
+        *,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self.interval = interval
+        self.settle = settle
+        self._clock = clock
+        self._task: asyncio.Task | None = None
+
+    async def run_once(self) -> bool:
+        """
+        Run one incremental pass.
+
+        Returns:
+            False when another worker held the lock and the pass was skipped
+        """
+        now = self._clock()
+        async with get_async_session() as db:
+            if not await self._try_lock(db):
+                return False
+            repo = AnalyticsRepository(db)
+            watermark = await repo.get_watermark(WATERMARK_NAME)
+            if watermark is not None:
+                await self._rebuild(
+                    repo, floor_hour(watermark - self.settle), floor_hour(now) + timedelta(hours=1)
+                )
+                await repo.set_watermark(WATERMARK_NAME, now)
+                return True
+
+            claim = await repo.get_watermark(BACKFILL_CLAIM_NAME)
+            if claim is not None and now - claim < BACKFILL_CLAIM_LEASE:
+                return False
+            await repo.set_watermark(BACKFILL_CLAIM_NAME, now)
+
+        logger.info("No analytics rollups yet, backfilling history")
+        await self.backfill(now - INITIAL_BACKFILL)
+        return True
+
+    async def backfill(
+        self,
+        since: datetime,
+        *,
+        on_day: Callable[[datetime], None] | None = None,
+    ) -> int:
+        """
+        Rebuild rollups from ``since`` up to now, one day per transaction.
+
+        Each day's transaction also refreshes the backfill claim, so workers
+        keep skipping their passes until the watermark is written.
+
+        Args:
+            since: Start of the history to rebuild
+            on_day: Called with the start of each day once it is committed
+
+        Returns:
+            Number of days rebuilt
+        """
+        now = self._clock()
+        day = floor_day(since)
+        days = 0
+        while day <= now:
+            next_day = day + timedelta(days=1)
+            async with get_async_session() as db:
+                await db.execute(select(func.pg_advisory_xact_lock(_ADVISORY_LOCK_KEY)))
+                repo = AnalyticsRepository(db)
+                await self._rebuild(repo, day, next_day)
+                await repo.set_watermark(BACKFILL_CLAIM_NAME, self._clock())
+            days += 1
+            if on_day is not None:
+                on_day(day)
+            day = next_day
+
+        async with get_async_session() as db:
+            await AnalyticsRepository(db).set_watermark(WATERMARK_NAME, now)
+        logger.info(
+            "Analytics rollups backfilled",
+            extra={"since": floor_day(since).isoformat(), "days": days},
+        )
+        return days
+
+    async def start(self) -> None:
+        """Run passes every ``interval`` seconds until ``stop`` is called."""
+        if self.interval <= 0 or (self._task and not self._task.done()):
+            return
+
+        async def _loop() -> None:
+            while True:
+                try:
+                    await self.run_once()
+                    await asyncio.sleep(self.interval)
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.warning(
+                        "Analytics rollup pass failed",
+                        extra={"error": str(e), "error_type": type(e).__name__}
+                    )
+                    await asyncio.sleep(self.interval)
+
+        self._task = asyncio.create_task(_loop())
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except Exception:
+                pass
+        self._task = None
+
+    @staticmethod
+    async def _try_lock(db) -> bool:
+        result = await db.execute(select(func.pg_try_advisory_xact_lock(_ADVISORY_LOCK_KEY)))
+        return bool(result.scalar())
+
+    @staticmethod
+    async def _rebuild(repo: AnalyticsRepository, start: datetime, end: datetime) -> None:
+        """Rebuild the hours in ``[start, end)`` (hour aligned) and the days containing them."""
+        await repo.rebuild_hours(start, end)
+        day_end = floor_day(end)
+        if day_end < end:
+            day_end += timedelta(days=1)
+        await repo.rebuild_days(floor_day(start), day_end)
@@ -0,0 +1,313 @@
+"""
+Chunk deduplication for the ingestion pipeline.
+
+Documents in one collection often share text: headers, disclaimers, slide
+footers, or the same file ingested twice. Such chunks are stored once; every
+document they came from is listed in the point's ``sources`` payload.
+
+Each chunk is fingerprinted on its normalized text (NFKC, case-folded,
+punctuation and whitespace collapsed):
+
+- ``content_hash``: SHA-256 of the normalized text, for exact duplicates;
+- ``simhash``: 64-bit SimHash over word 3-shingles, for near duplicates
+  (overlap windows, a changed date in a footer). Two chunks are near
+  duplicates when their SimHashes differ in at most ``max_distance`` bits.
+  SimHash cannot tell a changed footer date from a changed amount in a
+  contract, so near-duplicate folding is off by default
+  (``INGEST_DEDUP_SIMHASH_DISTANCE=0``) and only exact duplicates merge.
+
+The per-collection index lives in the vector store payload. The SimHash is
+split into ``max_distance + 1`` bands, and each band is stored as a keyword
+(``simhash_bands``). By pigeonhole, any two fingerprints within
+``max_distance`` bits agree on at least one whole band, so one keyword
+lookup on the hashes and bands of an item's chunks returns every possible
+match. ``ChunkIndex`` then confirms the matches in memory.
+
+Hashes and bands are scoped to the owning user. Chunks are never merged
+across users, so deduplication cannot widen or narrow access to a document.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from packages.parsers.models import DocChunk
+
+SIMHASH_BITS = 64
+# Chunks shorter than this many words only take part in exact matching:
+# a handful of shingles gives an unstable SimHash
+MIN_SIMHASH_WORDS = 8
+# Source references kept per stored chunk (``source_count`` keeps the total)
+MAX_SOURCES_PER_CHUNK = 100
+# Stored chunks fetched per item to match against
+MAX_STORED_CANDIDATES = 1024
+# Payload keys holding the index (keyword-indexed in the collection)
+DEDUP_INDEXED_FIELDS = ("content_hash", "simhash_bands")
+
+_SHINGLE_WORDS = 3
+_WORD = re.compile(r"\w+")
+
+
+def normalize_chunk_text(text: str) -> list[str]:
+    """Split chunk text into normalized words (NFKC, case-folded, no punctuation)."""
+    return _WORD.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+def simhash(words: Sequence[str]) -> int | None:
+    """
+    64-bit SimHash of a word sequence over its 3-word shingles.
+
+    Returns:
+        Fingerprint, or None when there are fewer than ``MIN_SIMHASH_WORDS`` words
+    """
+    if len(words) < MIN_SIMHASH_WORDS:
+        return None
+    shingles = {
+        " ".join(words[i:i + _SHINGLE_WORDS]) for i in range(len(words) - _SHINGLE_WORDS + 1)
+    }
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+            for s in shingles
+        ),
+        dtype="<u8",
+        count=len(shingles),
+    )
+    # One row of 64 bits per shingle; a fingerprint bit is set when most
+    # shingles have it set
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    majority = bits.sum(axis=0, dtype=np.int64) * 2 > len(shingles)
+    return int(np.packbits(majority, bitorder="little").view("<u8")[0])
+
+
+def _hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _bands(fingerprint: int, scope: str, max_distance: int) -> list[str]:
+    count = max_distance + 1
+    width = SIMHASH_BITS // count
+    bands = []
+    for index in range(count):
+        shift = index * width
+        bits = SIMHASH_BITS - shift if index == count - 1 else width
+        value = (fingerprint >> shift) & ((1 << bits) - 1)
+        bands.append(f"{scope}:{count}.{index}:{value:x}")
+    return bands
+
+
+@dataclass(slots=True)
+class ChunkFingerprint:
+    """Dedup keys of one chunk."""
+
+    content_hash: str
+    simhash: int | None
+    bands: list[str]
+
+    def payload(self) -> dict[str, Any]:
+        """Payload fields that put the chunk into the collection's index."""
+        payload: dict[str, Any] = {"content_hash": self.content_hash}
+        if self.simhash is not None:
+            payload["simhash"] = f"{self.simhash:016x}"
+            payload["simhash_bands"] = self.bands
+        return payload
+
+
+def fingerprint_chunk(text: str, *, user_id: int | None, max_distance: int) -> ChunkFingerprint:
+    """
+    Fingerprint a chunk for deduplication within its owner's documents.
+
+    Args:
+        text: Chunk text
+        user_id: Owner of the document (None for unowned ingestion)
+        max_distance: Max differing SimHash bits for near duplicates (0 = exact only)
+
+    Returns:
+        Chunk fingerprint
+    """
+    scope = "-" if user_id is None else str(user_id)
+    words = normalize_chunk_text(text)
+    digest = hashlib.sha256(" ".join(words).encode("utf-8")).hexdigest()
+    fingerprint = simhash(words) if max_distance > 0 else None
+    return ChunkFingerprint(
+        content_hash=f"{scope}:{digest}",
+        simhash=fingerprint,
+        bands=_bands(fingerprint, scope, max_distance) if fingerprint is not None else [],
+    )
+
+
+def chunk_source(chunk: DocChunk) -> dict[str, Any]:
+    """Reference to the document a chunk was cut from, as stored in ``sources``."""
+    metadata = chunk.metadata
+    source = {
+        "uri": chunk.uri,
+        "path_hash": metadata.get("path_hash"),
+        "chunk_index": metadata.get("chunk_index", chunk.chunk_id),
+        "filename": metadata.get("filename"),
+        "user_id": metadata.get("user_id"),
+        "tags": metadata.get("tags"),
+    }
+    return {key: value for key, value in source.items() if value is not None}
+
+
+def _source_key(source: dict[str, Any]) -> tuple[Any, Any]:
+    return source.get("path_hash"), source.get("chunk_index")
+
+
+@dataclass(slots=True)
+class IndexedChunk:
+    """A chunk already stored in the collection, as returned by the index lookup."""
+
+    point_id: str
+    content_hash: str
+    simhash: int | None
+    sources: list[dict[str, Any]] = field(default_factory=list)
+    source_count: int = 0
+
+    @classmethod
+    def from_payload(cls, point_id: str, payload: dict[str, Any]) -> IndexedChunk:
+        simhash_hex = payload.get("simhash")
+        return cls(
+            point_id=point_id,
+            content_hash=payload.get("content_hash", ""),
+            simhash=int(simhash_hex, 16) if simhash_hex else None,
+            sources=list(payload.get("sources") or []),
+            source_count=int(payload.get("source_count") or 0),
+        )
+
+
+def source_payload(
+    added: Sequence[dict[str, Any]], stored: IndexedChunk | None = None
+) -> dict[str, Any]:
+    """
+    ``sources``/``source_count`` payload of a point after adding references.
+
+    References already listed are skipped, so re-ingesting a document leaves
+    its chunks unchanged. At most ``MAX_SOURCES_PER_CHUNK`` are kept;
+    ``source_count`` keeps counting past that.
+
+    Args:
+        added: References of the chunks folded into the point
+        stored: The point as stored (None for a point being created)
+
+    Returns:
+        Payload fields to write
+    """
+    sources = list(stored.sources) if stored else []
+    count = max(stored.source_count, len(sources)) if stored else 0
+    seen = {_source_key(source) for source in sources}
+    for source in added:
+        key = _source_key(source)
+        if key in seen:
+            continue
+        seen.add(key)
+        count += 1
+        if len(sources) < MAX_SOURCES_PER_CHUNK:
+            sources.append(source)
+    return {"sources": sources, "source_count": count}
+
+
+class ChunkIndex:
+    """In-memory matcher over stored chunks and the chunks accepted so far."""
+
+    def __init__(self, max_distance: int) -> None:
+        self.max_distance = max_distance
+        self._by_hash: dict[str, str] = {}
+        self._by_band: dict[str, list[tuple[int, str]]] = {}
+
+    def add(self, point_id: str, content_hash: str, fingerprint: int | None, bands: Sequence[str]) -> None:
+        self._by_hash.setdefault(content_hash, point_id)
+        if fingerprint is not None:
+            for band in bands:
+                self._by_band.setdefault(band, []).append((fingerprint, point_id))
+
+    def find(self, chunk: ChunkFingerprint) -> str | None:
+        """Point id of an exact or near duplicate of ``chunk``, if any."""
+        point_id = self._by_hash.get(chunk.content_hash)
+        if point_id is not None or chunk.simhash is None:
+            return point_id
+        best: tuple[int, str] | None = None
+        for band in chunk.bands:
+            for fingerprint, candidate in self._by_band.get(band, ()):
+                distance = _hamming(fingerprint, chunk.simhash)
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, candidate)
+        return best[1] if best else None
+
+
+@dataclass(slots=True)
+class DedupResult:
+    """Chunks of one item split into new points and duplicates."""
+
+    unique: list[DocChunk]
+    #: Source references per point id: the new points' own (plus their
+    #: duplicates in the batch) and those to add to stored points
+    sources: dict[str, list[dict[str, Any]]]
+    #: Stored points that duplicates were folded into
+    matched: dict[str, IndexedChunk]
+    #: Fingerprints of the new points, by chunk id
+    fingerprints: dict[str, ChunkFingerprint]
+    duplicate_count: int
+
+
+def deduplicate_chunks(
+    chunks: Sequence[DocChunk],
+    fingerprints: Sequence[ChunkFingerprint],
+    stored: Iterable[IndexedChunk],
+    *,
+    max_distance: int,
+) -> DedupResult:
+    """
+    Keep the first of each group of duplicate chunks.
+
+    A chunk matching a stored chunk or an earlier chunk of the batch is
+    dropped; its source reference goes to the point it matched.
+
+    Args:
+        chunks: Chunks of one item, metadata already built
+        fingerprints: Fingerprint of each chunk
+        stored: Possible matches already in the collection
+        max_distance: Max differing SimHash bits for near duplicates
+
+    Returns:
+        Dedup result
+    """
+    index = ChunkIndex(max_distance)
+    stored_by_id: dict[str, IndexedChunk] = {}
+    for entry in stored:
+        stored_by_id[entry.point_id] = entry
+        bands = (
+            _bands(entry.simhash, entry.content_hash.split(":", 1)[0], max_distance)
+            if entry.simhash is not None and max_distance > 0
+            else []
+        )
+        index.add(entry.point_id, entry.content_hash, entry.simhash, bands)
+
+    unique: list[DocChunk] = []
+    sources: dict[str, list[dict[str, Any]]] = {}
+    matched: dict[str, IndexedChunk] = {}
+    unique_fingerprints: dict[str, ChunkFingerprint] = {}
+    for chunk, fingerprint in zip(chunks, fingerprints, strict=True):
+        match = index.find(fingerprint)
+        if match is None:
+            unique.append(chunk)
+            sources[chunk.id] = [chunk_source(chunk)]
+            unique_fingerprints[chunk.id] = fingerprint
+            index.add(chunk.id, fingerprint.content_hash, fingerprint.simhash, fingerprint.bands)
+            continue
+        sources.setdefault(match, []).append(chunk_source(chunk))
+        if match in stored_by_id:
+            matched[match] = stored_by_id[match]
+    return DedupResult(
+        unique=unique,
+        sources=sources,
+        matched=matched,
+        fingerprints=unique_fingerprints,
+        duplicate_count=len(chunks) - len(unique),
+    )
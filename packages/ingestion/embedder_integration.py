@@ -4,7 +4,7 @@ Embedding and vector store integration for ingestion pipeline.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Sequence
+from typing import Any, Mapping, Sequence
 
 from qdrant_client.http.models import PointStruct
 
@@ -51,6 +51,7 @@ async def prepare_points(
     vectors: list[list[float]],
     settings: Settings,
     collection_name: str | None = None,
+    extra_payload: Mapping[str, dict[str, Any]] | None = None,
 ) -> list[PointStruct]:
     """
     Prepare Qdrant PointStructs from embedded chunks.
@@ -60,6 +61,8 @@ async def prepare_points(
         vectors: Corresponding embedding vectors
         settings: Pipeline settings
         collection_name: Optional collection override
+        extra_payload: Additional top-level payload fields per chunk id
+            (dedup fingerprints and source references)
 
     Returns:
         List of PointStruct ready for upsert
@@ -82,6 +85,8 @@ async def prepare_points(
             "text": chunk.text,
             "metadata": metadata,
         }
+        if extra_payload and chunk.id in extra_payload:
+            payload.update(extra_payload[chunk.id])
         points.append(PointStruct(id=chunk.id, vector=vector, payload=payload))
 
     return points
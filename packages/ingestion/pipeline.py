@@ -16,7 +16,7 @@ import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Any, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 from urllib.parse import urljoin, urlparse
 
 from qdrant_client import QdrantClient
@@ -26,23 +26,36 @@ from uuid import uuid4
 
 from packages.common import Settings, get_logger, get_settings
 from packages.llm import Embedder
-from packages.parsers import (
-    DocumentToImageConverter,
-    VisionParser,
-)
-from packages.parsers.media_transcriber import (
-    parse_audio_to_markdown,
-    parse_video_to_markdown,
-)
 from packages.parsers.models import DocChunk, IngestionItem, IngestionReport
 from packages.llm.model_manager import get_model_manager
-from packages.vectorstore import ensure_collections, get_client
+from packages.vectorstore import (
+    ensure_collections,
+    ensure_keyword_indexes,
+    find_points_matching_any,
+    get_client,
+    set_point_payloads,
+)
 from packages.vectorstore.schema import DocumentSource
 
 from packages.parsers.chunker import chunk_text, chunk_markdown_with_headers
+from .dedup import (
+    DEDUP_INDEXED_FIELDS,
+    MAX_STORED_CANDIDATES,
+    DedupResult,
+    IndexedChunk,
+    deduplicate_chunks,
+    fingerprint_chunk,
+    source_payload,
+)
 from .embedder_integration import embed_chunks, prepare_points, upsert_embedded_chunks
 from .metadata_builder import build_chunk_metadata, prune_metadata
 
+if TYPE_CHECKING:
+    # Rendering (PIL, OpenCV, pypdfium2) and transcription (ffmpeg, faster-whisper)
+    # are imported on first use; API workers that only serve chat never load them.
+    from packages.parsers.doc_to_image import DocumentToImageConverter
+    from packages.parsers.vision_parser import VisionParser
+
 logger = get_logger(__name__)
 
 _CUSTOM_MIME_TYPES: tuple[tuple[str, str], ...] = (
@@ -91,6 +104,9 @@ EMBEDDED_ASSET_EXTENSIONS: set[str] = {
 MAX_EMBEDDED_ASSETS = 25
 MAX_EMBEDDED_ASSET_BYTES = 8 * 1024 * 1024
 
+# Called with (item uri, fraction done) while long media items are transcribed
+IngestionProgressCallback = Callable[[str, float], None]
+
 
 @dataclass(slots=True)
 class PipelineConfig:
@@ -108,6 +124,8 @@ class ProcessedItemResult:
 
     chunk_count: int
     artifact_summary: dict[str, Any]
+    # Chunks folded into an identical or near-identical chunk instead of stored
+    duplicate_chunks: int = 0
 
 
 class IngestionPipeline:
@@ -127,15 +145,33 @@ class IngestionPipeline:
         )
         self._temp_dirs: list[Path] = []
         self._active_ingestions = 0
+        # Per collection: dedup lookup and writes of concurrent items must not interleave
+        self._dedup_locks: dict[str, asyncio.Lock] = {}
 
-        # Vision-based components
-        self.doc_converter = DocumentToImageConverter()
-        self.vision_parser = VisionParser()
+        # Vision-based components, created on first use
+        self._doc_converter: DocumentToImageConverter | None = None
+        self._vision_parser: VisionParser | None = None
 
         # Ensure collections on init
         client = self._get_qdrant_client()
         ensure_collections(client, self._settings)
 
+    @property
+    def doc_converter(self) -> DocumentToImageConverter:
+        if self._doc_converter is None:
+            from packages.parsers.doc_to_image import DocumentToImageConverter
+
+            self._doc_converter = DocumentToImageConverter()
+        return self._doc_converter
+
+    @property
+    def vision_parser(self) -> VisionParser:
+        if self._vision_parser is None:
+            from packages.parsers.vision_parser import VisionParser
+
+            self._vision_parser = VisionParser()
+        return self._vision_parser
+
     def _get_qdrant_client(self) -> QdrantClient:
         return get_client(self._settings)
 
@@ -153,11 +189,23 @@ class IngestionPipeline:
         tags: Sequence[str] | None = None,
         collection_name: str | None = None,
         user_id: int | None = None,
+        progress: IngestionProgressCallback | None = None,
     ) -> IngestionReport:
-        """High-level ingestion API for local paths or web resources."""
+        """
+        High-level ingestion API for local paths or web resources.
+
+        ``progress`` is called on the event loop with ``(item_uri, fraction)``
+        as audio and video items are transcribed.
+        """
         self._active_ingestions += 1
         client = self._get_qdrant_client()
         ensure_collections(client, self._settings, collection_name=collection_name)
+        if self._settings.ingest_dedup_enabled:
+            ensure_keyword_indexes(
+                client,
+                collection_name or self._settings.qdrant_collection,
+                DEDUP_INDEXED_FIELDS,
+            )
 
         recursive = self._config.recursive if recursive is None else recursive
         tags = list(tags or [])
@@ -210,6 +258,7 @@ class IngestionPipeline:
                         collection_name=collection_name,
                         user_id=user_id,
                         semaphore=semaphore,
+                        progress=progress,
                     )
                 )
                 for idx, item in enumerate(items)
@@ -257,6 +306,7 @@ class IngestionPipeline:
                         "uri": item.uri,
                         "mime": item.mime,
                         "chunks": stats.chunk_count,
+                        "duplicate_chunks": stats.duplicate_chunks,
                         "size_bytes": item.bytes_size,
                         "artifacts": artifact_counts,
                         "artifact_samples": artifact_samples,
@@ -291,11 +341,17 @@ class IngestionPipeline:
         collection_name: str | None = None,
         user_id: int | None = None,
         semaphore: asyncio.Semaphore,
+        progress: IngestionProgressCallback | None = None,
     ) -> tuple[int, IngestionItem, ProcessedItemResult | None, Exception | None]:
         async with semaphore:
             try:
                 stats = await self._process_item(
-                    item, tags=tags, from_web=from_web, collection_name=collection_name, user_id=user_id
+                    item,
+                    tags=tags,
+                    from_web=from_web,
+                    collection_name=collection_name,
+                    user_id=user_id,
+                    progress=progress,
                 )
                 return (index, item, stats, None)
             except Exception as exc:
@@ -311,6 +367,16 @@ class IngestionPipeline:
                 )
                 return (index, item, None, exc)
 
+    @staticmethod
+    def _media_progress(
+        item: IngestionItem, progress: IngestionProgressCallback | None
+    ) -> Callable[[float], None] | None:
+        """Adapt ``progress`` for transcription, which reports from a worker thread."""
+        if progress is None:
+            return None
+        loop = asyncio.get_running_loop()
+        return lambda fraction: loop.call_soon_threadsafe(progress, item.uri, fraction)
+
     async def _process_item(
         self,
         item: IngestionItem,
@@ -319,19 +385,25 @@ class IngestionPipeline:
         from_web: bool,
         collection_name: str | None = None,
         user_id: int | None = None,
+        progress: IngestionProgressCallback | None = None,
     ) -> ProcessedItemResult:
         """Process a single item using the most appropriate method."""
         source = self._determine_source(item.mime, from_web=from_web)
         markdown_content = ""
+        media_progress = self._media_progress(item, progress)
 
         try:
             # Route to appropriate processor based on file type
             if source == "audio":
+                from packages.parsers.media_transcriber import parse_audio_to_markdown
+
                 logger.info(f"Processing audio file: {item.path}")
-                markdown_content = await parse_audio_to_markdown(item.path)
+                markdown_content = await parse_audio_to_markdown(item.path, media_progress)
             elif source == "video":
+                from packages.parsers.media_transcriber import parse_video_to_markdown
+
                 logger.info(f"Processing video file: {item.path}")
-                markdown_content = await parse_video_to_markdown(item.path)
+                markdown_content = await parse_video_to_markdown(item.path, media_progress)
             elif self._is_plain_text_file(item.mime, item.path):
                 # Plain text files: read directly (fast, accurate, no OCR needed)
                 logger.info(f"Processing plain text file: {item.path}")
@@ -445,8 +517,6 @@ class IngestionPipeline:
         if not prepared_chunks:
             return ProcessedItemResult(chunk_count=0, artifact_summary=artifact_summary)
 
-        vectors = await embed_chunks(prepared_chunks, self._get_embedder())
-
         attach_summary = True
         artifacts_sample = artifact_summary.get("artifacts") or {}
         pages_metadata = artifact_summary.get("pages") or []
@@ -481,19 +551,109 @@ class IngestionPipeline:
             )
             chunk.metadata = prune_metadata(chunk.metadata)
 
-        points = await prepare_points(
-            prepared_chunks,
-            vectors,
-            self._settings,
-            collection_name=collection_name,
-        )
+        if not self._settings.ingest_dedup_enabled:
+            await self._write_chunks(prepared_chunks, collection_name=collection_name)
+            return ProcessedItemResult(
+                chunk_count=len(prepared_chunks),
+                artifact_summary=artifact_summary,
+            )
 
-        await upsert_embedded_chunks(points, self._settings)
+        collection = collection_name or self._settings.qdrant_collection
+        lock = self._dedup_locks.setdefault(collection, asyncio.Lock())
+        async with lock:
+            # The Qdrant client is synchronous: keep its calls off the event loop
+            dedup = await asyncio.to_thread(
+                self._deduplicate, prepared_chunks, collection_name=collection, user_id=user_id
+            )
+            await self._write_chunks(dedup.unique, collection_name=collection, dedup=dedup)
+            if dedup.matched:
+                await asyncio.to_thread(
+                    set_point_payloads,
+                    {
+                        point_id: source_payload(dedup.sources[point_id], stored)
+                        for point_id, stored in dedup.matched.items()
+                    },
+                    self._get_qdrant_client(),
+                    self._settings,
+                    collection_name=collection,
+                )
+
+        if dedup.duplicate_count:
+            logger.info(
+                "ingestion-chunks-deduplicated",
+                extra={
+                    "item_uri": item.uri,
+                    "chunk_count": len(prepared_chunks),
+                    "duplicate_chunks": dedup.duplicate_count,
+                    "merged_into_stored": len(dedup.matched),
+                    "collection_name": collection,
+                }
+            )
 
         return ProcessedItemResult(
             chunk_count=len(prepared_chunks),
             artifact_summary=artifact_summary,
+            duplicate_chunks=dedup.duplicate_count,
+        )
+
+    def _deduplicate(
+        self,
+        chunks: list[DocChunk],
+        *,
+        collection_name: str,
+        user_id: int | None,
+    ) -> DedupResult:
+        """Split an item's chunks into new ones and duplicates (see ``dedup``)."""
+        max_distance = self._settings.ingest_dedup_simhash_distance
+        fingerprints = [
+            fingerprint_chunk(chunk.text, user_id=user_id, max_distance=max_distance)
+            for chunk in chunks
+        ]
+        records = find_points_matching_any(
+            self._get_qdrant_client(),
+            self._settings,
+            {
+                "content_hash": sorted({f.content_hash for f in fingerprints}),
+                "simhash_bands": sorted({band for f in fingerprints for band in f.bands}),
+            },
+            with_payload=("content_hash", "simhash", "sources", "source_count"),
+            limit=MAX_STORED_CANDIDATES,
+            collection_name=collection_name,
         )
+        stored = [IndexedChunk.from_payload(str(r.id), r.payload or {}) for r in records]
+        return deduplicate_chunks(chunks, fingerprints, stored, max_distance=max_distance)
+
+    async def _write_chunks(
+        self,
+        chunks: list[DocChunk],
+        *,
+        collection_name: str | None,
+        dedup: DedupResult | None = None,
+    ) -> None:
+        """Embed chunks and upsert them as new points."""
+        if not chunks:
+            return
+        vectors = await embed_chunks(chunks, self._get_embedder())
+
+        extra_payload: dict[str, dict[str, Any]] | None = None
+        if dedup is not None:
+            extra_payload = {
+                chunk.id: {
+                    **dedup.fingerprints[chunk.id].payload(),
+                    **source_payload(dedup.sources[chunk.id]),
+                }
+                for chunk in chunks
+            }
+
+        points = await prepare_points(
+            chunks,
+            vectors,
+            self._settings,
+            collection_name=collection_name,
+            extra_payload=extra_payload,
+        )
+
+        await upsert_embedded_chunks(points, self._settings, collection_name=collection_name)
 
     async def _download_embedded_assets(
         self,
@@ -1,4 +1,4 @@
-from .client import MCPClient, MCPTool, MCPError, MCPTransportError, MCPRpcError
+from .client import MCPClient, MCPTool, MCPError, MCPTransportError, MCPTimeoutError, MCPRpcError
 from .base_handler import (
     MCPProtocolHandler,
     MCPServerInfo,
@@ -12,6 +12,7 @@ __all__ = [
     "MCPTool",
     "MCPError",
     "MCPTransportError",
+    "MCPTimeoutError",
     "MCPRpcError",
     # Server utilities
     "MCPProtocolHandler",
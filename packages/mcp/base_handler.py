@@ -8,9 +8,12 @@ that can be shared across all MCP servers.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Callable
 from dataclasses import dataclass, field
 
@@ -24,6 +27,7 @@ class MCPToolDefinition:
     description: str
     input_schema: dict[str, Any]
     handler: Callable
+    cache: dict[str, Any] | None = None
 
 
 @dataclass
@@ -43,40 +47,65 @@ class MCPProtocolHandler:
     - JSON-RPC request/response handling
     - Standard error responses
     - Initialize method handling
+
+    Synchronous tool handlers run on a small thread pool so they never block
+    the event loop serving other requests.
     """
 
-    def __init__(self, server_info: MCPServerInfo):
+    def __init__(self, server_info: MCPServerInfo, sync_workers: int = 8):
         self.server_info = server_info
         self.logger = logging.getLogger(f"mcp.{server_info.name}")
         self._tools: dict[str, MCPToolDefinition] = {}
+        self._tools_version: str | None = None
+        self._sync_workers = max(1, sync_workers)
+        self._executor: ThreadPoolExecutor | None = None
 
     def register_tool(
         self,
         name: str,
         description: str,
         input_schema: dict[str, Any],
-        handler: Callable
+        handler: Callable,
+        cache: dict[str, Any] | None = None,
     ) -> None:
-        """Register a tool with its handler."""
+        """
+        Register a tool with its handler.
+
+        ``cache`` declares a result cache policy for idempotent tools, e.g.
+        ``{"ttl": 300, "keyFields": ["url"]}``; clients may then reuse results
+        for identical arguments until the TTL expires.
+        """
         tool = MCPToolDefinition(
             name=name,
             description=description,
             input_schema=input_schema,
-            handler=handler
+            handler=handler,
+            cache=cache,
         )
         self._tools[name] = tool
+        self._tools_version = None
         self.logger.info("Registered tool", extra={"tool_name": name})
 
     def get_tools_schema(self) -> list[dict[str, Any]]:
         """Return tool definitions in MCP schema format."""
-        return [
-            {
+        schema = []
+        for tool in self._tools.values():
+            entry = {
                 "name": tool.name,
                 "description": tool.description,
                 "inputSchema": tool.input_schema,
             }
-            for tool in self._tools.values()
-        ]
+            if tool.cache:
+                entry["cache"] = tool.cache
+            schema.append(entry)
+        return schema
+
+    def tools_version(self) -> str:
+        """Hash of the advertised tool schemas; it changes whenever any tool does."""
+        if self._tools_version is None:
+            payload = json.dumps(self.get_tools_schema(), sort_keys=True, separators=(",", ":"))
+            self._tools_version = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+        return self._tools_version
 
     def get_initialize_response(self) -> dict[str, Any]:
         """Return standard initialize response."""
@@ -90,14 +119,17 @@ class MCPProtocolHandler:
                 "tools": {
                     "list": True,
                     "call": True,
+                    "version": True,
                 }
             },
+            "toolsVersion": self.tools_version(),
         }
 
     def get_tools_list_response(self) -> dict[str, Any]:
         """Return tools/list response."""
         return {
-            "tools": self.get_tools_schema()
+            "tools": self.get_tools_schema(),
+            "version": self.tools_version(),
         }
 
     async def handle_tool_call(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
@@ -125,7 +157,9 @@ class MCPProtocolHandler:
             if inspect.iscoroutinefunction(tool.handler) or asyncio.iscoroutinefunction(tool.handler):
                 result = await tool.handler(**arguments)
             else:
-                result = tool.handler(**arguments)
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), partial(tool.handler, **arguments)
+                )
             return {
                 "content": [
                     {
@@ -142,6 +176,14 @@ class MCPProtocolHandler:
             )
             raise
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._sync_workers,
+                thread_name_prefix=f"mcp-{self.server_info.name}",
+            )
+        return self._executor
+
     def create_jsonrpc_response(
         self,
         request_id: Any,
@@ -230,6 +272,8 @@ class MCPProtocolHandler:
                 result = self.get_initialize_response()
             elif method == "tools/list":
                 result = self.get_tools_list_response()
+            elif method == "tools/version":
+                result = {"version": self.tools_version()}
             elif method == "tools/call":
                 name = params.get("name")
                 arguments = params.get("arguments", {})
@@ -270,14 +314,22 @@ class MCPProtocolHandler:
 
 async def mcp_websocket_handler(
     websocket: WebSocket,
-    handler: MCPProtocolHandler
+    handler: MCPProtocolHandler,
+    max_in_flight: int = 32,
 ) -> None:
     """
     Generic WebSocket handler for MCP protocol.
 
+    Each JSON-RPC request is handled in its own task and answered as soon as
+    it completes, so responses may arrive out of order (clients match them by
+    id) and a slow tool call does not hold up the ones behind it. At most
+    ``max_in_flight`` requests run at once; beyond that the socket is not read,
+    which pushes back on the client.
+
     Args:
         websocket: FastAPI WebSocket instance
         handler: MCPProtocolHandler instance
+        max_in_flight: Concurrent requests per connection
 
     Usage:
         @app.websocket("/mcp")
@@ -287,15 +339,41 @@ async def mcp_websocket_handler(
     await websocket.accept()
     handler.logger.info("MCP WebSocket connected", extra={"status": "connected"})
 
+    slots = asyncio.Semaphore(max(1, max_in_flight))
+    send_lock = asyncio.Lock()
+    in_flight: set[asyncio.Task] = set()
+
+    async def respond(raw_message: str) -> None:
+        try:
+            response = await handler.handle_websocket_request(raw_message)
+            async with send_lock:
+                await websocket.send_text(response)
+        except Exception as e:
+            handler.logger.debug(
+                "Dropped MCP response",
+                extra={"reason": str(e), "error_type": type(e).__name__}
+            )
+
+    def finished(task: asyncio.Task) -> None:
+        in_flight.discard(task)
+        slots.release()
+
     try:
         while True:
             raw_message = await websocket.receive_text()
-            response = await handler.handle_websocket_request(raw_message)
-            await websocket.send_text(response)
+            await slots.acquire()
+            task = asyncio.create_task(respond(raw_message))
+            in_flight.add(task)
+            task.add_done_callback(finished)
 
     except Exception as e:
         handler.logger.info(
             "MCP WebSocket disconnected",
-            extra={"reason": str(e), "error_type": type(e).__name__}
+            extra={"reason": str(e), "error_type": type(e).__name__, "in_flight": len(in_flight)}
         )
         # WebSocket disconnection is normal, no need to raise
+    finally:
+        for task in list(in_flight):
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
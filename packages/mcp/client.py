@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 import websockets
 from websockets.protocol import State
 
@@ -31,6 +31,10 @@ class MCPTransportError(MCPError):
     """Raised for transport-level issues (connectivity, timeouts)."""
 
 
+class MCPTimeoutError(MCPTransportError):
+    """Raised when one request gets no response in time; the connection stays usable."""
+
+
 class MCPRpcError(MCPError):
     """Raised when the MCP server returns a JSON-RPC error."""
 
@@ -54,6 +58,7 @@ class MCPTool:
     server_id: str
     server_url: str
     tags: list[str] | None = None
+    cache: dict[str, Any] | None = None  # Result cache policy, see packages.agent.tool_cache
 
     def to_llm_schema(self) -> dict[str, Any]:
         """Convert to OpenAI/Ollama tool schema format."""
@@ -67,6 +72,190 @@ class MCPTool:
         }
 
 
+class _MCPConnection:
+    """
+    One multiplexed WebSocket to an MCP server.
+
+    Requests are matched to responses by JSON-RPC id, so any number can be in
+    flight at once. A background task pings the server only after the socket
+    has been idle for the heartbeat interval.
+    """
+
+    def __init__(self, client: "MCPClient", index: int):
+        self.client = client
+        self.index = index
+        self.reserved = 0  # requests assigned to this connection and not finished
+        self.heartbeats = 0
+        self._ws: Any | None = None
+        self._initialized = False
+        self._closed = False
+        self._send_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+        self._pending: dict[int, asyncio.Future] = {}
+        self._recv_task: asyncio.Task | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self._last_activity = time.monotonic()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def ensure_open(self) -> None:
+        if self._initialized and self._ws is not None and not self.client._is_ws_closed(self._ws):
+            return
+        async with self._open_lock:
+            if self._closed:
+                raise MCPTransportError("Connection closed")
+            if self._initialized and self._ws is not None and not self.client._is_ws_closed(self._ws):
+                return
+            logger.info(
+                "Connecting to MCP server",
+                extra={
+                    "server_id": self.client.server_id,
+                    "ws_url": self.client.ws_url,
+                    "connection": self.index,
+                },
+            )
+            self._ws = await websockets.connect(self.client.ws_url, open_timeout=self.client.timeout)  # type: ignore
+            await self._initialize()
+            self._touch()
+            self._recv_task = asyncio.create_task(self._recv_loop())
+            if self.client.heartbeat_interval > 0:
+                self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def _initialize(self) -> None:
+        assert self._ws is not None
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self.client._next_id(),
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-10-01",
+                "clientInfo": {"name": "youworker-agent", "version": "0.1.0"},
+                "capabilities": {"tools": {"list": True, "call": True}},
+            },
+        }
+        async with self._send_lock:
+            await self._ws.send(json.dumps(payload))
+            raw = await asyncio.wait_for(self._ws.recv(), timeout=self.client.timeout)
+        resp = json.loads(raw)
+        if "error" in resp:
+            raise RuntimeError(f"MCP initialize failed: {resp['error']}")
+        self._initialized = True
+
+    async def request(
+        self, method: str, params: dict[str, Any], *, timeout: float | None = None
+    ) -> dict[str, Any]:
+        await self.ensure_open()
+        assert self._ws is not None
+        req_id = self.client._next_id()
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = fut
+        try:
+            async with self._send_lock:
+                await self._ws.send(
+                    json.dumps({"jsonrpc": "2.0", "id": req_id, "method": method, "params": params})
+                )
+            self._touch()
+            try:
+                return await asyncio.wait_for(fut, timeout=timeout or self.client.timeout)
+            except asyncio.TimeoutError as exc:
+                # Only this request is abandoned: a late response for its id is
+                # dropped by the receive loop, other requests keep the socket.
+                raise MCPTimeoutError(f"No response to {method} within the timeout") from exc
+            except MCPRpcError:
+                raise
+            except Exception as exc:
+                raise MCPTransportError("RPC response wait failed") from exc
+        finally:
+            self._pending.pop(req_id, None)
+
+    async def close(self, reason: str = "Client closed") -> None:
+        self._closed = True
+        current = asyncio.current_task()
+        for task in (self._heartbeat_task, self._recv_task):
+            if task is not None and task is not current and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._heartbeat_task = self._recv_task = None
+        self._fail_pending(reason)
+        if self._ws is not None and not self.client._is_ws_closed(self._ws):
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+        self._ws = None
+        self._initialized = False
+
+    def _touch(self) -> None:
+        self._last_activity = time.monotonic()
+
+    def _fail_pending(self, reason: str) -> None:
+        for fut in list(self._pending.values()):
+            if not fut.done():
+                fut.set_exception(MCPTransportError(reason))
+        self._pending.clear()
+
+    async def _heartbeat_loop(self) -> None:
+        interval = self.client.heartbeat_interval
+        while not self._closed:
+            idle = time.monotonic() - self._last_activity
+            if idle < interval or self._pending:
+                # Traffic (or a request waiting on a response) proves the socket is alive
+                await asyncio.sleep(interval - idle if idle < interval else interval)
+                continue
+            try:
+                await self.request("ping", {}, timeout=min(self.client.timeout, interval))
+                self.heartbeats += 1
+            except MCPRpcError:
+                # The server answered, so the connection is fine even without ping support
+                self.heartbeats += 1
+            except Exception as exc:
+                logger.warning(
+                    "MCP heartbeat failed",
+                    extra={
+                        "server_id": self.client.server_id,
+                        "connection": self.index,
+                        "error": str(exc),
+                    },
+                )
+                await self.close("Heartbeat failed")
+                return
+
+    async def _recv_loop(self) -> None:
+        assert self._ws is not None
+        try:
+            while True:
+                raw = await self._ws.recv()
+                self._touch()
+                try:
+                    msg = json.loads(raw)
+                except Exception:
+                    continue
+                req_id = msg.get("id")
+                if req_id is None:
+                    continue
+                fut = self._pending.pop(req_id, None)
+                if fut is None or fut.done():
+                    continue
+                if "error" in msg:
+                    err = msg["error"]
+                    fut.set_exception(
+                        MCPRpcError(err.get("code"), err.get("message", ""), err.get("data"))
+                    )
+                else:
+                    fut.set_result(msg.get("result", {}))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Terminate all pending futures on receive failure; the pool replaces the connection
+            self._closed = True
+            self._fail_pending("WebSocket receive loop terminated")
+
+
 class MCPClient:
     """
     Client for communicating with MCP servers via JSON-RPC over WebSocket.
@@ -75,11 +264,33 @@ class MCPClient:
     - initialize handshake
     - tools/list
     - tools/call
+
+    Calls are spread over a small pool of multiplexed connections: each call
+    goes to the least-loaded open connection, and a new connection is opened
+    (up to ``pool_size``) only when every open one is busy. At most
+    ``max_in_flight_per_connection`` calls per connection run at once; further
+    calls wait, which ``pool_stats`` reports as saturation.
+
+    A call that times out fails on its own and leaves its connection open;
+    only send or receive failures close the connection, and only those are
+    retried on a fresh one.
     """
 
-    def __init__(self, server_url: str, server_id: str, timeout: float = 30.0):
+    def __init__(
+        self,
+        server_url: str,
+        server_id: str,
+        timeout: float = 30.0,
+        *,
+        pool_size: int = 2,
+        max_in_flight_per_connection: int = 8,
+        heartbeat_interval: float = 30.0,
+    ):
         self.server_id = server_id
         self.timeout = timeout
+        self.pool_size = max(1, pool_size)
+        self.max_in_flight_per_connection = max(1, max_in_flight_per_connection)
+        self.heartbeat_interval = heartbeat_interval
 
         # Normalize to WebSocket URL, append `/mcp` if no path given
         parsed = urlparse(server_url.rstrip("/"))
@@ -110,90 +321,50 @@ class MCPClient:
         )
 
         self._healthy = True
-        self._ws: Any | None = None
+        self.tools_version: str | None = None  # Schema hash from the last tools/list
         self._id_counter = 0
-        self._send_lock = asyncio.Lock()
-        self._initialized = False
-        self._last_ws_activity: float = 0.0
-        self._heartbeat_interval: float = 30.0
-        self._pending: dict[int, asyncio.Future] = {}
-        self._recv_task: asyncio.Task | None = None
-        self._init_lock = asyncio.Lock()
-
-    async def _connect(self) -> None:
-        # Already initialized
-        if self._ws is not None and not self._is_ws_closed(self._ws) and self._initialized:
-            return
-        # Socket exists but not initialized yet
-        if self._ws is not None and not self._is_ws_closed(self._ws) and not self._initialized:
-            async with self._init_lock:
-                if not self._initialized:
-                    await self._initialize()
-            return
-        logger.info(
-            "Connecting to MCP server",
-            extra={"server_id": self.server_id, "ws_url": self.ws_url}
-        )
-        self._ws = await websockets.connect(self.ws_url, open_timeout=self.timeout)  # type: ignore
-        async with self._init_lock:
-            if not self._initialized:
-                await self._initialize()
-        self._last_ws_activity = time.time()
-        if self._recv_task is None or self._recv_task.done():
-            self._recv_task = asyncio.create_task(self._recv_loop())
-
-    async def _initialize(self) -> None:
-        if self._initialized:
-            return
-        assert self._ws is not None
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-10-01",
-                "clientInfo": {"name": "youworker-agent", "version": "0.1.0"},
-                "capabilities": {"tools": {"list": True, "call": True}},
-            },
-        }
-        async with self._send_lock:
-            await self._ws.send(json.dumps(payload))
-            raw = await asyncio.wait_for(self._ws.recv(), timeout=self.timeout)
-        resp = json.loads(raw)
-        if "error" in resp:
-            raise RuntimeError(f"MCP initialize failed: {resp['error']}")
-        self._initialized = True
-
-        # record activity for heartbeat
-        self._last_ws_activity = time.time()
+        self._connections: list[_MCPConnection] = []
+        self._connection_counter = 0
+        self._capacity = asyncio.Condition()  # notified whenever a reservation ends
+        self._waiting = 0
+        self._requests = 0
+        self._failures = 0
+        self._reconnects = 0
+        self._peak_in_flight = 0
 
     def _next_id(self) -> int:
         self._id_counter += 1
         return self._id_counter
 
     async def close(self):
-        if self._recv_task and not self._recv_task.done():
-            self._recv_task.cancel()
-            try:
-                await self._recv_task
-            except (asyncio.CancelledError, Exception):
-                pass
-        self._recv_task = None
-
-        for fut in list(self._pending.values()):
-            if not fut.done():
-                fut.set_exception(MCPTransportError("Client closed"))
-        self._pending.clear()
-
-        if self._ws is not None and not self._is_ws_closed(self._ws):
-            await self._ws.close()
-        self._ws = None
-        self._initialized = False
+        connections, self._connections = self._connections, []
+        for connection in connections:
+            await connection.close()
 
     @property
     def is_healthy(self) -> bool:
         return self._healthy
 
+    def pool_stats(self) -> dict[str, Any]:
+        """Connection pool usage; ``saturated`` means calls are queueing for a slot."""
+        open_connections = [c for c in self._connections if not c.closed]
+        in_flight = sum(c.reserved for c in self._connections)
+        capacity = self.pool_size * self.max_in_flight_per_connection
+        return {
+            "pool_size": self.pool_size,
+            "open_connections": len(open_connections),
+            "in_flight": in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "capacity": capacity,
+            "utilization": round(in_flight / capacity, 3),
+            "waiting": self._waiting,
+            "saturated": self._waiting > 0 or in_flight >= capacity,
+            "requests": self._requests,
+            "failures": self._failures,
+            "reconnects": self._reconnects,
+            "heartbeats": sum(c.heartbeats for c in self._connections),
+        }
+
     @retry(
         stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), reraise=True
     )
@@ -203,6 +374,8 @@ class MCPClient:
             result = await self._send_rpc("tools/list", {})
             tools_data = result.get("tools", [])
             tools = self._parse_tools(tools_data)
+            version = result.get("version")
+            self.tools_version = version if isinstance(version, str) else None
             self._healthy = True
             logger.info(
                 "Discovered tools from MCP server",
@@ -217,8 +390,32 @@ class MCPClient:
             self._healthy = False
             raise
 
+    async def fetch_tools_version(self) -> str | None:
+        """
+        Ask the server for its current tool schema hash.
+
+        Returns:
+            The hash, or ``None`` when the server does not advertise one
+        """
+        try:
+            result = await self._send_rpc("tools/version", {})
+        except MCPRpcError as e:
+            if e.code == -32601:  # Method not found: server predates schema versions
+                return None
+            raise
+        except Exception:
+            self._healthy = False
+            raise
+        self._healthy = True
+        version = result.get("version")
+        return version if isinstance(version, str) else None
+
+    # A timed-out call may still be running on the server, so it is not repeated
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), reraise=True
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_not_exception_type(MCPTimeoutError),
+        reraise=True,
     )
     async def call_tool(
         self, tool_name: str, arguments: dict[str, Any], correlation_id: str | None = None
@@ -245,152 +442,84 @@ class MCPClient:
             self._healthy = False
             raise
 
+    def _pick_connection(self) -> _MCPConnection | None:
+        """Least-loaded connection with a free slot, opening a new one while all are busy."""
+        self._connections = [c for c in self._connections if not c.closed]
+        available = [
+            c for c in self._connections if c.reserved < self.max_in_flight_per_connection
+        ]
+        connection = min(available, key=lambda c: c.reserved, default=None)
+        if (connection is None or connection.reserved) and len(self._connections) < self.pool_size:
+            connection = _MCPConnection(self, self._connection_counter)
+            self._connection_counter += 1
+            self._connections.append(connection)
+        return connection
+
+    async def _acquire_connection(self) -> _MCPConnection:
+        """Reserve a slot on a connection, waiting while every connection is at its cap."""
+        async with self._capacity:
+            while (connection := self._pick_connection()) is None:
+                self._waiting += 1
+                try:
+                    await self._capacity.wait()
+                finally:
+                    self._waiting -= 1
+            connection.reserved += 1
+        in_flight = sum(c.reserved for c in self._connections)
+        self._peak_in_flight = max(self._peak_in_flight, in_flight)
+        return connection
+
+    async def _release_connection(self, connection: _MCPConnection) -> None:
+        connection.reserved -= 1
+        async with self._capacity:
+            self._capacity.notify()
+
     async def _send_rpc(
         self,
         method: str,
         params: dict[str, Any],
         *,
-        allow_heartbeat: bool = True,
         correlation_id: str | None = None,
     ) -> dict[str, Any]:
-        """Send JSON-RPC over WebSocket, handling reconnects and heartbeats."""
-        await self._connect()
-        attempts = 0
-        last_exc: Exception | None = None
-
-        while attempts < 2:
-            attempts += 1
-            req_id: int | None = None
-            try:
-                if allow_heartbeat and method != "ping":
-                    await self._maybe_heartbeat()
-
-                assert self._ws is not None
-                req_id = self._next_id()
-
-                # Add correlation ID to params metadata if provided
-                if correlation_id:
-                    params_with_metadata = params.copy()
-                    if "metadata" not in params_with_metadata:
-                        params_with_metadata["metadata"] = {}
-                    params_with_metadata["metadata"]["correlation_id"] = correlation_id
-                    request = {"jsonrpc": "2.0", "id": req_id, "method": method, "params": params_with_metadata}
-                else:
-                    request = {"jsonrpc": "2.0", "id": req_id, "method": method, "params": params}
-
-                loop = asyncio.get_running_loop()
-                fut: asyncio.Future = loop.create_future()
-                self._pending[req_id] = fut
-
-                async with self._send_lock:
-                    await self._ws.send(json.dumps(request))
-                    self._last_ws_activity = time.time()
+        """
+        Send JSON-RPC on a pooled connection, replacing it once if the transport fails.
 
-                try:
-                    result: dict[str, Any] = await asyncio.wait_for(fut, timeout=self.timeout)
-                    self._pending.pop(req_id, None)
-                    self._healthy = True
-                    return result
-                except MCPRpcError as rpc_err:
-                    raise rpc_err
-                except Exception as exc:
-                    raise MCPTransportError("RPC response wait failed") from exc
+        Raises:
+            MCPRpcError: If the server answered with an error
+            MCPTimeoutError: If no response arrived in time (not retried)
+            MCPTransportError: If sending or receiving failed on two connections
+        """
+        # Add correlation ID to params metadata if provided
+        if correlation_id:
+            params = params.copy()
+            params["metadata"] = {**params.get("metadata", {}), "correlation_id": correlation_id}
 
+        self._requests += 1
+        last_exc: Exception | None = None
+        for attempt in range(2):
+            connection = await self._acquire_connection()
+            try:
+                result = await connection.request(method, params)
+                self._healthy = True
+                return result
             except MCPRpcError:
-                if req_id is not None:
-                    self._pending.pop(req_id, None)
                 raise
-            except MCPTransportError as exc:
-                if req_id is not None:
-                    self._pending.pop(req_id, None)
-                last_exc = exc
-                self._healthy = False
-                try:
-                    await self._reconnect()
-                except Exception as reconnect_exc:
-                    last_exc = reconnect_exc
-                    break
+            except MCPTimeoutError:
+                self._failures += 1
+                raise
             except Exception as exc:
-                if req_id is not None:
-                    self._pending.pop(req_id, None)
                 last_exc = exc
                 self._healthy = False
-                try:
-                    await self._reconnect()
-                except Exception as reconnect_exc:
-                    last_exc = reconnect_exc
-                    break
-
+                self._reconnects += 1
+                await connection.close("WebSocket reconnect")
+            finally:
+                await self._release_connection(connection)
+            if attempt == 0:
+                await asyncio.sleep(0.1 + random.random() * 0.4)
+
+        self._failures += 1
         raise MCPTransportError("RPC failed after reconnect attempts") from last_exc
 
-    async def _reconnect(self) -> None:
-        try:
-            if self._ws is not None and not self._is_ws_closed(self._ws):
-                await self._ws.close()
-        finally:
-            self._ws = None
-            self._initialized = False
-            # Fail all pending futures
-            for fut in list(self._pending.values()):
-                if not fut.done():
-                    fut.set_exception(MCPTransportError("WebSocket reconnect"))
-            self._pending.clear()
-            if self._recv_task and not self._recv_task.done():
-                self._recv_task.cancel()
-                try:
-                    await self._recv_task
-                except Exception:
-                    pass
-            self._recv_task = None
-
-        await asyncio.sleep(0.1 + random.random() * 0.4)
-
-        try:
-            await self._connect()
-        except Exception as exc:
-            raise MCPTransportError("Failed to reconnect to MCP server") from exc
-
-    async def _maybe_heartbeat(self) -> None:
-        now = time.time()
-        if now - self._last_ws_activity > self._heartbeat_interval:
-            if self._pending:
-                return
-            try:
-                await self._send_rpc("ping", {}, allow_heartbeat=False)
-            except Exception:
-                # Ignore; reconnect will be attempted by caller
-                pass
-
-    async def _recv_loop(self) -> None:
-        assert self._ws is not None
-        try:
-            while True:
-                raw = await self._ws.recv()
-                self._last_ws_activity = time.time()
-                try:
-                    msg = json.loads(raw)
-                except Exception:
-                    continue
-                req_id = msg.get("id")
-                if req_id is None:
-                    continue
-                fut = self._pending.pop(req_id, None)
-                if fut is None or fut.done():
-                    continue
-                if "error" in msg:
-                    err = msg["error"]
-                    fut.set_exception(
-                        MCPRpcError(err.get("code"), err.get("message", ""), err.get("data"))
-                    )
-                else:
-                    fut.set_result(msg.get("result", {}))
-        except Exception:
-            # Terminate all pending futures on receive failure
-            for fut in list(self._pending.values()):
-                if not fut.done():
-                    fut.set_exception(MCPTransportError("WebSocket receive loop terminated"))
-            self._pending.clear()
-
     def _is_ws_closed(self, ws: Any) -> bool:
         """Best-effort check whether a websocket is closed.
 
@@ -421,6 +550,7 @@ class MCPClient:
                     server_id=self.server_id,
                     server_url=self.ws_url,
                     tags=tool_data.get("tags"),
+                    cache=tool_data.get("cache"),
                 )
             )
         return tools
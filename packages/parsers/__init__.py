@@ -2,18 +2,46 @@
 Document parsers - Vision-based extraction with Qwen3-VL.
 
 All parsing now routes through vision model for maximum information extraction.
+
+The renderer, vision parser and media transcriber depend on PIL, OpenCV,
+pypdfium2, ffmpeg and faster-whisper; they are imported on first attribute
+access.
 """
 
-from .doc_to_image import DocumentToImageConverter
-from .media_transcriber import (
-    parse_audio_to_markdown,
-    parse_video_to_markdown,
-    transcribe_simple,
-)
-from .vision_parser import VisionParser
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .models import DocChunk, IngestionItem, IngestionReport
 from .chunker import chunk_text
 
+if TYPE_CHECKING:
+    from .doc_to_image import DocumentToImageConverter
+    from .media_transcriber import (
+        parse_audio_to_markdown,
+        parse_video_to_markdown,
+        transcribe_simple,
+    )
+    from .vision_parser import VisionParser
+
+_LAZY_ATTRIBUTES = {
+    "DocumentToImageConverter": ".doc_to_image",
+    "VisionParser": ".vision_parser",
+    "parse_audio_to_markdown": ".media_transcriber",
+    "parse_video_to_markdown": ".media_transcriber",
+    "transcribe_simple": ".media_transcriber",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     "DocumentToImageConverter",
     "VisionParser",
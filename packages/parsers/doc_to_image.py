@@ -16,6 +16,8 @@ from typing import Any
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from packages.common import get_settings
+
 logger = logging.getLogger(__name__)
 
 # Optional imports with graceful fallbacks
@@ -61,6 +63,52 @@ except ImportError:
     logger.warning("openpyxl not available - Excel rendering disabled")
 
 
+# Below this spacing, decoding forward with grab() is cheaper than seeking,
+# since each seek restarts decoding from the previous keyframe.
+MIN_SEEK_INTERVAL_SECONDS = 2.0
+
+
+def _iter_keyframes(cap: Any, interval: int, total_frames: int, fps: float):
+    """
+    Yield ``(frame_number, frame)`` for every ``interval``-th frame of ``cap``.
+
+    Intermediate frames are never converted: long intervals seek straight to
+    the target frame, short ones (or streams that refuse to seek) advance with
+    ``grab()``, which skips the colour conversion and copy ``read()`` performs.
+    """
+    use_seek = total_frames > 0 and interval >= fps * MIN_SEEK_INTERVAL_SECONDS
+    position = 0  # Index of the frame the next read() returns
+    target = 0
+    while total_frames <= 0 or target < total_frames:
+        if position < target:
+            if use_seek and cap.set(cv2.CAP_PROP_POS_FRAMES, target):
+                position = target
+            else:
+                use_seek = False
+                while position < target:
+                    if not cap.grab():
+                        return
+                    position += 1
+        ok, frame = cap.read()
+        if not ok:
+            return
+        yield target, frame
+        position = target + 1
+        target += interval
+
+
+def _frame_dhash(frame: np.ndarray) -> int:
+    """64-bit difference hash of a BGR frame (robust to compression noise and scaling)."""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def _hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
 class DocumentToImageConverter:
     """
     Converts documents to images for vision model processing.
@@ -75,14 +123,33 @@ class DocumentToImageConverter:
     - Videos: OpenCV keyframe extraction
     """
 
-    def __init__(self, max_image_size: tuple[int, int] = (1920, 1920)):
+    def __init__(
+        self,
+        max_image_size: tuple[int, int] = (1920, 1920),
+        video_frame_interval: float | None = None,
+        video_scene_threshold: int | None = None,
+    ):
         """
         Initialize converter.
 
         Args:
             max_image_size: Maximum image dimensions (width, height)
+            video_frame_interval: Seconds between video keyframes (defaults to settings)
+            video_scene_threshold: Max perceptual-hash distance for a keyframe to count
+                as a duplicate of the previous one; 0 keeps all (defaults to settings)
         """
+        settings = get_settings()
         self.max_image_size = max_image_size
+        self.video_frame_interval = (
+            video_frame_interval
+            if video_frame_interval is not None
+            else settings.ingest_video_frame_interval
+        )
+        self.video_scene_threshold = (
+            video_scene_threshold
+            if video_scene_threshold is not None
+            else settings.ingest_video_scene_threshold
+        )
 
     async def convert(self, file_path: Path) -> list[dict[str, Any]]:
         """
@@ -374,7 +441,15 @@ class DocumentToImageConverter:
         return await loop.run_in_executor(None, _render)
 
     async def _convert_video(self, file_path: Path) -> list[dict[str, Any]]:
-        """Extract keyframes from video (1 per 5 seconds)."""
+        """
+        Extract keyframes from video (1 per ``video_frame_interval`` seconds).
+
+        Only the sampled frames are decoded: the capture seeks to each target
+        frame, or skips intermediate frames with ``grab()`` when the container
+        is not seekable. Frames whose perceptual hash is within
+        ``video_scene_threshold`` bits of the last kept frame are dropped so
+        static scenes do not produce repeated vision calls.
+        """
         if not CV2_AVAILABLE:
             logger.error("Video conversion requested but opencv-python not available")
             return []
@@ -383,46 +458,58 @@ class DocumentToImageConverter:
 
         def _extract_frames():
             frames = []
+            cap = cv2.VideoCapture(str(file_path))
             try:
-                cap = cv2.VideoCapture(str(file_path))
-                fps = cap.get(cv2.CAP_PROP_FPS) or 25
-                frame_interval = int(fps * 5)  # 1 frame per 5 seconds
+                if not cap.isOpened():
+                    logger.error(f"Could not open video {file_path}")
+                    return frames
 
-                frame_num = 0
-                extracted = 0
+                fps = cap.get(cv2.CAP_PROP_FPS) or 25
+                total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+                frame_interval = max(1, int(round(fps * self.video_frame_interval)))
+
+                last_hash: int | None = None
+                sampled = 0
+
+                for frame_num, frame in _iter_keyframes(cap, frame_interval, total_frames, fps):
+                    sampled += 1
+                    if self.video_scene_threshold > 0:
+                        frame_hash = _frame_dhash(frame)
+                        if (
+                            last_hash is not None
+                            and _hamming(frame_hash, last_hash) <= self.video_scene_threshold
+                        ):
+                            continue
+                        last_hash = frame_hash
+
+                    # Convert BGR to RGB
+                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    pil_image = Image.fromarray(rgb_frame)
+                    pil_image = self._resize_if_needed(pil_image)
 
-                while True:
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
+                    timestamp = frame_num / fps if fps > 0 else 0
 
-                    if frame_num % frame_interval == 0:
-                        # Convert BGR to RGB
-                        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        pil_image = Image.fromarray(rgb_frame)
-                        pil_image = self._resize_if_needed(pil_image)
-
-                        timestamp = frame_num / fps if fps > 0 else 0
-
-                        frames.append(
-                            {
-                                "image": pil_image,
-                                "page_num": extracted + 1,
-                                "metadata": {
-                                    "source": "video",
-                                    "timestamp": timestamp,
-                                    "frame_number": frame_num,
-                                },
-                            }
-                        )
-                        extracted += 1
-
-                    frame_num += 1
+                    frames.append(
+                        {
+                            "image": pil_image,
+                            "page_num": len(frames) + 1,
+                            "metadata": {
+                                "source": "video",
+                                "timestamp": timestamp,
+                                "frame_number": frame_num,
+                            },
+                        }
+                    )
 
-                cap.release()
+                logger.info(
+                    f"Extracted {len(frames)} keyframes from {file_path} "
+                    f"({sampled} sampled, {sampled - len(frames)} near-duplicates dropped)"
+                )
 
             except Exception as e:
                 logger.error(f"Error extracting frames from video {file_path}: {e}")
+            finally:
+                cap.release()
 
             return frames
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import tempfile
+from collections import deque
+from concurrent.futures import Future
 from contextlib import suppress
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
 import ffmpeg
+import numpy as np
 
 from packages.common import (
     AcceleratorChoice,
@@ -15,23 +17,16 @@ from packages.common import (
     resolve_accelerator,
 )
 
-logger = get_logger(__name__)
-
-try:
-    from faster_whisper import WhisperModel  # type: ignore
+from packages.common.audio_frontend import PCM16_SCALE, GrowableAudioBuffer, frame_rms
+from packages.common.whisper_engine import PRIORITY_BATCH, WHISPER_AVAILABLE, WhisperSpec, get_whisper_engine
 
-    WHISPER_AVAILABLE = True
-except ImportError:  # pragma: no cover
-    WhisperModel = None
-    WHISPER_AVAILABLE = False
+logger = get_logger(__name__)
 
 _settings = get_settings()
 
 WHISPER_MODEL_NAME = _settings.ingest_whisper_model or "large-v3-turbo"
 WHISPER_COMPUTE_TYPE = _settings.ingest_whisper_compute_type or "float16"  # GPU default
 WHISPER_GPU_COMPUTE_TYPE = _settings.ingest_whisper_gpu_compute_type or "float16"
-WHISPER_CPU_THREADS = max(1, _settings.ingest_whisper_cpu_threads or 4)
-WHISPER_NUM_WORKERS = max(1, _settings.ingest_whisper_num_workers or 1)
 WHISPER_LANGUAGE = _settings.ingest_whisper_language
 
 
@@ -43,141 +38,135 @@ _WHISPER_ACCELERATOR = resolve_accelerator(
     preference="gpu",  # Media transcription always uses GPU
     explicit_device=_settings.ingest_whisper_device or _settings.ingest_gpu_device,
 )
-_MODEL_CACHE: WhisperModel | None = None
-_MODEL_CHOICE: AcceleratorChoice | None = None
-
-
-def _reset_whisper_model() -> None:
-    """Release the cached Whisper model so a new configuration can be loaded."""
-    global _MODEL_CACHE, _MODEL_CHOICE
-    if _MODEL_CACHE is not None:
-        release = getattr(_MODEL_CACHE, "release_model", None)
-        if callable(release):
-            with suppress(Exception):
-                release()
-    _MODEL_CACHE = None
-    _MODEL_CHOICE = None
 
 
 def release_resources() -> None:
     """Public helper to free any cached Whisper resources."""
-    _reset_whisper_model()
-
-
-def _get_whisper_model(
-    choice: AcceleratorChoice | None = None,
-    *,
-    cpu_threads: int | None = None,
-    num_workers: int | None = None,
-) -> WhisperModel:
-    """Load and cache the Whisper model on GPU (required for media transcription)."""
-    global _MODEL_CACHE, _MODEL_CHOICE
-    if choice is None and _MODEL_CACHE is not None:
-        return _MODEL_CACHE
-    if choice is not None and _MODEL_CACHE is not None:
-        if _MODEL_CHOICE == choice:
-            return _MODEL_CACHE
-        _reset_whisper_model()
-
-    if WhisperModel is None:  # pragma: no cover
-        raise RuntimeError("WhisperModel is not available. Install faster-whisper.")
-
-    attempts: list[AcceleratorChoice]
-    if choice is not None:
-        attempts = [choice]
-    else:
-        attempts = [_WHISPER_ACCELERATOR]
-        # No CPU fallback - media transcription requires GPU
-
-    last_error: Exception | None = None
-    for candidate in attempts:
-        threads = (
-            max(1, cpu_threads)
-            if cpu_threads is not None and not candidate.using_gpu
-            else WHISPER_CPU_THREADS
-        )
-        workers = max(1, num_workers) if num_workers is not None else WHISPER_NUM_WORKERS
-        compute_type = _active_compute_type(candidate)
-        kwargs = {
-            "device": candidate.device,
-            "compute_type": compute_type,
-            "cpu_threads": threads,
-            "num_workers": workers,
-        }
-        if candidate.using_gpu and candidate.device_index is not None:
-            kwargs["device_index"] = candidate.device_index
-
-        logger.info(
-            "whisper-model-load",
-            extra={
-                "model": WHISPER_MODEL_NAME,
-                "device": candidate.compute_device,
-                "compute_type": compute_type,
-                "accelerator": candidate.requested,
-                "gpu_available": candidate.gpu_available,
-            },
+    get_whisper_engine().release()
+
+
+def _whisper_spec(choice: AcceleratorChoice | None = None) -> WhisperSpec:
+    """Model spec for media transcription on the shared Whisper engine."""
+    candidate = choice or _WHISPER_ACCELERATOR
+    return WhisperSpec(
+        WHISPER_MODEL_NAME,
+        device=candidate.device,
+        compute_type=_active_compute_type(candidate),
+        device_index=candidate.device_index if candidate.using_gpu else None,
+    )
+
+
+ProgressCallback = Callable[[float], None]
+
+SAMPLE_RATE = 16000
+# Bytes of 16-bit mono PCM read from ffmpeg per pipe read (one second)
+_PIPE_READ_BYTES = SAMPLE_RATE * 2
+# Energy frame used to look for pauses (30 ms)
+_FRAME_SAMPLES = 480
+# Frames averaged when scoring a cut point (~300 ms), so cuts land in real pauses
+_PAUSE_FRAMES = 10
+# Segments whose loudest frame stays under this RMS (about -50 dBFS) are skipped
+_SILENCE_RMS = 0.003
+
+
+def _probe_duration(path: Path) -> float | None:
+    with suppress(Exception):
+        return float(ffmpeg.probe(str(path))["format"]["duration"])
+    return None
+
+
+def _stream_pcm(path: Path) -> Iterator[np.ndarray]:
+    """Decode ``path`` to 16 kHz mono int16 PCM through an ffmpeg pipe, one second at a time."""
+    process = (
+        ffmpeg.input(str(path))
+        .output("pipe:", format="s16le", acodec="pcm_s16le", ac=1, ar=SAMPLE_RATE)
+        .global_args("-nostdin", "-loglevel", "error")
+        .run_async(pipe_stdout=True, pipe_stderr=True)
+    )
+    pending = b""
+    decoded = False
+    try:
+        while True:
+            data = process.stdout.read(_PIPE_READ_BYTES)
+            if not data:
+                break
+            data, pending = pending + data, b""
+            if len(data) % 2:
+                data, pending = data[:-1], data[-1:]
+            yield np.frombuffer(data, dtype=np.int16)
+        decoded = True
+    finally:
+        # On EOF ffmpeg is still shutting down: wait for its real exit status.
+        # Only a stream abandoned early (closed or failed) is killed.
+        if not decoded and process.poll() is None:
+            process.kill()
+        stderr = process.stderr.read() if process.stderr else b""
+        returncode = process.wait()
+    if returncode != 0:
+        logger.warning(
+            "ffmpeg-demux-error",
+            extra={"path": str(path), "error": stderr.decode(errors="ignore")},
         )
-        try:
-            model = WhisperModel(
-                WHISPER_MODEL_NAME,
-                **kwargs,
-            )
-        except Exception as exc:  # pragma: no cover
-            last_error = exc
-            logger.warning(
-                "whisper-model-load-failed",
-                extra={
-                    "model": WHISPER_MODEL_NAME,
-                    "device": candidate.compute_device,
-                    "compute_type": compute_type,
-                    "accelerator": candidate.requested,
-                    "error": str(exc),
-                },
-            )
-            continue
+        raise RuntimeError(f"ffmpeg failed to decode {path.name}")
 
-        _MODEL_CACHE = model
-        _MODEL_CHOICE = candidate
-        return model
 
-    if last_error is not None:  # pragma: no cover
-        raise RuntimeError("Failed to initialise Whisper model on all accelerators") from last_error
-    raise RuntimeError("Failed to initialise Whisper model")
-
-
-class _DemuxedAudio:
-    def __init__(self, path: Path) -> None:
-        self.path = path
+class _PauseSplitter:
+    """
+    Cut a PCM stream into segments of roughly ``target_seconds`` at pauses.
 
-    def __enter__(self) -> Path:
-        return self.path
+    Once the buffer reaches ``1.5 * target_seconds`` the quietest ~300 ms
+    stretch between ``target_seconds / 2`` and the end of the buffer becomes the
+    cut point (ties going to the one closest to ``target_seconds``), so segments
+    only split a word when there is no pause at all.
+    """
 
-    def __exit__(self, exc_type, exc, tb) -> None:
-        try:
-            self.path.unlink(missing_ok=True)
-        except Exception:  # pragma: no cover
-            logger.warning("audio-temp-clean-failed", extra={"path": str(self.path)})
-
-
-def _demux_to_wav(path: Path) -> _DemuxedAudio:
-    tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    tmp_path = Path(tmp.name)
-    tmp.close()
-    try:
-        (
-            ffmpeg.input(str(path))
-            .output(str(tmp_path), format="wav", ac=1, ar=16000)
-            .overwrite_output()
-            .run(quiet=True)
-        )
-    except ffmpeg.Error as exc:  # pragma: no cover
-        logger.warning(
-            "ffmpeg-demux-error",
-            extra={"path": str(path), "error": exc.stderr.decode(errors="ignore")},
-        )
-        tmp_path.unlink(missing_ok=True)
-        raise
-    return _DemuxedAudio(tmp_path)
+    def __init__(self, target_seconds: float, sample_rate: int = SAMPLE_RATE) -> None:
+        self.sample_rate = sample_rate
+        self.target_samples = int(target_seconds * sample_rate)
+        self.min_samples = self.target_samples // 2
+        self.max_samples = int(target_seconds * 1.5 * sample_rate)
+        self._buffer = GrowableAudioBuffer(self.max_samples * 2, dtype=np.int16)
+        self._offset = 0
+
+    def feed(self, pcm: np.ndarray) -> list[tuple[int, np.ndarray]]:
+        """Add int16 samples; return ``(start_sample, float32_audio)`` for completed segments."""
+        self._buffer.append(pcm)
+        segments: list[tuple[int, np.ndarray]] = []
+        while len(self._buffer) >= self.max_samples:
+            cut = self._cut_point(self._buffer.view(0, self.max_samples))
+            segments.append(self._emit(self._buffer.view(0, cut)))
+            self._buffer.consume(cut)
+        return segments
+
+    def flush(self) -> list[tuple[int, np.ndarray]]:
+        if not len(self._buffer):
+            return []
+        segment = self._emit(self._buffer.view())
+        self._buffer.clear()
+        return [segment]
+
+    def _cut_point(self, buffer: np.ndarray) -> int:
+        energy = frame_rms(buffer, _FRAME_SAMPLES)
+        # Edge padding keeps the buffer ends from looking quieter than they are
+        padded = np.pad(energy, (_PAUSE_FRAMES // 2, (_PAUSE_FRAMES - 1) // 2), mode="edge")
+        smoothed = np.convolve(padded, np.ones(_PAUSE_FRAMES) / _PAUSE_FRAMES, mode="valid")
+        first = self.min_samples // _FRAME_SAMPLES
+        candidates = smoothed[first:]
+        # Among equally quiet stretches prefer the one closest to the target length
+        distance = np.abs(np.arange(candidates.size) - (self.target_samples // _FRAME_SAMPLES - first))
+        score = candidates + distance / max(1, candidates.size) * 0.01 * float(np.median(smoothed))
+        quietest = first + int(np.argmin(score))
+        return quietest * _FRAME_SAMPLES + _FRAME_SAMPLES // 2
+
+    def _emit(self, pcm: np.ndarray) -> tuple[int, np.ndarray]:
+        start = self._offset
+        self._offset += pcm.size
+        return start, pcm.astype(np.float32) * PCM16_SCALE
+
+
+def _is_silent(audio: np.ndarray) -> bool:
+    levels = frame_rms(audio, _FRAME_SAMPLES)
+    return not levels.size or float(levels.max()) < _SILENCE_RMS
 
 
 def _segments_to_paragraphs(segments) -> list[tuple[str, float, float]]:
@@ -259,22 +248,38 @@ def _transcribe_kwargs() -> dict:
 
 
 def _run_transcription(
-    model: WhisperModel, audio_path: Path, *, language_hint: str | None
+    model: Any,
+    audio: np.ndarray,
+    *,
+    language_hint: str | None,
+    language: str | None = None,
 ) -> tuple[list, str | None]:
-    """Run the Whisper transcription pass preferring auto-detection, with fallback to hints."""
+    """
+    Run the Whisper transcription pass preferring auto-detection, with fallback to hints.
+
+    A known ``language`` skips detection entirely.
+    """
+    engine = get_whisper_engine()
+    batched = engine.batched(model)
+    transcriber = batched or model
+    extra_kwargs = {"batch_size": engine.batch_size} if batched is not None else {}
+
     candidates: list[str | None] = [None]
-    if language_hint:
+    if language:
+        candidates = [language]
+    elif language_hint:
         candidates.append(language_hint)
 
     last_detected: str | None = None
     segments: list = []
 
     for attempt, candidate in enumerate(candidates, start=1):
-        segments_iter, info = model.transcribe(
-            str(audio_path),
+        segments_iter, info = transcriber.transcribe(
+            audio,
             language=candidate,
             task="transcribe",
             **_transcribe_kwargs(),
+            **extra_kwargs,
         )
         segments = list(segments_iter)
         detected_language = _extract_language(info, fallback=candidate if candidate else None)
@@ -320,49 +325,157 @@ def _extract_language(info, *, fallback: str | None) -> str | None:
     return fallback.lower() if isinstance(fallback, str) else fallback
 
 
-def _transcribe_simple_sync(file_path: Path) -> dict[str, Any]:
+def _transcribe_segment(
+    model: Any,
+    audio: np.ndarray,
+    offset: float,
+    *,
+    language_hint: str | None,
+    language: str | None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    segments, language = _run_transcription(
+        model, audio, language_hint=language_hint, language=language
+    )
+    stitched = []
+    for segment in segments:
+        text = (getattr(segment, "text", "") or "").strip()
+        if not text:
+            continue
+        start = float(getattr(segment, "start", 0.0) or 0.0)
+        end = float(getattr(segment, "end", start) or start)
+        stitched.append({"start": offset + start, "end": offset + end, "text": text})
+    return stitched, language
+
+
+def _transcribe_stream(
+    pcm_chunks: Iterable[np.ndarray],
+    *,
+    engine: Any,
+    spec: WhisperSpec,
+    language_hint: str | None,
+    segment_seconds: float,
+    total_seconds: float | None = None,
+    progress: ProgressCallback | None = None,
+) -> tuple[list[dict[str, Any]], str | None, float]:
+    """
+    Transcribe a PCM stream segment by segment on the shared Whisper engine.
+
+    The first segment is transcribed on its own to settle the language; every
+    later segment is queued as soon as it has been cut, with at most
+    ``2 * engine.workers`` segments held in memory, so the workers decode in
+    parallel while ffmpeg keeps reading. Segment timestamps are shifted by the
+    segment's offset, and results are stitched back in order.
+
+    Returns:
+        ``(segments, language, audio_seconds)`` with absolute timestamps
+    """
+    splitter = _PauseSplitter(segment_seconds)
+    max_in_flight = max(2, engine.workers * 2)
+    in_flight: deque[tuple[float, Future]] = deque()
+    stitched: list[dict[str, Any]] = []
+    language: str | None = None
+    language_settled = False
+    done_seconds = 0.0
+    audio_seconds = 0.0
+
+    def collect(wait_for: int) -> None:
+        nonlocal done_seconds
+        while len(in_flight) > wait_for:
+            seconds, future = in_flight.popleft()
+            segments, _ = future.result()
+            stitched.extend(segments)
+            done_seconds += seconds
+            if progress is not None and total_seconds:
+                progress(min(1.0, done_seconds / total_seconds))
+
+    def queue(start: int, audio: np.ndarray) -> None:
+        nonlocal language, language_settled, done_seconds
+        seconds = audio.size / SAMPLE_RATE
+        if _is_silent(audio):
+            done_seconds += seconds
+            return
+        future = engine.submit(
+            spec,
+            lambda model, known=language: _transcribe_segment(
+                model,
+                audio,
+                start / SAMPLE_RATE,
+                language_hint=language_hint,
+                language=known,
+            ),
+            priority=PRIORITY_BATCH,
+            audio_seconds=seconds,
+        )
+        if not language_settled:
+            language_settled = True
+            segments, detected = future.result()
+            language = detected or language_hint
+            future = Future()
+            future.set_result((segments, language))
+        in_flight.append((seconds, future))
+        collect(max_in_flight - 1)
+
+    try:
+        for pcm in pcm_chunks:
+            audio_seconds += pcm.size / SAMPLE_RATE
+            for start, audio in splitter.feed(pcm):
+                queue(start, audio)
+        for start, audio in splitter.flush():
+            queue(start, audio)
+        collect(0)
+    except BaseException:
+        for _, future in in_flight:
+            future.cancel()
+        raise
+
+    if progress is not None:
+        progress(1.0)
+    return stitched, language or language_hint, audio_seconds
+
+
+def _transcribe_simple_sync(
+    file_path: Path, progress: ProgressCallback | None = None
+) -> dict[str, Any]:
     """
     Synchronous helper for transcription using GPU.
 
+    Audio is streamed from ffmpeg, split at pauses and transcribed in parallel
+    across the Whisper engine workers.
+
     Returns dict with:
     - text: Full transcript as single string
     - language: Detected language code
     - duration: Audio duration in seconds
+    - segments: Transcribed segments with absolute ``start``/``end`` seconds
     """
     if not WHISPER_AVAILABLE:
         logger.warning(f"Whisper not available, cannot transcribe {file_path}")
         return {"text": "", "language": None, "duration": 0}
 
     language_hint = _resolve_language_hint(WHISPER_LANGUAGE)
-    model = _get_whisper_model()
 
     logger.info(f"Starting transcription: {file_path}")
 
-    with _demux_to_wav(file_path) as audio_path:
-        try:
-            segments, detected_language = _run_transcription(
-                model,
-                audio_path,
-                language_hint=language_hint,
-            )
-        except Exception as exc:
-            logger.error(f"Transcription failed: {exc}", exc_info=True)
-            return {"text": "", "language": None, "duration": 0}
+    try:
+        # Queued behind any live dictation on the shared engine
+        segments, detected_language, audio_seconds = _transcribe_stream(
+            _stream_pcm(file_path),
+            engine=get_whisper_engine(),
+            spec=_whisper_spec(),
+            language_hint=language_hint,
+            segment_seconds=_settings.ingest_media_segment_seconds,
+            total_seconds=_probe_duration(file_path),
+            progress=progress,
+        )
+    except Exception as exc:
+        logger.error(f"Transcription failed: {exc}", exc_info=True)
+        return {"text": "", "language": None, "duration": 0}
 
     if not segments:
         return {"text": "", "language": detected_language, "duration": 0}
 
-    # Extract full text and calculate duration
-    full_text = " ".join(
-        (getattr(seg, "text", "") or "").strip()
-        for seg in segments
-    ).strip()
-
-    # Get duration from last segment
-    duration = 0.0
-    if segments:
-        last_seg = segments[-1]
-        duration = float(getattr(last_seg, "end", 0.0) or 0.0)
+    full_text = " ".join(segment["text"] for segment in segments).strip()
+    duration = max(audio_seconds, segments[-1]["end"])
 
     logger.info(f"Transcription complete: {len(segments)} segments, {duration:.1f}s")
 
@@ -370,22 +483,28 @@ def _transcribe_simple_sync(file_path: Path) -> dict[str, Any]:
         "text": full_text,
         "language": detected_language,
         "duration": duration,
+        "segments": segments,
     }
 
 
-async def transcribe_simple(file_path: Path) -> dict[str, Any]:
+async def transcribe_simple(
+    file_path: Path, progress: ProgressCallback | None = None
+) -> dict[str, Any]:
     """
     Async GPU transcription for vision-based pipeline.
 
     Runs transcription in thread pool to avoid blocking event loop.
+    ``progress`` receives the transcribed fraction (0-1) and is called from
+    that thread.
 
     Returns dict with:
     - text: Full transcript as single string
     - language: Detected language code
     - duration: Audio duration in seconds
+    - segments: Transcribed segments with absolute ``start``/``end`` seconds
     """
     import asyncio
-    return await asyncio.to_thread(_transcribe_simple_sync, file_path)
+    return await asyncio.to_thread(_transcribe_simple_sync, file_path, progress)
 
 
 # ============================================================================
@@ -393,18 +512,21 @@ async def transcribe_simple(file_path: Path) -> dict[str, Any]:
 # ============================================================================
 
 
-async def parse_audio_to_markdown(file_path: Path) -> str:
+async def parse_audio_to_markdown(
+    file_path: Path, progress: ProgressCallback | None = None
+) -> str:
     """
     Parse audio file to formatted markdown.
 
     Args:
         file_path: Path to audio file
+        progress: Optional callback receiving the transcribed fraction (0-1)
 
     Returns:
         Transcribed markdown with metadata
     """
     try:
-        transcript_data = await transcribe_simple(file_path)
+        transcript_data = await transcribe_simple(file_path, progress)
 
         if not transcript_data or "text" not in transcript_data:
             logger.warning(f"No transcript returned for {file_path}")
@@ -437,7 +559,9 @@ async def parse_audio_to_markdown(file_path: Path) -> str:
         return ""
 
 
-async def parse_video_to_markdown(file_path: Path) -> str:
+async def parse_video_to_markdown(
+    file_path: Path, progress: ProgressCallback | None = None
+) -> str:
     """
     Parse video file with vision + transcription to formatted markdown.
 
@@ -449,6 +573,7 @@ async def parse_video_to_markdown(file_path: Path) -> str:
 
     Args:
         file_path: Path to video file
+        progress: Optional callback receiving the transcribed fraction (0-1)
 
     Returns:
         Rich markdown with visual + audio content
@@ -467,14 +592,14 @@ async def parse_video_to_markdown(file_path: Path) -> str:
 
         if not frames:
             logger.warning(f"No frames extracted from {file_path}, trying audio only")
-            return await parse_audio_to_markdown(file_path)
+            return await parse_audio_to_markdown(file_path, progress)
 
         # Step 2 & 3: Analyze frames + transcribe audio in parallel
         logger.info(f"Analyzing {len(frames)} frames and transcribing audio")
 
         # Run vision analysis and transcription concurrently
         vision_task = vision_parser.analyze_images_batch(frames, max_concurrent=2)
-        transcription_task = transcribe_simple(file_path)
+        transcription_task = transcribe_simple(file_path, progress)
 
         vision_markdown, transcript_data = await asyncio.gather(
             vision_task,
@@ -1,12 +1,22 @@
 from .qdrant import QdrantStore, SearchResult
-from .helpers import ensure_collections, get_client, upsert_points
+from .helpers import (
+    ensure_collections,
+    ensure_keyword_indexes,
+    find_points_matching_any,
+    get_client,
+    set_point_payloads,
+    upsert_points,
+)
 from .schema import DocumentSource, DEFAULT_COLLECTION, EMBEDDING_DIM
 
 __all__ = [
     "QdrantStore",
     "SearchResult",
     "ensure_collections",
+    "ensure_keyword_indexes",
+    "find_points_matching_any",
     "get_client",
+    "set_point_payloads",
     "upsert_points",
     "DocumentSource",
     "DEFAULT_COLLECTION",
@@ -3,10 +3,21 @@ Helper functions for Qdrant vector store operations.
 """
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
 
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchAny,
+    PayloadSchemaType,
+    PointStruct,
+    Record,
+    SetPayload,
+    SetPayloadOperation,
+    VectorParams,
+)
 
 if TYPE_CHECKING:
     from packages.common import Settings
@@ -114,3 +125,140 @@ def upsert_points(
             extra={"error": str(e), "error_type": type(e).__name__}
         )
         raise
+
+
+def ensure_keyword_indexes(
+    client: QdrantClient, collection_name: str, field_names: Sequence[str]
+) -> None:
+    """
+    Create keyword payload indexes that a collection is missing.
+
+    Args:
+        client: Qdrant client
+        collection_name: Collection to index
+        field_names: Top-level payload keys to index
+    """
+    try:
+        info = client.get_collection(collection_name)
+        existing = set((info.payload_schema or {}).keys())
+        for field_name in field_names:
+            if field_name in existing:
+                continue
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType.KEYWORD,
+            )
+            logger.info(
+                "Created payload index",
+                extra={"collection_name": collection_name, "field_name": field_name}
+            )
+    except Exception as e:
+        logger.error(
+            "Failed to ensure payload indexes",
+            extra={
+                "collection_name": collection_name,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+        )
+        raise
+
+
+def find_points_matching_any(
+    client: QdrantClient,
+    settings: "Settings",
+    match_any: Mapping[str, Sequence[str]],
+    *,
+    with_payload: Sequence[str],
+    limit: int,
+    collection_name: str | None = None,
+) -> list[Record]:
+    """
+    Fetch points whose keyword payload matches any of the given values.
+
+    Args:
+        client: Qdrant client
+        settings: Application settings
+        match_any: Values to look for, per payload key (a point matches on any key)
+        with_payload: Payload keys to return
+        limit: Maximum number of points to return
+        collection_name: Collection to search
+
+    Returns:
+        Matching points, without vectors
+    """
+    conditions = [
+        FieldCondition(key=key, match=MatchAny(any=list(values)))
+        for key, values in match_any.items()
+        if values
+    ]
+    if not conditions:
+        return []
+
+    collection_name = collection_name or settings.qdrant_collection
+
+    try:
+        records, _ = client.scroll(
+            collection_name=collection_name,
+            scroll_filter=Filter(should=conditions),
+            limit=limit,
+            with_payload=list(with_payload),
+            with_vectors=False,
+        )
+        return records
+    except Exception as e:
+        logger.error(
+            "Failed to look up points by payload",
+            extra={
+                "collection_name": collection_name,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+        )
+        raise
+
+
+def set_point_payloads(
+    payloads: Mapping[Any, dict[str, Any]],
+    client: QdrantClient,
+    settings: "Settings",
+    *,
+    collection_name: str | None = None,
+) -> None:
+    """
+    Overwrite payload keys of several points in one request.
+
+    Args:
+        payloads: Payload keys to set, per point id
+        client: Qdrant client
+        settings: Application settings
+        collection_name: Collection holding the points
+    """
+    if not payloads:
+        return
+
+    collection_name = collection_name or settings.qdrant_collection
+
+    try:
+        client.batch_update_points(
+            collection_name=collection_name,
+            update_operations=[
+                SetPayloadOperation(set_payload=SetPayload(payload=payload, points=[point_id]))
+                for point_id, payload in payloads.items()
+            ],
+        )
+        logger.info(
+            "Updated point payloads",
+            extra={"point_count": len(payloads), "collection_name": collection_name}
+        )
+    except Exception as e:
+        logger.error(
+            "Failed to update point payloads",
+            extra={
+                "collection_name": collection_name,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+        )
+        raise
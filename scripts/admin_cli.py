@@ -10,12 +10,14 @@ Usage:
     python scripts/admin_cli.py user create --username admin --is-root
     python scripts/admin_cli.py user reset-api-key --user-id 1
     python scripts/admin_cli.py db health
+    python scripts/admin_cli.py analytics backfill --days 90
 """
 
 from __future__ import annotations
 
 import asyncio
 import sys
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # Add project root to path for imports
@@ -33,6 +35,7 @@ from packages.db.crud import (
     get_user_by_id,
     regenerate_user_api_key,
 )
+from packages.db.rollups import RollupAggregator
 from packages.db.session import init_db, get_async_session
 
 app = typer.Typer(
@@ -42,8 +45,10 @@ app = typer.Typer(
 )
 user_app = typer.Typer(help="User management commands")
 db_app = typer.Typer(help="Database management commands")
+analytics_app = typer.Typer(help="Analytics rollup commands")
 app.add_typer(user_app, name="user")
 app.add_typer(db_app, name="db")
+app.add_typer(analytics_app, name="analytics")
 
 console = Console()
 
@@ -234,6 +239,27 @@ def db_info():
     console.print(f"  [bold]Pre-ping:[/bold] {settings.db_pool_pre_ping}")
 
 
+@analytics_app.command("backfill")
+def analytics_backfill(
+    days: int = typer.Option(365, "--days", min=1, help="Days of history to rebuild"),
+):
+    """Rebuild the hourly/daily usage rollups read by the analytics dashboard."""
+
+    async def _backfill():
+        settings = get_settings()
+        await init_db(settings)
+
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        console.print(f"\n[bold]Rebuilding usage rollups since {since:%Y-%m-%d}[/bold]")
+        aggregator = RollupAggregator()
+        rebuilt = await aggregator.backfill(
+            since, on_day=lambda day: console.print(f"  {day:%Y-%m-%d} [green]✓[/green]")
+        )
+        console.print(f"\n[green]✓[/green] Rebuilt {rebuilt} day(s)")
+
+    run_async(_backfill())
+
+
 @app.command("version")
 def version():
     """Show version information."""
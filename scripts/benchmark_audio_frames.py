@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark voice-turn transport: base64-in-JSON against binary audio frames.
+
+Measures bytes on the wire and the server-side CPU spent turning what the
+socket delivered back into PCM16, for a microphone upload sent in 64 ms
+chunks (the browser client's chunk size) and for one spoken answer.
+
+Usage:
+    python scripts/benchmark_audio_frames.py
+    python scripts/benchmark_audio_frames.py --seconds 30 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.api.audio_frames import FrameType, decode_frame, encode_frame  # noqa: E402
+
+MIC_SAMPLE_RATE = 16000
+MIC_CHUNK_SAMPLES = 1024
+TTS_SAMPLE_RATE = 22050
+TTS_FRAME_BYTES = 8192
+
+
+def _pcm(seconds: float, sample_rate: int) -> bytes:
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(seconds * sample_rate)) * 3000).astype("<i2").tobytes()
+
+
+def _chunks(pcm: bytes, size: int) -> list[bytes]:
+    return [pcm[offset : offset + size] for offset in range(0, len(pcm), size)]
+
+
+def json_messages(chunks: list[bytes], sample_rate: int) -> list[str]:
+    return [
+        json.dumps({"type": "audio", "audio_data": base64.b64encode(c).decode("ascii"), "sample_rate": sample_rate})
+        for c in chunks
+    ]
+
+
+def binary_frames(chunks: list[bytes], sample_rate: int) -> list[bytes]:
+    return [
+        encode_frame(FrameType.AUDIO, c, sample_rate=sample_rate, sequence=i)
+        for i, c in enumerate(chunks)
+    ]
+
+
+def decode_json(messages: list[str]) -> int:
+    return sum(len(base64.b64decode(json.loads(m)["audio_data"])) for m in messages)
+
+
+def decode_binary(frames: list[bytes]) -> int:
+    return sum(len(decode_frame(f).payload) for f in frames)
+
+
+def _timed(fn, arg, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=10.0, help="Length of the spoken turn")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    cases = {
+        "mic upload": _chunks(_pcm(args.seconds, MIC_SAMPLE_RATE), MIC_CHUNK_SAMPLES * 2),
+        "tts answer": _chunks(_pcm(args.seconds, TTS_SAMPLE_RATE), TTS_FRAME_BYTES),
+    }
+    print(f"{'case':<12} {'transport':<10} {'wire bytes':>12} {'decode ms':>10}")
+    for name, chunks in cases.items():
+        sample_rate = MIC_SAMPLE_RATE if name == "mic upload" else TTS_SAMPLE_RATE
+        messages = json_messages(chunks, sample_rate)
+        frames = binary_frames(chunks, sample_rate)
+        rows = (
+            ("json+b64", sum(len(m) for m in messages), _timed(decode_json, messages, args.repeat)),
+            ("binary", sum(len(f) for f in frames), _timed(decode_binary, frames, args.repeat)),
+        )
+        for transport, size, ms in rows:
+            print(f"{name:<12} {transport:<10} {size:>12,} {ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of the audio front-end: CPU time per microphone chunk.
+
+Compares the previous per-chunk path (``np.concatenate`` onto the utterance
+buffer, PCM16 conversion through temporaries, ``chunk ** 2`` energy and an
+FFT ``scipy.signal.resample`` of each chunk) with the shared front-end
+(``GrowableAudioBuffer``, ``pcm16_to_float`` into a reused buffer, ``rms``
+and the stateful ``StreamingResampler``).
+
+Usage:
+    python scripts/benchmark_audio_frontend.py
+    python scripts/benchmark_audio_frontend.py --seconds 60 --rates 48000,44100,16000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from packages.common.audio_frontend import (  # noqa: E402
+    GrowableAudioBuffer,
+    StreamingResampler,
+    pcm16_to_float,
+    rms,
+)
+
+TARGET_RATE = 16000
+CHUNK_SAMPLES = 1024  # what the browser client sends per message
+
+
+def _chunks(seconds: float, rate: int) -> list[bytes]:
+    rng = np.random.default_rng(0)
+    pcm = (rng.standard_normal(int(seconds * rate)) * 3000).astype("<i2").tobytes()
+    size = CHUNK_SAMPLES * 2
+    return [pcm[i : i + size] for i in range(0, len(pcm), size)]
+
+
+def legacy(chunks: list[bytes], rate: int) -> None:
+    from scipy import signal
+
+    buffer = np.array([], dtype=np.float32)
+    for chunk in chunks:
+        audio = np.frombuffer(chunk, dtype=np.int16).astype(np.float32) / 32768
+        buffer = np.concatenate([buffer, audio])
+        np.sqrt(np.mean(audio**2))
+        if rate != TARGET_RATE:
+            np.array(signal.resample(audio, int(len(audio) * TARGET_RATE / rate)), dtype=np.float32)
+
+
+def frontend(chunks: list[bytes], rate: int) -> None:
+    buffer = GrowableAudioBuffer(rate * 5)
+    resampler = StreamingResampler(rate, TARGET_RATE)
+    scratch = np.empty(CHUNK_SAMPLES, dtype=np.float32)
+    for chunk in chunks:
+        audio = pcm16_to_float(chunk, out=scratch)
+        buffer.append(audio)
+        rms(audio)
+        resampler.process(audio)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=30.0, help="Utterance length")
+    parser.add_argument("--rates", default="48000,44100,22050,16000", help="Input sample rates")
+    args = parser.parse_args()
+
+    print(f"{'rate (Hz)':>10} {'legacy us/chunk':>16} {'front-end us/chunk':>19}")
+    for rate in (int(r) for r in args.rates.split(",") if r.strip()):
+        chunks = _chunks(args.seconds, rate)
+        timings = []
+        for run in (legacy, frontend):
+            started = time.process_time()
+            run(chunks, rate)
+            timings.append((time.process_time() - started) / len(chunks) * 1e6)
+        print(f"{rate:>10} {timings[0]:>16.1f} {timings[1]:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
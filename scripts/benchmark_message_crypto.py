@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark of chat history decryption.
+
+Simulates loading a long session's history: ``--messages`` Fernet tokens with
+a mix of short turns and long assistant answers are decrypted
+
+- serially on the event loop, one row at a time (how result processing
+  decrypted every row before),
+- in one batch through ``MessageCrypto.decrypt_many`` with a cold cache,
+  for each ``--workers`` setting,
+- again with a warm plaintext cache (a hot session reloaded on the next turn).
+
+Reports messages/sec and the longest event-loop stall seen by a 1 ms ticker
+while the history was being decrypted.
+
+Usage:
+    python scripts/benchmark_message_crypto.py
+    python scripts/benchmark_message_crypto.py --messages 20000 --workers 0 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from cryptography.fernet import Fernet
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from packages.db.message_crypto import MessageCrypto  # noqa: E402
+
+
+def _history(fernet: Fernet, count: int) -> list[bytes]:
+    rng = random.Random(0)
+    sizes = [rng.choice((80, 200, 600)) if rng.random() < 0.7 else rng.randint(2_000, 12_000)
+             for _ in range(count)]
+    return [fernet.encrypt(("x" * size).encode()) for size in sizes]
+
+
+async def _measure(load: Callable[[], Awaitable[None]]) -> tuple[float, float]:
+    """Run ``load`` next to a 1 ms ticker; return (seconds, worst ticker delay in ms)."""
+    worst = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal worst
+        while not done:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, (time.perf_counter() - before) * 1000 - 1)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    await load()
+    elapsed = time.perf_counter() - started
+    done = True
+    await tick
+    return elapsed, worst
+
+
+async def run(args: argparse.Namespace) -> None:
+    fernet = Fernet(Fernet.generate_key())
+    tokens = _history(fernet, args.messages)
+    print(f"{args.messages} messages, {sum(map(len, tokens)) / 1e6:.1f} MB of ciphertext")
+    print(f"{'mode':>22} {'msg/s':>10} {'max stall ms':>13}")
+
+    def report(name: str, elapsed: float, stall: float) -> None:
+        print(f"{name:>22} {args.messages / elapsed:>10.0f} {stall:>13.1f}")
+
+    async def serial_load() -> None:
+        for token in tokens:
+            fernet.decrypt(token).decode("utf-8")
+
+    report("serial, on loop", *await _measure(serial_load))
+
+    for workers in args.workers:
+        crypto = MessageCrypto(fernet, workers=workers, cache_bytes=args.cache_mb * 1024 * 1024)
+
+        async def batch_load() -> None:
+            await crypto.decrypt_many(tokens)
+
+        report(f"batch, {workers} workers", *await _measure(batch_load))
+        report(f"  warm cache, {workers} w", *await _measure(batch_load))
+        crypto.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=5000, help="Messages in the history")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4], help="Pool sizes")
+    parser.add_argument("--cache-mb", type=int, default=256, help="Plaintext cache size")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
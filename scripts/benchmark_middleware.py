@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the API's per-request middleware stack.
+
+Compares the previous three ``@app.middleware("http")`` functions (correlation
+ID, API version, security headers; each a ``BaseHTTPMiddleware`` layer) with
+the single pure-ASGI ``RequestContextMiddleware``. Reports JSON throughput and,
+for a streamed SSE response, the delay between the endpoint yielding a chunk
+and the client receiving it.
+
+Usage:
+    python scripts/benchmark_middleware.py
+    python scripts/benchmark_middleware.py --requests 5000 --chunks 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.api.middleware.request_context import RequestContextMiddleware  # noqa: E402
+from packages.common import set_correlation_id  # noqa: E402
+
+
+def _routes(app: FastAPI, chunks: int, sent_at: list[float]) -> FastAPI:
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def events():
+            for index in range(chunks):
+                sent_at.append(time.perf_counter())
+                yield f"data: {index}\n\n"
+                await asyncio.sleep(0)
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def legacy_app(chunks: int, sent_at: list[float]) -> FastAPI:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def add_correlation_id(request: Request, call_next):
+        correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
+        set_correlation_id(correlation_id)
+        response = await call_next(request)
+        response.headers["X-Correlation-ID"] = correlation_id
+        return response
+
+    @app.middleware("http")
+    async def add_api_version(request: Request, call_next):
+        api_version = request.headers.get("X-API-Version", "v1")
+        if not api_version.startswith("v"):
+            api_version = f"v{api_version}"
+        request.state.api_version = api_version
+        response = await call_next(request)
+        response.headers["X-API-Version"] = api_version
+        return response
+
+    @app.middleware("http")
+    async def add_security_headers(request: Request, call_next):
+        response = await call_next(request)
+        response.headers.setdefault("X-Content-Type-Options", "nosniff")
+        response.headers.setdefault("Referrer-Policy", "same-origin")
+        response.headers.setdefault("X-Frame-Options", "SAMEORIGIN")
+        return response
+
+    return _routes(app, chunks, sent_at)
+
+
+def asgi_app(chunks: int, sent_at: list[float]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    return _routes(app, chunks, sent_at)
+
+
+async def _throughput(client: httpx.AsyncClient, requests: int, concurrency: int) -> float:
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            response = await client.get("/ping")
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+
+async def _stream_latency(client: httpx.AsyncClient, sent_at: list[float]) -> list[float]:
+    sent_at.clear()
+    delays = []
+    async with client.stream("GET", "/stream") as response:
+        async for line in response.aiter_lines():
+            if line.startswith("data:"):
+                index = int(line[5:])
+                delays.append((time.perf_counter() - sent_at[index]) * 1e6)
+    return delays
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(f"{'stack':>8} {'req/s':>10} {'chunk p50 us':>13} {'chunk p99 us':>13}")
+    for name, factory in (("legacy", legacy_app), ("asgi", asgi_app)):
+        sent_at: list[float] = []
+        app = factory(args.chunks, sent_at)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _throughput(client, 50, 1)  # warm-up
+            rate = await _throughput(client, args.requests, args.concurrency)
+            delays = await _stream_latency(client, sent_at)
+        p99 = statistics.quantiles(delays, n=100)[98] if len(delays) > 1 else delays[0]
+        print(f"{name:>8} {rate:>10.0f} {statistics.median(delays):>13.1f} {p99:>13.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000, help="JSON requests per stack")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--chunks", type=int, default=100, help="SSE chunks per stream")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark streaming STT: real-time factor against utterance length.
+
+Compares the sliding-window ``StreamingRecognizer`` with the previous strategy
+of re-transcribing the whole utterance after every chunk.
+
+With faster-whisper installed and ``--audio`` pointing at a 16 kHz mono WAV
+file, real decode time is measured. Otherwise a synthetic decoder is used and
+decode cost is modelled as proportional to the decoded audio length, which is
+what dominates Whisper inference time.
+
+Usage:
+    python scripts/benchmark_streaming_stt.py
+    python scripts/benchmark_streaming_stt.py --audio sample.wav --model small
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.api.streaming_stt import DecodeResult, StreamingRecognizer, Word  # noqa: E402
+
+SAMPLE_RATE = 16000
+CHUNK_SECONDS = 0.064  # 1024 samples, the size the browser client sends
+STRIDE_SECONDS = 1.0
+# Synthetic decoder cost in seconds per second of decoded audio (small model on CPU)
+SYNTHETIC_COST = 0.08
+
+
+def synthetic_decoder(words_per_second: float = 2.5):
+    """Decoder producing a deterministic word per 0.4 s and charging modelled cost."""
+    spent = {"seconds": 0.0, "longest": 0.0}
+
+    def decode(window: np.ndarray, prompt: str) -> DecodeResult:
+        duration = window.size / SAMPLE_RATE
+        spent["seconds"] += duration * SYNTHETIC_COST
+        spent["longest"] = max(spent["longest"], duration * SYNTHETIC_COST)
+        step = 1.0 / words_per_second
+        # Times are relative to the window, words are keyed by absolute position
+        # through the window's first sample value, which the benchmark sets to its offset.
+        offset = float(window[0]) if window.size else 0.0
+        words = []
+        t = (-offset) % step
+        while t + step <= duration:
+            index = int(round((offset + t) / step))
+            words.append(Word(t, t + step * 0.8, f"w{index}"))
+            t += step
+        return DecodeResult(words=words)
+
+    return decode, spent
+
+
+def load_wav(path: Path) -> np.ndarray:
+    with wave.open(str(path), "rb") as wav:
+        if wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1:
+            raise SystemExit("Expected a 16 kHz mono WAV file")
+        frames = wav.readframes(wav.getnframes())
+    return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768
+
+
+def whisper_decoder(model_name: str):
+    from faster_whisper import WhisperModel
+
+    model = WhisperModel(model_name, device="cpu", compute_type="int8")
+
+    def decode(window: np.ndarray, prompt: str) -> DecodeResult:
+        segments, info = model.transcribe(
+            window,
+            beam_size=1,
+            word_timestamps=True,
+            initial_prompt=prompt or None,
+            condition_on_previous_text=False,
+        )
+        words = [
+            Word(float(w.start), float(w.end), w.word.strip())
+            for seg in segments
+            for w in (seg.words or [])
+            if w.word.strip()
+        ]
+        return DecodeResult(words=words, language=getattr(info, "language", None))
+
+    return decode
+
+
+def run_streaming(audio: np.ndarray, decode) -> tuple[float, float, str]:
+    recognizer = StreamingRecognizer(decode, sample_rate=SAMPLE_RATE, stride_s=STRIDE_SECONDS)
+    chunk = int(CHUNK_SECONDS * SAMPLE_RATE)
+    started = time.perf_counter()
+    result = None
+    for begin in range(0, audio.size, chunk):
+        recognizer.add_audio(audio[begin : begin + chunk])
+        while recognizer.ready():
+            result = recognizer.step() or result
+    result = recognizer.finish() or result
+    elapsed = time.perf_counter() - started
+    max_latency = max(recognizer.stats.partial_latencies, default=0.0)
+    text = result["text"] if result else ""
+    return elapsed, max_latency, text
+
+
+def run_full_redecode(audio: np.ndarray, decode) -> float:
+    chunk = int(CHUNK_SECONDS * SAMPLE_RATE)
+    started = time.perf_counter()
+    for end in range(chunk, audio.size + chunk, chunk):
+        decode(audio[: min(end, audio.size)], "")
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--audio", type=Path, help="16 kHz mono WAV to benchmark with")
+    parser.add_argument("--model", default="small", help="faster-whisper model name")
+    parser.add_argument(
+        "--lengths", default="5,10,20,30,60", help="Utterance lengths in seconds"
+    )
+    args = parser.parse_args()
+
+    lengths = [float(v) for v in args.lengths.split(",") if v.strip()]
+    source = load_wav(args.audio) if args.audio else None
+    synthetic = source is None
+
+    print(f"{'length (s)':>10} {'stream RTF':>11} {'full RTF':>9} {'max partial latency (s)':>24}")
+    for length in lengths:
+        samples = int(length * SAMPLE_RATE)
+        if synthetic:
+            # Each sample carries its own offset in seconds so the synthetic
+            # decoder can emit stable, position-keyed words.
+            audio = (np.arange(samples, dtype=np.float32) / SAMPLE_RATE).astype(np.float32)
+            stream_decode, stream_spent = synthetic_decoder()
+            full_decode, full_spent = synthetic_decoder()
+            run_streaming(audio, stream_decode)
+            run_full_redecode(audio, full_decode)
+            stream_rtf = stream_spent["seconds"] / length
+            full_rtf = full_spent["seconds"] / length
+            # Worst case: a word lands just after a decode, waits one stride, then the longest decode
+            latency = STRIDE_SECONDS + stream_spent["longest"]
+        else:
+            audio = np.resize(source, samples)
+            decode = whisper_decoder(args.model)
+            stream_time, latency, _ = run_streaming(audio, decode)
+            full_rtf = run_full_redecode(audio, decode) / length
+            stream_rtf = stream_time / length
+        print(f"{length:>10.0f} {stream_rtf:>11.3f} {full_rtf:>9.3f} {latency:>24.2f}")
+
+
+if __name__ == "__main__":
+    main()
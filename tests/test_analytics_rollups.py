@@ -0,0 +1,115 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import packages.common  # noqa: F401  (import order: packages.db needs packages.common first)
+from packages.db import rollups
+
+
+class _Result:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar(self):
+        return self._value
+
+
+class _Session:
+    def __init__(self, locked: bool):
+        self.locked = locked
+
+    async def execute(self, statement):
+        return _Result(not self.locked)
+
+
+class _Repo:
+    watermarks: dict = {}
+    calls: list = []
+
+    def __init__(self, db):
+        pass
+
+    async def get_watermark(self, name):
+        return _Repo.watermarks.get(name)
+
+    async def set_watermark(self, name, watermark):
+        _Repo.watermarks[name] = watermark
+
+    async def rebuild_hours(self, start, end):
+        _Repo.calls.append(("hours", start, end))
+
+    async def rebuild_days(self, start, end):
+        _Repo.calls.append(("days", start, end))
+
+
+def _patch(monkeypatch, locked=False):
+    @asynccontextmanager
+    async def session():
+        yield _Session(locked)
+
+    _Repo.calls = []
+    _Repo.watermarks = {}
+    monkeypatch.setattr(rollups, "get_async_session", session)
+    monkeypatch.setattr(rollups, "AnalyticsRepository", _Repo)
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_incremental_pass_rebuilds_settle_window(monkeypatch):
+    _patch(monkeypatch)
+    _Repo.watermarks[rollups.WATERMARK_NAME] = _utc(2025, 3, 1, 23, 50)
+    now = _utc(2025, 3, 2, 0, 20)
+    aggregator = rollups.RollupAggregator(settle=timedelta(minutes=30), clock=lambda: now)
+
+    assert asyncio.run(aggregator.run_once()) is True
+
+    assert _Repo.calls == [
+        ("hours", _utc(2025, 3, 1, 23), _utc(2025, 3, 2, 1)),
+        ("days", _utc(2025, 3, 1), _utc(2025, 3, 3)),
+    ]
+    assert _Repo.watermarks[rollups.WATERMARK_NAME] == now
+
+
+def test_pass_skipped_while_another_worker_holds_the_lock(monkeypatch):
+    _patch(monkeypatch, locked=True)
+    _Repo.watermarks[rollups.WATERMARK_NAME] = _utc(2025, 3, 1)
+    aggregator = rollups.RollupAggregator(clock=lambda: _utc(2025, 3, 2))
+
+    assert asyncio.run(aggregator.run_once()) is False
+    assert _Repo.calls == []
+
+
+def test_backfill_rebuilds_one_day_per_transaction(monkeypatch):
+    _patch(monkeypatch)
+    now = _utc(2025, 3, 3, 12)
+    aggregator = rollups.RollupAggregator(clock=lambda: now)
+    seen = []
+
+    days = asyncio.run(aggregator.backfill(_utc(2025, 3, 1, 15), on_day=seen.append))
+
+    assert days == 3
+    assert seen == [_utc(2025, 3, 1), _utc(2025, 3, 2), _utc(2025, 3, 3)]
+    assert _Repo.calls[:2] == [
+        ("hours", _utc(2025, 3, 1), _utc(2025, 3, 2)),
+        ("days", _utc(2025, 3, 1), _utc(2025, 3, 2)),
+    ]
+    assert _Repo.watermarks[rollups.WATERMARK_NAME] == now
+
+
+def test_only_the_worker_that_claims_the_backfill_runs_it(monkeypatch):
+    _patch(monkeypatch)
+    now = _utc(2025, 3, 3, 12)
+    _Repo.watermarks[rollups.BACKFILL_CLAIM_NAME] = now - timedelta(minutes=2)
+    aggregator = rollups.RollupAggregator(clock=lambda: now)
+
+    # Another worker is backfilling: this pass neither rebuilds nor claims
+    assert asyncio.run(aggregator.run_once()) is False
+    assert _Repo.calls == []
+
+    # Its claim went stale (the worker died), so this one takes over
+    _Repo.watermarks[rollups.BACKFILL_CLAIM_NAME] = now - rollups.BACKFILL_CLAIM_LEASE
+    assert asyncio.run(aggregator.run_once()) is True
+    assert _Repo.calls[0] == ("hours", _utc(2024, 3, 3), _utc(2024, 3, 4))
+    assert _Repo.watermarks[rollups.WATERMARK_NAME] == now
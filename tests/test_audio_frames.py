@@ -0,0 +1,61 @@
+"""Tests for the binary WebSocket audio frames."""
+
+import numpy as np
+import pytest
+
+from apps.api.audio_frames import (
+    FRAME_HEADER_SIZE,
+    AudioUpload,
+    Codec,
+    FrameError,
+    FrameType,
+    decode_frame,
+    encode_frame,
+)
+
+
+def test_frame_round_trip_and_validation():
+    payload = np.arange(160, dtype="<i2").tobytes()
+    data = encode_frame(FrameType.AUDIO, payload, sample_rate=48000, sequence=7, channels=2)
+
+    frame = decode_frame(data)
+    assert len(data) == FRAME_HEADER_SIZE + len(payload)
+    assert (frame.type, frame.codec, frame.channels) == (FrameType.AUDIO, Codec.PCM16, 2)
+    assert (frame.sample_rate, frame.sequence) == (48000, 7)
+    assert frame.payload.tobytes() == payload
+
+    with pytest.raises(FrameError):
+        decode_frame(data[:5])
+    with pytest.raises(FrameError):
+        decode_frame(b"\x09" + data[1:])
+
+
+async def test_upload_streams_chunks_to_the_transcriber_as_they_arrive():
+    received: list[bytes] = []
+    partials: list[dict] = []
+
+    async def transcribe(chunks, sample_rate):
+        assert sample_rate == 16000
+        async for chunk in chunks:
+            received.append(chunk)
+            yield {"text": f"chunk {len(received)}", "is_final": False}
+        yield {"text": "ciao", "is_final": True, "language": "it"}
+        yield {"text": "a tutti", "is_final": True, "language": "it"}
+
+    async def on_result(result):
+        partials.append(result)
+
+    upload = AudioUpload(transcribe, on_result)
+    stereo = np.array([[100, 300], [-200, 0], [50, 50]], dtype="<i2").tobytes()
+    # Split mid-sample: the odd trailing byte is carried into the next frame
+    await upload.feed(decode_frame(encode_frame(FrameType.AUDIO, stereo[:5], sample_rate=16000, channels=2)))
+    await upload.feed(
+        decode_frame(encode_frame(FrameType.AUDIO, stereo[5:], sample_rate=16000, sequence=1, channels=2))
+    )
+    result = await upload.finish()
+
+    mono = np.frombuffer(b"".join(received), dtype="<i2").tolist()
+    assert mono == [200, -100, 50]
+    assert result["text"] == "ciao a tutti" and result["language"] == "it"
+    assert [p["is_final"] for p in partials] == [False, False, True, True]
+    assert upload.frames_received == 2 and upload.bytes_received == len(stereo)
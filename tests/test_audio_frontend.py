@@ -0,0 +1,51 @@
+"""Tests for the shared audio front-end."""
+
+import numpy as np
+import pytest
+
+from packages.common import audio_frontend
+from packages.common.audio_frontend import GrowableAudioBuffer, StreamingResampler, pcm16_to_float, resample
+
+
+def _tones(seconds: float, rate: int) -> np.ndarray:
+    t = np.arange(int(seconds * rate)) / rate
+    return (0.5 * np.sin(2 * np.pi * 440 * t) + 0.2 * np.sin(2 * np.pi * 3000 * t)).astype(np.float32)
+
+
+def test_growable_buffer_keeps_samples_across_growth_and_consume():
+    buffer = GrowableAudioBuffer(4, dtype=np.int16)
+    buffer.append(np.arange(3, dtype=np.int16))
+    buffer.consume(2)
+    buffer.append(np.arange(3, 10, dtype=np.int16))
+
+    assert buffer.view().tolist() == [2, 3, 4, 5, 6, 7, 8, 9]
+    assert buffer.take(3).tolist() == [2, 3, 4]
+    assert len(buffer) == 5 and buffer.capacity == 8
+
+
+@pytest.mark.parametrize("numpy_only", [False, True])
+@pytest.mark.parametrize("source_rate", [48000, 44100, 22050, 8000])
+def test_streaming_resampler_matches_one_shot_and_preserves_tones(monkeypatch, numpy_only, source_rate):
+    if numpy_only:
+        monkeypatch.setattr(audio_frontend, "upfirdn", None)
+    audio = _tones(1.0, source_rate)
+
+    resampler = StreamingResampler(source_rate, 16000)
+    chunked = np.concatenate([resampler.process(audio[i : i + 1000]) for i in range(0, audio.size, 1000)])
+    whole = StreamingResampler(source_rate, 16000).process(audio)
+    np.testing.assert_allclose(chunked, whole, atol=1e-6)
+
+    output = resample(audio, source_rate, 16000)
+    assert output.size == 16000
+    expected = _tones(1.0, 16000)
+    # Away from the edges the tones come through with negligible error
+    assert np.abs(output[200:-200] - expected[200:-200]).max() < 1e-3
+
+
+def test_pcm16_to_float_reuses_output_buffer_and_ignores_odd_byte():
+    out = np.empty(8, dtype=np.float32)
+    data = np.array([0, 16384, -32768], dtype="<i2").tobytes() + b"\x01"
+
+    converted = pcm16_to_float(data, out=out)
+    assert converted.base is out
+    assert converted.tolist() == [0.0, 0.5, -1.0]
@@ -0,0 +1,132 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+from qdrant_client import QdrantClient
+
+import packages.common  # noqa: F401  (import order: packages.ingestion needs packages.common first)
+from packages.common.settings import IngestionConfig
+from packages.ingestion import embedder_integration, pipeline
+from packages.ingestion.dedup import deduplicate_chunks, fingerprint_chunk, normalize_chunk_text, simhash
+from packages.parsers.models import DocChunk, IngestionItem
+from packages.vectorstore import ensure_collections, ensure_keyword_indexes
+
+WORDS = [f"w{i}" for i in range(500)]
+
+
+def _text(seed: int, length: int = 300) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def _chunk(text: str, index: int, uri: str = "file:///a.md") -> DocChunk:
+    return DocChunk(
+        id=f"{uri}#{index}",
+        chunk_id=index,
+        text=text,
+        uri=uri,
+        mime="text/markdown",
+        source="file",
+        metadata={"path_hash": uri, "chunk_index": index},
+    )
+
+
+def test_fingerprints_match_normalized_and_near_identical_text():
+    exact = fingerprint_chunk("Confidential — do NOT distribute!", user_id=1, max_distance=3)
+    same = fingerprint_chunk("confidential do not   distribute", user_id=1, max_distance=3)
+    other_owner = fingerprint_chunk("confidential do not distribute", user_id=2, max_distance=3)
+    assert exact.content_hash == same.content_hash != other_owner.content_hash
+
+    words = normalize_chunk_text(_text(1))
+    edited = list(words)
+    edited[150] = "changed"
+    distance = (simhash(words) ^ simhash(edited)).bit_count()
+    unrelated = (simhash(words) ^ simhash(normalize_chunk_text(_text(2)))).bit_count()
+    assert distance <= 3 < unrelated
+
+
+def test_duplicates_within_a_batch_are_folded_into_the_first_chunk():
+    footer = "Company Ltd. All rights reserved. Printed copies are uncontrolled."
+    chunks = [_chunk(_text(1), 1), _chunk(footer, 2), _chunk(_text(2), 3), _chunk(footer, 4)]
+    fingerprints = [fingerprint_chunk(c.text, user_id=1, max_distance=3) for c in chunks]
+
+    result = deduplicate_chunks(chunks, fingerprints, [], max_distance=3)
+
+    assert [c.chunk_id for c in result.unique] == [1, 2, 3]
+    assert result.duplicate_count == 1
+    assert [s["chunk_index"] for s in result.sources[chunks[1].id]] == [2, 4]
+
+
+def test_chunks_differing_in_a_number_are_kept_by_default():
+    body = _text(4)
+    chunks = [
+        _chunk(f"{body} Total due: 1200 EUR.", 1),
+        _chunk(f"{body} Total due: 9800 EUR.", 2, "file:///b.md"),
+    ]
+
+    def dedup(max_distance):
+        fingerprints = [fingerprint_chunk(c.text, user_id=1, max_distance=max_distance) for c in chunks]
+        return deduplicate_chunks(chunks, fingerprints, [], max_distance=max_distance)
+
+    # Close enough for SimHash to call them near duplicates...
+    assert dedup(3).duplicate_count == 1
+    # ...so only exact duplicates merge unless near-duplicate folding is enabled
+    result = dedup(IngestionConfig().dedup_simhash_distance)
+    assert result.duplicate_count == 0
+    assert [c.chunk_id for c in result.unique] == [1, 2]
+
+
+def _pipeline(client: QdrantClient, monkeypatch) -> pipeline.IngestionPipeline:
+    settings = SimpleNamespace(
+        qdrant_collection="documents",
+        embedding_dim=4,
+        ingest_dedup_enabled=True,
+        ingest_dedup_simhash_distance=3,
+    )
+    ensure_collections(client, settings)
+    ensure_keyword_indexes(client, "documents", ("content_hash", "simhash_bands"))
+
+    async def fake_embed(chunks, embedder):
+        return [[1.0, 0.0, 0.0, float(i)] for i, _ in enumerate(chunks)]
+
+    monkeypatch.setattr(pipeline, "embed_chunks", fake_embed)
+    monkeypatch.setattr(embedder_integration, "get_client", lambda settings: client)
+
+    instance = object.__new__(pipeline.IngestionPipeline)
+    instance._settings = settings
+    instance._dedup_locks = {}
+    instance._get_qdrant_client = lambda: client
+    instance._get_embedder = lambda: None
+    return instance
+
+
+def test_reingested_and_near_duplicate_documents_share_points(tmp_path, monkeypatch):
+    client = QdrantClient(":memory:")
+    ingest = _pipeline(client, monkeypatch)
+    body = _text(3, length=1500)
+    first = tmp_path / "first.md"
+    first.write_text(body, encoding="utf-8")
+    # Same document with a typo fixed, saved under another name
+    second = tmp_path / "second.md"
+    second.write_text(body.replace(" w7 ", " w8 ", 1), encoding="utf-8")
+
+    def process(path):
+        item = IngestionItem(path=path, uri=path.as_uri(), mime="text/markdown", bytes_size=1)
+        return asyncio.run(ingest._process_item(item, tags=[], from_web=False, user_id=1))
+
+    first_result = process(first)
+    assert first_result.duplicate_chunks == 0
+    stored = client.count("documents").count
+    assert stored == first_result.chunk_count
+
+    again = process(first)
+    near = process(second)
+
+    assert again.duplicate_chunks == again.chunk_count
+    assert near.duplicate_chunks == near.chunk_count
+    assert client.count("documents").count == stored
+
+    points, _ = client.scroll("documents", with_payload=True)
+    uris = {source["uri"] for source in points[0].payload["sources"]}
+    assert uris == {first.as_uri(), second.as_uri()}
+    assert points[0].payload["source_count"] == 2
@@ -0,0 +1,85 @@
+"""Tests for the web server's validated DNS cache and pinned transport."""
+
+import asyncio
+import socket
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from apps.mcp_servers.web import dns_cache
+from apps.mcp_servers.web.dns_cache import (
+    DISALLOWED_ADDRESS_MESSAGE,
+    RejectedHostError,
+    SafeResolver,
+    build_pinned_transport,
+)
+from apps.mcp_servers.web.http_cache import is_cacheable_failure
+
+ANSWERS = {"public.example": "93.184.216.34", "internal.example": "10.0.0.5"}
+
+
+def _run(resolver, lookups, calls):
+    async def fake_getaddrinfo(host, port, proto=0):
+        calls.append(host)
+        await asyncio.sleep(0.01)
+        if host not in ANSWERS:
+            raise socket.gaierror("no such host")
+        return [(socket.AF_INET, socket.SOCK_STREAM, proto, "", (ANSWERS[host], 0))]
+
+    async def scenario():
+        asyncio.get_running_loop().getaddrinfo = fake_getaddrinfo
+        return await asyncio.gather(*(resolver.resolve(host) for host in lookups), return_exceptions=True)
+
+    return asyncio.run(scenario())
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=50.0)
+    monkeypatch.setattr(dns_cache, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_concurrent_lookups_share_one_query_until_the_ttl_expires(clock):
+    resolver = SafeResolver(ttl=300, negative_ttl=30)
+    calls = []
+
+    results = _run(resolver, ["public.example", "Public.Example.", "public.example"], calls)
+
+    assert results == [("93.184.216.34",)] * 3
+    assert calls == ["public.example"]
+
+    clock.value += 299
+    _run(resolver, ["public.example"], calls)
+    assert len(calls) == 1
+    clock.value += 2
+    _run(resolver, ["public.example"], calls)
+    assert len(calls) == 2
+
+
+def test_disallowed_and_unresolvable_hosts_are_rejected_and_cached(clock):
+    resolver = SafeResolver(ttl=300, negative_ttl=30)
+    calls = []
+
+    internal, missing, literal = _run(resolver, ["internal.example", "missing.example", "127.0.0.1"], calls)
+
+    assert isinstance(internal, ValueError) and str(internal) == DISALLOWED_ADDRESS_MESSAGE
+    assert isinstance(missing, ValueError)
+    assert str(literal) == DISALLOWED_ADDRESS_MESSAGE
+
+    clock.value += 31
+    _run(resolver, ["internal.example", "missing.example"], calls)
+    # The failed lookup expires after the negative TTL, the rejection after the full TTL
+    assert calls == ["internal.example", "missing.example", "missing.example"]
+
+
+def test_pinned_transport_refuses_to_connect_to_disallowed_addresses():
+    async def fetch():
+        async with httpx.AsyncClient(transport=build_pinned_transport(SafeResolver())) as client:
+            await client.get("http://127.0.0.1:9/")
+
+    with pytest.raises(httpx.ConnectError, match="disallowed") as excinfo:
+        asyncio.run(fetch())
+    assert isinstance(excinfo.value.__cause__, RejectedHostError)
+    assert not is_cacheable_failure(excinfo.value)
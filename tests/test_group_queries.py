@@ -0,0 +1,121 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import apps.api.main  # noqa: F401  (resolves the routes <-> services import cycle)
+from apps.api.services.group_service import GroupService
+from packages.common.exceptions import AuthorizationError, ValidationError
+from packages.db.models import User
+from packages.db.repositories import GroupRepository, UserRepository
+
+T0 = datetime(2025, 3, 1, 12, tzinfo=timezone.utc)
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+        self.rowcount = value if isinstance(value, int) else 0
+
+    def one(self):
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.value
+
+
+class _ScriptedSession:
+    """Answers each statement with the next scripted value and records it."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.info = {}
+        self.identity_map = {}
+        self.added = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        assert self.results, f"unexpected extra statement: {statement}"
+        return _Result(self.results.pop(0))
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _service(session):
+    return GroupService(GroupRepository(session), UserRepository(session))
+
+
+def _access(requester_role, target_role=None, admin_count=1, member_count=2):
+    return (True, requester_role, target_role, admin_count, member_count)
+
+
+def test_remove_member_checks_roles_and_admin_count_in_one_statement():
+    session = _ScriptedSession(_access("admin", "member", admin_count=2), 1)
+
+    assert asyncio.run(_service(session).remove_member(7, 2, requester_user_id=1))
+    assert len(session.statements) == 2
+    assert session.commits == 1
+
+
+def test_demoting_the_last_admin_is_refused_after_one_statement():
+    session = _ScriptedSession(_access("admin", "admin", admin_count=1))
+
+    with pytest.raises(ValidationError):
+        asyncio.run(_service(session).update_member_role(7, 1, "member", requester_user_id=1))
+    assert len(session.statements) == 1
+
+
+def test_update_member_role_reuses_the_loaded_user():
+    user = SimpleNamespace(username="ada")
+    membership = SimpleNamespace(user_id=2, role="admin", joined_at=T0, user=user)
+    session = _ScriptedSession(_access("admin", "member"), membership)
+
+    result = asyncio.run(_service(session).update_member_role(7, 2, "admin", requester_user_id=1))
+
+    assert result["username"] == "ada"
+    assert len(session.statements) == 2
+
+
+def test_add_member_answers_repeated_lookups_from_the_request_cache():
+    user = User(id=2, username="ada")
+    session = _ScriptedSession(_access("admin", None), [user], [])
+    service = _service(session)
+
+    result = asyncio.run(service.add_member(7, 2, "member", requester_user_id=1))
+
+    # access + user lookup; the duplicate check is answered by the cached role
+    assert result["username"] == "ada"
+    assert len(session.statements) == 2
+    assert session.added[0].role == "member"
+
+    async def repeated_lookups():
+        assert await service.group_repo.is_member(2, 7)
+        assert await service.user_repo.get_by_id(404) is None
+        assert await service.user_repo.get_by_id(404) is None
+
+    asyncio.run(repeated_lookups())
+    assert len(session.statements) == 3
+
+
+def test_non_members_are_refused_before_members_are_loaded():
+    session = _ScriptedSession(_access(None, None))
+
+    with pytest.raises(AuthorizationError):
+        asyncio.run(_service(session).get_group_members(7, user_id=3))
+    assert len(session.statements) == 1
@@ -0,0 +1,117 @@
+"""Tests for the web server's HTML extractors and worker pool."""
+
+import asyncio
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+from readability import Document
+
+from apps.mcp_servers.web.html_processing import (
+    HtmlProcessor,
+    _ParsedDocument,
+    extract_article,
+    extract_crawl_page,
+    extract_page,
+    extract_search_results,
+    parse_html,
+)
+
+ARTICLE = """<!DOCTYPE html>
+<html><head>
+  <title>Tide tables explained | Coastal Notes</title>
+  <meta name="description" content="How to read a tide table.">
+  <meta property="og:site_name" content="Coastal Notes">
+  <meta name="author" content="">
+  <script>var tracking = 1;</script>
+</head><body>
+  <nav><a href="https://example.com/home">Home</a></nav>
+  <article>
+    <h1>Tide tables explained</h1>
+    <p>A tide table lists the times and heights of high and low water for a port.
+       Heights are given relative to chart datum, the lowest astronomical tide.</p>
+    <p>Spring tides follow the new and full moon; neap tides fall in between.
+       See the <a href="https://example.com/datum">chart datum guide</a> and
+       <a href="/relative">this relative link</a> for details.</p>
+  </article>
+  <footer><a href="https://example.com/imprint">Imprint</a></footer>
+</body></html>"""
+
+
+def test_page_extraction_drops_boilerplate_and_keeps_absolute_links():
+    page = extract_page(ARTICLE, max_links=10)
+
+    assert page["title"] == "Tide tables explained | Coastal Notes"
+    assert "tracking" not in page["text"] and "Imprint" not in page["text"]
+    assert "chart datum" in page["text"]
+    assert page["links"] == [{"url": "https://example.com/datum", "text": "chart datum guide"}]
+    assert extract_page("   ", max_links=10) == {"title": "", "text": "", "links": []}
+
+
+def test_article_extraction_reads_title_metadata_and_links():
+    article = extract_article(ARTICLE, include_links=True)
+
+    assert article["title"] == "Tide tables explained"
+    assert "A tide table lists" in article["text"] and "Imprint" not in article["text"]
+    assert article["metadata"] == {
+        "description": "How to read a tide table.",
+        "og:site_name": "Coastal Notes",
+    }
+    assert {"url": "https://example.com/datum", "text": "chart datum guide"} in article["links"]
+    assert extract_article(ARTICLE, include_links=False)["links"] == []
+
+
+def test_crawl_snippet_matches_plain_readability():
+    page = extract_crawl_page(ARTICLE, want_links=True)
+
+    # The shared-tree Document must summarise exactly like readability's own parsing
+    assert _ParsedDocument(parse_html(ARTICLE)).summary() == Document(ARTICLE).summary()
+    assert page["snippet"].startswith("Tide tables explained A tide table lists the times")
+    assert "Home" not in page["snippet"]
+    assert page["links"] == [
+        "https://example.com/home",
+        "https://example.com/datum",
+        "https://example.com/imprint",
+    ]
+    assert extract_crawl_page(ARTICLE, want_links=False)["links"] == []
+
+
+def test_search_results_are_read_from_result_blocks():
+    html = """<html><body>
+      <div class="result results_links"><h2 class="result__title">
+        <a class="result__a" href="https://tides.example/">Tide times</a></h2>
+        <a class="result__snippet">Daily tide tables.</a></div>
+      <div class="result"><a class="result__url" href="https://moon.example/">moon.example</a></div>
+      <div class="result"><span>nothing useful</span></div>
+    </body></html>"""
+
+    assert extract_search_results(html, top_k=5) == [
+        {"title": "Tide times", "url": "https://tides.example/", "snippet": "Daily tide tables."},
+        {"title": "", "url": "https://moon.example/", "snippet": ""},
+    ]
+    assert len(extract_search_results(html, top_k=1)) == 1
+
+
+class _BrokenExecutor(Executor):
+    def __init__(self):
+        self.closed = False
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.closed = True
+
+
+def test_broken_pool_is_replaced_and_the_call_retried():
+    processor = HtmlProcessor(mode="thread", max_workers=1)
+    broken = processor._executor = _BrokenExecutor()
+
+    try:
+        page = asyncio.run(processor.run(extract_page, ARTICLE, 1))
+    finally:
+        processor.shutdown()
+
+    assert page["title"] == "Tide tables explained | Coastal Notes"
+    assert broken.closed
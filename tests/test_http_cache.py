@@ -0,0 +1,121 @@
+"""Tests for the web server's HTTP response cache."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from apps.mcp_servers.web import http_cache
+from apps.mcp_servers.web.dns_cache import RejectedHostError
+from apps.mcp_servers.web.http_cache import ResponseCache, freshness_lifetime, replay_failure
+
+URL = "https://example.com/page"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(http_cache, "time", SimpleNamespace(monotonic=lambda: now.value, time=time.time))
+    return now
+
+
+def _response(status=200, content=b"body", url=URL, **headers):
+    return httpx.Response(
+        status,
+        headers={name.replace("_", "-"): value for name, value in headers.items()},
+        content=content,
+        request=httpx.Request("GET", url),
+    )
+
+
+def _cache(**overrides):
+    options = {"max_bytes": 1000, "max_entry_bytes": 500, "default_ttl": 60.0, "negative_ttl": 15.0}
+    options.update(overrides)
+    return ResponseCache(**options)
+
+
+def test_freshness_follows_cache_control_expires_and_age():
+    date = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    http_date = format_datetime(date, usegmt=True)
+    expires = format_datetime(date + timedelta(seconds=120), usegmt=True)
+
+    assert freshness_lifetime(httpx.Headers({"cache-control": "max-age=300"}), 60) == 300
+    assert freshness_lifetime(httpx.Headers({"cache-control": "s-maxage=30, max-age=300"}), 60) == 30
+    assert freshness_lifetime(httpx.Headers({"cache-control": "max-age=300", "age": "100"}), 60) == 200
+    assert freshness_lifetime(httpx.Headers({"expires": expires, "date": http_date}), 60) == 120
+    assert freshness_lifetime(httpx.Headers({"expires": "0"}), 60) == 0
+    assert freshness_lifetime(httpx.Headers({}), 60) == 60
+    assert freshness_lifetime(httpx.Headers({"cache-control": "no-cache"}), 60) == 0
+    assert freshness_lifetime(httpx.Headers({"cache-control": "private, max-age=300"}), 60) is None
+    assert freshness_lifetime(httpx.Headers({"cache-control": "no-store"}), 60) is None
+
+
+def test_entries_go_stale_and_revalidate_with_304(clock):
+    cache = _cache()
+    cache.store(URL, _response(cache_control="max-age=10", etag='"v1"'))
+
+    assert cache.get(URL).is_fresh()
+    clock.value += 11
+    entry = cache.get(URL)
+    assert not entry.is_fresh()
+    assert cache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+
+    cache.refresh(entry, _response(304, content=b"", cache_control="max-age=30", etag='"v1"'))
+
+    assert cache.get(URL).is_fresh()
+    assert cache.get(URL).content == b"body"
+    assert cache.snapshot()["revalidated"] == 1
+    assert (cache.stats.hits, cache.stats.misses) == (3, 1)
+
+
+def test_least_recently_used_entries_are_evicted_by_size(clock):
+    cache = _cache(max_bytes=250, max_entry_bytes=200)
+    for name in ("a", "b"):
+        cache.store(f"{URL}/{name}", _response(content=b"x" * 100))
+    cache.get(f"{URL}/a")
+    cache.store(f"{URL}/c", _response(content=b"x" * 100))
+    cache.store(f"{URL}/big", _response(content=b"x" * 300))
+
+    assert cache.get(f"{URL}/b") is None
+    assert cache.get(f"{URL}/a") is not None
+    assert cache.get(f"{URL}/c") is not None
+    assert cache.get(f"{URL}/big") is None
+    assert cache.snapshot()["bytes"] == 200
+    assert cache.stats.evictions == 1
+
+
+def test_negative_cache_keeps_host_failures_until_they_expire(clock):
+    cache = _cache(max_negative_entries=2)
+    request = httpx.Request("GET", URL)
+    server_error = httpx.HTTPStatusError("boom", request=request, response=httpx.Response(503, request=request))
+    not_found = httpx.HTTPStatusError("gone", request=request, response=httpx.Response(404, request=request))
+
+    assert not cache.record_failure(URL, not_found)
+    assert not cache.record_failure(URL, ValueError("Resolved address is not allowed"))
+    rejected = httpx.ConnectError("not allowed", request=request)
+    rejected.__cause__ = RejectedHostError("Resolved address is not allowed")
+    assert not cache.record_failure(URL, rejected)
+    assert cache.record_failure(URL, server_error)
+    assert cache.get_failure(URL) is server_error
+
+    clock.value += 16
+    assert cache.get_failure(URL) is None
+
+    for name in ("a", "b", "c"):
+        cache.record_failure(f"{URL}/{name}", httpx.ConnectError("refused", request=request))
+    assert cache.get_failure(f"{URL}/a") is None
+    assert cache.get_failure(f"{URL}/c") is not None
+    assert cache.snapshot()["negative_entries"] == 2
+
+
+def test_replayed_failures_are_new_exceptions():
+    original = httpx.ConnectError("refused", request=httpx.Request("GET", URL))
+
+    replayed = replay_failure(original)
+
+    assert type(replayed) is httpx.ConnectError and replayed is not original
+    assert replayed.request is original.request
+    assert replayed.__traceback__ is None
@@ -0,0 +1,86 @@
+"""
+Cold-start import budgets for the API worker and the MCP servers.
+
+Each entry point is imported in a fresh interpreter under ``-X importtime``.
+The tests fail when a dependency that should only load on first use
+(renderers, transcription, signal processing, database/vector clients for
+servers that do not use them) is imported eagerly.
+
+The wall-clock budgets depend on the machine and its load, so they are only
+checked when ``CHECK_IMPORT_BUDGETS=1`` is set (e.g. on a quiet benchmark
+host). Budgets leave roughly 2x headroom over a development machine.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+FIRST_PARTY = ("apps", "packages")
+_MISSING_MODULE = re.compile(r"ModuleNotFoundError: No module named '([^']+)'")
+
+MEDIA_AND_VISION = ("PIL", "cv2", "pypdfium2", "ffmpeg", "faster_whisper", "piper", "scipy")
+DATA_CLIENTS = ("qdrant_client", "sqlalchemy", "numpy")
+
+# module, budget in seconds, modules that must not be imported
+TARGETS = [
+    ("apps.api.main", 5.0, MEDIA_AND_VISION),
+    ("apps.mcp_servers.datetime.server", 1.5, MEDIA_AND_VISION + DATA_CLIENTS),
+    ("apps.mcp_servers.units.server", 1.5, MEDIA_AND_VISION + DATA_CLIENTS),
+    ("apps.mcp_servers.web.server", 2.0, MEDIA_AND_VISION + DATA_CLIENTS),
+    ("apps.mcp_servers.semantic.server", 3.0, MEDIA_AND_VISION + ("sqlalchemy",)),
+]
+
+
+@lru_cache(maxsize=None)
+def _profile(module: str) -> tuple[float, frozenset[str]]:
+    code = f"import sys, json; import {module}; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if proc.returncode != 0:
+        # A missing third-party dependency skips; a missing first-party module
+        # is a broken import path and fails
+        missing = _MISSING_MODULE.findall(proc.stderr)
+        if missing and missing[-1].split(".")[0] not in FIRST_PARTY:
+            pytest.skip(f"{module} needs {missing[-1]}, which is not installed")
+        raise AssertionError(proc.stderr[-2000:])
+
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module:
+            cumulative_us = int(cumulative)
+    modules = frozenset(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return cumulative_us / 1e6, modules
+
+
+@pytest.mark.parametrize("module,budget,forbidden", TARGETS, ids=[t[0] for t in TARGETS])
+def test_cold_start_imports_are_lazy(module, budget, forbidden):
+    _, modules = _profile(module)
+
+    eager = sorted(name for name in forbidden if name in modules)
+    assert not eager, f"{module} imports {eager} at start-up; import them where they are used"
+
+
+@pytest.mark.skipif(
+    os.environ.get("CHECK_IMPORT_BUDGETS") != "1",
+    reason="wall-clock budget; set CHECK_IMPORT_BUDGETS=1 to check it",
+)
+@pytest.mark.parametrize("module,budget,forbidden", TARGETS, ids=[t[0] for t in TARGETS])
+def test_cold_start_import_budget(module, budget, forbidden):
+    seconds, _ = _profile(module)
+
+    assert seconds <= budget, f"{module} took {seconds:.2f}s to import (budget {budget:.1f}s)"
@@ -0,0 +1,124 @@
+import asyncio
+import io
+import json
+import zipfile
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+import packages.common  # noqa: F401  (import order: packages.db needs packages.common first)
+from apps.api.utils.export_stream import ndjson_stream, zip_stream
+from packages.common.exceptions import ValidationError
+from packages.db.models import Document
+from packages.db.pagination import Cursor, apply_keyset, next_cursor
+from packages.db.repositories import DocumentRepository
+
+T0 = datetime(2025, 3, 1, 12, tzinfo=timezone.utc)
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    cursor = Cursor(position=T0 + timedelta(microseconds=17), id=42)
+    assert Cursor.decode(cursor.encode()) == cursor
+    assert Cursor.from_token(None) is None
+
+    with pytest.raises(ValidationError):
+        Cursor.decode("not-a-cursor")
+
+
+def test_apply_keyset_seeks_past_cursor():
+    query = apply_keyset(
+        select(Document).where(Document.user_id == 1),
+        Document.created_at, Document.id, Cursor(T0, 7), limit=50
+    )
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert "(documents.created_at, documents.id) < (" in sql
+    assert "ORDER BY documents.created_at DESC, documents.id DESC" in sql
+    assert "OFFSET" not in sql
+
+    rows = [SimpleNamespace(id=i, created_at=T0 - timedelta(minutes=i)) for i in range(3)]
+    assert next_cursor(rows, "created_at", limit=3) == Cursor(T0 - timedelta(minutes=2), 2)
+    assert next_cursor(rows, "created_at", limit=5) is None
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _PagingSession:
+    """Serves fake rows oldest first, honouring the keyset bound of each statement."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        # Anonymous parameters: [limit] on the first page, [position, id, limit] after
+        *bound, limit = [
+            value for key, value in statement.compile().params.items() if key.startswith("param_")
+        ]
+        rows = [r for r in self.rows if not bound or (r.created_at, r.id) > tuple(bound)]
+        return _Result(rows[:limit])
+
+
+def test_iter_keyset_fetches_in_batches():
+    rows = [SimpleNamespace(id=i, created_at=T0 + timedelta(minutes=i)) for i in range(5)]
+    session = _PagingSession(rows)
+    repo = DocumentRepository(session)
+
+    async def collect():
+        return [batch async for batch in repo.iter_user_documents(1, batch_size=2)]
+
+    batches = asyncio.run(collect())
+
+    assert [[r.id for r in batch] for batch in batches] == [[0, 1], [2, 3], [4]]
+    assert len(session.statements) == 3
+
+
+async def _records():
+    yield "user", {"id": 1, "username": "ada", "created_at": T0}
+    yield "session", {"id": 10, "title": "hello", "created_at": T0}
+    for i in range(3):
+        yield "message", {"id": i, "session_id": 10, "content": "hé" * 50, "created_at": T0}
+
+
+def _drain(stream):
+    async def collect():
+        return [chunk async for chunk in stream]
+
+    return asyncio.run(collect())
+
+
+def test_ndjson_stream_writes_one_record_per_line():
+    counts = Counter()
+    chunks = _drain(ndjson_stream(_records(), exported_at=T0, counts=counts, chunk_bytes=128))
+
+    assert len(chunks) > 1
+    lines = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert [line["type"] for line in lines] == ["export", "user", "session"] + ["message"] * 3
+    assert lines[0]["data"]["exported_at"] == T0.isoformat()
+    assert lines[3]["data"]["content"] == "hé" * 50
+    assert counts == {"user": 1, "session": 1, "message": 3}
+
+
+def test_zip_stream_is_a_valid_archive():
+    chunks = _drain(zip_stream(_records(), exported_at=T0, chunk_bytes=64))
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        lines = archive.read("export.ndjson").splitlines()
+        manifest = json.loads(archive.read("manifest.json"))
+
+    assert len(lines) == 6
+    assert manifest["counts"] == {"user": 1, "session": 1, "message": 3}
@@ -0,0 +1,67 @@
+"""Tests for incremental MCP tool discovery."""
+
+import asyncio
+
+from packages.agent.registry import MCPRegistry
+from packages.mcp import MCPTool
+from packages.mcp.base_handler import MCPProtocolHandler, MCPServerInfo
+
+
+class _Client:
+    def __init__(self, server_id, version="v1"):
+        self.server_id = server_id
+        self.ws_url = f"ws://{server_id}/mcp"
+        self.is_healthy = True
+        self.version = version
+        self.description = "first"
+        self.tools_version = None
+        self.listings = 0
+
+    async def fetch_tools_version(self):
+        return self.version
+
+    async def list_tools(self):
+        self.listings += 1
+        self.tools_version = self.version
+        return [MCPTool(f"{self.server_id}.tool", self.description, {}, self.server_id, self.ws_url)]
+
+
+def test_only_servers_with_new_schema_versions_are_relisted():
+    refreshed = []
+
+    async def scenario():
+        registry = MCPRegistry([])
+        registry.clients = {"a": _Client("a"), "b": _Client("b")}
+        registry.set_refreshed_callback(lambda tools, clients: refreshed.append(sorted(tools)))
+
+        assert await registry.refresh_tools() is True
+        schemas = registry.to_llm_tools()
+        assert registry.to_llm_tools() is schemas
+
+        assert await registry.refresh_tools() is False
+        assert registry.to_llm_tools() is schemas
+        assert [c.listings for c in registry.clients.values()] == [1, 1]
+
+        registry.clients["b"].version = "v2"
+        registry.clients["b"].description = "second"
+        assert await registry.refresh_tools() is True
+        assert [c.listings for c in registry.clients.values()] == [1, 2]
+        assert registry.to_llm_tools() is not schemas
+        assert registry.to_llm_tools(exclude_servers=["a"])[0]["function"]["description"] == "second"
+
+        # Health changes are persisted even when no tool changed
+        registry.clients["a"].is_healthy = False
+        assert await registry.refresh_tools() is False
+        assert [t["function"]["name"] for t in registry.to_llm_tools()] == ["b_tool"]
+
+    asyncio.run(scenario())
+    assert len(refreshed) == 3
+
+
+def test_server_tools_version_tracks_registered_tools():
+    handler = MCPProtocolHandler(MCPServerInfo(name="test"))
+    handler.register_tool("one", "", {"type": "object"}, lambda: None)
+    first = handler.tools_version()
+    assert handler.get_tools_list_response()["version"] == first
+    handler.register_tool("two", "", {"type": "object"}, lambda: None)
+    assert handler.tools_version() != first
@@ -0,0 +1,150 @@
+"""Tests for the pooled MCP client."""
+
+import asyncio
+import json
+
+import pytest
+
+import packages.mcp.client as mcp_client
+from packages.mcp.client import MCPClient, MCPTimeoutError
+
+
+class _FakeSocket:
+    """Answers ``initialize`` at once and holds ``tools/call`` until released."""
+
+    def __init__(self, server):
+        self.server = server
+        self.closed = False
+        self._outbox: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, raw):
+        msg = json.loads(raw)
+        if msg["method"] == "tools/call":
+            self.server.calls.append(self)
+            if msg["params"]["arguments"].get("hang"):
+                return
+            asyncio.get_running_loop().create_task(self._answer_later(msg["id"]))
+        else:
+            await self._outbox.put({"jsonrpc": "2.0", "id": msg["id"], "result": {"tools": []}})
+
+    async def _answer_later(self, req_id):
+        await self.server.release.wait()
+        await self._outbox.put(
+            {"jsonrpc": "2.0", "id": req_id, "result": {"content": [{"type": "text", "text": "ok"}]}}
+        )
+
+    async def recv(self):
+        return json.dumps(await self._outbox.get())
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeServer:
+    def __init__(self):
+        self.sockets: list[_FakeSocket] = []
+        self.calls: list[_FakeSocket] = []
+        self.release = asyncio.Event()
+
+    async def connect(self, url, **kwargs):
+        socket = _FakeSocket(self)
+        self.sockets.append(socket)
+        return socket
+
+
+def test_concurrent_calls_spread_over_pool_and_report_saturation(monkeypatch):
+    async def scenario():
+        server = _FakeServer()
+        monkeypatch.setattr(mcp_client.websockets, "connect", server.connect)
+        client = MCPClient(
+            "http://mcp:7001",
+            "web",
+            pool_size=2,
+            max_in_flight_per_connection=2,
+            heartbeat_interval=0,
+        )
+
+        calls = [asyncio.create_task(client.call_tool("web.search", {"q": i})) for i in range(5)]
+        for _ in range(50):
+            await asyncio.sleep(0)
+            if len(server.calls) == 4:
+                break
+
+        stats = client.pool_stats()
+        assert len(server.sockets) == 2
+        assert {id(s) for s in server.calls} == {id(s) for s in server.sockets}
+        assert stats["in_flight"] == 4
+        assert stats["waiting"] == 1
+        assert stats["saturated"] is True
+
+        server.release.set()
+        await asyncio.gather(*calls)
+        stats = client.pool_stats()
+        assert stats["in_flight"] == 0
+        assert stats["saturated"] is False
+        assert stats["requests"] == 5
+        assert stats["open_connections"] == 2
+        await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_idle_connection_is_pinged_by_heartbeat_timer(monkeypatch):
+    async def scenario():
+        server = _FakeServer()
+        monkeypatch.setattr(mcp_client.websockets, "connect", server.connect)
+        client = MCPClient("ws://mcp:7001/mcp", "web", heartbeat_interval=0.05)
+
+        await client.list_tools()
+        await asyncio.sleep(0.2)
+
+        assert client.pool_stats()["heartbeats"] >= 1
+        assert client.is_healthy
+        await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_timed_out_call_leaves_the_shared_connection_to_other_calls(monkeypatch):
+    async def scenario():
+        server = _FakeServer()
+        monkeypatch.setattr(mcp_client.websockets, "connect", server.connect)
+        client = MCPClient("ws://mcp:7001/mcp", "web", timeout=0.1, pool_size=1, heartbeat_interval=0)
+
+        slow = asyncio.create_task(client.call_tool("web.search", {"hang": True}))
+        await asyncio.sleep(0.05)
+        fast = asyncio.create_task(client.call_tool("web.search", {"q": 1}))
+
+        with pytest.raises(MCPTimeoutError):
+            await slow
+        server.release.set()
+        assert await fast == {"result": "ok"}
+
+        # Sent once, never retried, and the socket was not replaced
+        assert len(server.calls) == 2
+        assert len(server.sockets) == 1 and not server.sockets[0].closed
+        assert client.pool_stats()["reconnects"] == 0
+        await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_in_flight_calls_are_capped_per_connection(monkeypatch):
+    async def scenario():
+        server = _FakeServer()
+        monkeypatch.setattr(mcp_client.websockets, "connect", server.connect)
+        client = MCPClient(
+            "ws://mcp:7001/mcp", "web", pool_size=1, max_in_flight_per_connection=2, heartbeat_interval=0
+        )
+
+        calls = [asyncio.create_task(client.call_tool("web.search", {"q": i})) for i in range(3)]
+        for _ in range(50):
+            await asyncio.sleep(0)
+        assert len(server.calls) == 2
+        assert client.pool_stats()["waiting"] == 1
+
+        server.release.set()
+        assert await asyncio.gather(*calls) == [{"result": "ok"}] * 3
+        await client.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,68 @@
+"""Tests for concurrent request handling in the MCP server runtime."""
+
+import asyncio
+import json
+import threading
+
+from packages.mcp.base_handler import MCPProtocolHandler, MCPServerInfo, mcp_websocket_handler
+
+
+class _FakeWebSocket:
+    def __init__(self, messages):
+        self._incoming: asyncio.Queue = asyncio.Queue()
+        for message in messages:
+            self._incoming.put_nowait(json.dumps(message))
+        self.sent: list[dict] = []
+        self.done = asyncio.Event()
+        self.expected = len(messages)
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self):
+        if self._incoming.empty():
+            await self.done.wait()
+            raise RuntimeError("disconnect")
+        return await self._incoming.get()
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+        if len(self.sent) == self.expected:
+            self.done.set()
+
+
+def _call(req_id, name):
+    return {"jsonrpc": "2.0", "id": req_id, "method": "tools/call", "params": {"name": name, "arguments": {}}}
+
+
+def test_slow_call_does_not_block_later_requests_and_sync_tools_use_threads():
+    handler = MCPProtocolHandler(MCPServerInfo(name="test"))
+    release = asyncio.Event()
+    threads = []
+
+    async def slow():
+        await release.wait()
+        return "slow"
+
+    def blocking():
+        threads.append(threading.current_thread().name)
+        return "sync"
+
+    async def fast():
+        release.set()
+        return "fast"
+
+    handler.register_tool("slow", "", {}, slow)
+    handler.register_tool("sync", "", {}, blocking)
+    handler.register_tool("fast", "", {}, fast)
+
+    async def scenario():
+        ws = _FakeWebSocket([_call(1, "slow"), _call(2, "sync"), _call(3, "fast")])
+        await asyncio.wait_for(mcp_websocket_handler(ws, handler), timeout=5)
+        return ws.sent
+
+    sent = asyncio.run(scenario())
+    order = [message["id"] for message in sent]
+    assert order.index(3) < order.index(1)
+    assert {m["id"]: m["result"]["content"][0]["json"] for m in sent} == {1: "slow", 2: "sync", 3: "fast"}
+    assert threads and threads[0].startswith("mcp-test")
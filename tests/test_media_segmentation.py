@@ -0,0 +1,189 @@
+"""Tests for pause-aligned media segmentation and transcript stitching."""
+
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ffmpeg")
+
+import packages.common  # noqa: F401,E402  (import order: packages.parsers needs packages.common first)
+from packages.common.whisper_engine import WhisperEngine, WhisperSpec  # noqa: E402
+from packages.parsers import media_transcriber  # noqa: E402
+from packages.parsers.media_transcriber import (  # noqa: E402
+    SAMPLE_RATE,
+    _PauseSplitter,
+    _stream_pcm,
+    _transcribe_stream,
+)
+
+
+def _speech(seconds: float, frequency: float = 220.0) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * frequency * t) * 8000).astype(np.int16)
+
+
+def _pause(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.int16)
+
+
+def _program(layout):
+    """PCM for ``[(kind, seconds), ...]`` plus the absolute start of each speech burst."""
+    parts, starts, position = [], [], 0.0
+    for kind, seconds in layout:
+        if kind == "speech":
+            starts.append(position)
+        parts.append(_speech(seconds) if kind == "speech" else _pause(seconds))
+        position += seconds
+    return np.concatenate(parts), starts
+
+
+def _feed_in_chunks(splitter, pcm, chunk=SAMPLE_RATE):
+    segments = []
+    for offset in range(0, pcm.size, chunk):
+        segments.extend(splitter.feed(pcm[offset : offset + chunk]))
+    return segments + splitter.flush()
+
+
+def test_segments_are_cut_in_the_pause_nearest_the_target_length():
+    pcm, _ = _program(
+        [("speech", 2.6), ("pause", 0.5), ("speech", 2.9), ("pause", 0.5), ("speech", 4.0)]
+    )
+    segments = _feed_in_chunks(_PauseSplitter(target_seconds=4), pcm)
+
+    starts = [start / SAMPLE_RATE for start, _ in segments]
+    # First cut inside the 2.6-3.1 s pause, the second inside 6.0-6.5 s
+    assert 2.6 <= starts[1] <= 3.1
+    assert 6.0 <= starts[2] <= 6.5
+    assert sum(audio.size for _, audio in segments) == pcm.size
+    assert all(a + audio.size == b for (a, audio), (b, _) in zip(segments, segments[1:]))
+    assert segments[0][1].dtype == np.float32 and np.abs(segments[0][1]).max() <= 1.0
+
+
+def test_segments_without_pauses_are_cut_at_the_maximum_length():
+    segments = _feed_in_chunks(_PauseSplitter(target_seconds=4), _speech(13.0))
+
+    lengths = [audio.size / SAMPLE_RATE for _, audio in segments]
+    assert all(2.0 <= length <= 6.0 for length in lengths)
+    assert sum(lengths) == pytest.approx(13.0)
+
+
+class _BurstModel:
+    """Fake Whisper model: one segment per burst of sound, timed within its audio."""
+
+    def __init__(self):
+        self.languages = []
+
+    def transcribe(self, audio, *, language=None, task="transcribe", **kwargs):
+        self.languages.append(language)
+        frame = SAMPLE_RATE // 100
+        frames = audio[: audio.size // frame * frame].reshape(-1, frame)
+        loud = np.sqrt((frames**2).mean(axis=1)) > 0.05
+        padded = np.concatenate(([False], loud, [False])).astype(np.int8)
+        bounds = np.flatnonzero(np.diff(padded)) * frame
+        segments = [
+            SimpleNamespace(start=start / SAMPLE_RATE, end=end / SAMPLE_RATE, text=f" burst {i} ")
+            for i, (start, end) in enumerate(zip(bounds[::2], bounds[1::2]))
+        ]
+        return iter(segments), SimpleNamespace(language="it")
+
+
+class _FakeEngine(WhisperEngine):
+    def __init__(self, model):
+        super().__init__(workers=2, batch_size=1)
+        self.model = model
+
+    def _load(self, spec):
+        return self.model
+
+
+def test_stream_transcripts_are_stitched_with_absolute_timestamps(monkeypatch):
+    model = _BurstModel()
+    engine = _FakeEngine(model)
+    monkeypatch.setattr(media_transcriber, "get_whisper_engine", lambda: engine)
+    pcm, burst_starts = _program(
+        [("pause", 0.3)]
+        + [item for _ in range(6) for item in (("speech", 1.2), ("pause", 0.6))]
+        + [("pause", 5.0), ("speech", 1.0)]
+    )
+    progress = []
+
+    try:
+        segments, language, audio_seconds = _transcribe_stream(
+            (pcm[i : i + SAMPLE_RATE] for i in range(0, pcm.size, SAMPLE_RATE)),
+            engine=engine,
+            spec=WhisperSpec("fake"),
+            language_hint=None,
+            segment_seconds=3,
+            total_seconds=pcm.size / SAMPLE_RATE,
+            progress=progress.append,
+        )
+    finally:
+        engine.shutdown()
+
+    assert language == "it"
+    # Detected once on the first segment, then passed to every later one
+    assert model.languages[0] is None and set(model.languages[1:]) == {"it"}
+    assert audio_seconds == pytest.approx(pcm.size / SAMPLE_RATE)
+    # Cuts fall in pauses, so each burst comes back once, at its absolute
+    # position, with the silent stretch skipped
+    assert [segment["start"] for segment in segments] == pytest.approx(burst_starts, abs=0.02)
+    assert all(segment["text"].startswith("burst") for segment in segments)
+    assert progress[-1] == 1.0 and progress == sorted(progress)
+
+
+class _FakeFfmpeg:
+    """Stands in for the ffmpeg-python chain; ``run_async`` starts ``script`` instead."""
+
+    def __init__(self, script):
+        self.script = script
+        self.process = None
+
+    def input(self, *args, **kwargs):
+        return self
+
+    output = global_args = input
+
+    def run_async(self, pipe_stdout=False, pipe_stderr=False):
+        self.process = subprocess.Popen(
+            [sys.executable, "-c", self.script], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        return self.process
+
+
+# Writes two seconds of PCM, closes stdout, then takes a while to exit
+_SLOW_EXIT = f"""
+import os, sys, time
+sys.stdout.buffer.write(bytes({SAMPLE_RATE * 4}))
+sys.stdout.flush()
+os.close(1)
+time.sleep(0.3)
+sys.exit({{code}})
+"""
+
+
+def test_pcm_stream_waits_for_ffmpeg_to_exit_after_eof(monkeypatch):
+    monkeypatch.setattr(media_transcriber, "ffmpeg", _FakeFfmpeg(_SLOW_EXIT.format(code=0)))
+
+    chunks = list(_stream_pcm(Path("talk.mp3")))
+
+    assert sum(chunk.size for chunk in chunks) == SAMPLE_RATE * 2
+
+    monkeypatch.setattr(media_transcriber, "ffmpeg", _FakeFfmpeg(_SLOW_EXIT.format(code=1)))
+    with pytest.raises(RuntimeError, match="failed to decode talk.mp3"):
+        list(_stream_pcm(Path("talk.mp3")))
+
+
+def test_abandoned_pcm_stream_kills_ffmpeg(monkeypatch):
+    # Still running long after the consumer stops reading
+    fake = _FakeFfmpeg(_SLOW_EXIT.replace("0.3", "30").format(code=0))
+    monkeypatch.setattr(media_transcriber, "ffmpeg", fake)
+
+    stream = _stream_pcm(Path("talk.mp3"))
+    next(stream)
+    stream.close()
+
+    assert fake.process.returncode is not None and fake.process.returncode != 0
@@ -0,0 +1,84 @@
+import asyncio
+
+from cryptography.fernet import Fernet
+
+import packages.common  # noqa: F401  (import order: packages.db needs packages.common first)
+from packages.db import models
+from packages.db.message_crypto import INLINE_DECRYPT_THRESHOLD, MessageCrypto, PlaintextCache
+
+
+class _CountingCrypto(MessageCrypto):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.decrypted = 0
+
+    def _decrypt_uncached(self, token):
+        self.decrypted += 1
+        return super()._decrypt_uncached(token)
+
+
+def _crypto(monkeypatch, **kwargs) -> _CountingCrypto:
+    crypto = _CountingCrypto(Fernet(Fernet.generate_key()), **kwargs)
+    monkeypatch.setattr(models, "get_message_crypto", lambda: crypto)
+    return crypto
+
+
+def test_content_is_decrypted_lazily_and_once(monkeypatch):
+    crypto = _crypto(monkeypatch)
+    written = models.ChatMessage(role="user", content="hello")
+    assert written.content_token != b"hello"
+
+    loaded = models.ChatMessage(role="user", content_token=written.content_token)
+    assert crypto.decrypted == 0
+
+    assert loaded.content == "hello"
+    assert loaded.content == "hello"
+    assert crypto.decrypted == 1
+
+
+def test_batch_decryption_uses_the_pool_and_fills_the_cache(monkeypatch):
+    crypto = _crypto(monkeypatch, workers=2, cache_bytes=1 << 20)
+    count = INLINE_DECRYPT_THRESHOLD * 3
+    tokens = [crypto._fernet.encrypt(f"message {i}".encode()) for i in range(count)]
+    messages = [models.ChatMessage(role="user", content_token=t) for t in tokens]
+    messages.append(models.ChatMessage(role="tool", content_token=None))
+
+    asyncio.run(models.decrypt_message_contents(messages))
+    try:
+        assert crypto.decrypted == count
+        assert crypto._executor is not None
+        assert [m.content for m in messages] == [f"message {i}" for i in range(count)] + [None]
+        assert crypto.decrypted == count
+
+        reloaded = [models.ChatMessage(role="user", content_token=t) for t in tokens]
+        asyncio.run(models.decrypt_message_contents(reloaded))
+        assert crypto.decrypted == count
+        assert crypto.cache.hits == count
+    finally:
+        crypto.shutdown()
+
+
+def test_plaintext_cache_is_bounded_and_skips_legacy_rows(monkeypatch):
+    cache = PlaintextCache(max_bytes=10)
+    cache.put(b"a" * 60, "12345")
+    cache.put(b"b" * 60, "67890")
+    cache.put(b"c" * 60, "xy")
+    assert cache.get(b"a" * 60) is None
+    assert cache.get(b"c" * 60) == "xy"
+    assert cache.size_bytes <= 10
+
+    crypto = _crypto(monkeypatch, cache_bytes=1 << 20)
+    assert crypto.decrypt(b"stored before encryption was enabled") == (
+        "stored before encryption was enabled"
+    )
+    assert len(crypto.cache) == 0
+
+
+def test_legacy_rows_sharing_a_token_suffix_do_not_hit_the_cache(monkeypatch):
+    crypto = _crypto(monkeypatch, cache_bytes=1 << 20)
+    token = crypto.encrypt("secret")
+    # A plaintext row that happens to end like a cached token
+    legacy = b"plain " + token[-48:]
+
+    assert crypto.decrypt(legacy) == legacy.decode()
+    assert crypto.decrypt(token) == "secret"
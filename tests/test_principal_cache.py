@@ -0,0 +1,65 @@
+"""Tests for the authenticated-principal cache."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import apps.api.auth.security as security
+from apps.api.auth.principal_cache import PrincipalCache, principal_cache
+
+
+def test_entries_expire_and_are_dropped_per_user():
+    now = [0.0]
+    cache = PrincipalCache(ttl=10, clock=lambda: now[0])
+    alice, bob = SimpleNamespace(id=1), SimpleNamespace(id=2)
+    cache.put("sub:alice", alice)
+    cache.put("key:abc:alice", alice)
+    cache.put("sub:bob", bob)
+    cache.add_grant(1, "documents")
+
+    cache.invalidate_user(1)
+    assert cache.get("sub:alice") is None and cache.get("key:abc:alice") is None
+    assert not cache.has_grant(1, "documents")
+    assert cache.get("sub:bob") is bob
+
+    now[0] = 10.0
+    assert cache.get("sub:bob") is None
+
+
+def test_repeat_jwt_requests_skip_the_database(monkeypatch):
+    sessions = []
+    user = SimpleNamespace(id=7, username="alice")
+
+    @asynccontextmanager
+    async def fake_session():
+        sessions.append(1)
+        yield object()
+
+    class _Repo:
+        def __init__(self, db):
+            pass
+
+        async def get_by_username(self, username):
+            return user if username == "alice" else None
+
+    monkeypatch.setattr(security, "get_async_session", fake_session)
+    monkeypatch.setattr(security, "UserRepository", _Repo)
+    monkeypatch.setattr(principal_cache, "ttl", 60.0)
+    principal_cache.clear()
+    token = security.create_access_token({"sub": "alice"})
+
+    async def scenario():
+        first = await security.get_current_user(youworker_token=token)
+        second = await security.get_current_user(youworker_token=token)
+        return first, second
+
+    try:
+        first, second = asyncio.run(scenario())
+        assert first is user and second is user
+        assert len(sessions) == 1
+
+        principal_cache.invalidate_user(7)
+        asyncio.run(security.get_current_user(youworker_token=token))
+        assert len(sessions) == 2
+    finally:
+        principal_cache.clear()
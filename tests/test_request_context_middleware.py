@@ -0,0 +1,67 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from apps.api.middleware.request_context import RequestContextMiddleware
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/version")
+    async def version(request: Request) -> dict:
+        return {"api_version": request.state.api_version}
+
+    @app.get("/framed")
+    async def framed() -> JSONResponse:
+        return JSONResponse({}, headers={"X-Frame-Options": "DENY"})
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def events():
+            for index in range(3):
+                yield f"data: {index}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+async def _get(path: str, headers: dict | None = None) -> httpx.Response:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers=headers)
+
+
+def test_context_headers_and_state():
+    response = asyncio.run(_get("/version", {"X-Correlation-ID": "abc", "X-API-Version": "2"}))
+
+    assert response.json() == {"api_version": "v2"}
+    assert response.headers["x-correlation-id"] == "abc"
+    assert response.headers["x-api-version"] == "v2"
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["referrer-policy"] == "same-origin"
+
+
+def test_generated_correlation_id_and_default_version():
+    response = asyncio.run(_get("/version"))
+
+    assert response.headers["x-correlation-id"]
+    assert response.headers["x-api-version"] == "v1"
+
+
+def test_endpoint_security_headers_are_kept():
+    response = asyncio.run(_get("/framed"))
+
+    assert response.headers.get_list("x-frame-options") == ["DENY"]
+
+
+def test_streamed_response_passes_through():
+    response = asyncio.run(_get("/stream"))
+
+    assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    assert response.headers["x-api-version"] == "v1"
+    assert response.headers["x-content-type-options"] == "nosniff"
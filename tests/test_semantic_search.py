@@ -0,0 +1,57 @@
+"""Tests for the semantic server's knowledge_search citations."""
+
+import asyncio
+from types import SimpleNamespace
+
+from apps.mcp_servers.semantic import server
+from packages.vectorstore.qdrant import SearchResult
+
+
+class _Store:
+    def __init__(self, results):
+        self.results = results
+
+    async def search(self, **kwargs):
+        return self.results
+
+
+class _Ollama:
+    def __init__(self):
+        self.prompts = []
+
+    async def embed(self, text, model=None):
+        return [0.0]
+
+    async def chat_stream(self, messages, model=None, tools=None):
+        self.prompts.append(messages[-1].content)
+        yield SimpleNamespace(content="See [1].")
+
+
+def test_deduplicated_chunks_cite_every_source_document(monkeypatch):
+    shared = SearchResult(
+        id="p1",
+        text="Printed copies are uncontrolled.",
+        score=0.9,
+        metadata={
+            "uri": "file:///a.md",
+            "sources": [
+                {"uri": "file:///a.md", "filename": "a.md", "chunk_index": 4, "user_id": 1},
+                {"uri": "file:///b.md", "filename": "b.md", "chunk_index": 2, "user_id": 1},
+            ],
+            "source_count": 3,
+        },
+    )
+    legacy = SearchResult(id="p2", text="Older point.", score=0.5, metadata={"uri": "file:///c.md"})
+    ollama = _Ollama()
+    monkeypatch.setattr(server, "vector_store", _Store([shared, legacy]))
+    monkeypatch.setattr(server, "ollama_client", ollama)
+
+    result = asyncio.run(server.knowledge_search("uncontrolled copies"))
+
+    first, second = result["citations"]
+    assert [s["uri"] for s in first["sources"]] == ["file:///a.md", "file:///b.md"]
+    assert first["sources"][1] == {"uri": "file:///b.md", "filename": "b.md", "chunk_index": 2}
+    assert first["source_count"] == 3
+    assert second["sources"] == [{"uri": "file:///c.md"}] and second["source_count"] == 1
+    assert result["sources"][0]["sources"] == first["sources"]
+    assert "[1] Source: file:///a.md, file:///b.md (+1 more)" in ollama.prompts[0]
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+
+import apps.api.main  # noqa: F401  (resolves the routes <-> services import cycle)
+from apps.api.readiness import FAILED, PENDING, READY, StartupReadiness
+from apps.api.services import startup
+
+
+def test_readiness_tracks_critical_components():
+    async def scenario():
+        readiness = StartupReadiness()
+        readiness.register("database", critical=True)
+        readiness.register("models")
+        assert not readiness.ready
+
+        async def fail():
+            raise RuntimeError("ollama down")
+
+        async def connect():
+            await asyncio.sleep(0)
+
+        assert await readiness.run("models", fail) is False
+        assert not readiness.ready
+        assert await readiness.run("database", connect) is True
+        return readiness
+
+    readiness = asyncio.run(scenario())
+    snapshot = readiness.snapshot()
+    assert snapshot["ready"] is True
+    assert snapshot["components"]["database"]["state"] == READY
+    assert snapshot["components"]["models"]["state"] == FAILED
+    assert "ollama down" in snapshot["components"]["models"]["error"]
+
+
+def test_optional_stages_are_retried_until_they_succeed():
+    attempts = []
+
+    async def flaky():
+        attempts.append(len(attempts))
+        if len(attempts) < 3:
+            raise ConnectionError("qdrant starting")
+
+    async def scenario():
+        readiness = StartupReadiness()
+        readiness.register("ingestion_pipeline")
+        return readiness, await readiness.run(
+            "ingestion_pipeline", flaky, retry=True, retry_delay=0.01
+        )
+
+    readiness, completed = asyncio.run(scenario())
+    assert completed is True
+    component = readiness.snapshot()["components"]["ingestion_pipeline"]
+    assert component["state"] == READY and component["error"] is None
+    assert component["attempts"] == 3
+
+
+def test_initialize_returns_before_slow_stages(monkeypatch):
+    release_models = None
+    database_done = []
+
+    async def init_database(self):
+        database_done.append(True)
+
+    async def warm_up_models(self):
+        await release_models.wait()
+
+    async def noop(self, *args):
+        return None
+
+    monkeypatch.setattr(startup.StartupService, "_validate_encryption_config", lambda self: None)
+    monkeypatch.setattr(startup.StartupService, "_validate_csrf_config", lambda self: None)
+    monkeypatch.setattr(startup.StartupService, "_init_database", init_database)
+    monkeypatch.setattr(startup.StartupService, "_warm_up_models", warm_up_models)
+    monkeypatch.setattr(startup.StartupService, "_init_ingestion_pipeline", noop)
+    monkeypatch.setattr(startup.StartupService, "_connect_mcp_servers", noop)
+
+    async def scenario():
+        nonlocal release_models
+        release_models = asyncio.Event()
+        app = FastAPI()
+        service = startup.StartupService()
+
+        await asyncio.wait_for(service.initialize(app), timeout=5)
+        readiness = app.state.readiness
+        assert database_done and readiness.ready
+        assert readiness.state("models") == PENDING
+        assert app.state.agent_loop is not None
+
+        release_models.set()
+        assert await readiness.wait("models") is True
+        assert readiness.state("mcp_servers") == READY
+        await service._cancel_startup_tasks()
+
+    asyncio.run(scenario())
+
+
+def test_initialize_fails_when_database_fails(monkeypatch):
+    async def broken_database(self):
+        raise ConnectionError("postgres unreachable")
+
+    async def hang(self, *args):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(startup.StartupService, "_validate_encryption_config", lambda self: None)
+    monkeypatch.setattr(startup.StartupService, "_validate_csrf_config", lambda self: None)
+    monkeypatch.setattr(startup.StartupService, "_init_database", broken_database)
+    for stage in ("_warm_up_models", "_init_ingestion_pipeline", "_connect_mcp_servers"):
+        monkeypatch.setattr(startup.StartupService, stage, hang)
+
+    async def scenario():
+        service = startup.StartupService()
+        with pytest.raises(ConnectionError):
+            await service.initialize(FastAPI())
+        assert service._startup_tasks == []
+
+    asyncio.run(scenario())
@@ -0,0 +1,62 @@
+"""Tests for the incremental streaming recognizer."""
+
+import numpy as np
+
+from apps.api.streaming_stt import AudioRingBuffer, DecodeResult, StreamingRecognizer, Word
+
+SAMPLE_RATE = 16000
+WORD_SECONDS = 0.4
+
+
+def _timeline(seconds: float) -> np.ndarray:
+    # Every sample holds its own timestamp so the fake decoder knows where a window starts.
+    return np.arange(int(seconds * SAMPLE_RATE), dtype=np.float32) / SAMPLE_RATE
+
+
+def _decoder(calls: list[float]):
+    def decode(window: np.ndarray, prompt: str) -> DecodeResult:
+        calls.append(window.size / SAMPLE_RATE)
+        offset = float(window[0])
+        duration = window.size / SAMPLE_RATE
+        words = []
+        t = (-offset) % WORD_SECONDS
+        while t + WORD_SECONDS <= duration + 1e-6:
+            index = int(round((offset + t) / WORD_SECONDS))
+            words.append(Word(t, t + WORD_SECONDS * 0.8, f"w{index}"))
+            t += WORD_SECONDS
+        return DecodeResult(words=words, language="it")
+
+    return decode
+
+
+def test_ring_buffer_reads_across_wraparound():
+    buffer = AudioRingBuffer(8)
+    buffer.write(np.arange(6, dtype=np.float32))
+    buffer.write(np.arange(6, 11, dtype=np.float32))
+
+    assert buffer.start == 3
+    assert buffer.read(0).tolist() == [3, 4, 5, 6, 7, 8, 9, 10]
+    assert buffer.read(5, 9).tolist() == [5, 6, 7, 8]
+
+
+def test_recognizer_commits_incrementally_with_bounded_windows():
+    calls: list[float] = []
+    recognizer = StreamingRecognizer(
+        _decoder(calls), sample_rate=SAMPLE_RATE, stride_s=1.0, max_window_s=6.0
+    )
+    audio = _timeline(30.0)
+    partials = []
+    for begin in range(0, audio.size, 1024):
+        recognizer.add_audio(audio[begin : begin + 1024])
+        while recognizer.ready():
+            partials.append(recognizer.step())
+    final = recognizer.finish()
+
+    expected = " ".join(f"w{i}" for i in range(int(30.0 / WORD_SECONDS)))
+    assert final["is_final"] and final["text"] == expected
+    # The committed prefix only ever grows between partials.
+    committed = [p["committed_text"] for p in partials if p]
+    assert all(later.startswith(earlier) for earlier, later in zip(committed, committed[1:]))
+    # No pass decodes more than the configured window, unlike whole-buffer re-decoding.
+    assert max(calls) <= 6.0
+    assert sum(calls) < 30.0 * 4
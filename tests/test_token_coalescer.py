@@ -0,0 +1,54 @@
+"""Tests for streamed token coalescing."""
+
+import asyncio
+
+from apps.api.utils.token_coalescer import TokenCoalescer
+
+
+async def _token_stream(count: int, delay: float = 0.0):
+    for index in range(count):
+        if delay:
+            await asyncio.sleep(delay)
+        yield {"event": "token", "data": {"text": f"t{index} "}}
+    yield {"event": "done", "data": {"final_text": "ok"}}
+
+
+async def test_coalescer_merges_tokens_and_preserves_text():
+    """Bursts of tokens should collapse into a handful of frames with identical text."""
+    coalescer = TokenCoalescer(flush_interval_ms=25, flush_bytes=4096)
+    frames = [frame async for frame in coalescer.coalesce(_token_stream(200))]
+
+    tokens = [frame for frame in frames if frame["event"] == "token"]
+    assert frames[-1]["event"] == "done"
+    assert "".join(f["data"]["text"] for f in tokens) == "".join(f"t{i} " for i in range(200))
+    # First token goes out on its own, the rest are merged.
+    assert tokens[0]["data"]["text"] == "t0 "
+    assert coalescer.frames_out * 10 <= coalescer.events_in
+
+
+async def test_coalescer_flushes_on_interval_while_upstream_is_slow():
+    """Buffered text must not wait for the next event once the interval has elapsed."""
+    coalescer = TokenCoalescer(flush_interval_ms=5, flush_bytes=4096)
+    frames = [frame async for frame in coalescer.coalesce(_token_stream(4, delay=0.02))]
+
+    tokens = [frame for frame in frames if frame["event"] == "token"]
+    assert len(tokens) == 4
+
+
+async def test_coalescer_reads_a_bounded_number_of_events_ahead():
+    """A stalled consumer must stop the upstream stream instead of buffering it."""
+    produced = 0
+
+    async def upstream():
+        nonlocal produced
+        for index in range(1000):
+            produced += 1
+            yield {"event": "log", "data": {"index": index}}
+
+    coalescer = TokenCoalescer(flush_interval_ms=25, max_queued=8)
+    frames = coalescer.coalesce(upstream())
+    assert (await frames.__anext__())["data"]["index"] == 0
+    await asyncio.sleep(0.05)
+
+    assert produced <= 8 + 2
+    await frames.aclose()
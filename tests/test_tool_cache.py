@@ -0,0 +1,105 @@
+"""Tests for the MCP tool result cache."""
+
+import asyncio
+
+from packages.agent.tool_cache import CACHE_HIT, CACHE_MISS, ToolCachePolicy, ToolResultCache
+
+
+def test_policy_from_metadata():
+    assert ToolCachePolicy.from_metadata(None) is None
+    assert ToolCachePolicy.from_metadata({"ttl": 0}) is None
+    assert ToolCachePolicy.from_metadata({"ttl": 60, "cacheable": False}) is None
+    policy = ToolCachePolicy.from_metadata({"ttl": "60", "keyFields": ["url"]})
+    assert policy == ToolCachePolicy(ttl=60.0, key_fields=("url",))
+    # Only key fields identify a call, and argument order does not matter
+    assert policy.key("web.fetch", {"url": "u", "x": 1}) == policy.key("web.fetch", {"x": 2, "url": "u"})
+
+
+def test_lru_ttl_and_errors_are_not_cached():
+    now = [0.0]
+    cache = ToolResultCache(max_entries=2, clock=lambda: now[0])
+    policy = ToolCachePolicy(ttl=10)
+    calls = []
+
+    async def lookup(value):
+        async def call():
+            calls.append(value)
+            return {"error": "bad"} if value < 0 else {"value": value}
+
+        return await cache.get_or_call("units.convert", {"value": value}, policy, call)
+
+    async def scenario():
+        assert (await lookup(1))[1] == CACHE_MISS
+        assert await lookup(1) == ({"value": 1}, CACHE_HIT)
+        await lookup(2)
+        await lookup(1)  # 1 becomes most recently used
+        await lookup(3)  # evicts 2
+        assert (await lookup(2))[1] == CACHE_MISS
+        now[0] = 11.0
+        assert (await lookup(3))[1] == CACHE_MISS
+        await lookup(-1)
+        assert (await lookup(-1))[1] == CACHE_MISS
+
+    asyncio.run(scenario())
+    assert calls == [1, 2, 3, 2, 3, -1, -1]
+    assert cache.evictions == 2
+
+
+def test_concurrent_identical_calls_share_one_request():
+    cache = ToolResultCache()
+    policy = ToolCachePolicy(ttl=60)
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"answer": 42}
+
+    async def scenario():
+        return await asyncio.gather(
+            *(cache.get_or_call("semantic.knowledge_search", {"question": "q"}, policy, call) for _ in range(5))
+        )
+
+    results = asyncio.run(scenario())
+    assert calls == 1
+    assert sorted(status for _, status in results) == [CACHE_HIT] * 4 + [CACHE_MISS]
+    assert all(result == {"answer": 42} for result, _ in results)
+    assert cache.stats()["coalesced"] == 4
+    assert cache.invalidate("semantic.") == 1
+
+
+def test_registry_serves_repeated_calls_from_cache():
+    from packages.agent.registry import MCPRegistry
+    from packages.mcp import MCPTool
+
+    class _Client:
+        server_id = "units"
+        is_healthy = True
+        tools_version = None
+        calls = 0
+
+        async def list_tools(self):
+            return [
+                MCPTool("units.convert", "", {}, "units", "ws://units/mcp", cache={"ttl": 60}),
+                MCPTool("units.clock", "", {}, "units", "ws://units/mcp"),
+            ]
+
+        async def call_tool(self, name, arguments):
+            type(self).calls += 1
+            return {"value": arguments["value"]}
+
+    async def scenario():
+        registry = MCPRegistry([])
+        registry.clients["units"] = _Client()
+        await registry.refresh_tools()
+        first = await registry.call_tool_with_status("units_convert", {"value": 1})
+        second = await registry.call_tool_with_status("units_convert", {"value": 1})
+        uncached = await registry.call_tool_with_status("units_clock", {"value": 1})
+        return first, second, uncached
+
+    first, second, uncached = asyncio.run(scenario())
+    assert first == ({"value": 1}, CACHE_MISS)
+    assert second == ({"value": 1}, CACHE_HIT)
+    assert uncached == ({"value": 1}, None)
+    assert _Client.calls == 2
@@ -0,0 +1,74 @@
+"""Tests for sentence-pipelined speech synthesis."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from apps.api.tts_pipeline import SentenceSplitter, SpeechPipeline
+
+
+def test_splitter_emits_sentences_as_tokens_arrive():
+    splitter = SentenceSplitter(min_chars=10)
+    text = "Ciao! Questa è la prima frase. Ecco il codice:\n```py\nx = 1. y = 2\n```\nFine del discorso."
+    emitted = []
+    for index in range(0, len(text), 3):
+        emitted.extend(splitter.feed(text[index : index + 3]))
+    emitted.extend(splitter.flush())
+
+    assert emitted[0] == "Ciao! Questa è la prima frase."
+    # Nothing inside the fenced block is treated as a sentence boundary.
+    assert any(s.startswith("```py") and s.endswith("Fine del discorso.") for s in emitted)
+    assert " ".join(emitted).replace("\n", " ").split() == text.replace("\n", " ").split()
+
+
+async def test_pipeline_synthesizes_concurrently_and_preserves_order():
+    def synthesize(sentence: str):
+        # Earlier sentences are slower, so completion order differs from submission order.
+        time.sleep(0.05 if sentence == "uno" else 0.01)
+        return sentence.encode(), 22050
+
+    executor = ThreadPoolExecutor(max_workers=3)
+    pipeline = SpeechPipeline(synthesize, executor=executor, max_pending=3)
+
+    async def produce():
+        for sentence in ("uno", "due", "tre"):
+            await pipeline.submit(sentence)
+        await pipeline.close()
+
+    started = time.perf_counter()
+    producer = asyncio.create_task(produce())
+    results = [item async for item in pipeline.results()]
+    await producer
+    executor.shutdown()
+
+    assert [sentence for sentence, _, _ in results] == ["uno", "due", "tre"]
+    assert time.perf_counter() - started < 0.05 + 0.01 * 3
+
+
+async def test_feeding_sentences_never_waits_for_synthesis():
+    release = threading.Event()
+
+    def synthesize(sentence: str):
+        release.wait(5)
+        return sentence.encode(), 22050
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    pipeline = SpeechPipeline(synthesize, executor=executor, max_pending=1)
+    sentences = [f"frase {index}" for index in range(10)]
+
+    # All sentences are accepted while the only synthesis slot is still busy
+    for sentence in sentences:
+        pipeline.feed(sentence)
+    release.set()
+
+    consumer = asyncio.create_task(_collect(pipeline))
+    await pipeline.close()
+    results = await consumer
+    executor.shutdown()
+
+    assert [sentence for sentence, _, _ in results] == sentences
+
+
+async def _collect(pipeline):
+    return [item async for item in pipeline.results()]
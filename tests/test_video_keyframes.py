@@ -0,0 +1,117 @@
+"""Tests for video keyframe sampling and near-duplicate frame filtering."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("PIL")
+
+import packages.common  # noqa: F401,E402  (import order: packages.parsers needs packages.common first)
+from packages.parsers.doc_to_image import (  # noqa: E402
+    DocumentToImageConverter,
+    _frame_dhash,
+    _hamming,
+    _iter_keyframes,
+)
+
+
+class _FakeCapture:
+    """Capture over numbered frames that records how it was driven."""
+
+    def __init__(self, frame_count, seekable=True):
+        self.frame_count = frame_count
+        self.seekable = seekable
+        self.position = 0
+        self.seeks = []
+        self.grabs = 0
+        self.reads = 0
+
+    def set(self, prop, value):
+        assert prop == cv2.CAP_PROP_POS_FRAMES
+        if not self.seekable:
+            return False
+        self.seeks.append(value)
+        self.position = value
+        return True
+
+    def grab(self):
+        if self.position >= self.frame_count:
+            return False
+        self.grabs += 1
+        self.position += 1
+        return True
+
+    def read(self):
+        if self.position >= self.frame_count:
+            return False, None
+        self.reads += 1
+        frame = np.full((4, 4, 3), self.position % 256, dtype=np.uint8)
+        self.position += 1
+        return True, frame
+
+
+def _sample(cap, interval, total_frames, fps=25.0):
+    return [(number, int(frame[0, 0, 0])) for number, frame in _iter_keyframes(cap, interval, total_frames, fps)]
+
+
+def test_short_intervals_skip_frames_with_grab():
+    cap = _FakeCapture(35)
+
+    assert _sample(cap, 10, 35) == [(0, 0), (10, 10), (20, 20), (30, 30)]
+    assert cap.seeks == [] and cap.reads == 4 and cap.grabs == 27
+
+
+def test_long_intervals_seek_to_each_keyframe():
+    cap = _FakeCapture(120)
+
+    assert _sample(cap, 50, 120) == [(0, 0), (50, 50), (100, 100)]
+    assert cap.seeks == [50, 100] and cap.grabs == 0
+
+
+def test_unseekable_or_unsized_streams_fall_back_to_grab():
+    refuses_seek = _FakeCapture(120, seekable=False)
+    assert _sample(refuses_seek, 50, 120) == [(0, 0), (50, 50), (100, 100)]
+    assert refuses_seek.grabs == 98
+
+    # Unknown frame count: sample until the stream ends
+    unsized = _FakeCapture(25)
+    assert [number for number, _ in _sample(unsized, 10, 0)] == [0, 10, 20]
+    assert unsized.seeks == []
+
+
+def _scene(seed, size=(96, 128)):
+    rng = np.random.default_rng(seed)
+    # Smooth random shapes: a blurred noise field, stable under small changes
+    field = cv2.GaussianBlur(rng.integers(0, 256, (*size, 3), dtype=np.uint8), (31, 31), 0)
+    return cv2.normalize(field, None, 0, 255, cv2.NORM_MINMAX)
+
+
+def test_dhash_ignores_noise_and_scaling_but_not_scene_changes():
+    scene = _scene(1)
+    noisy = np.clip(scene.astype(np.int16) + np.random.default_rng(0).integers(-4, 5, scene.shape), 0, 255)
+    scaled = cv2.resize(scene, (256, 192), interpolation=cv2.INTER_LINEAR)
+
+    base = _frame_dhash(scene)
+    assert _hamming(base, _frame_dhash(noisy.astype(np.uint8))) <= 5
+    assert _hamming(base, _frame_dhash(scaled)) <= 5
+    assert _hamming(base, _frame_dhash(_scene(2))) > 10
+
+
+def test_video_conversion_keeps_one_frame_per_scene(tmp_path):
+    path = tmp_path / "slides.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (128, 96))
+    for seed in (1, 2, 3):
+        for _ in range(20):  # two seconds per scene
+            writer.write(_scene(seed))
+    writer.release()
+
+    converter = DocumentToImageConverter(video_frame_interval=0.5, video_scene_threshold=10)
+    frames = asyncio.run(converter._convert_video(path))
+
+    assert [f["metadata"]["frame_number"] for f in frames] == [0, 20, 40]
+    assert [f["metadata"]["timestamp"] for f in frames] == [0.0, 2.0, 4.0]
+
+    keep_all = DocumentToImageConverter(video_frame_interval=0.5, video_scene_threshold=0)
+    assert len(asyncio.run(keep_all._convert_video(path))) == 12
@@ -0,0 +1,129 @@
+"""Tests for the web server's crawl engine, robots cache and host throttle."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from apps.mcp_servers.web import crawler
+from apps.mcp_servers.web.crawler import CrawlEngine, CrawlPage, HostThrottle, RobotsCache
+
+# Link graph: a -> b, c, d; b -> e, a; c -> f
+LINKS = {
+    "a": ["b", "c", "d#top", "mailto:x@example.com"],
+    "b": ["e", "a"],
+    "c": ["f", "https://other.example/g"],
+}
+
+
+def _url(name):
+    return name if name.startswith(("https:", "mailto:")) else f"https://site.example/{name}"
+
+
+def _urls(results):
+    return [r["url"] for r in results]
+
+
+def _engine(checked, robots=None, fetch_robots=None):
+    async def ensure_safe(url):
+        checked.append(url)
+        return url
+
+    async def visit(url, want_links):
+        name = url.rsplit("/", 1)[-1]
+        links = [_url(link) for link in LINKS.get(name, [])] if want_links else []
+        return CrawlPage(result={"url": url}, links=links)
+
+    async def no_robots(url):
+        return None
+
+    return CrawlEngine(
+        ensure_safe=ensure_safe,
+        visit=visit,
+        fetch_robots=fetch_robots or no_robots,
+        robots=robots,
+        throttle=HostThrottle(),
+    )
+
+
+def test_crawl_walks_levels_in_order_and_checks_only_budgeted_urls():
+    checked = []
+    engine = _engine(checked)
+
+    results = asyncio.run(engine.crawl(_url("a"), depth=2, max_pages=4, same_host=True))
+
+    assert _urls(results) == [_url(n) for n in ("a", "b", "c", "d")]
+    # The third level (e, f) was discovered but never resolved
+    assert checked == _urls(results)
+
+    checked.clear()
+    everything = asyncio.run(engine.crawl(_url("a"), depth=2, max_pages=10, same_host=False))
+    assert _urls(everything) == [_url(n) for n in ("a", "b", "c", "d", "e", "f")] + [
+        "https://other.example/g"
+    ]
+    shallow = asyncio.run(engine.crawl(_url("a"), depth=0, max_pages=10, same_host=True))
+    assert _urls(shallow) == [_url("a")]
+
+
+def test_disallowed_pages_are_skipped_via_robots():
+    robots = RobotsCache()
+
+    async def fetch_robots(url):
+        return "User-agent: *\nDisallow: /c\n"
+
+    results = asyncio.run(
+        _engine([], robots, fetch_robots).crawl(_url("a"), depth=1, max_pages=10, same_host=True)
+    )
+
+    assert _urls(results) == [_url(n) for n in ("a", "b", "d")]
+
+
+def test_robots_cache_fetches_once_per_origin_until_the_ttl_expires(monkeypatch):
+    now = SimpleNamespace(value=100.0)
+    monkeypatch.setattr(crawler, "time", SimpleNamespace(monotonic=lambda: now.value))
+    cache = RobotsCache(ttl=60)
+    fetches = []
+
+    async def fetch(url):
+        fetches.append(url)
+        await asyncio.sleep(0.01)
+        return "User-agent: *\nDisallow: /private\n"
+
+    async def lookups():
+        return await asyncio.gather(*(cache.get(_url(f"p{i}"), fetch) for i in range(5)))
+
+    parsers = asyncio.run(lookups())
+    assert fetches == ["https://site.example/robots.txt"]
+    assert len({id(p) for p in parsers}) == 1
+    assert not parsers[0].can_fetch("*", _url("private"))
+
+    now.value += 59
+    asyncio.run(cache.get(_url("x"), fetch))
+    assert len(fetches) == 1
+    now.value += 2
+    asyncio.run(cache.get(_url("x"), fetch))
+    assert len(fetches) == 2
+
+
+def test_host_throttle_spaces_calls_and_forgets_idle_hosts():
+    throttle = HostThrottle(max_per_host=2, min_delay=0.05)
+    throttle._SWEEP_AT = 1
+    starts = []
+
+    async def call():
+        starts.append(time.monotonic())
+
+    async def scenario():
+        await asyncio.gather(*(throttle.run("site.example", call) for _ in range(3)))
+        # Kept while the next slot is still closed, so spacing carries over
+        assert throttle.snapshot()["hosts"] == 1
+        await asyncio.sleep(0.06)
+        await throttle.run("other.example", call)
+
+    asyncio.run(scenario())
+
+    assert all(later - earlier >= 0.045 for earlier, later in zip(starts, starts[1:3]))
+    assert list(throttle._hosts) == ["other.example"]
+
+    unspaced = HostThrottle(max_per_host=1)
+    asyncio.run(unspaced.run("site.example", call))
+    assert unspaced.snapshot()["hosts"] == 0
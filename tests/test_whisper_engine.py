@@ -0,0 +1,112 @@
+"""Tests for the shared Whisper engine scheduler."""
+
+import threading
+
+from packages.common.whisper_engine import (
+    PRIORITY_BATCH,
+    PRIORITY_LIVE,
+    WhisperEngine,
+    WhisperSpec,
+)
+
+
+class _FakeEngine(WhisperEngine):
+    """Engine whose "models" are plain objects, so no faster-whisper is needed."""
+
+    loads = 0
+
+    def _load(self, spec):
+        type(self).loads += 1
+        return object()
+
+
+def test_live_jobs_run_before_queued_batch_jobs_and_share_one_model():
+    engine = _FakeEngine(workers=1)
+    spec = WhisperSpec("small", device="cpu", compute_type="int8")
+    gate = threading.Event()
+    blocking = threading.Event()
+    order: list[str] = []
+    models: set[int] = set()
+
+    def job(label):
+        def run(model):
+            models.add(id(model))
+            if label == "blocker":
+                blocking.set()
+                gate.wait(5)
+            order.append(label)
+            return label
+
+        return run
+
+    futures = [engine.submit(spec, job("blocker"), priority=PRIORITY_BATCH)]
+    assert blocking.wait(5)
+    futures += [
+        engine.submit(spec, job(f"batch-{i}"), priority=PRIORITY_BATCH, audio_seconds=10)
+        for i in range(2)
+    ]
+    futures.append(engine.submit(spec, job("live"), priority=PRIORITY_LIVE, audio_seconds=1))
+    gate.set()
+    assert [f.result(5) for f in futures][-1] == "live"
+    engine.shutdown()
+
+    assert order == ["blocker", "live", "batch-0", "batch-1"]
+    assert len(models) == 1 and _FakeEngine.loads == 1
+    stats = engine.stats()
+    assert stats["live"]["completed"] == 1 and stats["batch"]["completed"] == 3
+    assert stats["batch"]["rtf"] is not None
+
+
+class _SlowLoadEngine(WhisperEngine):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.loading = threading.Event()
+        self.finish_load = threading.Event()
+        self.loaded: list[str] = []
+
+    def _load(self, spec):
+        if spec.model == "large":
+            self.loading.set()
+            self.finish_load.wait(5)
+        self.loaded.append(spec.model)
+        return object()
+
+
+def test_a_slow_load_does_not_block_other_models_and_happens_once():
+    engine = _SlowLoadEngine(workers=3)
+    large, small = WhisperSpec("large"), WhisperSpec("small")
+
+    first = engine.submit(large, lambda model: model)
+    assert engine.loading.wait(5)
+    second = engine.submit(large, lambda model: model)
+    # Served while "large" is still loading
+    assert engine.submit(small, lambda model: "ok").result(5) == "ok"
+
+    engine.finish_load.set()
+    assert first.result(5) is second.result(5)
+    assert engine.loaded == ["small", "large"]
+    engine.shutdown()
+
+
+def test_shutdown_cancels_queued_jobs_and_waits_for_running_ones():
+    engine = _FakeEngine(workers=1)
+    spec = WhisperSpec("small")
+    started, release = threading.Event(), threading.Event()
+    seen_models = []
+
+    def running(model):
+        started.set()
+        release.wait(5)
+        seen_models.append(model in engine._models.values())
+        return "done"
+
+    current = engine.submit(spec, running)
+    assert started.wait(5)
+    queued = engine.submit(spec, lambda model: "never")
+
+    threading.Timer(0.05, release.set).start()
+    engine.shutdown(timeout=5)
+
+    assert current.result(0) == "done" and seen_models == [True]
+    assert queued.cancelled()
+    assert engine.stats()["models"] == []